@@ -12,8 +12,8 @@ import os.path
 from research_analytics_suite.data_engine import MemoryManager
 from research_analytics_suite.utils.Config import Config
 from research_analytics_suite.data_engine.Workspace import Workspace
-from research_analytics_suite.gui.launcher.GuiLauncher import GuiLauncher
 from research_analytics_suite.operation_manager.control.OperationControl import OperationControl
+from research_analytics_suite.operation_manager.execution.SharedProcessPool import SharedProcessPool
 from research_analytics_suite.utils.CustomLogger import CustomLogger
 from research_analytics_suite.utils.launch_args import get_launch_args
 
@@ -23,7 +23,13 @@ async def RASLauncher():
     Launches the Research Analytics Suite.
 
     This function checks the command line arguments to determine whether to create a new workspace or open an existing
-    one. It then initializes the asyncio event loop and starts the application.
+    one. It then initializes the asyncio event loop and starts the application. If the -b '--batch' flag is present,
+    the specified operation group is executed headlessly (no GUI, console or resource monitor) and the function returns
+    once it has finished.
+
+    Returns:
+        int: The exit status of the batch run in batch mode, BatchRunner.EXIT_WORKSPACE_FAILED if the workspace could
+             not be set up, otherwise None.
 
     Raises:
         AssertionError: If no active project is open.
@@ -53,9 +59,6 @@ async def RASLauncher():
     _workspace = Workspace()
     await _workspace.initialize()
 
-    # Add the operation control loop to the launch tasks
-    _launch_tasks.append(_operation_control.exec_loop())
-
     # Checks args for -o '--open_workspace' flag and -c '--config' flag
     # If -o flag is present, but -c flag is not, set the config path to the open_workspace path
     # If -c flag is present, but -o flag is not, set the open_workspace path to the directory of the config path
@@ -67,8 +70,7 @@ async def RASLauncher():
             try:
                 os.makedirs(_args.directory, exist_ok=True)
             except Exception as e:
-                _logger.error(e)
-                return
+                return _workspace_failed(_logger, e)
 
             # Set default name if not specified
             if _args.name is None:
@@ -116,6 +118,8 @@ async def RASLauncher():
             _logger.info('Creating New Workspace at: ' + os.path.join(_args.directory, _args.name))
             _workspace = await _workspace.create_workspace(_args.directory, _args.name)
         except Exception as e:
+            if _args.batch is not None:
+                return _workspace_failed(_logger, e)
             _logger.error(e)
 
     # If -o '--open_workspace' flag is present, open the existing workspace
@@ -137,8 +141,7 @@ async def RASLauncher():
             try:
                 _workspace = await _workspace.create_workspace(_args.directory, _args.open_workspace)
             except Exception as e:
-                _logger.error(e)
-                return
+                return _workspace_failed(_logger, e)
         else:
             _logger.info('Opening Existing Workspace at:\t' + f"{_args.directory}/{_args.open_workspace}")
 
@@ -146,11 +149,33 @@ async def RASLauncher():
                 _workspace = await _workspace.load_workspace(
                     os.path.normpath(os.path.join(_args.directory, _args.open_workspace)))
             except Exception as e:
+                if _args.batch is not None:
+                    return _workspace_failed(_logger, e)
                 _logger.error(e)
 
+    # Run the operation group headlessly if -b '--batch' flag is present; skips the GUI and persistent operations
+    if _args.batch is not None:
+        _logger.info("Launching RAS in batch mode")
+        from research_analytics_suite.operation_manager.execution.BatchRunner import BatchRunner
+        _batch_runner = BatchRunner(max_parallel=_args.jobs, output_path=_args.output)
+        try:
+            return await _batch_runner.run(_args.batch)
+        except Exception as e:
+            _logger.error(e)
+            return BatchRunner.EXIT_OPERATION_FAILED
+        finally:
+            _logger.info("Saving Workspace...")
+            await _workspace.save_current_workspace()
+            await _workspace.close()
+            SharedProcessPool().shutdown(wait=False)
+
+    # Add the operation control loop to the launch tasks
+    _launch_tasks.append(_operation_control.exec_loop())
+
     # Launch the GUI if specified
     if _args.gui is not None and _args.gui.lower() == 'true':
         try:
+            from research_analytics_suite.gui.launcher.GuiLauncher import GuiLauncher
             _gui_launcher = GuiLauncher()
         except Exception as e:
             _logger.error(e)
@@ -167,5 +192,23 @@ async def RASLauncher():
     finally:
         _logger.info("Saving Workspace...")
         await _workspace.save_current_workspace()
+        await _workspace.close()
+        SharedProcessPool().shutdown(wait=False)
         _logger.info("Exiting Research Analytics Suite...")
         asyncio.get_event_loop().close()
+
+
+def _workspace_failed(logger, error) -> int:
+    """
+    Logs a failure to set up the workspace and returns the corresponding exit status.
+
+    Args:
+        logger (CustomLogger): The logger.
+        error (Exception): The error raised while setting up the workspace.
+
+    Returns:
+        int: BatchRunner.EXIT_WORKSPACE_FAILED.
+    """
+    from research_analytics_suite.operation_manager.execution.BatchRunner import BatchRunner
+    logger.error(error)
+    return BatchRunner.EXIT_WORKSPACE_FAILED
@@ -23,28 +23,33 @@ from research_analytics_suite.RASLauncher import RASLauncher
 def main():
     """
     Initiates the Research Analytics Suite.
+
+    Exits with the status code returned by the launcher (non-zero when a batch run fails), or 1 on a fatal error.
     """
+    _exit_code = 0
     try:
         # Apply nest_asyncio to allow asyncio to run in Jupyter notebooks
         nest_asyncio.apply()
 
         # Run the Research Analytics Suite
-        asyncio.run(RASLauncher())
+        _exit_code = asyncio.run(RASLauncher()) or 0
 
     except KeyboardInterrupt:
         print('Exiting Research Analytics Suite..')
 
     except Exception as e:
         print(f"Fatal error occurred: {e}")
+        _exit_code = 1
 
     finally:
         print("Cleaning up..")
         asyncio.get_event_loop().close()
-        sys.exit(0)
+        sys.exit(_exit_code)
 
 
 if __name__ == '__main__':
-    sys.argv = ['__main__.py',
-                '-n', "RAS-test-workspace",
-                ]
+    if len(sys.argv) == 1:
+        sys.argv = ['__main__.py',
+                    '-n', "RAS-test-workspace",
+                    ]
     main()
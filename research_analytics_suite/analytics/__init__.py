@@ -2,15 +2,44 @@
 analytics package
 
 This package provides core analytical processing, data handling, model evaluation, and visualization.
+
+Sub-packages are imported on first attribute access (PEP 562) so that importing the package does not pull in
+sklearn or matplotlib until a model, metric or plot is actually requested.
 """
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'AnalyticsCore': '.core',
+    'MachineLearning': '.core',
+    'display_transformations': '.visualization',
+    'Model': '.models',
+    'Evaluator': '.evaluation',
+    'MLEvaluationOperation': '.evaluation',
+    'Predictor': '.prediction',
+    'PredictionOperation': '.prediction',
+    'Preprocessor': '.preprocessing',
+    'RunningMoments': '.preprocessing',
+    'MLTrainingOperation': '.training',
+    'HyperparameterSearchOperation': '.training',
+    'CandidateFitOperation': '.training',
+    'SharedArrays': '.training',
+    'ShardPrefetcher': '.training',
+    'TrainingShards': '.training',
+    'Metrics': '.utils',
+    'ConfusionMatrix': '.utils',
+}
+
+__all__ = list(_LAZY_ATTRIBUTES.keys())
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(_LAZY_ATTRIBUTES[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
 
-from .core import *
-from .visualization import *
-from .preloaded import *
-from .custom_user import *
-from .models import *
-from .evaluation import *
-from .prediction import *
-from .preprocessing import *
-from .training import *
-from .utils import *
+def __dir__():
+    return sorted(list(globals().keys()) + __all__)
@@ -1,11 +1,38 @@
-from sklearn.metrics import accuracy_score, precision_score, recall_score
+import numpy as np
+
+from research_analytics_suite.analytics.utils.ConfusionMatrix import ConfusionMatrix
 
 
 class Evaluator:
     @staticmethod
-    def evaluate(model, test_data, test_target):
-        predictions = model.predict(test_data)
-        accuracy = accuracy_score(test_target, predictions)
-        precision = precision_score(test_target, predictions, average='weighted')
-        recall = recall_score(test_target, predictions, average='weighted')
-        return {"accuracy": accuracy, "precision": precision, "recall": recall}
+    def evaluate(model, test_data, test_target, batch_rows=None):
+        """
+        Evaluate a model, predicting at most batch_rows rows at once into one accumulated confusion matrix.
+
+        Args:
+            model: A fitted model.
+            test_data: The test features.
+            test_target: The test labels.
+            batch_rows (int, optional): The number of rows predicted at once. Defaults to all rows.
+        """
+        return Evaluator.confusion_matrix(model, test_data, test_target, batch_rows).metrics()
+
+    @staticmethod
+    def evaluate_batches(model, batches):
+        """Evaluate a model over an iterable of (features, labels) batches, e.g. TrainingShards validation rows."""
+        matrix = ConfusionMatrix()
+        for X, y in batches:
+            if len(X):
+                matrix.update(y, model.predict(X))
+        return matrix.metrics()
+
+    @staticmethod
+    def confusion_matrix(model, test_data, test_target, batch_rows=None):
+        """Return the ConfusionMatrix of a model's predictions, predicting at most batch_rows rows at once."""
+        batch_rows = batch_rows or max(len(test_data), 1)
+        rows = test_data.iloc if hasattr(test_data, 'iloc') else test_data
+        target = np.asarray(test_target)
+        matrix = ConfusionMatrix()
+        for offset in range(0, len(test_data), batch_rows):
+            matrix.update(target[offset:offset + batch_rows], model.predict(rows[offset:offset + batch_rows]))
+        return matrix
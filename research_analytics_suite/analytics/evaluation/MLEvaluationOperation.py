@@ -1,12 +1,15 @@
+import asyncio
+
 from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
 
 
 class MLEvaluationOperation(BaseOperation):
-    def __init__(self, model, test_data, test_target):
+    def __init__(self, model, test_data, test_target, batch_rows=None):
         super().__init__(action=None, name="MLEvaluationOperation")
         self.model = model
         self.test_data = test_data
         self.test_target = test_target
+        self.batch_rows = batch_rows
 
     def start(self):
         """Initialize evaluation parameters."""
@@ -18,7 +21,8 @@ class MLEvaluationOperation(BaseOperation):
         try:
             self.status = "running"
             from research_analytics_suite.analytics.evaluation import Evaluator
-            metrics = await Evaluator.evaluate(self.model, self.test_data, self.test_target)
+            metrics = await asyncio.to_thread(Evaluator.evaluate, self.model, self.test_data, self.test_target,
+                                              self.batch_rows)
             self.status = "completed"
             self.add_log_entry("Evaluation completed successfully")
             return metrics
@@ -1,15 +1,43 @@
-from sklearn.linear_model import LogisticRegression
+import importlib
 
 
 class Model:
-    def __init__(self, model_type="logistic_regression"):
-        if model_type == "logistic_regression":
-            self.model = LogisticRegression()
-        else:
+    # Supported model types: (module, estimator class, default parameters)
+    MODEL_TYPES = {
+        "logistic_regression": ("sklearn.linear_model", "LogisticRegression", {}),
+        # Logistic regression fitted by SGD, which can train incrementally on shards
+        "sgd_classifier": ("sklearn.linear_model", "SGDClassifier", {"loss": "log_loss"}),
+        "random_forest": ("sklearn.ensemble", "RandomForestClassifier", {}),
+        "gradient_boosting": ("sklearn.ensemble", "HistGradientBoostingClassifier", {}),
+        "svm": ("sklearn.svm", "SVC", {}),
+        "knn": ("sklearn.neighbors", "KNeighborsClassifier", {}),
+    }
+
+    def __init__(self, model_type="logistic_regression", **params):
+        self.model_type = model_type
+        self.params = params
+        self.model = Model.create_estimator(model_type, params)
+
+    @staticmethod
+    def create_estimator(model_type, params=None):
+        """Create an unfitted estimator of a supported model type, with parameters overriding its defaults."""
+        if model_type not in Model.MODEL_TYPES:
             raise ValueError(f"Model type {model_type} is not supported")
+        module, name, defaults = Model.MODEL_TYPES[model_type]
+        estimator = getattr(importlib.import_module(module), name)
+        return estimator(**{**defaults, **(params or {})})
+
+    @property
+    def supports_partial_fit(self):
+        """Whether the model can be trained incrementally, one batch at a time."""
+        return hasattr(self.model, "partial_fit")
 
     def train(self, X_train, y_train):
         self.model.fit(X_train, y_train)
 
+    def partial_fit(self, X_train, y_train, classes=None):
+        """Train the model on one batch; classes must list every target class on the first call."""
+        self.model.partial_fit(X_train, y_train, classes=classes)
+
     def predict(self, X_test):
         return self.model.predict(X_test)
@@ -0,0 +1,215 @@
+import asyncio
+import os
+import pickle
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from research_analytics_suite.analytics.training.ShardPrefetcher import ShardPrefetcher
+from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+dd = lazy_import('dask.dataframe')
+pd = lazy_import('pandas')
+
+# Models loaded by this worker process, by the path they were saved to
+_MODELS = {}
+
+
+class PredictionOperation(BaseOperation):
+    """
+    Runs a fitted model over data in batches of batch_rows rows.
+
+    Dask data is read one partition at a time, at most `prefetch` ahead of inference, and in-memory data is sliced
+    without a copy, so memory is bounded by a few batches whatever the size of the data. Batches are predicted on a
+    thread pool, or in the SharedProcessPool when use_processes is set, with at most `workers` in flight, and their
+    predictions are appended in order to a file that is returned, memory-mapped, as the 'predictions' output slot.
+    Object predictions, such as string labels, cannot be memory-mapped, so they are written as int32 indices into the
+    'prediction_classes' output slot, which starts from the model's classes_.
+    The rows, latency and throughput of every batch, and latency percentiles, are returned as 'prediction_stats'.
+    """
+
+    def __init__(self, model, data, columns=None, batch_rows=50_000, method="predict", workers=2, prefetch=2,
+                 use_processes=False, output_path=None, name="PredictionOperation"):
+        """
+        Initializes the prediction.
+
+        Args:
+            model: A Model, or any fitted estimator with the given method.
+            data: A UnifiedDataEngine, Dask DataFrame, pandas DataFrame or numpy array of features.
+            columns (list, optional): The feature columns of DataFrame data. Defaults to all columns.
+            batch_rows (int): The maximum number of rows predicted at once.
+            method (str): The estimator method to call, e.g. 'predict' or 'predict_proba'.
+            workers (int): The maximum number of batches predicted concurrently.
+            prefetch (int): The maximum number of Dask partitions read ahead of inference.
+            use_processes (bool): Whether to predict in the SharedProcessPool instead of on threads.
+            output_path (str, optional): The predictions file. Defaults to the workspace data directory.
+        """
+        super().__init__(action=self.predict, name=name)
+        if hasattr(data, 'dask_data'):
+            data = data.dask_data.dask_dataframe
+        self.model = model
+        self.data = data
+        self.columns = columns
+        self.batch_rows = max(1, int(batch_rows))
+        self.method = method
+        self.workers = max(1, int(workers))
+        self.prefetch = prefetch
+        self.use_processes = use_processes
+        self.output_path = output_path
+        self.batch_stats = []
+        self._class_index = None
+
+    async def predict(self):
+        """Predict every batch and return the predictions and the batch statistics."""
+        estimator = getattr(self.model, 'model', self.model)
+        path = self.output_path or os.path.join(self._config.BASE_DIR, self._config.WORKSPACE_NAME,
+                                                self._config.DATA_DIR, f"{self.name}_{self.runtime_id}.predictions")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        loop = asyncio.get_running_loop()
+        model_path = None
+        if self.use_processes:
+            from research_analytics_suite.operation_manager.execution.SharedProcessPool import SharedProcessPool
+            executor = SharedProcessPool().executor
+            # Workers load the model from disk once, instead of unpickling it with every batch
+            handle, model_path = tempfile.mkstemp(suffix=".model", dir=os.path.dirname(os.path.abspath(path)))
+            with os.fdopen(handle, 'wb') as file:
+                pickle.dump(estimator, file, protocol=pickle.HIGHEST_PROTOCOL)
+            run = lambda X: loop.run_in_executor(executor, PredictionOperation.predict_batch, model_path,
+                                                 self.method, X)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="prediction")
+            method = getattr(estimator, self.method)
+            run = lambda X: loop.run_in_executor(executor, PredictionOperation._timed, method, X)
+
+        self.batch_stats = []
+        self._class_index = None
+        pending = deque()
+        shape = None
+        start = time.perf_counter()
+        try:
+            with open(path, 'wb') as output:
+                async for X in self._batches():
+                    pending.append((time.perf_counter(), len(X), run(X)))
+                    if len(pending) >= self.workers:
+                        shape = await self._write_next(output, pending, shape)
+                while pending:
+                    shape = await self._write_next(output, pending, shape)
+        finally:
+            for _, _, future in pending:
+                future.cancel()
+            if not self.use_processes:
+                executor.shutdown(wait=False, cancel_futures=True)
+            if model_path is not None:
+                os.remove(model_path)
+
+        predictions = self._open(path, shape)
+        stats = self._summary(time.perf_counter() - start)
+        self.add_log_entry(f"Predicted {stats['rows']} rows in {stats['batches']} batch(es) at "
+                           f"{stats['rows_per_second']:.0f} rows/s (p95 latency {stats['p95_seconds'] * 1e3:.1f} ms)")
+        outputs = {"predictions": predictions, "prediction_stats": {"summary": stats, "batches": self.batch_stats}}
+        if self._class_index is not None:
+            outputs["prediction_classes"] = np.array(list(self._class_index), dtype=object)
+        return outputs
+
+    @staticmethod
+    def predict_batch(model_path, method, X):
+        """Predict one batch in a worker process, loading the model on first use; return (predictions, seconds)."""
+        if model_path not in _MODELS:
+            with open(model_path, 'rb') as file:
+                _MODELS.clear()
+                _MODELS[model_path] = pickle.load(file)
+        return PredictionOperation._timed(getattr(_MODELS[model_path], method), X)
+
+    @staticmethod
+    def _timed(method, X):
+        """Call method on X; return the predictions and the seconds taken."""
+        start = time.perf_counter()
+        predictions = np.asarray(method(X))
+        return predictions, time.perf_counter() - start
+
+    async def _batches(self):
+        """Yield the feature arrays of the batches in order, reading Dask partitions ahead on background threads."""
+        if isinstance(self.data, dd.DataFrame):
+            async for partition in ShardPrefetcher(self._load_partition, range(self.data.npartitions),
+                                                   self.prefetch, workers=1):
+                for offset in range(0, len(partition), self.batch_rows):
+                    yield partition[offset:offset + self.batch_rows]
+        else:
+            rows = self.data.iloc if isinstance(self.data, pd.DataFrame) else self.data
+            for offset in range(0, len(self.data), self.batch_rows):
+                yield self._features(rows[offset:offset + self.batch_rows])
+
+    def _load_partition(self, index):
+        """Read one Dask partition as a feature array."""
+        return self._features(self.data.get_partition(int(index)).compute())
+
+    def _features(self, data):
+        """Return the feature columns of a batch as an array."""
+        if isinstance(data, pd.DataFrame):
+            return (data[self.columns] if self.columns is not None else data).to_numpy()
+        return np.asarray(data)
+
+    async def _write_next(self, output, pending, shape):
+        """Wait for the oldest batch in flight, append its predictions to the output and record its statistics."""
+        submitted, rows, future = pending[0]
+        predictions, seconds = await future
+        pending.popleft()
+        latency = time.perf_counter() - submitted
+
+        if predictions.dtype.hasobject:
+            predictions = self._encode(predictions)
+        predictions = np.ascontiguousarray(predictions)
+        if shape is None:
+            shape = (0,) + predictions.shape[1:], predictions.dtype
+        elif predictions.shape[1:] != shape[0][1:] or predictions.dtype != shape[1]:
+            raise ValueError(f"Batch {len(self.batch_stats)} predictions of shape {predictions.shape[1:]} and dtype "
+                             f"{predictions.dtype} do not match the earlier batches")
+        output.write(predictions.tobytes())
+        shape = (shape[0][0] + len(predictions),) + shape[0][1:], shape[1]
+
+        self.batch_stats.append({
+            "batch": len(self.batch_stats),
+            "rows": rows,
+            "seconds": seconds,
+            "latency_seconds": latency,
+            "rows_per_second": rows / seconds if seconds > 0 else float('inf'),
+        })
+        return shape
+
+    def _encode(self, predictions):
+        """Replace object predictions by int32 indices into the labels seen so far, starting from the model's."""
+        if self._class_index is None:
+            estimator = getattr(self.model, 'model', self.model)
+            self._class_index = {label: i for i, label in enumerate(getattr(estimator, 'classes_', []))}
+        labels, inverse = np.unique(predictions.ravel(), return_inverse=True)
+        lookup = np.array([self._class_index.setdefault(label, len(self._class_index)) for label in labels],
+                          dtype=np.int32)
+        return lookup[inverse].reshape(predictions.shape)
+
+    @staticmethod
+    def _open(path, shape):
+        """Memory-map the predictions file, read-only."""
+        if shape is None or shape[0][0] == 0:
+            return np.empty(0)
+        return np.memmap(path, dtype=shape[1], mode='r', shape=shape[0])
+
+    def _summary(self, elapsed):
+        """Summarize the batch statistics: totals, overall throughput and latency percentiles."""
+        rows = sum(batch["rows"] for batch in self.batch_stats)
+        latencies = np.array([batch["latency_seconds"] for batch in self.batch_stats] or [0.0])
+        p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+        return {
+            "batches": len(self.batch_stats),
+            "rows": rows,
+            "seconds": elapsed,
+            "rows_per_second": rows / elapsed if elapsed > 0 else float('inf'),
+            "p50_seconds": float(p50),
+            "p95_seconds": float(p95),
+            "p99_seconds": float(p99),
+            "max_seconds": float(latencies.max()),
+        }
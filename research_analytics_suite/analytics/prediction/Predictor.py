@@ -1,4 +1,19 @@
+import numpy as np
+
+
 class Predictor:
     @staticmethod
-    def predict(model, data):
-        return model.predict(data)
+    def predict(model, data, batch_rows=None):
+        """
+        Predict data with a fitted model.
+
+        Args:
+            model: A fitted model.
+            data: The features to predict.
+            batch_rows (int, optional): Predict at most this many rows at once, bounding the memory of inference.
+        """
+        if batch_rows is None or len(data) <= batch_rows:
+            return model.predict(data)
+        rows = data.iloc if hasattr(data, 'iloc') else data
+        return np.concatenate([np.asarray(model.predict(rows[offset:offset + batch_rows]))
+                               for offset in range(0, len(data), batch_rows)])
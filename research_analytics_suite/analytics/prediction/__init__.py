@@ -3,3 +3,4 @@ Modules for making predictions using trained models.
 """
 
 from .Predictor import Predictor
+from .PredictionOperation import PredictionOperation
@@ -67,3 +67,20 @@ class JitterTransform:
         datapoint.x += np.random.uniform(-self.jitter_strength, self.jitter_strength)
         datapoint.y += np.random.uniform(-self.jitter_strength, self.jitter_strength)
         return datapoint
+
+    def transform_batch(self, points):
+        """
+        Applies the jitter transformation to an array of coordinates.
+
+        The offsets are drawn in the same order as the per-point path (x then y for each point), so both paths give
+        the same result for the same random state.
+
+        Args:
+            points (np.ndarray): The coordinates to transform, shaped (N, 2) or (frames, keypoints, 2).
+
+        Returns:
+            np.ndarray: The transformed coordinates, with the same shape as `points`.
+        """
+
+        points = np.asarray(points, dtype=float)
+        return points + np.random.uniform(-self.jitter_strength, self.jitter_strength, size=points.shape)
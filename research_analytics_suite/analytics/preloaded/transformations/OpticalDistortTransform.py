@@ -14,6 +14,8 @@ Email: justlane@uw.edu
 Status: Prototype
 """
 
+import numpy as np
+
 
 class OpticalDistortTransform:
     """
@@ -34,20 +36,26 @@ class OpticalDistortTransform:
         Initializes the OpticalDistortTransform object with the provided distortion strength and pose frames.
 
         Args:
-            pose_frames: The frames of the pose to be transformed.
+            pose_frames: The frames of the pose to be transformed, or an array of coordinates shaped (N, 2) or
+                         (frames, keypoints, 2).
             k1 (float): The strength of the optical distortion transformation.
         """
 
-        x_vals = [coord.x for frame in pose_frames for coord in frame.coords]
-        y_vals = [coord.y for frame in pose_frames for coord in frame.coords]
+        if isinstance(pose_frames, np.ndarray):
+            x_min, x_max = float(np.nanmin(pose_frames[..., 0])), float(np.nanmax(pose_frames[..., 0]))
+            y_min, y_max = float(np.nanmin(pose_frames[..., 1])), float(np.nanmax(pose_frames[..., 1]))
+        else:
+            x_vals = [coord.x for frame in pose_frames for coord in frame.coords]
+            y_vals = [coord.y for frame in pose_frames for coord in frame.coords]
+            x_min, x_max, y_min, y_max = min(x_vals), max(x_vals), min(y_vals), max(y_vals)
 
-        self.x_center = (max(x_vals) + min(x_vals)) / 2
-        self.y_center = (max(y_vals) + min(y_vals)) / 2
+        self.x_center = (x_max + x_min) / 2
+        self.y_center = (y_max + y_min) / 2
 
         # Calculate k1 based on your requirements.
         # Here, I've simply normalized it based on the image space,
         # but you might want to adjust this based on the desired distortion level.
-        self.k1 = k1 * (max(x_vals) - min(x_vals))
+        self.k1 = k1 * (x_max - x_min)
 
     def __repr__(self):
         """
@@ -82,3 +90,23 @@ class OpticalDistortTransform:
         datapoint.x = x_distorted
         datapoint.y = y_distorted
         return datapoint
+
+    def transform_batch(self, points):
+        """
+        Applies the optical distortion transformation to an array of coordinates.
+
+        Args:
+            points (np.ndarray): The coordinates to transform, shaped (N, 2) or (frames, keypoints, 2).
+
+        Returns:
+            np.ndarray: The transformed coordinates, with the same shape as `points`.
+        """
+
+        points = np.asarray(points, dtype=float)
+        x = points[..., 0] - self.x_center
+        y = points[..., 1] - self.y_center
+        factor = 1 + self.k1 * (x ** 2 + y ** 2)
+        result = np.empty_like(points)
+        result[..., 0] = x * factor + self.x_center
+        result[..., 1] = y * factor + self.y_center
+        return result
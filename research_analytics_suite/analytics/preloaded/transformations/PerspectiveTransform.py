@@ -14,6 +14,8 @@ Email: justlane@uw.edu
 Status: Prototype
 """
 
+import numpy as np
+
 
 class PerspectiveTransform:
     """
@@ -66,3 +68,17 @@ class PerspectiveTransform:
         datapoint.x *= scale
         datapoint.y *= scale
         return datapoint
+
+    def transform_batch(self, points):
+        """
+        Applies the perspective transformation to an array of coordinates.
+
+        Args:
+            points (np.ndarray): The coordinates to transform, shaped (N, 2) or (frames, keypoints, 2).
+
+        Returns:
+            np.ndarray: The transformed coordinates, with the same shape as `points`.
+        """
+
+        points = np.asarray(points, dtype=float)
+        return points * (1.0 + self.perspective_coeff * points[..., 1:2])
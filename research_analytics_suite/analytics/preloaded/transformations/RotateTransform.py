@@ -16,6 +16,8 @@ Status: Prototype
 
 import math
 
+import numpy as np
+
 
 class RotateTransform:
     """
@@ -67,3 +69,36 @@ class RotateTransform:
         datapoint.x = original_x * math.cos(self.theta) - datapoint.y * math.sin(self.theta)
         datapoint.y = original_x * math.sin(self.theta) + datapoint.y * math.cos(self.theta)
         return datapoint
+
+    def affine_matrix(self):
+        """
+        Returns the rotation as a 3x3 homogeneous matrix acting on column vectors (x, y, 1).
+
+        Returns:
+            np.ndarray: The affine matrix of the rotation.
+        """
+
+        cos_theta = math.cos(self.theta)
+        sin_theta = math.sin(self.theta)
+        return np.array([[cos_theta, -sin_theta, 0.0],
+                         [sin_theta, cos_theta, 0.0],
+                         [0.0, 0.0, 1.0]])
+
+    def transform_batch(self, points):
+        """
+        Applies the rotation transformation to an array of coordinates.
+
+        Args:
+            points (np.ndarray): The coordinates to transform, shaped (N, 2) or (frames, keypoints, 2).
+
+        Returns:
+            np.ndarray: The transformed coordinates, with the same shape as `points`.
+        """
+
+        points = np.asarray(points, dtype=float)
+        cos_theta = math.cos(self.theta)
+        sin_theta = math.sin(self.theta)
+        result = np.empty_like(points)
+        result[..., 0] = points[..., 0] * cos_theta - points[..., 1] * sin_theta
+        result[..., 1] = points[..., 0] * sin_theta + points[..., 1] * cos_theta
+        return result
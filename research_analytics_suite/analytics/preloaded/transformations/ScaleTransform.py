@@ -14,6 +14,8 @@ Email: justlane@uw.edu
 Status: Prototype
 """
 
+import numpy as np
+
 
 class ScaleTransform:
     """
@@ -64,3 +66,28 @@ class ScaleTransform:
         datapoint.x *= self.scale
         datapoint.y *= self.scale
         return datapoint
+
+    def affine_matrix(self):
+        """
+        Returns the scaling as a 3x3 homogeneous matrix acting on column vectors (x, y, 1).
+
+        Returns:
+            np.ndarray: The affine matrix of the scaling.
+        """
+
+        return np.array([[self.scale, 0.0, 0.0],
+                         [0.0, self.scale, 0.0],
+                         [0.0, 0.0, 1.0]])
+
+    def transform_batch(self, points):
+        """
+        Applies the scale transformation to an array of coordinates.
+
+        Args:
+            points (np.ndarray): The coordinates to transform, shaped (N, 2) or (frames, keypoints, 2).
+
+        Returns:
+            np.ndarray: The transformed coordinates, with the same shape as `points`.
+        """
+
+        return np.asarray(points, dtype=float) * self.scale
@@ -14,6 +14,8 @@ Email: justlane@uw.edu
 Status: Prototype
 """
 
+import numpy as np
+
 
 class TranslateTransform:
     """
@@ -67,3 +69,28 @@ class TranslateTransform:
         datapoint.x += self.delta_x
         datapoint.y += self.delta_y
         return datapoint
+
+    def affine_matrix(self):
+        """
+        Returns the translation as a 3x3 homogeneous matrix acting on column vectors (x, y, 1).
+
+        Returns:
+            np.ndarray: The affine matrix of the translation.
+        """
+
+        return np.array([[1.0, 0.0, self.delta_x],
+                         [0.0, 1.0, self.delta_y],
+                         [0.0, 0.0, 1.0]])
+
+    def transform_batch(self, points):
+        """
+        Applies the translation transformation to an array of coordinates.
+
+        Args:
+            points (np.ndarray): The coordinates to transform, shaped (N, 2) or (frames, keypoints, 2).
+
+        Returns:
+            np.ndarray: The transformed coordinates, with the same shape as `points`.
+        """
+
+        return np.asarray(points, dtype=float) + np.array([self.delta_x, self.delta_y])
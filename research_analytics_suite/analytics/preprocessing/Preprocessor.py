@@ -1,27 +1,106 @@
 import numpy as np
-from sklearn.preprocessing import StandardScaler
+
+from research_analytics_suite.analytics.preprocessing.RunningMoments import RunningMoments
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+dask = lazy_import('dask')
+dd = lazy_import('dask.dataframe')
+pd = lazy_import('pandas')
 
 
 class Preprocessor:
+    """
+    Standardizes features to zero mean and unit variance, like sklearn's StandardScaler.
+
+    The statistics are mergeable RunningMoments, so they are fitted chunk by chunk with partial_fit, per Dask
+    partition in parallel with fit, or on separate workers and combined with merge; fitting never needs more than one
+    chunk in memory. Dask data is transformed lazily, partition by partition.
+    """
+
     def __init__(self):
-        self.scaler = StandardScaler()
+        self.moments = RunningMoments()
+        self.mean_ = None
+        self.scale_ = None
+
+    @property
+    def is_fitted(self):
+        """Whether the scaler statistics have been computed."""
+        return self.mean_ is not None
+
+    def fit(self, data, chunk_rows=100_000):
+        """
+        Fit the statistics from scratch.
+
+        Args:
+            data: A UnifiedDataEngine or Dask DataFrame, whose partitions are summarized in parallel; an array or
+                DataFrame, read chunk_rows rows at a time; or an iterable of chunks.
+            chunk_rows (int): The number of rows summarized at once, for in-memory data.
+        """
+        self.moments = RunningMoments()
+        if hasattr(data, 'dask_data'):
+            data = data.dask_data.dask_dataframe
+        if isinstance(data, dd.DataFrame):
+            partials = dask.compute(*[dask.delayed(RunningMoments.of)(partition) for partition in data.to_delayed()])
+            return self.merge(sum(partials, RunningMoments()))
+        if isinstance(data, (np.ndarray, pd.DataFrame)):
+            rows = data.iloc if isinstance(data, pd.DataFrame) else data
+            data = (rows[offset:offset + chunk_rows] for offset in range(0, len(data), chunk_rows))
+        for chunk in data:
+            self.partial_fit(chunk)
+        return self
+
+    def partial_fit(self, data):
+        """Update the scaler statistics with one chunk of data."""
+        self.moments.update(self._as_2d(data))
+        return self._finalize()
+
+    def merge(self, other):
+        """
+        Combine statistics fitted elsewhere, e.g. by another worker.
+
+        Args:
+            other (Preprocessor | RunningMoments): The statistics to merge.
+        """
+        self.moments.merge(getattr(other, 'moments', other))
+        return self._finalize()
 
     def fit_transform(self, data):
-        # Check if data is a scalar value
-        if np.isscalar(data):
-            # Convert data to a 2D array
-            data = np.array([[data]])
-        elif len(data.shape) == 1:
-            # Reshape data to have a single feature
-            data = data.reshape(-1, 1)
-        return self.scaler.fit_transform(data)
+        data = self._as_2d(data)
+        return self.fit(data).transform(data)
 
     def transform(self, data):
-        # Check if data is a scalar value
+        """Standardize one chunk of data, or, lazily, every partition of a Dask DataFrame."""
+        if not self.is_fitted:
+            raise ValueError("Preprocessor must be fitted before transform")
+        if isinstance(data, dd.DataFrame):
+            return data.map_partitions(self._transform_frame)
+        if isinstance(data, pd.DataFrame):
+            return self._transform_frame(data)
+        return (self._as_2d(data) - self.mean_) / self.scale_
+
+    def transform_chunks(self, chunks):
+        """Standardize an iterable of chunks lazily, one chunk at a time."""
+        for chunk in chunks:
+            yield self.transform(chunk)
+
+    def _transform_frame(self, frame):
+        return (frame.astype(float) - self.mean_) / self.scale_
+
+    def _finalize(self):
+        """Derive the mean and scale from the moments; constant columns, up to rounding, keep a scale of 1."""
+        if self.moments.count is not None:
+            count, mean, variance = self.moments.count, self.moments.mean, self.moments.variance
+            eps = np.finfo(float).eps
+            constant = variance <= count * eps * variance + (count * mean * eps) ** 2
+            self.mean_ = mean
+            self.scale_ = np.where(constant, 1.0, np.sqrt(variance))
+        return self
+
+    @staticmethod
+    def _as_2d(data):
         if np.isscalar(data):
-            # Convert data to a 2D array
-            data = np.array([[data]])
-        elif len(data.shape) == 1:
-            # Reshape data to have a single feature
-            data = data.reshape(-1, 1)
-        return self.scaler.transform(data)
\ No newline at end of file
+            return np.array([[data]])
+        if isinstance(data, pd.DataFrame):
+            return data.to_numpy(dtype=float)
+        data = np.asarray(data)
+        return data.reshape(-1, 1) if data.ndim == 1 else data
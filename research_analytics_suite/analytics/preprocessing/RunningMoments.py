@@ -0,0 +1,72 @@
+import numpy as np
+
+
+class RunningMoments:
+    """
+    The per-column count, mean and sum of squared deviations of data seen in chunks.
+
+    Chunks are added with update() in one vectorized pass each, and moments computed separately, e.g. per Dask
+    partition or per worker, are combined exactly with merge() or `+`, so the mean and variance of any amount of data
+    are computed in constant memory. NaNs are ignored, column by column.
+    """
+
+    def __init__(self):
+        self.count = None
+        self.mean = None
+        self.m2 = None
+
+    @staticmethod
+    def of(data):
+        """Return the moments of one chunk."""
+        return RunningMoments().update(data)
+
+    def update(self, data):
+        """
+        Add a chunk of rows.
+
+        Args:
+            data (array-like): A 2D chunk of rows, with one column per feature.
+        """
+        data = np.asarray(data, dtype=float)
+        if data.ndim == 1:
+            data = data.reshape(-1, 1)
+        chunk = RunningMoments()
+        missing = np.isnan(data)
+        chunk.count = (~missing).sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            chunk.mean = np.where(chunk.count > 0, np.nansum(data, axis=0) / chunk.count, 0.0)
+        deviations = np.where(missing, 0.0, data - chunk.mean)
+        chunk.m2 = np.einsum('ij,ij->j', deviations, deviations)
+        return self.merge(chunk)
+
+    def merge(self, other):
+        """Combine the moments of another RunningMoments, in place."""
+        if other.count is None:
+            return self
+        if self.count is None:
+            self.count, self.mean, self.m2 = other.count.copy(), other.mean.copy(), other.m2.copy()
+            return self
+        if self.count.shape != other.count.shape:
+            raise ValueError(f"Cannot merge moments of {len(self.count)} and {len(other.count)} columns")
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            share = np.where(count > 0, other.count / count, 0.0)
+        self.mean = self.mean + delta * share
+        self.m2 = self.m2 + other.m2 + delta ** 2 * self.count * share
+        self.count = count
+        return self
+
+    def __add__(self, other):
+        return RunningMoments().merge(self).merge(other)
+
+    def __radd__(self, other):
+        # Lets sum() start from 0
+        return self if other == 0 else self.__add__(other)
+
+    @property
+    def variance(self):
+        """The population variance of each column."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > 0, self.m2 / self.count, 0.0)
@@ -3,3 +3,4 @@ Data preprocessing modules.
 """
 
 from .Preprocessor import Preprocessor
+from .RunningMoments import RunningMoments
@@ -0,0 +1,92 @@
+import time
+
+from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+
+# Cross-validation splits computed by this worker process, by (data handle, n_splits, random_state)
+_SPLITS = {}
+
+
+class CandidateFitOperation(BaseOperation):
+    """
+    Fits and scores one candidate configuration on one cross-validation fold.
+
+    The fit runs in the SharedProcessPool on data shared through SharedArrays, so the operation itself only awaits the
+    pool. The training rows of each fold are in a fixed random order, and the first `resource` of them are used, so
+    successive halving rungs train on growing, nested subsamples.
+    """
+
+    def __init__(self, handle, model_type, params, fold, n_splits, resource, scoring="accuracy", random_state=42,
+                 name="CandidateFitOperation"):
+        super().__init__(action=self.fit, name=name)
+        self.handle = handle
+        self.model_type = model_type
+        self.params = params
+        self.fold = fold
+        self.n_splits = n_splits
+        self.resource = resource
+        self.scoring = scoring
+        self.random_state = random_state
+        self.result = None
+
+    async def fit(self):
+        """Fit and score the candidate in the shared process pool."""
+        from research_analytics_suite.operation_manager.execution.SharedProcessPool import SharedProcessPool
+        self.result = await SharedProcessPool().run(CandidateFitOperation.fit_and_score, self.handle,
+                                                    self.model_type, self.params, self.fold, self.n_splits,
+                                                    self.resource, self.scoring, self.random_state)
+        return {"candidate_score": self.result}
+
+    @staticmethod
+    def fit_and_score(handle, model_type, params, fold, n_splits, resource, scoring, random_state):
+        """Fit a candidate on a subsample of a fold's training rows and score it on the fold's test rows."""
+        from sklearn.metrics import get_scorer
+        from research_analytics_suite.analytics.models.Model import Model
+        from research_analytics_suite.analytics.training.SharedArrays import SharedArrays
+
+        arrays = SharedArrays.attach(handle)
+        X, y = arrays["X"], arrays["y"]
+        train, test = CandidateFitOperation._splits(handle, y, n_splits, random_state)[fold]
+        train = train[:resource]
+
+        start = time.perf_counter()
+        estimator = Model.create_estimator(model_type, params).fit(X[train], y[train])
+        fit_seconds = time.perf_counter() - start
+        score = get_scorer(scoring)(estimator, X[test], y[test])
+        return {"score": float(score), "fit_seconds": fit_seconds, "resource": len(train)}
+
+    @staticmethod
+    def refit(handle, model_type, params):
+        """Fit a candidate on all rows and return the fitted estimator."""
+        from research_analytics_suite.analytics.models.Model import Model
+        from research_analytics_suite.analytics.training.SharedArrays import SharedArrays
+
+        arrays = SharedArrays.attach(handle)
+        return Model.create_estimator(model_type, params).fit(arrays["X"], arrays["y"])
+
+    @staticmethod
+    def _splits(handle, y, n_splits, random_state):
+        """Return the (ordered train, test) indices of each fold, stratified for classification targets."""
+        key = (tuple(sorted(block for block, _, _ in handle.values())), n_splits, random_state)
+        if key not in _SPLITS:
+            import numpy as np
+            from sklearn.model_selection import KFold, StratifiedKFold
+            from sklearn.utils.multiclass import type_of_target
+
+            stratify = type_of_target(y) in ("binary", "multiclass")
+            splitter = (StratifiedKFold if stratify else KFold)(n_splits, shuffle=True, random_state=random_state)
+            rng = np.random.default_rng(random_state)
+            splits = []
+            for train, test in splitter.split(np.zeros(len(y)), y):
+                train = rng.permutation(train)
+                if stratify:
+                    # Interleave the classes so that every prefix of the training rows keeps their proportions
+                    labels = y[train]
+                    position = np.empty(len(train))
+                    for label in np.unique(labels):
+                        members = labels == label
+                        position[members] = (np.arange(members.sum()) + rng.random()) / members.sum()
+                    train = train[np.argsort(position, kind="stable")]
+                splits.append((train, test))
+            _SPLITS.clear()
+            _SPLITS[key] = splits
+        return _SPLITS[key]
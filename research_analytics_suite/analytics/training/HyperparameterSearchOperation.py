@@ -0,0 +1,165 @@
+import math
+
+import numpy as np
+
+from research_analytics_suite.analytics.models.Model import Model
+from research_analytics_suite.analytics.training.CandidateFitOperation import CandidateFitOperation
+from research_analytics_suite.analytics.training.SharedArrays import SharedArrays
+from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+pd = lazy_import('pandas')
+
+
+class HyperparameterSearchOperation(BaseOperation):
+    """
+    Searches candidate model configurations with cross-validated successive halving.
+
+    Each rung fans out one concurrent CandidateFitOperation child per surviving candidate and fold. The children fit
+    in the SharedProcessPool on data placed once in shared memory. After each rung the best 1/eta of the candidates,
+    by mean fold score, go on to the next rung, which trains on eta times more rows; the last rung uses every training
+    row of each fold. Every rung's metrics are returned as the 'search_results' output slot, with 'best_params' and
+    'best_score'.
+    """
+
+    def __init__(self, data, target, model_type="logistic_regression", param_grid=None, candidates=None,
+                 n_splits=3, eta=3, min_resource=None, scoring="accuracy", random_state=42, refit=True,
+                 name="HyperparameterSearchOperation"):
+        """
+        Initializes the search.
+
+        Args:
+            data: A UnifiedDataEngine, DataFrame or array of features.
+            target: The name of the target column of data, or an array of targets.
+            model_type (str): A Model type, see Model.MODEL_TYPES.
+            param_grid (dict, optional): Lists of values per parameter, expanded into every combination.
+            candidates (list[dict], optional): Explicit parameter sets, used instead of param_grid.
+            n_splits (int): The number of cross-validation folds.
+            eta (int): The halving factor: the fraction of candidates kept, and the growth of rows, per rung.
+            min_resource (int, optional): The number of training rows in the first rung.
+            scoring (str): An sklearn scorer name.
+            random_state (int): The seed of the folds and subsamples.
+            refit (bool): Whether to fit the best candidate on all rows, as best_model.
+        """
+        super().__init__(action=self.search, name=name, concurrent=True)
+        if candidates is None:
+            from sklearn.model_selection import ParameterGrid
+            candidates = list(ParameterGrid(param_grid or {}))
+        if not candidates:
+            raise ValueError("No candidate configurations to search")
+
+        self.data = data
+        self.target = target
+        self.model_type = model_type
+        self.candidates = [dict(candidate) for candidate in candidates]
+        self.n_splits = n_splits
+        self.eta = max(2, int(eta))
+        self.min_resource = min_resource
+        self.scoring = scoring
+        self.random_state = random_state
+        self.refit = refit
+
+        self.results = []
+        self.best_params = None
+        self.best_score = None
+        self.best_model = None
+
+    async def search(self):
+        """Run successive halving over the candidates and return the metrics of every rung."""
+        from research_analytics_suite.operation_manager.execution.SharedProcessPool import SharedProcessPool
+
+        self.results = []
+        self.best_params = self.best_score = self.best_model = None
+
+        X, y = self._arrays()
+        shared = SharedArrays(X=X, y=y)
+        try:
+            resources = self._resources(len(y), self._class_count(y))
+            survivors = list(range(len(self.candidates)))
+            for rung, resource in enumerate(resources):
+                scores = await self._run_rung(shared.handle, rung, resource, survivors)
+                ranked = sorted(survivors, key=lambda candidate: scores[candidate], reverse=True)
+                survivors = ranked[:max(1, math.ceil(len(ranked) / self.eta))]
+                self._progress = int(100 * (rung + 1) / len(resources))
+
+            best = survivors[0]
+            self.best_params = self.candidates[best]
+            self.best_score = scores[best]
+            self.add_log_entry(f"Best candidate {self.best_params} scored {self.best_score:.4f}")
+
+            if self.refit:
+                self.best_model = Model(self.model_type, **self.best_params)
+                self.best_model.model = await SharedProcessPool().run(CandidateFitOperation.refit, shared.handle,
+                                                                      self.model_type, self.best_params)
+        finally:
+            shared.close()
+
+        return {"search_results": self.results, "best_params": self.best_params, "best_score": self.best_score}
+
+    async def _run_rung(self, handle, rung, resource, survivors):
+        """Fit every surviving candidate on every fold as concurrent child operations; return mean fold scores."""
+        children = {}
+        for candidate in survivors:
+            for fold in range(self.n_splits):
+                child = CandidateFitOperation(handle, self.model_type, self.candidates[candidate], fold,
+                                              self.n_splits, resource, self.scoring, self.random_state,
+                                              name=f"{self.name}_r{rung}_c{candidate}_f{fold}")
+                await child.initialize_operation()
+                await self.add_child_operation(child)
+                children[(candidate, fold)] = child
+
+        await self.execute_child_operations()
+
+        scores = {}
+        for candidate in survivors:
+            folds = [children[(candidate, fold)].result for fold in range(self.n_splits)]
+            failed = any(result is None for result in folds)
+            score = -np.inf if failed else float(np.mean([result["score"] for result in folds]))
+            scores[candidate] = score
+            self.results.append({
+                "rung": rung,
+                "candidate": candidate,
+                "params": self.candidates[candidate],
+                "resource": resource,
+                "mean_score": score,
+                "fold_scores": [None if result is None else result["score"] for result in folds],
+                "fit_seconds": sum(result["fit_seconds"] for result in folds if result is not None),
+                "failed": failed,
+            })
+
+        for child in children.values():
+            await self.remove_child_operation(child)
+        return scores
+
+    def _resources(self, n_rows, n_classes):
+        """Return the number of training rows of each rung, growing by eta up to all training rows of a fold."""
+        n_train = n_rows * (self.n_splits - 1) // self.n_splits
+        rungs = int(math.log(len(self.candidates), self.eta) + 1e-9) + 1
+        min_resource = self.min_resource or max(n_train // self.eta ** (rungs - 1), 20 * n_classes)
+        return [min(n_train, max(min_resource, n_train // self.eta ** (rungs - 1 - rung))) for rung in range(rungs)]
+
+    @staticmethod
+    def _class_count(y):
+        """Return the number of classes of classification targets, or 1 for regression targets."""
+        from sklearn.utils.multiclass import type_of_target
+        if type_of_target(y) in ('binary', 'multiclass'):
+            return len(np.unique(y))
+        return 1
+
+    def _arrays(self):
+        """
+        Return the features and targets as numpy arrays.
+
+        Object targets, such as a pandas column of string labels, are converted to fixed-width strings, since object
+        arrays cannot be placed in shared memory.
+        """
+        data = self.data
+        if hasattr(data, 'dask_data'):
+            data = data.dask_data.compute()
+        if isinstance(data, pd.DataFrame) and isinstance(self.target, str):
+            X, y = data.drop(columns=[self.target]).to_numpy(), data[self.target].to_numpy()
+        else:
+            X, y = np.asarray(data), np.asarray(self.target)
+        if y.dtype.hasobject:
+            y = y.astype(str)
+        return X, y
@@ -1,39 +1,119 @@
-from sklearn.model_selection import train_test_split
+import asyncio
+
+import numpy as np
 
 from research_analytics_suite.analytics import Model
+from research_analytics_suite.analytics.training.ShardPrefetcher import ShardPrefetcher
+from research_analytics_suite.analytics.training.TrainingShards import TrainingShards
 from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
 
 
 class MLTrainingOperation(BaseOperation):
-    def __init__(self, model: Model, data, target, test_size=0.2, random_state=42):
+    """
+    Trains a model on shards streamed from the data.
+
+    Shards are loaded and preprocessed on background threads, at most `prefetch` ahead of the model, while the model is
+    fitted on a worker thread so the event loop stays responsive. Models that support partial_fit are trained one shard
+    at a time, so the data never has to fit in memory; other models are fitted once on all training shards.
+    """
+
+    def __init__(self, model: Model, data, target, test_size=0.2, random_state=42, preprocessor=None,
+                 shard_rows=100_000, epochs=1, prefetch=2, workers=2):
         super().__init__(action=None, name="MLTrainingOperation")
         self.model = model
         self.data = data
         self.target = target
         self.test_size = test_size
         self.random_state = random_state
-        self.train_data = None
-        self.val_data = None
+        self.preprocessor = preprocessor
+        self.shard_rows = shard_rows
+        self.epochs = epochs
+        self.prefetch = prefetch
+        self.workers = workers
+        self.shards = None
+        self._val_data = None
+
+    @property
+    def train_data(self):
+        """The training rows as (X, y), or None before start(). Every training shard is loaded into memory."""
+        if self.shards is None:
+            return None
+        shards = [self.shards.load(index) for index in range(len(self.shards))]
+        return np.concatenate([X for X, _ in shards]), np.concatenate([y for _, y in shards])
+
+    @property
+    def val_data(self):
+        """The validation rows as (X, y), or None before start(); loaded on first use."""
+        if self.shards is None:
+            return None
+        if self._val_data is None:
+            self._val_data = self.load_validation()
+        return self._val_data
 
     def start(self):
-        """Initialize training parameters and split data."""
-        X_train, X_val, y_train, y_val = train_test_split(
-            self.data, self.target, test_size=self.test_size, random_state=self.random_state
-        )
-        self.train_data = (X_train, y_train)
-        self.val_data = (X_val, y_val)
+        """Initialize training parameters and shard the data into training and validation rows."""
+        self.shards = TrainingShards(self.data, self.target, test_size=self.test_size,
+                                     random_state=self.random_state, shard_rows=self.shard_rows,
+                                     preprocessor=self.preprocessor)
+        self._val_data = None
         self._status = "started"
-        self.add_log_entry("Training operation started")
+        self.add_log_entry(f"Training operation started on {len(self.shards)} shard(s)")
 
     async def execute(self):
         """Train the machine learning model."""
         try:
+            if self.shards is None:
+                self.start()
             self._status = "running"
-            X_train, y_train = self.train_data
-            self.model.train(X_train, y_train)
+
+            if self.preprocessor is not None and not self.preprocessor.is_fitted:
+                await self._fit_preprocessor()
+                # Validation rows loaded before the fit were not transformed
+                self._val_data = None
+
+            if self.model.supports_partial_fit:
+                await self._train_incrementally()
+            else:
+                self.add_log_entry("Model does not support partial_fit; fitting on all training shards at once")
+                await self._train_in_memory()
+
             self._status = "completed"
             self.add_log_entry("Training completed successfully")
         except Exception as e:
             self._logger.error(e, self)
             self._status = "error"
             self.add_log_entry(f"Error during training: {e}")
+
+    def load_validation(self):
+        """Load the validation rows of every shard."""
+        shards = [self.shards.load(index, subset='validation') for index in range(len(self.shards))]
+        return np.concatenate([X for X, _ in shards]), np.concatenate([y for _, y in shards])
+
+    async def _fit_preprocessor(self):
+        """Fit the preprocessor statistics in one streamed pass over the training shards."""
+        async for X, _ in ShardPrefetcher(lambda index: self.shards.load(index, transform=False),
+                                          range(len(self.shards)), self.prefetch, self.workers):
+            if len(X):
+                await asyncio.to_thread(self.preprocessor.partial_fit, X)
+
+    async def _train_incrementally(self):
+        """Fit the model shard by shard while the next shards load, shuffling the shard order of each epoch."""
+        classes = await asyncio.to_thread(self.shards.classes)
+        total = self.epochs * len(self.shards)
+        done = 0
+        for epoch in range(self.epochs):
+            order = np.random.default_rng([self.random_state, epoch]).permutation(len(self.shards))
+            async for X, y in ShardPrefetcher(self.shards.load, order, self.prefetch, self.workers):
+                if len(X):
+                    await asyncio.to_thread(self.model.partial_fit, X, y, classes)
+                done += 1
+                self._progress = int(100 * done / total)
+
+    async def _train_in_memory(self):
+        """Load every training shard and fit the model on all of them."""
+        shards = [shard async for shard in ShardPrefetcher(self.shards.load, range(len(self.shards)),
+                                                           self.prefetch, self.workers)]
+        X_train = np.concatenate([X for X, _ in shards])
+        y_train = np.concatenate([y for _, y in shards])
+        await asyncio.to_thread(self.model.train, X_train, y_train)
+        self._progress = 100
@@ -0,0 +1,51 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ShardPrefetcher:
+    """
+    Loads shards on background threads ahead of their use.
+
+    At most `prefetch` shards are loading or waiting to be consumed at any time, which bounds memory to a few shards
+    while shard loading and preprocessing overlap with the consumer, e.g. model fitting. Shards are yielded in order
+    with `async for`, so the event loop is never blocked on a load.
+    """
+
+    def __init__(self, load, indices, prefetch=2, workers=2):
+        """
+        Initializes the prefetcher.
+
+        Args:
+            load (callable): Loads a shard from its index; called on a worker thread.
+            indices (iterable): The indices of the shards to load, in order.
+            prefetch (int): The maximum number of shards loaded ahead of the consumer.
+            workers (int): The number of loader threads.
+        """
+        self.load = load
+        self.indices = list(indices)
+        self.prefetch = max(1, int(prefetch))
+        self.workers = max(1, int(workers))
+
+    async def __aiter__(self):
+        loop = asyncio.get_running_loop()
+        pending = deque()
+        remaining = iter(self.indices)
+
+        executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="shard_loader")
+        try:
+            for index in remaining:
+                pending.append(loop.run_in_executor(executor, self.load, index))
+                if len(pending) >= self.prefetch:
+                    break
+            while pending:
+                shard = await pending.popleft()
+                index = next(remaining, None)
+                if index is not None:
+                    pending.append(loop.run_in_executor(executor, self.load, index))
+                yield shard
+        finally:
+            for future in pending:
+                future.cancel()
+            # Do not wait on loads still running when the consumer stops early
+            executor.shutdown(wait=False, cancel_futures=True)
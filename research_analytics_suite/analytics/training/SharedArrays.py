@@ -0,0 +1,74 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Arrays attached by this process, by handle, so that each worker attaches once per search
+_ATTACHED = {}
+_MAX_ATTACHED = 4
+
+
+class SharedArrays:
+    """
+    Numpy arrays placed in shared memory so that worker processes read them without a copy.
+
+    The creating process owns the blocks and must call close() when the workers are done. Workers receive the small,
+    picklable `handle` and call SharedArrays.attach(handle) to get read-only views of the arrays.
+    """
+
+    def __init__(self, **arrays):
+        """
+        Copies arrays into new shared memory blocks.
+
+        Args:
+            **arrays: The arrays to share, by name.
+        """
+        self._blocks = []
+        self.handle = {}
+        try:
+            for name, array in arrays.items():
+                array = np.ascontiguousarray(array)
+                if array.dtype.hasobject:
+                    raise TypeError(f"Array {name} of dtype object cannot be placed in shared memory")
+                block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._blocks.append(block)
+                np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)[...] = array
+                self.handle[name] = (block.name, array.shape, array.dtype.str)
+        except Exception:
+            self.close()
+            raise
+
+    @staticmethod
+    def attach(handle):
+        """
+        Return read-only views of shared arrays, attaching to their blocks on first use in this process.
+
+        Args:
+            handle (dict): The handle of a SharedArrays instance.
+        """
+        key = tuple(sorted((name, block_name) for name, (block_name, _, _) in handle.items()))
+        if key not in _ATTACHED:
+            while len(_ATTACHED) >= _MAX_ATTACHED:
+                # Release the mappings of the oldest search still attached by this worker
+                for block in _ATTACHED.pop(next(iter(_ATTACHED)))[0]:
+                    try:
+                        block.close()
+                    except BufferError:
+                        pass  # Still referenced; the mapping is released with the last view
+            blocks, arrays = [], {}
+            for name, (block_name, shape, dtype) in handle.items():
+                block = shared_memory.SharedMemory(name=block_name)
+                blocks.append(block)
+                arrays[name] = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+                arrays[name].flags.writeable = False
+            _ATTACHED[key] = (blocks, arrays)
+        return _ATTACHED[key][1]
+
+    def close(self):
+        """Release and delete the shared memory blocks."""
+        for block in self._blocks:
+            block.close()
+            try:
+                block.unlink()
+            except FileNotFoundError:
+                pass
+        self._blocks = []
@@ -0,0 +1,95 @@
+import numpy as np
+
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+dd = lazy_import('dask.dataframe')
+pd = lazy_import('pandas')
+
+
+class TrainingShards:
+    """
+    Splits training data into shards that are loaded one at a time.
+
+    A Dask DataFrame, or the Dask data of a UnifiedDataEngine, is sharded by partition, so that only the shards being
+    loaded or fitted are in memory. In-memory DataFrames and arrays are sharded into blocks of shard_rows rows. Each
+    shard is split into training and validation rows with a seeded draw per shard, so the split is the same whenever a
+    shard is reloaded, and optionally transformed by a fitted Preprocessor.
+    """
+
+    def __init__(self, data, target, test_size=0.2, random_state=42, shard_rows=100_000, preprocessor=None):
+        """
+        Initializes the shards.
+
+        Args:
+            data: A UnifiedDataEngine, Dask DataFrame, pandas DataFrame or numpy array of features.
+            target: The name of the target column of data, or an array of targets aligned with in-memory data.
+            test_size (float): The fraction of rows of each shard held out for validation.
+            random_state (int): The seed of the training/validation split.
+            shard_rows (int): The number of rows per shard, for data that is not a Dask DataFrame.
+            preprocessor (Preprocessor, optional): Applied to the features of each shard once it is fitted.
+        """
+        if hasattr(data, 'dask_data'):
+            data = data.dask_data.dask_dataframe
+        if isinstance(target, str) and isinstance(data, dd.DataFrame) and target not in data.columns:
+            raise ValueError(f"Target column {target} is not in the data")
+        if not isinstance(target, str) and isinstance(data, dd.DataFrame):
+            raise ValueError("The target of Dask data must be a column name")
+
+        self.data = data
+        self.target = target if isinstance(target, str) else np.asarray(target)
+        self.test_size = test_size
+        self.random_state = random_state
+        self.shard_rows = int(shard_rows)
+        self.preprocessor = preprocessor
+
+    def __len__(self):
+        if isinstance(self.data, dd.DataFrame):
+            return self.data.npartitions
+        return -(-len(self.data) // self.shard_rows)
+
+    def classes(self):
+        """Return the sorted target classes, reading only the target column."""
+        if isinstance(self.data, dd.DataFrame):
+            return np.sort(self.data[self.target].dropna().unique().compute().to_numpy())
+        return np.unique(self._targets(self.data, slice(None)))
+
+    def load(self, index, subset='train', transform=True):
+        """
+        Load one shard as (X, y).
+
+        Args:
+            index (int): The index of the shard.
+            subset (str): 'train', 'validation' or 'all' rows of the shard.
+            transform (bool): Whether to apply the preprocessor, if it is fitted.
+        """
+        index = int(index)
+        if isinstance(self.data, dd.DataFrame):
+            shard = self.data.get_partition(index).compute()
+            rows = slice(None)
+        else:
+            rows = slice(index * self.shard_rows, (index + 1) * self.shard_rows)
+            shard = self.data.iloc[rows] if isinstance(self.data, pd.DataFrame) else self.data[rows]
+
+        X = self._features(shard)
+        y = self._targets(shard, rows)
+
+        if subset != 'all':
+            held_out = np.random.default_rng([self.random_state, index]).random(len(X)) < self.test_size
+            keep = held_out if subset == 'validation' else ~held_out
+            X, y = X[keep], y[keep]
+
+        if transform and self.preprocessor is not None and self.preprocessor.is_fitted and len(X):
+            X = self.preprocessor.transform(X)
+        return X, y
+
+    def _features(self, shard):
+        if isinstance(shard, pd.DataFrame):
+            if isinstance(self.target, str):
+                shard = shard.drop(columns=[self.target])
+            return shard.to_numpy()
+        return np.asarray(shard)
+
+    def _targets(self, shard, rows):
+        if isinstance(self.target, str):
+            return shard[self.target].to_numpy()
+        return self.target[rows]
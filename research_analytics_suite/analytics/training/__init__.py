@@ -2,4 +2,9 @@
 Modules for training machine learning models.
 """
 
+from .CandidateFitOperation import CandidateFitOperation
+from .HyperparameterSearchOperation import HyperparameterSearchOperation
 from .MLTrainingOperation import MLTrainingOperation
+from .ShardPrefetcher import ShardPrefetcher
+from .SharedArrays import SharedArrays
+from .TrainingShards import TrainingShards
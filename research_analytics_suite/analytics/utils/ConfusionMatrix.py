@@ -0,0 +1,96 @@
+import numpy as np
+
+
+class ConfusionMatrix:
+    """
+    A confusion matrix accumulated over batches of labels and predictions.
+
+    Each update adds the counts of one batch, so metrics over chunked predictions never need every label in memory.
+    Matrices built by separate workers are combined with merge() or `+`, and accuracy, precision, recall and F1 are all
+    derived from the one matrix. Rows are true labels and columns predicted labels, in the sorted order of `labels`.
+    """
+
+    def __init__(self, labels=None):
+        """
+        Initializes an empty matrix.
+
+        Args:
+            labels (array-like, optional): Labels to include even if they never occur.
+        """
+        self.labels = np.unique(np.asarray(labels)) if labels is not None else np.empty(0)
+        self.matrix = np.zeros((len(self.labels), len(self.labels)), dtype=np.int64)
+
+    def update(self, y_true, y_pred):
+        """
+        Add the counts of one batch.
+
+        Args:
+            y_true (array-like): The true labels.
+            y_pred (array-like): The predicted labels.
+        """
+        y_true, y_pred = np.asarray(y_true).ravel(), np.asarray(y_pred).ravel()
+        if len(y_true) != len(y_pred):
+            raise ValueError(f"Found {len(y_true)} labels but {len(y_pred)} predictions")
+        if len(y_true) == 0:
+            return self
+        self._extend(np.unique(np.concatenate([y_true, y_pred])))
+        n = len(self.labels)
+        cells = np.searchsorted(self.labels, y_true) * n + np.searchsorted(self.labels, y_pred)
+        self.matrix += np.bincount(cells, minlength=n * n).reshape(n, n)
+        return self
+
+    def merge(self, other):
+        """Add the counts of another ConfusionMatrix, e.g. one accumulated by another worker."""
+        self._extend(other.labels)
+        if len(other.labels):
+            index = np.searchsorted(self.labels, other.labels)
+            self.matrix[np.ix_(index, index)] += other.matrix
+        return self
+
+    def __add__(self, other):
+        return ConfusionMatrix(self.labels).merge(self).merge(other)
+
+    def __radd__(self, other):
+        # Lets sum() start from 0
+        return self if other == 0 else self.__add__(other)
+
+    def metrics(self, average='weighted'):
+        """
+        Return accuracy, precision, recall and F1.
+
+        Args:
+            average (str): How per-label scores are averaged: 'weighted' by support, 'macro' or 'micro'. Labels with
+                no predictions, or no support, score 0, as in sklearn.
+        """
+        total = self.matrix.sum()
+        correct = np.trace(self.matrix)
+        accuracy = correct / total if total else 0.0
+
+        true_positives = np.diag(self.matrix).astype(float)
+        predicted = self.matrix.sum(axis=0)
+        support = self.matrix.sum(axis=1)
+        if average == 'micro':
+            precision = recall = f1 = accuracy
+        else:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                precisions = np.where(predicted > 0, true_positives / predicted, 0.0)
+                recalls = np.where(support > 0, true_positives / support, 0.0)
+                f1s = np.where(precisions + recalls > 0, 2 * precisions * recalls / (precisions + recalls), 0.0)
+            if average == 'weighted':
+                weights = support / total if total else np.zeros(len(support))
+            elif average == 'macro':
+                weights = np.full(len(support), 1 / len(support)) if len(support) else np.zeros(0)
+            else:
+                raise ValueError(f"Average {average} is not supported")
+            precision, recall, f1 = (float(np.dot(weights, scores)) for scores in (precisions, recalls, f1s))
+
+        return {"accuracy": float(accuracy), "precision": float(precision), "recall": float(recall), "f1": float(f1)}
+
+    def _extend(self, labels):
+        """Add rows and columns for labels not seen before."""
+        labels = np.union1d(self.labels, labels) if len(self.labels) else np.unique(labels)
+        if len(labels) != len(self.labels):
+            matrix = np.zeros((len(labels), len(labels)), dtype=np.int64)
+            index = np.searchsorted(labels, self.labels)
+            matrix[np.ix_(index, index)] = self.matrix
+            self.labels, self.matrix = labels, matrix
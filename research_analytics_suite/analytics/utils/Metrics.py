@@ -1,11 +1,22 @@
-from sklearn.metrics import accuracy_score, precision_score, recall_score
+from research_analytics_suite.analytics.utils.ConfusionMatrix import ConfusionMatrix
 
 
 class Metrics:
     @staticmethod
-    def calculate_metrics(y_true, y_pred):
+    def calculate_metrics(y_true, y_pred, average='weighted'):
         """Calculate and return evaluation metrics."""
-        accuracy = accuracy_score(y_true, y_pred)
-        precision = precision_score(y_true, y_pred, average='weighted')
-        recall = recall_score(y_true, y_pred, average='weighted')
-        return {"accuracy": accuracy, "precision": precision, "recall": recall}
+        return ConfusionMatrix().update(y_true, y_pred).metrics(average)
+
+    @staticmethod
+    def accumulate(batches, matrix=None):
+        """
+        Accumulate a confusion matrix over batches of (y_true, y_pred).
+
+        Args:
+            batches (iterable): Pairs of true labels and predictions.
+            matrix (ConfusionMatrix, optional): A matrix to add the batches to.
+        """
+        matrix = matrix if matrix is not None else ConfusionMatrix()
+        for y_true, y_pred in batches:
+            matrix.update(y_true, y_pred)
+        return matrix
@@ -3,3 +3,4 @@ Utility functions and common metrics.
 """
 
 from .Metrics import Metrics
+from .ConfusionMatrix import ConfusionMatrix
@@ -2,7 +2,8 @@
 Module for applying and visualizing transformations in the Research Analytics Suite.
 
 This module defines a function to apply a series of transformations to a given dataset and visualize the results
-using matplotlib. It includes methods for deep copying _action, applying transformations, and plotting the results.
+using matplotlib. The coordinates are held in a single array; each transformation is applied once to the whole array
+through its `transform_batch` method, and large point clouds are either downsampled or rendered as density bins.
 
 Author: Lane
 Copyright: Lane
@@ -14,64 +15,133 @@ Email: justlane@uw.edu
 Status: Prototype
 """
 
-from copy import deepcopy
+import math
 
-from matplotlib import pyplot as plt
+import numpy as np
 
 
-def display_transformations(data_in, transformations, cmap='viridis'):
+def display_transformations(data_in, transformations, cmap='viridis', max_points=100_000, density=False, bins=256):
     """
     Applies a series of transformations to a given dataset and visualizes the results.
 
     This function applies each transformation in the list to the dataset in order and plots the results using matplotlib
 
     Args:
-        data_in: The dataset to apply the transformations to.
+        data_in: The dataset to apply the transformations to; a PoseData, an object exposing `pose.frames`, or an
+                 array of coordinates shaped (N, 2) or (frames, keypoints, 2).
         transformations (list): The list of transformations to be applied.
         cmap (str): The colormap to use for the plot.
+        max_points (int): The maximum number of points drawn per stage in scatter mode; larger stages are
+                          downsampled with an even stride.
+        density (bool): Whether to draw each stage as a 2D histogram of point density instead of a scatter plot.
+        bins (int): The number of bins along each axis in density mode.
 
     Returns:
         None
     """
+    from matplotlib import pyplot as plt
+
+    points = _as_coordinate_array(data_in)
+    stages = [('Original', points)]
+    for transform in transformations:
+        points = transform.transform_batch(points)
+        stages.append((str(transform.__repr__()), points))
+
+    if density:
+        _plot_density(plt, stages, cmap, bins)
+    else:
+        _plot_scatter(plt, stages, cmap, max_points)
+    plt.show()
+
+
+def _as_coordinate_array(data_in) -> np.ndarray:
+    """
+    Returns the coordinates of a dataset as a float array shaped (N, 2).
+
+    Args:
+        data_in: A PoseData, an object exposing `pose.frames`, or an array-like of coordinates whose last
+                 dimension is 2.
+
+    Returns:
+        np.ndarray: The coordinates.
+    """
+    from research_analytics_suite.data_engine.core.PoseData import PoseData
+    if isinstance(data_in, PoseData):
+        return data_in.xy.reshape(-1, 2).astype(float)
+
+    if hasattr(data_in, 'pose'):
+        frames = data_in.pose.frames
+        count = sum(len(frame.coords) for frame in frames)
+        points = np.empty((count, 2), dtype=float)
+        points[:, 0] = np.fromiter((coord.x for frame in frames for coord in frame.coords), dtype=float, count=count)
+        points[:, 1] = np.fromiter((coord.y for frame in frames for coord in frame.coords), dtype=float, count=count)
+        return points
+
+    points = np.asarray(data_in, dtype=float)
+    if points.shape[-1] != 2:
+        raise ValueError(f"Expected coordinates with a last dimension of 2, got shape {points.shape}")
+    return points.reshape(-1, 2)
+
+
+def _plot_scatter(plt, stages, cmap, max_points):
+    """
+    Plots every stage on one set of axes, downsampling stages with more than `max_points` points.
 
+    Args:
+        plt: The matplotlib pyplot module.
+        stages (list[tuple[str, np.ndarray]]): The label and coordinates of each stage.
+        cmap (str): The colormap to use for the plot.
+        max_points (int): The maximum number of points drawn per stage.
+    """
     plt.figure(figsize=(10, 10))
+    colormap = plt.get_cmap(cmap, len(stages))
 
-    # Create a colormap based on the number of transformations
-    colormap = plt.get_cmap(cmap, len(transformations) + 1)
-
-    # Plot the original _action first
-    x_original = []
-    y_original = []
-    for frame in data_in.pose.frames:
-        for coord in frame.coords:
-            x_original.append(coord.x)
-            y_original.append(coord.y)
-    plt.scatter(x_original, y_original, color=colormap(0), label='Original', s=1,
-                alpha=0.5)  # Using the first color of colormap
-
-    current_frames = deepcopy(data_in.pose.frames)
-
-    # Apply each transformation in sequence and plot
-    for i, transform in enumerate(transformations):
-        transformed_x = []
-        transformed_y = []
-
-        # Apply the transformation to current_frames
-        for frame in current_frames:
-            for coord in frame.coords:
-                transformed_coord = transform.transform(deepcopy(coord))
-                transformed_x.append(transformed_coord.x)
-                transformed_y.append(transformed_coord.y)
-                coord.x = transformed_coord.x  # Update the coordinate for the next transformation
-                coord.y = transformed_coord.y
-
-        # Plot the transformed coordinates using the next color in the colormap
-        plt.scatter(transformed_x, transformed_y, color=colormap(i + 1), label=str(transform.__repr__()), s=1,
-                    alpha=0.5)
+    for i, (label, points) in enumerate(stages):
+        stride = max(1, math.ceil(len(points) / max_points)) if max_points else 1
+        sample = points[::stride]
+        plt.scatter(sample[:, 0], sample[:, 1], color=colormap(i), label=label, s=1, alpha=0.5, rasterized=True)
 
     plt.title("Visualization of Transformations")
     plt.xlabel("X Coordinate")
     plt.ylabel("Y Coordinate")
     plt.legend(loc='upper right', markerscale=5)
     plt.grid(True)
-    plt.show()
+
+
+def _plot_density(plt, stages, cmap, bins):
+    """
+    Plots the point density of every stage as a 2D histogram, one subplot per stage, over a shared extent.
+
+    When no stage has a finite point, the stages are drawn as empty histograms over the unit square.
+
+    Args:
+        plt: The matplotlib pyplot module.
+        stages (list[tuple[str, np.ndarray]]): The label and coordinates of each stage.
+        cmap (str): The colormap to use for the plot.
+        bins (int): The number of bins along each axis.
+    """
+    finite = [points[np.isfinite(points).all(axis=1)] for _, points in stages]
+    filled = [points for points in finite if len(points)]
+    x_min = min((points[:, 0].min() for points in filled), default=0.0)
+    x_max = max((points[:, 0].max() for points in filled), default=1.0)
+    y_min = min((points[:, 1].min() for points in filled), default=0.0)
+    y_max = max((points[:, 1].max() for points in filled), default=1.0)
+    extent = [[x_min, x_max if x_max > x_min else x_min + 1], [y_min, y_max if y_max > y_min else y_min + 1]]
+
+    columns = min(3, len(stages))
+    rows = math.ceil(len(stages) / columns)
+    figure, axes = plt.subplots(rows, columns, figsize=(5 * columns, 5 * rows), squeeze=False, sharex=True,
+                                sharey=True)
+
+    for axis, (label, _), points in zip(axes.flat, stages, finite):
+        counts, x_edges, y_edges = np.histogram2d(points[:, 0], points[:, 1], bins=bins, range=extent)
+        axis.imshow(np.log1p(counts.T), origin='lower', cmap=cmap, aspect='auto',
+                    extent=(x_edges[0], x_edges[-1], y_edges[0], y_edges[-1]))
+        axis.set_title(label, fontsize=9)
+
+    for axis in list(axes.flat)[len(stages):]:
+        axis.set_visible(False)
+
+    figure.suptitle("Visualization of Transformations")
+    figure.supxlabel("X Coordinate")
+    figure.supylabel("Y Coordinate")
@@ -18,6 +18,7 @@ from collections import defaultdict
 from research_analytics_suite.library_manifest import LibraryManifest
 from research_analytics_suite.utils.Config import Config
 from research_analytics_suite.data_engine.memory.DataCache import DataCache
+from research_analytics_suite.data_engine.engine.DaskClusterManager import DaskClusterManager
 from research_analytics_suite.data_engine.engine.DataEngineOptimized import DataEngineOptimized
 from research_analytics_suite.data_engine.engine.UnifiedDataEngine import UnifiedDataEngine
 from research_analytics_suite.utils.CustomLogger import CustomLogger
@@ -52,7 +53,7 @@ class Workspace:
             self._data_engines = {}
             self._dependencies = defaultdict(list)
 
-            self._distributed = None
+            self._distributed = DaskClusterManager(self._config)
             self._storage_type = "memory"
             self._db_path = None
 
@@ -84,6 +85,8 @@ class Workspace:
             data_engine (DataEngineOptimized): The data engine to add.
         """
         self._data_engines[data_engine.runtime_id] = data_engine
+        if self._distributed.is_running:
+            data_engine.dask_client = self._distributed.client
         self._logger.info(f"Data engine '{self._data_engines[data_engine.runtime_id].short_id}' added to workspace")
 
     def remove_data_engine(self, name):
@@ -116,6 +119,31 @@ class Workspace:
         """
         return self._data_engines.get(name, None)
 
+    @property
+    def dask_client(self):
+        """Gets the workspace's Dask client if the cluster has been started, without starting it."""
+        return self._distributed.client if self._distributed.is_running else None
+
+    async def get_dask_client(self):
+        """
+        Returns the workspace's Dask client, starting the workspace cluster on first use.
+
+        Returns:
+            dask.distributed.Client: The shared Dask client.
+        """
+        client = await self._distributed.get_client()
+        for data_engine in self._data_engines.values():
+            data_engine.dask_client = client
+        return client
+
+    async def close(self):
+        """
+        Releases the workspace's shared resources, shutting down its Dask cluster.
+        """
+        await self._distributed.close()
+        for data_engine in self._data_engines.values():
+            data_engine.dask_client = None
+
     def get_default_data_engine(self):
         """
         Retrieves the default data engine.
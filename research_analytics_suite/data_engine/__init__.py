@@ -3,6 +3,8 @@ data_engine package
 
 This package provides the core functionality for handling data using Dask and PyTorch,
 managing metadata, caching data, and integrating live data input sources.
+
+PyTorch-backed classes are resolved on first access so that importing the package does not import torch.
 """
 
 from .core import *
@@ -11,3 +13,15 @@ from .engine import *
 from .memory import *
 from .data_streams import *
 from .Workspace import Workspace
+
+
+def __getattr__(name):
+    if name == 'TorchData':
+        from .core.TorchData import TorchData
+        globals()['TorchData'] = TorchData
+        return TorchData
+    if name == 'TorchChunkDataset':
+        from .core.TorchChunkDataset import TorchChunkDataset
+        globals()['TorchChunkDataset'] = TorchChunkDataset
+        return TorchChunkDataset
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
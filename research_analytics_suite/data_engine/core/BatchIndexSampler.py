@@ -0,0 +1,82 @@
+"""
+BatchIndexSampler Module
+
+Defines the BatchIndexSampler class, which yields whole batches of indices for a DataLoader so that a dataset serves
+each batch with one indexing operation instead of one __getitem__ call and a collate per sample.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import math
+
+import numpy as np
+
+
+class BatchIndexSampler:
+    """
+    Yields batches of indices for a map-style dataset.
+
+    Without shuffling, batches are slices, so that tensor datasets return views of their storage. With shuffling,
+    batches are sorted arrays of random indices, which keeps reads from memory-mapped storage as sequential as
+    possible. Use with `DataLoader(dataset, sampler=BatchIndexSampler(...), batch_size=None)`.
+
+    Attributes:
+        length (int): The number of items in the dataset.
+        batch_size (int): The number of items per batch.
+        shuffle (bool): Whether to draw the items in a random order.
+        drop_last (bool): Whether to drop the last batch if it is incomplete.
+    """
+
+    def __init__(self, length: int, batch_size: int = 32, shuffle: bool = False, drop_last: bool = False,
+                 seed: int = None):
+        """
+        Initializes the BatchIndexSampler instance.
+
+        Args:
+            length (int): The number of items in the dataset.
+            batch_size (int): The number of items per batch. Defaults to 32.
+            shuffle (bool): Whether to draw the items in a random order. Defaults to False.
+            drop_last (bool): Whether to drop the last batch if it is incomplete. Defaults to False.
+            seed (int, optional): The seed of the shuffling. Each epoch draws a new order from it.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.length = int(length)
+        self.batch_size = int(batch_size)
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self._rng = np.random.default_rng(seed)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of batches per epoch.
+
+        Returns:
+            int: The number of batches.
+        """
+        if self.drop_last:
+            return self.length // self.batch_size
+        return math.ceil(self.length / self.batch_size)
+
+    def __iter__(self):
+        """
+        Yields the batches of one epoch.
+
+        Yields:
+            slice | np.ndarray: The indices of a batch.
+        """
+        order = self._rng.permutation(self.length) if self.shuffle else None
+        for batch in range(len(self)):
+            start = batch * self.batch_size
+            stop = min(start + self.batch_size, self.length)
+            if order is None:
+                yield slice(start, stop)
+            else:
+                yield np.sort(order[start:stop])
@@ -1,7 +1,10 @@
 """
 DaskData Module
 
-Defines the DaskData class for handling data using Dask in the Research Analytics Suite.
+Defines the DaskData class for handling data using Dask in the Research Analytics Suite. Partition counts are chosen
+by the PartitionPlanner from the estimated size of the data, and are re-planned after operations that shrink it.
+Applied functions and filters are queued in a DataPipeline and fused into a single partition pass when the Dask
+DataFrame is next used; the re-planning is deferred until then too, and sizes the result from its first partition.
 
 Author: Lane
 Copyright: Lane
@@ -13,10 +16,13 @@ Email: justlane@uw.edu
 Status: Prototype
 """
 
-import dask.dataframe as dd
-import pandas as pd
-
 from research_analytics_suite.data_engine.core.BaseData import BaseData
+from research_analytics_suite.data_engine.core.DataPipeline import DataPipeline
+from research_analytics_suite.data_engine.core.PartitionPlanner import PartitionPlanner
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+dd = lazy_import('dask.dataframe')
+pd = lazy_import('pandas')
 
 
 class DaskData(BaseData):
@@ -26,6 +32,8 @@ class DaskData(BaseData):
     Attributes:
         data: The data point.
         dask_dataframe: Dask DataFrame created from the data point.
+        partition_info (dict): The partitioning chosen for the Dask DataFrame, see PartitionPlanner.plan.
+        pipeline (DataPipeline): The transformations queued since the Dask DataFrame was last used.
     """
     def __init__(self, data):
         """
@@ -35,20 +43,98 @@ class DaskData(BaseData):
             data: The data point.
         """
         super().__init__(data)
-        self.dask_dataframe = self.set_dataframe(data)
+        self.partition_info = None
+        self.pipeline = DataPipeline()
+        self._replan = None
+        self._dask_dataframe = self.set_dataframe(data)
 
-    def apply(self, action):
+    @property
+    def dask_dataframe(self):
+        """
+        Gets the Dask DataFrame, adding the queued transformations to its graph as one fused pass and repartitioning
+        it if a re-plan is pending.
         """
-        Applies a function to the Dask DataFrame.
+        if self._dask_dataframe is not None and self.pipeline.steps:
+            pipeline, self.pipeline = self.pipeline, DataPipeline()
+            self._dask_dataframe = pipeline.execute(self._dask_dataframe)
+        if self._dask_dataframe is not None and self._replan:
+            reason, self._replan = self._replan, None
+            self._replan_from_sample(reason)
+        return self._dask_dataframe
+
+    @dask_dataframe.setter
+    def dask_dataframe(self, value):
+        """Sets the Dask DataFrame, discarding any queued transformations."""
+        self.pipeline = DataPipeline()
+        self._replan = None
+        self._dask_dataframe = value
+
+    def apply(self, action, rebalance: bool = False, reads=None, writes=None):
+        """
+        Applies a function to each partition of the Dask DataFrame.
 
         Args:
             action (function): The function to apply to the Dask DataFrame.
+            rebalance (bool): Whether to re-plan the partitions for the size of the result, for actions that
+                              shrink or grow the data, when the Dask DataFrame is next used. Defaults to False.
+            reads (list, optional): The columns the function reads, see DataPipeline.map.
+            writes (list, optional): The columns the function writes, see DataPipeline.map.
+        """
+        if self._dask_dataframe is not None:
+            self.pipeline.map(action, reads=reads, writes=writes)
+            if rebalance:
+                self._replan = 'apply'
+        return self
+
+    def filter(self, predicate, columns=None):
+        """
+        Keeps the rows for which a predicate holds, and re-plans the partitions for the reduced size when the Dask
+        DataFrame is next used. Nothing is computed until then.
+
+        Args:
+            predicate (function): A function of a partition returning a boolean mask of the rows to keep.
+            columns (list, optional): The columns the predicate reads, see DataPipeline.filter.
+        """
+        if self._dask_dataframe is not None:
+            self.pipeline.filter(predicate, columns=columns)
+            self._replan = 'filter'
+        return self
+
+    def rebalance(self, reason: str = 'rebalance'):
+        """
+        Persists the Dask DataFrame, measures its partitions and repartitions it to the planned partition count.
+
+        Args:
+            reason (str): Why the data is rebalanced, recorded in partition_info.
         """
-        if self.dask_dataframe is not None:
-            self.dask_dataframe = self.dask_dataframe.map_partitions(action)
+        if self.dask_dataframe is None:
+            return self
+
+        persisted = self.dask_dataframe.persist()
+        nbytes = int(persisted.memory_usage_per_partition(deep=True).sum().compute())
+        plan = PartitionPlanner().plan(nbytes, reason=reason)
+        if plan['npartitions'] != persisted.npartitions:
+            persisted = persisted.repartition(npartitions=plan['npartitions']).persist()
+
+        self.dask_dataframe = persisted
+        self.partition_info = plan
         return self
 
-    def set_dataframe(self, data) -> dd.DataFrame:
+    def _replan_from_sample(self, reason: str):
+        """
+        Repartitions the Dask DataFrame, lazily, for a size extrapolated from its first partition, which is the only
+        one computed.
+
+        Args:
+            reason (str): Why the partitions are re-planned, recorded in partition_info.
+        """
+        frame = self._dask_dataframe
+        plan = PartitionPlanner().plan(PartitionPlanner.estimate_nbytes(frame), reason=f"{reason} (sampled)")
+        if plan['npartitions'] != frame.npartitions:
+            self._dask_dataframe = frame.repartition(npartitions=plan['npartitions'])
+        self.partition_info = plan
+
+    def set_dataframe(self, data) -> 'dd.DataFrame':
         """
         Sets the Dask DataFrame.
 
@@ -57,10 +143,15 @@ class DaskData(BaseData):
         """
         dataframe = None
 
+        if data is None:
+            return dataframe
+
         if isinstance(data, dd.DataFrame):
             dataframe = data
+            self.partition_info = {'npartitions': data.npartitions, 'reason': 'dask input'}
         elif isinstance(data, pd.DataFrame):
-            dataframe = dd.from_pandas(data, npartitions=4)
+            self.partition_info = PartitionPlanner().plan(PartitionPlanner.estimate_nbytes(data), reason='pandas input')
+            dataframe = dd.from_pandas(data, npartitions=self.partition_info['npartitions'])
 
         return dataframe
 
@@ -4,47 +4,379 @@ DataPipeline Module
 This module defines the DataPipeline class, which provides a framework for building and managing
 data transformation pipelines within the research analytics suite.
 
+Steps are recorded into a lazy plan rather than run as they are added. When the pipeline is executed the plan is
+optimized: filters and column projections are moved towards the source, adjacent partition-wise steps are fused into a
+single pass over each partition, and intermediate results are only materialized where a step asks for it.
+Checkpoint steps store their input in the workspace, so that re-running the pipeline resumes from the latest one.
+
 Author: Lane
 """
+import time
 
 
 class DataPipeline:
     """
     A class to build and manage data transformation pipelines.
+
+    The pipeline records four kinds of steps:
+
+    - 'map': a function applied to each partition (or to the whole data when it is not partitioned). Maps that declare
+      the columns they read and write are treated as row-wise, so filters and projections can be moved past them.
+    - 'filter': a predicate returning a boolean mask of the rows to keep.
+    - 'select': a projection to a list of columns.
+    - 'step': an opaque function of the whole data, such as a groupby or a sort, which is never fused or reordered.
+
+    A 'materialize' marker persists the data computed so far, for collections that support it, and a 'checkpoint'
+    marker stores it with PipelineCheckpoints.
+
+    Attributes:
+        timings (list[dict]): The 'stage', 'seconds' and 'rows' of each stage of the last execution. Dask stages are
+                              lazy, so their time is counted by the next materialize or checkpoint stage.
     """
+    _PARTITION_KINDS = ('map', 'filter', 'select')
+
     def __init__(self):
         """
         Initializes the DataPipeline instance.
         """
         self._steps = []
+        self.timings = []
 
     def add_step(self, step):
         """
         Adds a transformation step to the pipeline.
 
         Args:
-            step (function): The transformation step to add.
+            step (function): The transformation step to add, a function of the whole data.
+        """
+        self._steps.append({'kind': 'step', 'func': step})
+        return self
+
+    def map(self, func, reads=None, writes=None):
+        """
+        Adds a partition-wise transformation to the pipeline.
+
+        Args:
+            func (function): A function of a partition returning the transformed partition.
+            reads (list, optional): The columns the function reads. Declaring both reads and writes marks the
+                                    function as row-wise, so that filters and projections can be moved before it.
+            writes (list, optional): The columns the function creates or overwrites.
+        """
+        self._steps.append({'kind': 'map', 'func': func,
+                            'reads': list(reads) if reads is not None else None,
+                            'writes': list(writes) if writes is not None else None})
+        return self
+
+    def filter(self, predicate, columns=None):
+        """
+        Adds a row filter to the pipeline.
+
+        Args:
+            predicate (function): A function of a partition returning a boolean mask of the rows to keep.
+            columns (list, optional): The columns the predicate reads. Filters that declare their columns can be
+                                      moved before row-wise maps that do not write them.
+        """
+        self._steps.append({'kind': 'filter', 'func': predicate,
+                            'columns': list(columns) if columns is not None else None})
+        return self
+
+    def select(self, columns):
+        """
+        Adds a column projection to the pipeline.
+
+        Args:
+            columns (list): The columns to keep.
+        """
+        self._steps.append({'kind': 'select', 'columns': list(columns)})
+        return self
+
+    def materialize(self):
+        """
+        Marks the point at which the intermediate result should be persisted, for example before it is reused.
+        """
+        self._steps.append({'kind': 'materialize'})
+        return self
+
+    def checkpoint(self, name: str = None):
+        """
+        Marks a point at which the intermediate result is stored in the workspace.
+
+        The checkpoint is keyed by a hash of the pipeline input and of every step before it. When the pipeline is
+        executed again, it resumes from the latest checkpoint whose key is stored.
+
+        Args:
+            name (str, optional): A name for the checkpoint, shown in PipelineCheckpoints.report.
+        """
+        self._steps.append({'kind': 'checkpoint', 'name': name})
+        return self
+
+    def optimize(self) -> list:
+        """
+        Returns the optimized plan.
+
+        Filters and projections are pushed towards the source within each run of partition-wise steps, and each run is
+        fused into a single 'fused' stage. Opaque steps, materialize and checkpoint markers are kept in place.
+
+        Returns:
+            list: The stages of the optimized plan.
         """
-        self._steps.append(step)
+        plan = []
+        run = []
+        for step in self._steps:
+            if step['kind'] in DataPipeline._PARTITION_KINDS:
+                DataPipeline._push_down(run, dict(step))
+                continue
+            plan.extend(DataPipeline._fuse(run))
+            run = []
+            plan.append(step)
+        plan.extend(DataPipeline._fuse(run))
+        return plan
 
-    def execute(self, data):
+    def explain(self) -> list:
+        """
+        Describes the optimized plan.
+
+        Returns:
+            list[str]: One description per stage of the optimized plan.
+        """
+        return [DataPipeline._describe(stage) for stage in self.optimize()]
+
+    def execute(self, data, checkpoints=None):
         """
         Executes the transformation pipeline on the data.
 
+        For Dask collections the result is lazy, with one partition pass per fused stage. If the pipeline has
+        checkpoints, execution starts after the latest one that is already stored for this input.
+
         Args:
             data: The data to transform.
+            checkpoints (PipelineCheckpoints, optional): The checkpoint store. Defaults to the workspace store.
 
         Returns:
             The transformed data.
         """
-        for step in self._steps:
-            data = step(data)
+        plan = self.optimize()
+        keys = {}
+        if any(stage['kind'] == 'checkpoint' for stage in plan):
+            if checkpoints is None:
+                from research_analytics_suite.data_engine.core.PipelineCheckpoints import PipelineCheckpoints
+                checkpoints = PipelineCheckpoints()
+            keys = self._checkpoint_keys(data)
+
+        self.timings = []
+        start = 0
+        for index in range(len(plan) - 1, -1, -1):
+            if id(plan[index]) in keys:
+                restored = checkpoints.load(keys[id(plan[index])], lazy=hasattr(data, 'map_partitions'))
+                if restored is not None:
+                    data, start = restored, index + 1
+                    self.timings.append({'stage': DataPipeline._describe(plan[index]), 'seconds': 0.0,
+                                         'rows': None, 'resumed': True})
+                    break
+
+        since_checkpoint = 0.0
+        for stage in plan[start:]:
+            began = time.perf_counter()
+            kind = stage['kind']
+            if kind == 'select':
+                data = data[stage['columns']]
+            elif kind == 'fused':
+                func = DataPipeline._compose(stage['steps'])
+                data = data.map_partitions(func) if hasattr(data, 'map_partitions') else func(data)
+            elif kind == 'materialize':
+                if hasattr(data, 'persist'):
+                    data = data.persist()
+            elif kind == 'checkpoint':
+                data = checkpoints.save(keys[id(stage)], data, name=stage['name'], seconds=since_checkpoint)
+            else:
+                data = stage['func'](data)
+
+            seconds = time.perf_counter() - began
+            since_checkpoint = 0.0 if kind == 'checkpoint' else since_checkpoint + seconds
+            rows = None if hasattr(data, 'map_partitions') else getattr(data, 'shape', (None,))[0]
+            self.timings.append({'stage': DataPipeline._describe(stage), 'seconds': seconds, 'rows': rows})
         return data
 
+    def compute(self, data, checkpoints=None):
+        """
+        Executes the pipeline and computes the result in one pass through the data.
+
+        Args:
+            data: The data to transform.
+            checkpoints (PipelineCheckpoints, optional): The checkpoint store. Defaults to the workspace store.
+
+        Returns:
+            The computed result.
+        """
+        result = self.execute(data, checkpoints=checkpoints)
+        return result.compute() if hasattr(result, 'compute') else result
+
+    def _checkpoint_keys(self, data) -> dict:
+        """
+        Returns the key of each checkpoint step, chained from the fingerprint of the input through every step.
+
+        Args:
+            data: The pipeline input.
+
+        Returns:
+            dict: The keys, by the id of the checkpoint step.
+        """
+        from research_analytics_suite.data_engine.core.PipelineCheckpoints import PipelineCheckpoints
+        keys = {}
+        key = PipelineCheckpoints.fingerprint(data)
+        for step in self._steps:
+            key = PipelineCheckpoints.step_key(key, step)
+            if step['kind'] == 'checkpoint':
+                keys[id(step)] = key
+        return keys
+
+    @staticmethod
+    def _commutes(left: dict, step: dict) -> bool:
+        """
+        Returns whether a filter can be moved before the step to its left.
+
+        Args:
+            left (dict): The step to the left.
+            step (dict): The filter.
+
+        Returns:
+            bool: Whether the two steps can be swapped.
+        """
+        columns = step.get('columns')
+        if columns is None:
+            return False
+        if left['kind'] == 'map':
+            return left['reads'] is not None and left['writes'] is not None and not set(columns) & set(left['writes'])
+        if left['kind'] == 'select':
+            return set(columns) <= set(left['columns'])
+        return False
+
+    @staticmethod
+    def _push_down(run: list, step: dict):
+        """
+        Appends a step to a run of partition-wise steps, moving filters and projections as early as possible.
+
+        Args:
+            run (list): The optimized run so far.
+            step (dict): The step to append.
+        """
+        if step['kind'] == 'filter':
+            index = len(run)
+            while index > 0 and DataPipeline._commutes(run[index - 1], step):
+                index -= 1
+            run.insert(index, step)
+            return
+
+        if step['kind'] != 'select' or not run:
+            run.append(step)
+            return
+
+        left = run[-1]
+        if left['kind'] == 'select':
+            # A projection to columns the earlier one dropped must still fail, so only subsets are merged
+            if set(step['columns']) <= set(left['columns']):
+                left['columns'] = list(step['columns'])
+            else:
+                run.append(step)
+            return
+
+        if left['kind'] == 'map' and left['reads'] is not None and left['writes'] is not None:
+            needed = DataPipeline._union([c for c in step['columns'] if c not in left['writes']], left['reads'])
+        elif left['kind'] == 'filter' and left['columns'] is not None:
+            needed = DataPipeline._union(step['columns'], left['columns'])
+        else:
+            run.append(step)
+            return
+
+        run.pop()
+        DataPipeline._push_down(run, {'kind': 'select', 'columns': needed})
+        run.append(left)
+        if left['kind'] == 'map' or needed != step['columns']:
+            run.append(step)
+
+    @staticmethod
+    def _fuse(run: list) -> list:
+        """
+        Fuses a run of partition-wise steps into stages. Leading projections are kept as collection-level stages so
+        that readers which support column pruning only load the selected columns.
+
+        Args:
+            run (list): The optimized run.
+
+        Returns:
+            list: The stages of the run.
+        """
+        stages = []
+        index = 0
+        while index < len(run) and run[index]['kind'] == 'select':
+            stages.append(run[index])
+            index += 1
+        if index < len(run):
+            stages.append({'kind': 'fused', 'steps': run[index:]})
+        return stages
+
+    @staticmethod
+    def _compose(steps: list):
+        """
+        Composes partition-wise steps into one function of a partition.
+
+        Args:
+            steps (list): The steps to compose.
+
+        Returns:
+            function: The composed function.
+        """
+        def fused(partition):
+            for step in steps:
+                if step['kind'] == 'map':
+                    partition = step['func'](partition)
+                elif step['kind'] == 'filter':
+                    partition = partition[step['func'](partition)]
+                else:
+                    partition = partition[step['columns']]
+            return partition
+        return fused
+
+    @staticmethod
+    def _union(first: list, second: list) -> list:
+        """
+        Returns the columns of two lists without duplicates, in order of first appearance.
+
+        Args:
+            first (list): The first columns.
+            second (list): The second columns.
+
+        Returns:
+            list: The union of the columns.
+        """
+        return list(dict.fromkeys(list(first) + list(second)))
+
+    @staticmethod
+    def _describe(stage: dict) -> str:
+        """
+        Describes a stage of the plan.
+
+        Args:
+            stage (dict): The stage.
+
+        Returns:
+            str: The description.
+        """
+        kind = stage['kind']
+        if kind == 'select':
+            return f"select{stage['columns']}"
+        if kind == 'fused':
+            return f"fused({', '.join(DataPipeline._describe(step) for step in stage['steps'])})"
+        if kind == 'materialize':
+            return kind
+        if kind == 'checkpoint':
+            return f"checkpoint:{stage['name'] or ''}"
+        return f"{kind}:{getattr(stage['func'], '__name__', type(stage['func']).__name__)}"
+
     @property
     def steps(self):
         return self._steps
 
     @steps.setter
     def steps(self, value):
-        self._steps = value
+        self._steps = [step if isinstance(step, dict) else {'kind': 'step', 'func': step} for step in value]
@@ -0,0 +1,165 @@
+"""
+PartitionPlanner Module
+
+Defines the PartitionPlanner class, which chooses how many Dask partitions a dataset is split into from its estimated
+in-memory size, the number of workers available and a target partition size in bytes. Small data stays in a single
+partition to avoid scheduler overhead, and large data is split so that no partition exceeds the target size.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import math
+import os
+
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+dd = lazy_import('dask.dataframe')
+pd = lazy_import('pandas')
+
+
+class PartitionPlanner:
+    """
+    Chooses partition counts and read block sizes for Dask data.
+
+    Attributes:
+        target_size (int): The target in-memory size of a partition, in bytes.
+        workers (int): The number of parallel workers to keep busy.
+    """
+    DEFAULT_TARGET_SIZE = 128 * 2 ** 20
+    MIN_PARTITION_SIZE = 16 * 2 ** 20
+    SAMPLE_ROWS = 1000
+
+    # Approximate ratio of in-memory size to file size for each format
+    EXPANSION = {'csv': 2.0, 'json': 1.5, 'ndjson': 1.5, 'parquet': 4.0, 'excel': 8.0, 'hdf5': 1.0}
+
+    def __init__(self, target_size: int = None, workers: int = None):
+        """
+        Initializes the PartitionPlanner instance.
+
+        Args:
+            target_size (int, optional): The target partition size in bytes. Defaults to Config.DASK_PARTITION_SIZE.
+            workers (int, optional): The number of workers. Defaults to the threads of the workspace's Dask cluster,
+                                     or Config.NUM_THREADS when no cluster is running.
+        """
+        from research_analytics_suite.utils.Config import Config
+        config = Config()
+        self.target_size = int(target_size or config.DASK_PARTITION_SIZE or PartitionPlanner.DEFAULT_TARGET_SIZE)
+        self.workers = max(1, int(workers or PartitionPlanner._available_workers(config)))
+
+    @staticmethod
+    def _available_workers(config) -> int:
+        """
+        Returns the number of threads of the workspace's Dask cluster, or the configured thread count.
+
+        Args:
+            config (Config): The configuration.
+
+        Returns:
+            int: The number of workers.
+        """
+        from research_analytics_suite.data_engine.Workspace import Workspace
+        client = Workspace().dask_client
+        if client is not None:
+            try:
+                return sum(client.nthreads().values()) or 1
+            except Exception:
+                pass
+        return config.NUM_THREADS or os.cpu_count() or 1
+
+    def plan(self, nbytes: int, reason: str = 'estimated') -> dict:
+        """
+        Chooses the number of partitions for data of the given in-memory size.
+
+        Data smaller than MIN_PARTITION_SIZE stays in one partition. Larger data is split into at least one partition
+        per worker, as long as partitions stay above MIN_PARTITION_SIZE, and into as many partitions as needed to keep
+        each one under the target size.
+
+        Args:
+            nbytes (int): The estimated in-memory size of the data, in bytes.
+            reason (str): Why the plan was made, recorded in the result.
+
+        Returns:
+            dict: The 'npartitions', the 'estimated_bytes', the expected 'partition_bytes', the 'target_bytes', the
+                  'workers' and the 'reason'.
+        """
+        nbytes = max(0, int(nbytes))
+        npartitions = max(1, math.ceil(nbytes / self.target_size))
+        if nbytes >= 2 * PartitionPlanner.MIN_PARTITION_SIZE:
+            npartitions = max(npartitions, min(self.workers, nbytes // PartitionPlanner.MIN_PARTITION_SIZE))
+
+        return {
+            'npartitions': int(npartitions),
+            'estimated_bytes': nbytes,
+            'partition_bytes': int(nbytes / npartitions),
+            'target_bytes': self.target_size,
+            'workers': self.workers,
+            'reason': reason,
+        }
+
+    def plan_file(self, file_path: str, data_type: str) -> dict:
+        """
+        Chooses the number of partitions, and the read block size, for a data file.
+
+        Args:
+            file_path (str): The path to the data file.
+            data_type (str): The format of the file.
+
+        Returns:
+            dict: The plan, with the 'blocksize' in bytes of the file to read per partition.
+        """
+        size = os.path.getsize(file_path)
+        plan = self.plan(size * PartitionPlanner.EXPANSION.get(data_type, 1.0), reason=f"{data_type} file size")
+        plan['blocksize'] = max(1, math.ceil(size / plan['npartitions']))
+        return plan
+
+    @staticmethod
+    def estimate_nbytes(data) -> int:
+        """
+        Estimates the in-memory size of a pandas or Dask DataFrame.
+
+        Object columns are measured deeply on a sample of rows; a Dask DataFrame is estimated from its first partition,
+        scaled by its number of partitions, so at most one partition is computed. The index is measured on the whole
+        frame, since a sample of a RangeIndex is a much larger integer index.
+
+        Args:
+            data (pd.DataFrame | dd.DataFrame): The data.
+
+        Returns:
+            int: The estimated size in bytes.
+        """
+        if isinstance(data, dd.DataFrame):
+            first = data.get_partition(0).compute()
+            return PartitionPlanner.estimate_nbytes(first) * data.npartitions
+
+        if isinstance(data, pd.DataFrame):
+            if len(data) <= PartitionPlanner.SAMPLE_ROWS:
+                return int(data.memory_usage(deep=True).sum())
+            sample = data.sample(PartitionPlanner.SAMPLE_ROWS, random_state=0)
+            if pd.api.types.is_object_dtype(data.index) or pd.api.types.is_string_dtype(data.index):
+                index_bytes = sample.index.memory_usage(deep=True) / len(sample) * len(data)
+            else:
+                index_bytes = data.index.memory_usage()
+            return int(PartitionPlanner._sample_bytes(sample) * len(data) + index_bytes)
+
+        return 0
+
+    @staticmethod
+    def _sample_bytes(sample) -> float:
+        """
+        Returns the mean in-memory size of a row of a sample, without its index.
+
+        Args:
+            sample (pd.DataFrame): The sample.
+
+        Returns:
+            float: The mean size of a row in bytes.
+        """
+        if len(sample) == 0:
+            return 0.0
+        return float(sample.memory_usage(deep=True, index=False).sum()) / len(sample)
@@ -0,0 +1,403 @@
+"""
+PipelineCheckpoints Module
+
+Defines the PipelineCheckpoints class, which stores the outputs of DataPipeline checkpoint steps in the workspace as
+Parquet, keyed by a hash of the pipeline input and of the definitions of the steps that produced them. A pipeline that
+is run again on the same input resumes from its latest stored checkpoint instead of starting from scratch.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import json
+import os
+import shutil
+import time
+import types
+import uuid
+
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+dask_base = lazy_import('dask.base')
+dd = lazy_import('dask.dataframe')
+pd = lazy_import('pandas')
+
+
+class PipelineCheckpoints:
+    """
+    Stores DataPipeline checkpoints as Parquet datasets.
+
+    Each checkpoint is kept in its own directory, named by its key, with the data and a manifest recording how long
+    the steps before it took, its size on disk, its row count and how often it has been reused. A checkpoint is valid
+    once its manifest has been written.
+
+    Attributes:
+        directory (str): The directory the checkpoints are stored in.
+    """
+    MANIFEST = 'manifest.json'
+    VERSION = 1
+
+    def __init__(self, directory: str = None):
+        """
+        Initializes the PipelineCheckpoints instance.
+
+        Args:
+            directory (str, optional): The checkpoint directory. Defaults to Config.CHECKPOINT_DIR in the workspace.
+        """
+        from research_analytics_suite.utils.Config import Config
+        from research_analytics_suite.utils.CustomLogger import CustomLogger
+        self._logger = CustomLogger()
+
+        if directory is None:
+            config = Config()
+            directory = os.path.join(config.BASE_DIR, config.WORKSPACE_NAME, config.CHECKPOINT_DIR)
+        self.directory = os.path.normpath(directory)
+
+    @staticmethod
+    def fingerprint(data) -> str:
+        """
+        Returns a hash of the data a pipeline is run on.
+
+        Pandas data is hashed by value; Dask collections are hashed by their graph, which for file readers includes
+        the paths read.
+
+        Args:
+            data: The pipeline input.
+
+        Returns:
+            str: The hash.
+        """
+        return dask_base.tokenize(data)
+
+    @staticmethod
+    def step_key(previous: str, step: dict) -> str:
+        """
+        Returns the key of a step, chained from the key of the step before it.
+
+        Functions are hashed by their module, name, bytecode, constants, defaults, closure and the values of the
+        globals they use, so editing a step, or a module constant or helper function it depends on, invalidates the
+        checkpoints after it. Globals and closure values whose state cannot be hashed deterministically, such as
+        locks or open files, are hashed by their type only.
+
+        Args:
+            previous (str): The key of the previous step, or the fingerprint of the input.
+            step (dict): The step.
+
+        Returns:
+            str: The key.
+        """
+        fields = {name: value for name, value in step.items() if name != 'func'}
+        func = step.get('func')
+        return dask_base.tokenize(previous, sorted(fields.items(), key=lambda item: item[0]),
+                                  PipelineCheckpoints._function_token(func) if func is not None else None)
+
+    @staticmethod
+    def _function_token(func, _seen=None) -> str:
+        """
+        Returns a hash of a function's definition that is stable between sessions.
+
+        Args:
+            func (function): The function.
+            _seen (set, optional): The ids of the functions already being hashed, to stop at recursive references.
+
+        Returns:
+            str: The hash.
+        """
+        code = getattr(func, '__code__', None)
+        if code is None:
+            return PipelineCheckpoints._value_token(func)
+
+        _seen = set() if _seen is None else _seen
+        _seen.add(id(func))
+        closure = [PipelineCheckpoints._closure_token(cell.cell_contents, _seen) for cell in func.__closure__ or ()]
+        namespace = getattr(func, '__globals__', {})
+        _globals = [(name, PipelineCheckpoints._global_token(namespace[name], func.__module__, _seen))
+                    for name in sorted(PipelineCheckpoints._global_names(code)) if name in namespace]
+        return dask_base.tokenize(func.__module__, func.__qualname__, PipelineCheckpoints._code_token(code),
+                                  func.__defaults__, closure, _globals)
+
+    @staticmethod
+    def _global_token(value, module: str, _seen: set):
+        """
+        Returns a hash of the value of a global used by a step function.
+
+        Functions defined in the step's module are hashed by their definition, recursively; other functions, classes
+        and modules are hashed by their name.
+
+        Args:
+            value: The value of the global.
+            module (str): The module of the step function.
+            _seen (set): The ids of the functions already being hashed.
+
+        Returns:
+            str: The hash.
+        """
+        if isinstance(value, types.ModuleType):
+            return value.__name__
+        if isinstance(value, types.FunctionType) and value.__module__ == module:
+            if id(value) in _seen:
+                return value.__qualname__
+            return PipelineCheckpoints._function_token(value, _seen)
+        if isinstance(value, type) or callable(value):
+            return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', type(value).__qualname__)}"
+        return PipelineCheckpoints._value_token(value)
+
+    @staticmethod
+    def _closure_token(value, _seen: set):
+        """
+        Returns a hash of a value captured in the closure of a step function.
+
+        Captured functions are hashed by their definition, recursively, and other values as in _value_token.
+
+        Args:
+            value: The captured value.
+            _seen (set): The ids of the functions already being hashed.
+
+        Returns:
+            str: The hash.
+        """
+        if callable(value) and not isinstance(value, type):
+            if id(value) in _seen:
+                return getattr(value, '__qualname__', type(value).__qualname__)
+            return PipelineCheckpoints._function_token(value, _seen)
+        return PipelineCheckpoints._value_token(value)
+
+    @staticmethod
+    def _value_token(value) -> str:
+        """
+        Returns a hash of a value, or of its type if its state cannot be hashed deterministically.
+
+        Args:
+            value: The value.
+
+        Returns:
+            str: The hash.
+        """
+        try:
+            return dask_base.tokenize(value, ensure_deterministic=True)
+        except Exception:
+            return type(value).__qualname__
+
+    @staticmethod
+    def _global_names(code) -> set:
+        """
+        Returns the names a code object and the code objects nested in it look up, which include its globals.
+
+        Args:
+            code (types.CodeType): The code object.
+
+        Returns:
+            set[str]: The names.
+        """
+        names = set(code.co_names)
+        for const in code.co_consts:
+            if isinstance(const, types.CodeType):
+                names |= PipelineCheckpoints._global_names(const)
+        return names
+
+    @staticmethod
+    def _code_token(code) -> str:
+        """
+        Returns a hash of a code object, including the code objects nested in it.
+
+        Args:
+            code (types.CodeType): The code object.
+
+        Returns:
+            str: The hash.
+        """
+        consts = [PipelineCheckpoints._code_token(const) if isinstance(const, types.CodeType) else const
+                  for const in code.co_consts]
+        return dask_base.tokenize(code.co_code, consts, code.co_names)
+
+    def path(self, key: str) -> str:
+        """
+        Returns the directory of a checkpoint.
+
+        Args:
+            key (str): The checkpoint key.
+
+        Returns:
+            str: The directory.
+        """
+        return os.path.join(self.directory, key)
+
+    def manifest(self, key: str):
+        """
+        Returns the manifest of a checkpoint.
+
+        Args:
+            key (str): The checkpoint key.
+
+        Returns:
+            dict: The manifest, or None if the checkpoint does not exist or is incomplete.
+        """
+        try:
+            with open(os.path.join(self.path(key), PipelineCheckpoints.MANIFEST), 'r') as manifest_file:
+                manifest = json.load(manifest_file)
+        except (OSError, ValueError):
+            return None
+        if manifest.get('version') != PipelineCheckpoints.VERSION or manifest.get('key') != key:
+            return None
+        return manifest
+
+    def exists(self, key: str) -> bool:
+        """
+        Returns whether a valid checkpoint is stored under a key.
+
+        Args:
+            key (str): The checkpoint key.
+
+        Returns:
+            bool: Whether the checkpoint exists.
+        """
+        return self.manifest(key) is not None
+
+    def load(self, key: str, lazy: bool):
+        """
+        Loads a checkpoint and records its reuse.
+
+        Args:
+            key (str): The checkpoint key.
+            lazy (bool): Whether to load a Dask DataFrame rather than a pandas DataFrame.
+
+        Returns:
+            The checkpointed data, or None if the checkpoint does not exist or cannot be read.
+        """
+        manifest = self.manifest(key)
+        if manifest is None:
+            return None
+
+        data_path = os.path.join(self.path(key), 'data.parquet')
+        try:
+            data = dd.read_parquet(data_path) if lazy else pd.read_parquet(data_path)
+        except Exception as e:
+            self._logger.warning(f"Checkpoint {manifest.get('name') or key} could not be read: {e}")
+            return None
+
+        manifest['hits'] = manifest.get('hits', 0) + 1
+        manifest['last_used'] = time.time()
+        self._write_manifest(key, manifest)
+        self._logger.info(f"Resuming pipeline from checkpoint {manifest.get('name') or key}")
+        return data
+
+    def save(self, key: str, data, name: str = None, seconds: float = 0.0):
+        """
+        Writes the data of a checkpoint. Data that cannot be stored as Parquet is returned unchanged and not stored.
+
+        Args:
+            key (str): The checkpoint key.
+            data (pd.DataFrame | dd.DataFrame): The data to store.
+            name (str, optional): The name of the checkpoint.
+            seconds (float): The time spent producing the data since the previous checkpoint.
+
+        Returns:
+            The data, read back from the checkpoint for Dask collections so that later steps start from it.
+        """
+        lazy = isinstance(data, dd.DataFrame)
+        if not lazy and not isinstance(data, pd.DataFrame):
+            self._logger.warning(f"Checkpoint {name or key} skipped: {type(data).__name__} cannot be stored")
+            return data
+
+        final_path = self.path(key)
+        temp_path = os.path.join(self.directory, f".{key}.{uuid.uuid4().hex[:8]}")
+        start = time.perf_counter()
+        try:
+            os.makedirs(temp_path, exist_ok=True)
+            data.to_parquet(os.path.join(temp_path, 'data.parquet'))
+            shutil.rmtree(final_path, ignore_errors=True)
+            os.replace(temp_path, final_path)
+        except Exception as e:
+            shutil.rmtree(temp_path, ignore_errors=True)
+            self._logger.warning(f"Checkpoint {name or key} skipped: {e}")
+            return data
+
+        if lazy:
+            data = dd.read_parquet(os.path.join(final_path, 'data.parquet'))
+        self._write_manifest(key, {
+            'version': PipelineCheckpoints.VERSION,
+            'key': key,
+            'name': name,
+            'rows': int(data.shape[0].compute() if lazy else data.shape[0]),
+            'bytes': PipelineCheckpoints._disk_size(final_path),
+            'seconds': seconds + time.perf_counter() - start,
+            'created': time.time(),
+            'last_used': None,
+            'hits': 0,
+        })
+        return data
+
+    def report(self) -> list:
+        """
+        Returns the manifests of all stored checkpoints, most valuable first.
+
+        Checkpoints are ranked by the seconds of computation they save per megabyte stored, counting each reuse.
+
+        Returns:
+            list[dict]: The manifests, each with the 'seconds_per_mb' used for ranking.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+
+        manifests = []
+        for key in os.listdir(self.directory):
+            manifest = self.manifest(key)
+            if manifest is not None:
+                megabytes = max(manifest['bytes'], 1) / 2 ** 20
+                manifest['seconds_per_mb'] = manifest['seconds'] * (1 + manifest['hits']) / megabytes
+                manifests.append(manifest)
+        return sorted(manifests, key=lambda manifest: manifest['seconds_per_mb'], reverse=True)
+
+    def remove(self, key: str):
+        """
+        Deletes a checkpoint.
+
+        Args:
+            key (str): The checkpoint key.
+        """
+        shutil.rmtree(self.path(key), ignore_errors=True)
+
+    def clear(self, keep=None):
+        """
+        Deletes stored checkpoints.
+
+        Args:
+            keep (list[str], optional): The keys of the checkpoints to keep.
+        """
+        keep = set(keep or [])
+        if not os.path.isdir(self.directory):
+            return
+        for key in os.listdir(self.directory):
+            if key not in keep:
+                self.remove(key)
+
+    def _write_manifest(self, key: str, manifest: dict):
+        """
+        Writes the manifest of a checkpoint.
+
+        Args:
+            key (str): The checkpoint key.
+            manifest (dict): The manifest.
+        """
+        manifest_path = os.path.join(self.path(key), PipelineCheckpoints.MANIFEST)
+        with open(f"{manifest_path}.tmp", 'w') as manifest_file:
+            json.dump(manifest, manifest_file, indent=4)
+        os.replace(f"{manifest_path}.tmp", manifest_path)
+
+    @staticmethod
+    def _disk_size(path: str) -> int:
+        """
+        Returns the total size of the files under a path.
+
+        Args:
+            path (str): The path.
+
+        Returns:
+            int: The size in bytes.
+        """
+        return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
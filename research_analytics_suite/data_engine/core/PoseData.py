@@ -0,0 +1,311 @@
+"""
+PoseData Module
+
+Defines the PoseData class, a compact array-backed container for pose-estimation data. Coordinates are held in a
+single float32 array shaped (frames, bodyparts, 3), where the last axis is (x, y, likelihood), alongside the names
+of the bodyparts. Slicing by frame range or bodypart returns views of the same memory, and the array can be
+memory-mapped from disk.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import json
+import os
+from typing import Optional, Union
+
+import numpy as np
+
+from research_analytics_suite.data_engine.core.BaseData import BaseData
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+pd = lazy_import('pandas')
+
+
+class PoseData(BaseData):
+    """
+    A class to hold pose-estimation coordinates as a single (frames, bodyparts, 3) array.
+
+    Attributes:
+        data (np.ndarray): The coordinates, shaped (frames, bodyparts, 3) with fields (x, y, likelihood).
+        bodyparts (list[str]): The name of each bodypart, in array order.
+        scorer (str): The name of the model or annotator that produced the coordinates.
+    """
+    FIELDS = ('x', 'y', 'likelihood')
+    DTYPE = np.float32
+
+    def __init__(self, data, bodyparts: Optional[list] = None, scorer: Optional[str] = None):
+        """
+        Initializes the PoseData instance.
+
+        Args:
+            data: The coordinates, shaped (frames, bodyparts, 3) or (frames, bodyparts, 2). Missing likelihoods
+                  are set to 1. Arrays that already have the expected shape and dtype are used without copying.
+            bodyparts (list[str], optional): The name of each bodypart. Defaults to 'bodypart<i>'.
+            scorer (str, optional): The name of the model or annotator. Defaults to None.
+        """
+        data = np.asarray(data)
+        if data.ndim != 3 or data.shape[-1] not in (2, 3):
+            raise ValueError(f"Expected coordinates shaped (frames, bodyparts, 2 or 3), got shape {data.shape}")
+
+        if data.shape[-1] == 2:
+            _data = np.ones(data.shape[:-1] + (3,), dtype=PoseData.DTYPE)
+            _data[..., :2] = data
+            data = _data
+        elif data.dtype != PoseData.DTYPE:
+            data = data.astype(PoseData.DTYPE)
+
+        if bodyparts is None:
+            bodyparts = [f"bodypart{i}" for i in range(data.shape[1])]
+        if len(bodyparts) != data.shape[1]:
+            raise ValueError(f"Expected {data.shape[1]} bodypart names, got {len(bodyparts)}")
+
+        super().__init__(data)
+        self.bodyparts = list(bodyparts)
+        self.scorer = scorer
+        self._bodypart_lookup = {name: i for i, name in enumerate(self.bodyparts)}
+
+    def __repr__(self):
+        return (f"PoseData(frames={self.n_frames}, bodyparts={self.n_bodyparts}, scorer={self.scorer}, "
+                f"nbytes={self.nbytes})")
+
+    def __len__(self):
+        return self.n_frames
+
+    def __getitem__(self, frames) -> 'PoseData':
+        """
+        Returns the given frames of every bodypart; integer and slice keys return views.
+
+        Args:
+            frames: An integer, slice or index array of frames.
+
+        Returns:
+            PoseData: The selected frames.
+        """
+        if isinstance(frames, (int, np.integer)):
+            frames = slice(frames, frames + 1 if frames != -1 else None)
+        return PoseData(self.data[frames], self.bodyparts, self.scorer)
+
+    @property
+    def n_frames(self) -> int:
+        """Gets the number of frames."""
+        return self.data.shape[0]
+
+    @property
+    def n_bodyparts(self) -> int:
+        """Gets the number of bodyparts."""
+        return self.data.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """Gets the size of the coordinate array in bytes."""
+        return self.data.nbytes
+
+    @property
+    def x(self) -> np.ndarray:
+        """Gets a (frames, bodyparts) view of the x coordinates."""
+        return self.data[..., 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        """Gets a (frames, bodyparts) view of the y coordinates."""
+        return self.data[..., 1]
+
+    @property
+    def likelihood(self) -> np.ndarray:
+        """Gets a (frames, bodyparts) view of the likelihoods."""
+        return self.data[..., 2]
+
+    @property
+    def xy(self) -> np.ndarray:
+        """Gets a (frames, bodyparts, 2) view of the x and y coordinates."""
+        return self.data[..., :2]
+
+    def select(self, frames: Optional[slice] = None, bodyparts: Union[str, list, None] = None) -> 'PoseData':
+        """
+        Selects a frame range and a subset of bodyparts.
+
+        Frame slices and bodyparts that are evenly spaced in array order (for example a single bodypart or a
+        contiguous run) are selected without copying; other bodypart selections are copied.
+
+        Args:
+            frames (slice, optional): The frames to select. Defaults to every frame.
+            bodyparts (str | list[str], optional): The bodyparts to select. Defaults to every bodypart.
+
+        Returns:
+            PoseData: The selection.
+        """
+        if frames is None:
+            frames = slice(None)
+
+        if bodyparts is None:
+            return PoseData(self.data[frames], self.bodyparts, self.scorer)
+
+        if isinstance(bodyparts, str):
+            bodyparts = [bodyparts]
+
+        missing = [name for name in bodyparts if name not in self._bodypart_lookup]
+        if missing:
+            raise KeyError(f"Unknown bodyparts: {missing}")
+
+        indices = [self._bodypart_lookup[name] for name in bodyparts]
+        return PoseData(self.data[frames][:, self._as_slice(indices)], list(bodyparts), self.scorer)
+
+    def with_coordinates(self, xy) -> 'PoseData':
+        """
+        Returns a copy with new x and y coordinates and the same likelihoods and metadata.
+
+        Args:
+            xy (np.ndarray): The new coordinates, shaped (frames, bodyparts, 2).
+
+        Returns:
+            PoseData: The new pose data.
+        """
+        data = self.data.copy()
+        data[..., :2] = xy
+        return PoseData(data, self.bodyparts, self.scorer)
+
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """
+        Converts the pose data to a DataFrame with DeepLabCut-style (scorer, bodyparts, coords) column levels.
+
+        Returns:
+            pd.DataFrame: The pose data, one row per frame.
+        """
+        columns = pd.MultiIndex.from_product([[self.scorer or 'scorer'], self.bodyparts, list(PoseData.FIELDS)],
+                                             names=['scorer', 'bodyparts', 'coords'])
+        return pd.DataFrame(self.data.reshape(self.n_frames, -1), columns=columns)
+
+    @staticmethod
+    def from_dataframe(dataframe: 'pd.DataFrame', scorer: Optional[str] = None) -> 'PoseData':
+        """
+        Creates pose data from a DataFrame.
+
+        Supported layouts are DeepLabCut-style column levels ending in (bodyparts, coords), optionally preceded by
+        scorer and individuals levels, and flat columns named '<bodypart>_x', '<bodypart>_y' and, optionally,
+        '<bodypart>_likelihood'. Multi-animal bodyparts are named '<individual>_<bodypart>'.
+
+        Args:
+            dataframe (pd.DataFrame): The pose data, one row per frame.
+            scorer (str, optional): The scorer name, overriding the one stored in the columns.
+
+        Returns:
+            PoseData: The pose data.
+        """
+        if isinstance(dataframe.columns, pd.MultiIndex):
+            levels = dataframe.columns.nlevels
+            fields = dataframe.columns.get_level_values(levels - 1)
+            keys = list(zip(*[dataframe.columns.get_level_values(i) for i in range(levels - 1)]))
+            if scorer is None and levels >= 3:
+                scorer = str(dataframe.columns.get_level_values(0)[0])
+            names = ['_'.join(str(part) for part in key[1 if levels >= 3 else 0:]) for key in keys]
+        else:
+            fields, names = [], []
+            for column in dataframe.columns:
+                name, _, field = str(column).rpartition('_')
+                fields.append(field)
+                names.append(name)
+
+        bodyparts = list(dict.fromkeys(name for name, field in zip(names, fields) if field in PoseData.FIELDS))
+        lookup = {name: i for i, name in enumerate(bodyparts)}
+
+        values = dataframe.to_numpy(dtype=PoseData.DTYPE, na_value=np.nan)
+        data = np.ones((len(dataframe), len(bodyparts), 3), dtype=PoseData.DTYPE)
+        for column, (name, field) in enumerate(zip(names, fields)):
+            if field in PoseData.FIELDS:
+                data[:, lookup[name], PoseData.FIELDS.index(field)] = values[:, column]
+
+        return PoseData(data, bodyparts, scorer)
+
+    @staticmethod
+    def from_dlc_csv(file_path: str) -> 'PoseData':
+        """
+        Creates pose data from a DeepLabCut CSV file, single- or multi-animal.
+
+        Args:
+            file_path (str): The path to the CSV file.
+
+        Returns:
+            PoseData: The pose data.
+        """
+        with open(file_path, 'r') as file:
+            header_rows = 0
+            for line in file:
+                label = line.split(',', 1)[0].strip().lower()
+                if label not in ('scorer', 'individuals', 'bodyparts', 'coords'):
+                    break
+                header_rows += 1
+
+        if header_rows < 2:
+            raise ValueError(f"'{file_path}' does not have DeepLabCut header rows")
+
+        dataframe = pd.read_csv(file_path, header=list(range(header_rows)), index_col=0)
+        return PoseData.from_dataframe(dataframe)
+
+    def save(self, file_path: str):
+        """
+        Saves the coordinates to a .npy file and the metadata to a JSON file next to it.
+
+        Args:
+            file_path (str): The path of the .npy file.
+        """
+        file_path = PoseData._npy_path(file_path)
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        np.save(file_path, np.ascontiguousarray(self.data))
+        with open(PoseData._metadata_path(file_path), 'w') as file:
+            json.dump({'bodyparts': self.bodyparts, 'scorer': self.scorer}, file)
+
+    @staticmethod
+    def load(file_path: str, mmap_mode: Optional[str] = 'r') -> 'PoseData':
+        """
+        Loads pose data saved with `save`, memory-mapping the coordinates by default.
+
+        Args:
+            file_path (str): The path of the .npy file.
+            mmap_mode (str, optional): The numpy memory-map mode, or None to read the file into memory.
+                                       Defaults to 'r'.
+
+        Returns:
+            PoseData: The pose data.
+        """
+        file_path = PoseData._npy_path(file_path)
+        metadata = dict()
+        if os.path.exists(PoseData._metadata_path(file_path)):
+            with open(PoseData._metadata_path(file_path), 'r') as file:
+                metadata = json.load(file)
+
+        return PoseData(np.load(file_path, mmap_mode=mmap_mode), metadata.get('bodyparts'), metadata.get('scorer'))
+
+    @staticmethod
+    def _as_slice(indices: list):
+        """
+        Returns a slice equivalent to evenly spaced indices, so that indexing returns a view; otherwise the indices.
+
+        Args:
+            indices (list[int]): The indices.
+
+        Returns:
+            slice | list[int]: The equivalent slice, or the indices. No indices select an empty slice.
+        """
+        if not indices:
+            return slice(0, 0)
+        if len(indices) == 1:
+            return slice(indices[0], indices[0] + 1)
+
+        step = indices[1] - indices[0]
+        if step > 0 and all(b - a == step for a, b in zip(indices, indices[1:])):
+            return slice(indices[0], indices[-1] + 1, step)
+        return indices
+
+    @staticmethod
+    def _npy_path(file_path: str) -> str:
+        return file_path if file_path.endswith('.npy') else f"{file_path}.npy"
+
+    @staticmethod
+    def _metadata_path(file_path: str) -> str:
+        return f"{os.path.splitext(file_path)[0]}.pose.json"
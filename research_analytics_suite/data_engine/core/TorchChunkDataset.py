@@ -0,0 +1,147 @@
+"""
+TorchChunkDataset Module
+
+Defines the TorchChunkDataset class, an IterableDataset that streams batches from chunked engine data. Only one chunk,
+such as one Dask partition or one block of rows of a memmap, is held in memory at a time, and batches are served as
+slices of the chunk's tensor rather than assembled sample by sample.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import numpy as np
+import pandas as pd
+import torch
+from torch.utils.data import IterableDataset, get_worker_info
+
+from research_analytics_suite.data_engine.core.TorchData import TorchData
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+dd = lazy_import('dask.dataframe')
+
+
+class TorchChunkDataset(IterableDataset):
+    """
+    Streams tensor batches from a Dask DataFrame, a pandas DataFrame, a numpy array or memmap, or a tensor.
+
+    A Dask DataFrame is read one partition at a time; other data is split into blocks of chunk_rows rows, which are
+    views of the storage. Batches never span more than two chunks. When shuffling, the chunk order and the rows within
+    each chunk are shuffled. With several DataLoader workers, each worker streams a disjoint subset of the chunks. Use
+    with `DataLoader(dataset, batch_size=None)`.
+
+    Attributes:
+        data: The chunked data.
+        batch_size (int): The number of rows per batch.
+        chunk_rows (int): The number of rows per chunk, for data that is not a Dask DataFrame.
+        shuffle (bool): Whether to shuffle the chunks and the rows within them.
+        drop_last (bool): Whether to drop the last batch if it is incomplete.
+    """
+
+    def __init__(self, data, batch_size: int = 32, columns=None, chunk_rows: int = 65536, shuffle: bool = False,
+                 drop_last: bool = False, seed: int = 0):
+        """
+        Initializes the TorchChunkDataset instance.
+
+        Args:
+            data: The chunked data.
+            batch_size (int): The number of rows per batch. Defaults to 32.
+            columns (list, optional): The DataFrame columns to stream. Defaults to all columns.
+            chunk_rows (int): The number of rows per chunk, for data that is not a Dask DataFrame. Defaults to 65536.
+            shuffle (bool): Whether to shuffle the chunks and the rows within them. Defaults to False.
+            drop_last (bool): Whether to drop the last batch if it is incomplete. Defaults to False.
+            seed (int): The seed of the shuffling, combined with the epoch. Defaults to 0.
+        """
+        super().__init__()
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if columns is not None and isinstance(data, (pd.DataFrame, dd.DataFrame)):
+            data = data[list(columns)]
+
+        self.data = data
+        self.batch_size = int(batch_size)
+        self.chunk_rows = max(int(chunk_rows), self.batch_size)
+        self.shuffle = shuffle
+        self.drop_last = drop_last
+        self._seed = seed
+        self._epoch = 0
+
+    def set_epoch(self, epoch: int):
+        """
+        Sets the epoch, so that each epoch is shuffled differently.
+
+        Args:
+            epoch (int): The epoch.
+        """
+        self._epoch = epoch
+
+    @property
+    def num_chunks(self) -> int:
+        """Gets the number of chunks of the data."""
+        if isinstance(self.data, dd.DataFrame):
+            return self.data.npartitions
+        return -(-len(self.data) // self.chunk_rows)
+
+    def __iter__(self):
+        """
+        Yields the batches of one epoch, for the chunks assigned to the current worker.
+
+        Yields:
+            torch.Tensor: A batch.
+        """
+        rng = np.random.default_rng([self._seed, self._epoch])
+        chunks = rng.permutation(self.num_chunks) if self.shuffle else np.arange(self.num_chunks)
+
+        worker = get_worker_info()
+        if worker is not None:
+            chunks = chunks[worker.id::worker.num_workers]
+
+        carry = None
+        for chunk in chunks:
+            tensor = self._chunk(int(chunk))
+            order = rng.permutation(len(tensor)) if self.shuffle else None
+            start = 0
+
+            if carry is not None:
+                start = min(self.batch_size - len(carry), len(tensor))
+                head = tensor[:start] if order is None else tensor[np.sort(order[:start])]
+                carry = torch.cat([carry, head])
+                if len(carry) < self.batch_size:
+                    continue
+                yield carry
+                carry = None
+
+            while start + self.batch_size <= len(tensor):
+                stop = start + self.batch_size
+                yield tensor[start:stop] if order is None else tensor[np.sort(order[start:stop])]
+                start = stop
+
+            if start < len(tensor):
+                carry = tensor[start:] if order is None else tensor[np.sort(order[start:])]
+
+        if carry is not None and not self.drop_last:
+            yield carry
+
+    def _chunk(self, index: int) -> torch.Tensor:
+        """
+        Loads a chunk as a tensor, sharing the storage of numpy and memmap data.
+
+        Args:
+            index (int): The index of the chunk.
+
+        Returns:
+            torch.Tensor: The chunk.
+        """
+        if isinstance(self.data, dd.DataFrame):
+            return TorchData.from_numpy(TorchData.frame_values(self.data.get_partition(index).compute()))
+
+        rows = slice(index * self.chunk_rows, (index + 1) * self.chunk_rows)
+        if isinstance(self.data, pd.DataFrame):
+            return TorchData.from_numpy(TorchData.frame_values(self.data.iloc[rows]))
+        if isinstance(self.data, np.ndarray):
+            return TorchData.from_numpy(self.data[rows])
+        return torch.as_tensor(self.data[rows])
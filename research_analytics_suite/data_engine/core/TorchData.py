@@ -1,7 +1,8 @@
 """
 TorchData Module
 
-Defines the TorchData class for handling data using PyTorch in the Research Analytics Suite.
+Defines the TorchData class for handling data using PyTorch in the Research Analytics Suite. Numeric numpy and
+memmap storage, and homogeneous DataFrames, are shared with the tensor through torch.from_numpy rather than copied.
 
 Author: Lane
 Copyright: Lane
@@ -12,6 +13,8 @@ Maintainer: Lane
 Email: justlane@uw.edu
 Status: Prototype
 """
+import warnings
+
 import numpy as np
 import pandas as pd
 import torch
@@ -52,8 +55,11 @@ class TorchData(BaseData, Dataset):
         """
         Retrieves an item from the PyTorch tensor by index.
 
+        A slice or an array of indices retrieves a whole batch with one indexing operation; a slice returns a view of
+        the storage. See BatchIndexSampler.
+
         Args:
-            idx (int): The index of the item to retrieve.
+            idx (int | slice | np.ndarray): The index, or indices, of the items to retrieve.
 
         Returns:
             The item at the specified index.
@@ -72,14 +78,54 @@ class TorchData(BaseData, Dataset):
         if isinstance(data, torch.Tensor):
             tensor = data
         elif isinstance(data, pd.DataFrame):
-            tensor = torch.tensor(data.values)
+            tensor = TorchData.from_numpy(TorchData.frame_values(data))
         elif isinstance(data, np.ndarray):
-            tensor = torch.tensor(data)
-        elif isinstance(data, list):
-            tensor = torch.tensor(data)
+            tensor = TorchData.from_numpy(data)
+        elif isinstance(data, (list, tuple)):
+            tensor = TorchData.from_numpy(np.asarray(data))
         elif isinstance(data, dict):
-            tensor = torch.tensor(list(data.values()))
-        elif isinstance(data, tuple):
-            tensor = torch.tensor(data)
+            tensor = TorchData.from_numpy(np.asarray(list(data.values())))
 
         return tensor
+
+    @staticmethod
+    def from_numpy(array: np.ndarray) -> torch.Tensor:
+        """
+        Wraps a numpy array, or memmap, in a tensor that shares its storage.
+
+        Arrays that torch cannot share, such as object or non-native byte order arrays, are copied instead. Read-only
+        arrays, such as memmaps opened with mode 'r', are shared as well and must not be written through the tensor.
+
+        Args:
+            array (np.ndarray): The array.
+
+        Returns:
+            torch.Tensor: The tensor.
+        """
+        if array.dtype.kind in 'biufc' and array.dtype.isnative and all(stride >= 0 for stride in array.strides):
+            try:
+                with warnings.catch_warnings():
+                    warnings.filterwarnings('ignore', message='The given NumPy array is not writable')
+                    return torch.from_numpy(array)
+            except (TypeError, ValueError):
+                pass
+        return torch.tensor(array)
+
+    @staticmethod
+    def frame_values(data: pd.DataFrame) -> np.ndarray:
+        """
+        Returns the values of a DataFrame as one numeric array.
+
+        A DataFrame with a single numeric dtype returns a view of its block; mixed numeric dtypes are converted to
+        their common type in one copy.
+
+        Args:
+            data (pd.DataFrame): The DataFrame.
+
+        Returns:
+            np.ndarray: The values.
+        """
+        dtypes = set(data.dtypes)
+        if len(dtypes) > 1 and all(isinstance(dtype, np.dtype) and dtype.kind in 'biuf' for dtype in dtypes):
+            return data.to_numpy(dtype=np.result_type(*dtypes))
+        return data.to_numpy()
@@ -1,8 +1,29 @@
 """
 Core classes for data handling.
+
+TorchData and TorchChunkDataset are imported on first access (PEP 562) so that torch is only loaded when the torch
+backend is used.
 """
 
 from .BaseData import BaseData
+from .BatchIndexSampler import BatchIndexSampler
 from .DaskData import DaskData
-from .TorchData import TorchData
 from .DataPipeline import DataPipeline
+from .PartitionPlanner import PartitionPlanner
+from .PipelineCheckpoints import PipelineCheckpoints
+from .PoseData import PoseData
+
+__all__ = ['BaseData', 'BatchIndexSampler', 'DaskData', 'DataPipeline', 'PartitionPlanner', 'PipelineCheckpoints',
+           'PoseData']
+
+
+def __getattr__(name):
+    if name == 'TorchData':
+        from .TorchData import TorchData
+        globals()['TorchData'] = TorchData
+        return TorchData
+    if name == 'TorchChunkDataset':
+        from .TorchChunkDataset import TorchChunkDataset
+        globals()['TorchChunkDataset'] = TorchChunkDataset
+        return TorchChunkDataset
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -3,6 +3,9 @@ AnalogInput Module
 
 Defines the AnalogInput class for handling live data input from analog sources.
 
+The read function is called on the input's reader thread, so a blocking acquisition call never blocks the event
+loop.
+
 Author: Lane
 Copyright: Lane
 Credits: Lane
@@ -12,37 +15,51 @@ Maintainer: Lane
 Email: justlane@uw.edu
 Status: Prototype
 """
-from research_analytics_suite.data_engine.data_streams import BaseInput
+import time
+
+from research_analytics_suite.data_engine.data_streams.ThreadedInput import ThreadedInput
 
 
-class AnalogInput(BaseInput):
+class AnalogInput(ThreadedInput):
     """
     Class for handling live data input from an analog source.
 
     Attributes:
         read_function: The function to read data from the analog source.
+        sample_rate: The rate, in Hz, at which the read function is called, or None to call it back to back.
     """
-    def __init__(self, read_function):
+    def __init__(self, read_function, sample_rate=None, **kwargs):
         """
         Initializes the AnalogInput instance.
 
         Args:
             read_function (function): The function to read data from the analog source.
+            sample_rate (float, optional): The rate, in Hz, at which the read function is called. Defaults to None.
+            **kwargs: Queue size, overflow policy and poll interval, see ThreadedInput.
         """
-        super().__init__(source="Analog")
+        super().__init__(source="Analog", **kwargs)
         self.read_function = read_function
+        self.sample_rate = sample_rate
+        self._next_read = None
+
+    def start(self):
+        """Starts the reader thread, pacing reads from now instead of catching up on the reads missed while stopped."""
+        if not self.is_running:
+            self._next_read = None
+        super().start()
 
     def read_data(self):
         """
-        Reads data from the analog source.
+        Reads data from the analog source, pacing reads to `sample_rate` when it is set.
 
         Returns:
             The data read from the analog source.
         """
+        if self.sample_rate:
+            now = time.monotonic()
+            if self._next_read is None:
+                self._next_read = now
+            if self._next_read > now:
+                self._stop_event.wait(self._next_read - now)
+            self._next_read += 1.0 / self.sample_rate
         return self.read_function()
-
-    def close(self):
-        """
-        Placeholder for closing any resources, if necessary.
-        """
-        pass
@@ -6,17 +6,41 @@ Research Analytics Suite. It provides a common interface for different types of
 
 Author: Lane
 """
+import time
 
 
 class BaseInput:
     """
     A base class for handling live data inputs.
 
+    Attributes:
+        source (str): The type of source the input reads from.
+        buffer (RingBuffer): The ring buffer the input's samples are ingested into, once attached.
+
     Methods:
         start(): Starts the live data input.
         stop(): Stops the live data input.
         read(): Reads data from the live input.
     """
+    def __init__(self, source=None):
+        """
+        Initializes the BaseInput instance.
+
+        Args:
+            source (str, optional): The type of source the input reads from.
+        """
+        self.source = source
+        self.buffer = None
+
+    def attach_buffer(self, buffer):
+        """
+        Attaches the ring buffer the input's samples are ingested into.
+
+        Args:
+            buffer (RingBuffer): The ring buffer.
+        """
+        self.buffer = buffer
+
     def start(self):
         """Starts the live data input."""
         raise NotImplementedError("Subclasses should implement this method")
@@ -28,3 +52,16 @@ class BaseInput:
     def read(self):
         """Reads data from the live input."""
         raise NotImplementedError("Subclasses should implement this method")
+
+    def drain(self, max_items: int = None) -> list:
+        """
+        Returns the samples available from the live input without blocking.
+
+        Args:
+            max_items (int, optional): The maximum number of samples to return. Defaults to every available sample.
+
+        Returns:
+            list[tuple[float, object]]: The timestamp and value of each sample, oldest first.
+        """
+        sample = self.read()
+        return [] if sample is None else [(time.time(), sample)]
@@ -3,7 +3,11 @@ DataTypeDetector Module
 
 This module defines the DataTypeDetector class, which provides methods to detect the type of data within
 a file or data input source within the research analytics suite. It supports multiple data formats
-including CSV, JSON, Excel, Parquet, Avro, and HDF5.
+including CSV, JSON, NDJSON, Excel, Parquet, Avro, and HDF5.
+
+Formats are identified from their signatures in the first and last few kilobytes of the file, without parsing the
+file: binary formats by their magic bytes, and text formats by their encoding, leading characters and a delimiter
+sniffed from the first lines.
 
 Author: Lane
 Copyright: Lane
@@ -14,9 +18,17 @@ Maintainer: Lane
 Email: justlane@uw.edu
 Status: Prototype
 """
+import codecs
+import csv
+import io
 import json
+import os
+import zipfile
+from collections import Counter
+
+from research_analytics_suite.utils.LazyModule import lazy_import
 
-import dask.dataframe as dd
+pq = lazy_import('pyarrow.parquet')
 
 
 class DataTypeDetector:
@@ -24,23 +36,58 @@ class DataTypeDetector:
     A class for detecting the type of data within a file or data input source.
 
     Methods:
-        detect_type(file_path) - Detects the type of data based on the file extension or content.
+        detect_type(file_path) - Detects the type of data based on the file content or extension.
+        detect(file_path) - Detects the format, encoding, delimiter, header row and estimated row count of a file.
         detect_by_content(file_path) - Detects the type of data by inspecting the content of the file.
         read_partial_file(file_path, size) - Reads a partial content from the file.
     """
+    HEAD_SIZE = 8192
+    TAIL_SIZE = 4096
+    SAMPLE_LINES = 64
+    DELIMITERS = (',', '\t', ';', '|')
+    NA_VALUES = frozenset({'', 'na', 'n/a', '#n/a', 'nan', 'null', 'none'})
+
+    PARQUET_MAGIC = b'PAR1'
+    HDF5_MAGIC = b'\x89HDF\r\n\x1a\n'
+    HDF5_OFFSETS = (0, 512, 1024, 2048, 4096)
+    ZIP_MAGIC = b'PK\x03\x04'
+    OLE_MAGIC = b'\xD0\xCF\x11\xE0\xA1\xB1\x1A\xE1'
+    AVRO_MAGIC = b'Obj\x01'
+
+    EXTENSIONS = {
+        '.csv': 'csv', '.tsv': 'csv', '.txt': 'csv', '.json': 'json', '.ndjson': 'ndjson', '.jsonl': 'ndjson',
+        '.xlsx': 'excel', '.xls': 'excel', '.excel': 'excel', '.parquet': 'parquet', '.avro': 'avro',
+        '.h5': 'hdf5', '.hdf5': 'hdf5', '.hdf': 'hdf5',
+    }
+
     @staticmethod
     def detect_type(file_path):
         """
-        Detects the type of data based on the file extension or content.
+        Detects the type of data based on the file content, or on the extension if the file is missing or empty.
 
         Args:
             file_path (str): The path to the data file.
 
         Returns:
-            str: The detected data type ('csv', 'json', 'excel', 'parquet', 'avro', 'hdf5', 'unknown').
+            str: The detected data type ('csv', 'json', 'ndjson', 'excel', 'parquet', 'avro', 'hdf5', 'unknown').
         """
+        if not os.path.isfile(file_path) or os.path.getsize(file_path) == 0:
+            return DataTypeDetector.detect_by_extension(file_path)
         return DataTypeDetector.detect_by_content(file_path)
 
+    @staticmethod
+    def detect_by_extension(file_path):
+        """
+        Detects the type of data from the file extension.
+
+        Args:
+            file_path (str): The path to the data file.
+
+        Returns:
+            str: The detected data type, or 'unknown'.
+        """
+        return DataTypeDetector.EXTENSIONS.get(os.path.splitext(file_path)[1].lower(), 'unknown')
+
     @staticmethod
     def detect_by_content(file_path):
         """
@@ -50,62 +97,51 @@ class DataTypeDetector:
             file_path (str): The path to the data file.
 
         Returns:
-            str: The detected data type ('csv', 'json', 'excel', 'parquet', 'avro', 'hdf5', 'unknown').
+            str: The detected data type ('csv', 'json', 'ndjson', 'excel', 'parquet', 'avro', 'hdf5', 'unknown').
         """
-        try:
-            content = DataTypeDetector.read_partial_file(file_path, 2048)
+        return DataTypeDetector.detect(file_path)['format']
 
-            # Try detecting JSON
-            try:
-                json.loads(content)
-                return 'json'
-            except json.JSONDecodeError:
-                pass
-
-            # Try detecting CSV
-            if ',' in content or ';' in content:
-                try:
-                    dd.read_csv(file_path, blocksize=25e6).head(5)
-                    return 'csv'
-                except Exception as e:
-                    print(f"Error reading CSV file: {e}")
-
-            # Try detecting Excel
-            if content.startswith(b'\x50\x4B\x03\x04') or content.startswith(b'\xD0\xCF\x11\xE0'):
-                try:
-                    dd.read_excel(file_path, nrows=5)
-                    return 'excel'
-                except Exception as e:
-                    print(f"Error reading Excel file: {e}")
-
-            # Try detecting Parquet
-            try:
-                dd.read_parquet(file_path).head(5)
-                return 'parquet'
-            except Exception as e:
-                print(f"Error reading Parquet file: {e}")
+    @staticmethod
+    def detect(file_path):
+        """
+        Detects the format of a file from its first and last few kilobytes.
 
-            # Try detecting Avro
-            try:
-                import fastavro
-                with open(file_path, 'rb') as f:
-                    reader = fastavro.reader(f)
-                    _ = next(reader)
-                    return 'avro'
-            except Exception as e:
-                print(f"Error reading Avro file: {e}")
-
-            # Try detecting HDF5
-            try:
-                dd.read_hdf(file_path, '/data').head(5)
-                return 'hdf5'
-            except Exception as e:
-                print(f"Error reading HDF5 file: {e}")
+        Args:
+            file_path (str): The path to the data file.
 
-        except Exception as e:
-            print(f"Error reading file: {e}")
+        Returns:
+            dict: The detected 'format'; the text 'encoding', 'delimiter', 'header_row' (the index of the last
+                  header line, or None) and 'data_row' (the index of the first data line) of delimited files; the
+                  'estimated_rows', exact where the file's metadata or size allows; and the file 'size' in bytes.
+                  Fields that do not apply are None.
+        """
+        info = {'format': 'unknown', 'encoding': None, 'delimiter': None, 'header_row': None, 'data_row': None,
+                'estimated_rows': None, 'size': 0}
+        try:
+            size = os.path.getsize(file_path)
+            info['size'] = size
+            with open(file_path, 'rb') as file:
+                head = file.read(DataTypeDetector.HEAD_SIZE)
+                if size > len(head):
+                    file.seek(max(len(head), size - DataTypeDetector.TAIL_SIZE))
+                    tail = file.read()
+                else:
+                    tail = head[-DataTypeDetector.TAIL_SIZE:]
+        except OSError:
+            return info
 
-        return 'unknown'
+        if not head:
+            return info
+
+        binary_format = DataTypeDetector._detect_binary(file_path, head, tail)
+        if binary_format is not None:
+            info['format'] = binary_format
+            if binary_format == 'parquet':
+                info['estimated_rows'] = DataTypeDetector._parquet_rows(file_path)
+            return info
+
+        info.update(DataTypeDetector._detect_text(head, size))
+        return info
 
     @staticmethod
     def read_partial_file(file_path, size):
@@ -121,3 +157,249 @@ class DataTypeDetector:
         """
         with open(file_path, 'rb') as file:
             return file.read(size).decode('utf-8', errors='ignore')
+
+    @staticmethod
+    def _detect_binary(file_path, head, tail):
+        """
+        Detects a binary format from its magic bytes.
+
+        Args:
+            file_path (str): The path to the file.
+            head (bytes): The first bytes of the file.
+            tail (bytes): The last bytes of the file.
+
+        Returns:
+            str: The detected format, or None if the file is not a known binary format.
+        """
+        if head.startswith(DataTypeDetector.PARQUET_MAGIC) and tail.endswith(DataTypeDetector.PARQUET_MAGIC):
+            return 'parquet'
+        if head.startswith(DataTypeDetector.AVRO_MAGIC):
+            return 'avro'
+        if head.startswith(DataTypeDetector.OLE_MAGIC):
+            return 'excel'
+        if any(head[offset:offset + 8] == DataTypeDetector.HDF5_MAGIC for offset in DataTypeDetector.HDF5_OFFSETS):
+            return 'hdf5'
+        if head.startswith(DataTypeDetector.ZIP_MAGIC):
+            try:
+                with zipfile.ZipFile(file_path) as archive:
+                    names = archive.namelist()
+            except (zipfile.BadZipFile, OSError):
+                return 'unknown'
+            return 'excel' if any(name.startswith('xl/') for name in names) else 'unknown'
+        if b'\x00' in head and not head.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+            return 'unknown'
+        return None
+
+    @staticmethod
+    def _parquet_rows(file_path):
+        """
+        Reads the row count of a Parquet file from its footer.
+
+        Args:
+            file_path (str): The path to the file.
+
+        Returns:
+            int: The number of rows, or None if the footer could not be read.
+        """
+        try:
+            return pq.ParquetFile(file_path).metadata.num_rows
+        except Exception:
+            return None
+
+    @staticmethod
+    def _detect_text(head, size):
+        """
+        Detects the encoding and format of a text file, and the layout of delimited text.
+
+        Args:
+            head (bytes): The first bytes of the file.
+            size (int): The size of the file in bytes.
+
+        Returns:
+            dict: The detected fields.
+        """
+        encoding, text = DataTypeDetector._decode(head)
+        complete = len(head) >= size
+        lines = text.splitlines()
+        if not complete and lines:
+            lines = lines[:-1]
+        # Rows are counted from every line when the head is the whole file, and sniffed from the first few
+        counted = lines if complete else lines[:DataTypeDetector.SAMPLE_LINES]
+        lines = lines[:DataTypeDetector.SAMPLE_LINES]
+        info = {'encoding': encoding}
+
+        stripped = text.lstrip()
+        if stripped.startswith(('{', '[')):
+            records = [line for line in lines if line.strip()]
+            if len(records) > 1 and all(DataTypeDetector._is_json_object(line) for line in records[:2]):
+                info['format'] = 'ndjson'
+                info['data_row'] = 0
+                info['estimated_rows'] = DataTypeDetector._estimate_rows(counted, 0, size, complete, encoding)
+            else:
+                info['format'] = 'json'
+            return info
+
+        rows, delimiter = DataTypeDetector._sniff_delimiter(lines)
+        if delimiter is None:
+            return info
+
+        data_row = DataTypeDetector.find_data_row(rows)
+        info.update({
+            'format': 'csv',
+            'delimiter': delimiter,
+            'data_row': data_row,
+            'header_row': data_row - 1 if data_row > 0 else None,
+            'estimated_rows': DataTypeDetector._estimate_rows(counted, data_row, size, complete, encoding),
+        })
+        return info
+
+    @staticmethod
+    def _decode(head):
+        """
+        Detects the encoding of text from its byte order mark, falling back from UTF-8 to Latin-1.
+
+        Args:
+            head (bytes): The first bytes of the file.
+
+        Returns:
+            tuple[str, str]: The encoding and the decoded text.
+        """
+        for bom, encoding in ((codecs.BOM_UTF8, 'utf-8-sig'), (codecs.BOM_UTF16_LE, 'utf-16-le'),
+                              (codecs.BOM_UTF16_BE, 'utf-16-be')):
+            if head.startswith(bom):
+                return encoding, head[len(bom):].decode(encoding.replace('-sig', ''), errors='ignore')
+
+        try:
+            return 'utf-8', head.decode('utf-8')
+        except UnicodeDecodeError as e:
+            if e.start >= len(head) - 3:
+                return 'utf-8', head[:e.start].decode('utf-8')
+            return 'latin-1', head.decode('latin-1')
+
+    @staticmethod
+    def _is_json_object(line):
+        """
+        Returns whether a line holds a single JSON object or array.
+
+        Args:
+            line (str): The line.
+
+        Returns:
+            bool: Whether the line is a JSON object or array.
+        """
+        try:
+            return isinstance(json.loads(line), (dict, list))
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _sniff_delimiter(lines):
+        """
+        Chooses the delimiter that splits the sample lines into the most consistent number of fields.
+
+        Lines that contain none of the delimiters are a single column when every line after the first has the same
+        numeric or text kind; they are split on commas.
+
+        Args:
+            lines (list[str]): The sample lines.
+
+        Returns:
+            tuple[list[list[str]], str]: The lines split on the delimiter and the delimiter, or ([], None).
+        """
+        lines = [line for line in lines if line.strip()]
+        best, best_score = ([], None), None
+        for delimiter in DataTypeDetector.DELIMITERS:
+            if not any(delimiter in line for line in lines):
+                continue
+            rows = list(csv.reader(io.StringIO('\n'.join(lines)), delimiter=delimiter))
+            widths = Counter(len(row) for row in rows)
+            width, count = widths.most_common(1)[0]
+            if width < 2:
+                continue
+            score = (count / len(rows), width)
+            if best_score is None or score > best_score:
+                best, best_score = (rows, delimiter), score
+
+        if best_score is None and lines and not any(delimiter in line for line in lines
+                                                    for delimiter in DataTypeDetector.DELIMITERS):
+            kinds = {DataTypeDetector.cell_kind(line) for line in lines[1:]} - {None}
+            if len(kinds) <= 1:
+                return [[line.strip()] for line in lines], ','
+        return best
+
+    @staticmethod
+    def find_data_row(rows):
+        """
+        Finds the first data row: the first row whose cells have the numeric or text kind of each column of the data.
+
+        The kind of each column is the most common kind of its non-empty cells in the second half of the sample. Empty
+        and NA cells match either kind, so missing values do not end the data, and every row before the first matching
+        row is a header row.
+
+        Args:
+            rows (list[list[str]]): The sample rows.
+
+        Returns:
+            int: The index of the first data row.
+        """
+        if not rows:
+            return 0
+
+        width = max(len(row) for row in rows)
+        kinds = [[DataTypeDetector.cell_kind(row[column]) if column < len(row) else None for column in range(width)]
+                 for row in rows]
+        reference = []
+        for column in range(width):
+            counts = Counter(row[column] for row in kinds[len(kinds) // 2:] if row[column] is not None)
+            reference.append(counts.most_common(1)[0][0] if counts else None)
+
+        data_row = len(kinds)
+        for i, row in enumerate(kinds):
+            filled = [(kind, expected) for kind, expected in zip(row, reference) if kind is not None]
+            if filled and all(expected is None or kind == expected for kind, expected in filled):
+                data_row = i
+                break
+
+        if data_row == 0 and not any(kind == 'number' for kind in reference) and len(rows) > 1:
+            return 1
+        return data_row
+
+    @staticmethod
+    def cell_kind(value):
+        """Returns 'number' or 'text' for a cell, or None for an empty or NA cell."""
+        value = str(value).strip()
+        if value.lower() in DataTypeDetector.NA_VALUES:
+            return None
+        return 'number' if DataTypeDetector._is_number(value) else 'text'
+
+    @staticmethod
+    def _is_number(value):
+        try:
+            float(value)
+            return True
+        except ValueError:
+            return False
+
+    @staticmethod
+    def _estimate_rows(lines, skip, size, complete, encoding):
+        """
+        Estimates the number of data rows from the average encoded length of the sample lines.
+
+        Args:
+            lines (list[str]): The complete sample lines.
+            skip (int): The number of leading lines that are not data rows.
+            size (int): The size of the file in bytes.
+            complete (bool): Whether the sample is the whole file.
+            encoding (str): The encoding of the file.
+
+        Returns:
+            int: The estimated number of data rows, or None if the sample has no data rows.
+        """
+        rows = [line for line in lines[skip:] if line.strip()]
+        if complete or not rows:
+            return len(rows) if complete else None
+
+        codec = encoding.replace('-sig', '')
+        header_bytes = sum(len(line.encode(codec)) + 1 for line in lines[:skip])
+        data_bytes = sum(len(line.encode(codec)) + 1 for line in lines[skip:])
+        return int(round((size - header_bytes) * len(rows) / data_bytes))
@@ -0,0 +1,257 @@
+"""
+DecimationPyramid Module
+
+Defines the DecimationPyramid class, a level-of-detail index over a live RingBuffer. Each level holds the minimum and
+maximum of every channel over fixed-size buckets of samples, each level's buckets `factor` times larger than the
+level below, so a plot can draw any time range with about two points per pixel while peaks are preserved. The
+pyramid is updated incrementally from the samples appended to the buffer since the previous update.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+from typing import Optional
+
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.RingBuffer import RingBuffer
+
+
+class DecimationPyramid:
+    """
+    Min/max decimation levels over a ring buffer.
+
+    Level 0 is the ring buffer itself. Level k (k >= 1) is a RingBuffer of buckets covering factor ** k samples, with
+    2 * channels values per bucket (the minimum of each channel, then the maximum) and the timestamp of the bucket's
+    first sample. Each level retains `capacity` buckets, so coarse levels cover a much longer history than the raw
+    buffer in the same memory.
+
+    Attributes:
+        buffer (RingBuffer): The ring buffer the pyramid is built from.
+        factor (int): The number of buckets of one level combined into a bucket of the next level.
+        levels (list[RingBuffer]): The decimated levels, finest first.
+    """
+
+    def __init__(self, buffer: RingBuffer, factor: int = 4, levels: int = 8, capacity: Optional[int] = None):
+        """
+        Initializes the DecimationPyramid instance.
+
+        Args:
+            buffer (RingBuffer): The ring buffer to build the pyramid from.
+            factor (int): The number of buckets combined into one bucket of the next level. Defaults to 4.
+            levels (int): The number of decimated levels. Defaults to 8.
+            capacity (int, optional): The number of buckets retained per level. Defaults to the buffer capacity
+                                      divided by the factor.
+        """
+        if factor < 2 or levels < 1:
+            raise ValueError("factor must be at least 2 and levels at least 1")
+
+        self.buffer = buffer
+        self.factor = int(factor)
+        capacity = int(capacity or max(1024, buffer.capacity // self.factor))
+        self.levels = [RingBuffer(capacity, channels=2 * buffer.channels, dtype=np.float64,
+                                  name=f"{buffer.name}_lod{k + 1}") for k in range(levels)]
+
+        self._consumed = 0
+        self._partial = [None] * levels
+
+    def __repr__(self):
+        return (f"DecimationPyramid(buffer={self.buffer.name}, factor={self.factor}, levels={len(self.levels)}, "
+                f"consumed={self._consumed})")
+
+    @property
+    def consumed(self) -> int:
+        """Gets the absolute index of the next buffer sample the pyramid has not yet seen."""
+        return self._consumed
+
+    def bucket_size(self, level: int) -> int:
+        """
+        Returns the number of raw samples per bucket of a level.
+
+        Args:
+            level (int): The level; 0 is the raw buffer.
+
+        Returns:
+            int: The number of samples per bucket.
+        """
+        return self.factor ** level
+
+    def update(self, max_samples: Optional[int] = None) -> int:
+        """
+        Adds the samples appended to the buffer since the previous update.
+
+        Samples that were overwritten in the buffer before they could be read are skipped.
+
+        Args:
+            max_samples (int, optional): The maximum number of samples to add. Defaults to every new sample.
+
+        Returns:
+            int: The number of samples added.
+        """
+        start = max(self._consumed, self.buffer.first_index)
+        stop = self.buffer.total_samples
+        if max_samples is not None:
+            stop = min(stop, start + int(max_samples))
+        if stop <= start:
+            return 0
+
+        timestamps, values = self.buffer.view(start, stop)
+        values = values.astype(np.float64, copy=False)
+        self._consumed = stop
+        self._add(0, timestamps, values, values)
+        return stop - start
+
+    def query(self, pixels: int, start: Optional[float] = None, stop: Optional[float] = None):
+        """
+        Returns the samples between two times, decimated to about two points per pixel.
+
+        The finest level whose retained history reaches `start` and which has no more than `pixels` buckets in the
+        range is used; if none qualifies, the coarsest level is combined further on the fly. Each bucket contributes
+        its minimum and its maximum, so peaks remain visible.
+
+        Args:
+            pixels (int): The number of horizontal pixels available.
+            start (float, optional): The earliest timestamp. Defaults to the oldest retained sample.
+            stop (float, optional): The latest timestamp. Defaults to the newest sample.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, int]: The timestamps, shaped (N,), the values, shaped (N, channels), and
+                                                the level used.
+        """
+        pixels = max(1, int(pixels))
+        channels = self.buffer.channels
+
+        coarsest = len(self.levels)
+        for level in range(coarsest + 1):
+            timestamps, values = self._level_data(level)
+            if len(timestamps) == 0:
+                continue
+
+            lower = 0 if start is None else max(0, int(np.searchsorted(timestamps, start, side='right')) - 1)
+            upper = len(timestamps) if stop is None else int(np.searchsorted(timestamps, stop, side='right'))
+            if level < coarsest:
+                if start is not None and timestamps[0] > start:
+                    continue
+                if upper - lower > (2 * pixels if level == 0 else pixels):
+                    continue
+
+            timestamps, values = timestamps[lower:upper], values[lower:upper]
+            if level == 0:
+                return timestamps.copy(), values.copy(), 0
+
+            group = -(-len(values) // pixels)
+            if group > 1:
+                timestamps, values = self._regroup(timestamps, values, group)
+
+            points = np.empty((2 * len(values), channels))
+            points[0::2] = values[:, :channels]
+            points[1::2] = values[:, channels:]
+            return np.repeat(timestamps, 2), points, level
+
+        return np.empty(0), np.empty((0, channels)), 0
+
+    def _regroup(self, timestamps: np.ndarray, values: np.ndarray, group: int):
+        """
+        Combines consecutive buckets of the coarsest level into larger buckets.
+
+        Args:
+            timestamps (np.ndarray): The timestamp of each bucket.
+            values (np.ndarray): The minima and maxima of each bucket.
+            group (int): The number of buckets combined.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The timestamps and values of the combined buckets.
+        """
+        channels = self.buffer.channels
+        starts = np.arange(0, len(values), group)
+        minima = np.minimum.reduceat(values[:, :channels], starts, axis=0)
+        maxima = np.maximum.reduceat(values[:, channels:], starts, axis=0)
+        return timestamps[starts], np.hstack([minima, maxima])
+
+    def _level_data(self, level: int):
+        """
+        Returns the retained data of a level, including its incomplete newest bucket.
+
+        The newest bucket combines the partial buckets of this level and of every level below it, which together
+        hold the samples seen since the level's last completed bucket.
+
+        Args:
+            level (int): The level; 0 is the raw buffer.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The timestamps and values of the level.
+        """
+        if level == 0:
+            start = max(self.buffer.first_index, 0)
+            return self.buffer.view(start, self._consumed) if self._consumed > start else (np.empty(0), np.empty(0))
+
+        timestamps, values = self.levels[level - 1].window()
+        partials = [partial for partial in reversed(self._partial[:level]) if partial is not None]
+        if not partials:
+            return timestamps, values
+
+        minimum = np.min([partial[1] for partial in partials], axis=0)
+        maximum = np.max([partial[2] for partial in partials], axis=0)
+        return (np.append(timestamps, partials[0][0]),
+                np.vstack([values, np.concatenate([minimum, maximum])[None, :]]))
+
+    def _add(self, level: int, timestamps: np.ndarray, minima: np.ndarray, maxima: np.ndarray):
+        """
+        Folds completed buckets of one level into the buckets of the level above.
+
+        Args:
+            level (int): The level the buckets belong to; 0 for raw samples.
+            timestamps (np.ndarray): The timestamp of each bucket.
+            minima (np.ndarray): The minimum of each channel per bucket.
+            maxima (np.ndarray): The maximum of each channel per bucket.
+        """
+        if level >= len(self.levels) or len(timestamps) == 0:
+            return
+
+        factor = self.factor
+        partial = self._partial[level]
+        index = 0
+
+        if partial is not None:
+            _timestamp, minimum, maximum, count = partial
+            take = min(factor - count, len(timestamps))
+            minimum = np.minimum(minimum, minima[:take].min(axis=0))
+            maximum = np.maximum(maximum, maxima[:take].max(axis=0))
+            count += take
+            index = take
+            if count < factor:
+                self._partial[level] = (_timestamp, minimum, maximum, count)
+                return
+            self._partial[level] = None
+            self._complete(level, np.array([_timestamp]), minimum[None, :], maximum[None, :])
+
+        whole = (len(timestamps) - index) // factor
+        if whole:
+            stop = index + whole * factor
+            channels = minima.shape[1]
+            self._complete(level, timestamps[index:stop:factor],
+                           minima[index:stop].reshape(whole, factor, channels).min(axis=1),
+                           maxima[index:stop].reshape(whole, factor, channels).max(axis=1))
+            index = stop
+
+        if index < len(timestamps):
+            self._partial[level] = (timestamps[index], minima[index:].min(axis=0), maxima[index:].max(axis=0),
+                                    len(timestamps) - index)
+
+    def _complete(self, level: int, timestamps: np.ndarray, minima: np.ndarray, maxima: np.ndarray):
+        """
+        Stores completed buckets in a level and passes them on to the level above.
+
+        Args:
+            level (int): The level the buckets were built for.
+            timestamps (np.ndarray): The timestamp of each bucket.
+            minima (np.ndarray): The minimum of each channel per bucket.
+            maxima (np.ndarray): The maximum of each channel per bucket.
+        """
+        self.levels[level].extend(np.hstack([minima, maxima]), timestamps)
+        self._add(level + 1, timestamps, minima, maxima)
@@ -4,10 +4,22 @@ LiveDataHandler Module
 This module defines the LiveDataHandler class, which handles live data inputs and integrates them into the
 Research Analytics Suite. It manages the lifecycle of live data sources and updates the data engine with new data.
 
+Each live input is ingested into its own preallocated RingBuffer, so the cost of ingesting a sample does not grow
+with the length of the recording; full blocks are spilled to Parquet files in the workspace data directory. Stream
+operators attached to a buffer are updated with each sample as it is ingested and publish their results into memory
+slots.
+
 Author: Lane
 """
+import asyncio
+import os
+
+import numpy as np
 
 from .BaseInput import BaseInput
+from .RingBuffer import RingBuffer
+from .operators.StreamOperator import StreamOperator
+from research_analytics_suite.utils.Config import Config
 from research_analytics_suite.utils.CustomLogger import CustomLogger
 
 
@@ -18,41 +30,241 @@ class LiveDataHandler:
     Attributes:
         data_engine (DataEngineOptimized): The data engine to update with live data.
         live_inputs (list): List of live data inputs.
+        buffers (dict[str, RingBuffer]): The ring buffer of each live input, keyed by buffer name.
+        operators (dict[str, list[StreamOperator]]): The stream operators attached to each buffer, keyed by buffer name.
     """
-    def __init__(self, data_engine):
+    DEFAULT_CAPACITY = 65536
+    DEFAULT_BLOCK_SIZE = 8192
+    DEFAULT_DRAIN_INTERVAL = 0.02
+
+    def __init__(self, data_engine, capacity: int = DEFAULT_CAPACITY, block_size: int = DEFAULT_BLOCK_SIZE,
+                 spill: bool = True, drain_interval: float = DEFAULT_DRAIN_INTERVAL):
         """
         Initializes the LiveDataHandler instance.
 
         Args:
             data_engine (DataEngineOptimized): The data engine to update with live data.
+            capacity (int): The default number of samples each ring buffer retains in memory.
+            block_size (int): The default number of samples per spilled block.
+            spill (bool): Whether full blocks are spilled to the workspace data directory. Defaults to True.
+            drain_interval (float): The time, in seconds, between drains of the running inputs. Defaults to 0.02.
         """
         self.data_engine = data_engine
         self._logger = CustomLogger()
+        self._config = Config()
         self.live_inputs = []
+        self.buffers = dict()
+        self.operators = dict()
+
+        self.capacity = capacity
+        self.block_size = block_size
+        self.spill = spill
+        self.drain_interval = drain_interval
+        self._drain_task = None
 
-    def add_live_input(self, live_input: BaseInput):
+    def add_live_input(self, live_input: BaseInput, channels: int = 1, dtype=np.float64, columns: list = None,
+                       capacity: int = None) -> RingBuffer:
         """
-        Adds a live data input to the handler.
+        Adds a live data input to the handler and creates the ring buffer its samples are ingested into.
 
         Args:
             live_input (BaseInput): The live data input to add.
+            channels (int): The number of values per sample. Defaults to 1.
+            dtype: The numpy dtype of the values. Defaults to float64.
+            columns (list[str], optional): The name of each channel.
+            capacity (int, optional): The number of samples retained in memory. Defaults to the handler capacity.
+
+        Returns:
+            RingBuffer: The ring buffer of the live input.
         """
+        name = f"{live_input.source or type(live_input).__name__}_{len(self.live_inputs)}"
+        buffer = self.create_buffer(name, channels=channels, dtype=dtype, columns=columns, capacity=capacity)
+        live_input.attach_buffer(buffer)
         self.live_inputs.append(live_input)
+        return buffer
+
+    def create_buffer(self, name: str, channels: int = 1, dtype=np.float64, columns: list = None,
+                      capacity: int = None) -> RingBuffer:
+        """
+        Creates a named ring buffer using the handler's capacity, block size and spill settings, and has the data
+        engine cache it.
+
+        Args:
+            name (str): The name of the buffer.
+            channels (int): The number of values per sample. Defaults to 1.
+            dtype: The numpy dtype of the values. Defaults to float64.
+            columns (list[str], optional): The name of each channel.
+            capacity (int, optional): The number of samples retained in memory. Defaults to the handler capacity.
+
+        Returns:
+            RingBuffer: The ring buffer.
+        """
+        capacity = capacity or self.capacity
+        spill_dir = None
+        if self.spill:
+            spill_dir = os.path.join(self._config.BASE_DIR, self._config.WORKSPACE_NAME, self._config.DATA_DIR,
+                                     'live', f"{self.data_engine.engine_id}", name)
+
+        buffer = RingBuffer(capacity, channels=channels, dtype=dtype, name=name, columns=columns,
+                            block_size=self.block_size if capacity % self.block_size == 0 else None,
+                            spill_dir=spill_dir)
+        self.buffers[name] = buffer
+        if hasattr(self.data_engine, 'cache_live_buffer'):
+            self.data_engine.cache_live_buffer(buffer)
+        return buffer
+
+    def get_buffer(self, live_input: BaseInput = None) -> RingBuffer:
+        """
+        Returns the ring buffer of a live input, or the default buffer for samples without an input.
+
+        Args:
+            live_input (BaseInput, optional): The live data input.
+
+        Returns:
+            RingBuffer: The ring buffer.
+        """
+        if live_input is not None and live_input.buffer is not None:
+            return live_input.buffer
+
+        if 'live' not in self.buffers:
+            self.create_buffer('live')
+        return self.buffers['live']
+
+    def add_operator(self, operator: StreamOperator, live_input: BaseInput = None) -> StreamOperator:
+        """
+        Attaches a stream operator to the buffer of a live input and adds its memory slot to the default collection.
+
+        Args:
+            operator (StreamOperator): The stream operator.
+            live_input (BaseInput, optional): The live data input. Defaults to the default live buffer.
+
+        Returns:
+            StreamOperator: The stream operator.
+        """
+        buffer = self.get_buffer(live_input)
+        if operator.channels != buffer.channels:
+            self._logger.error(Exception(f"Operator '{operator.name}' expects {operator.channels} channel(s) but "
+                                         f"buffer '{buffer.name}' has {buffer.channels}"), self)
+            return operator
+
+        self.operators.setdefault(buffer.name, []).append(operator)
+
+        from research_analytics_suite.data_engine.memory.MemoryManager import MemoryManager
+        collection = MemoryManager().default_collection
+        if collection is not None and collection.get_slot(operator.slot.memory_id) is None:
+            collection.add_slot(operator.slot)
+        return operator
+
+    def remove_operator(self, operator: StreamOperator):
+        """
+        Detaches a stream operator from every buffer.
+
+        Args:
+            operator (StreamOperator): The stream operator.
+        """
+        for operators in self.operators.values():
+            if operator in operators:
+                operators.remove(operator)
+
+    def get_operators(self, buffer: RingBuffer) -> list:
+        """
+        Returns the stream operators attached to a buffer.
+
+        Args:
+            buffer (RingBuffer): The ring buffer.
+
+        Returns:
+            list[StreamOperator]: The stream operators.
+        """
+        return self.operators.get(buffer.name, [])
+
+    async def publish_operators(self):
+        """Publishes the current result of every stream operator into its memory slot."""
+        for operators in self.operators.values():
+            for operator in operators:
+                try:
+                    await operator.publish()
+                except Exception as e:
+                    self._logger.error(Exception(f"Failed to publish stream operator '{operator.name}': {e}"), self)
 
     def start_all(self):
-        """Starts all live data inputs."""
+        """
+        Starts all live data inputs and, when called from a running event loop, the task that drains them every
+        `drain_interval` seconds. Without an event loop, samples are ingested by calling update_data_engine.
+        """
         for live_input in self.live_inputs:
             live_input.start()
 
+        if self._drain_task is None or self._drain_task.done():
+            try:
+                self._drain_task = asyncio.get_running_loop().create_task(self.drain_periodically())
+            except RuntimeError:
+                self._logger.debug("No running event loop; live samples are ingested by update_data_engine")
+
     def stop_all(self):
-        """Stops all live data inputs."""
+        """Stops all live data inputs, ingests their remaining samples and writes the samples not yet spilled."""
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
         for live_input in self.live_inputs:
             live_input.stop()
+        self.update_data_engine()
+        for buffer in self.buffers.values():
+            buffer.flush()
+
+    async def drain_periodically(self):
+        """
+        Ingests the samples waiting on every live input every `drain_interval` seconds until cancelled, and publishes
+        the stream operators whenever new samples arrived.
+        """
+        while True:
+            try:
+                if self.update_data_engine():
+                    await self.publish_operators()
+            except Exception as e:
+                self._logger.error(Exception(f"Failed to ingest live data: {e}"), self)
+            await asyncio.sleep(self.drain_interval)
 
-    def update_data_engine(self):
-        """Updates the data engine with data from all live inputs."""
+    def update_data_engine(self, max_items: int = None) -> int:
+        """
+        Ingests the samples waiting on every live input into their ring buffers.
+
+        Args:
+            max_items (int, optional): The maximum number of samples taken from each input per call.
+
+        Returns:
+            int: The number of samples ingested.
+        """
+        ingested = 0
         for live_input in self.live_inputs:
-            new_data = live_input.read()
-            if new_data is not None:
-                self.data_engine.update_live_data(new_data)
-                self._logger.info("Data engine updated with new live data")
+            for timestamp, new_data in live_input.drain(max_items):
+                self.data_engine.update_live_data(new_data, live_input, timestamp)
+                ingested += 1
+        return ingested
+
+    def stats(self) -> dict:
+        """
+        Returns the ingest counters of every live input that reports them.
+
+        Returns:
+            dict[str, dict]: The counters of each live input, keyed by buffer name.
+        """
+        return {live_input.buffer.name: live_input.stats() for live_input in self.live_inputs
+                if hasattr(live_input, 'stats') and live_input.buffer is not None}
+
+    @staticmethod
+    def to_sample(data):
+        """
+        Converts raw input data to sample values; text such as a serial line is split on commas.
+
+        Args:
+            data: The raw input data.
+
+        Returns:
+            The sample values.
+        """
+        if isinstance(data, bytes):
+            data = data.decode('utf-8')
+        if isinstance(data, str):
+            return [float(value) for value in data.strip().split(',') if value.strip()]
+        return data
@@ -0,0 +1,261 @@
+"""
+RingBuffer Module
+
+Defines the RingBuffer class, a preallocated, typed buffer for live data samples. Appending a sample costs the same
+regardless of how long the recording has run, the most recent samples can be read as zero-copy windows, and full
+blocks of samples can be spilled to columnar (Parquet) files on disk so that a recording is not limited by memory.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+pa = lazy_import('pyarrow')
+pq = lazy_import('pyarrow.parquet')
+
+
+class RingBuffer:
+    """
+    A fixed-capacity buffer of samples with one timestamp and a fixed number of channels per sample.
+
+    Every sample is written twice, at position i and i + capacity of a storage array of twice the capacity, so that
+    any window of up to `capacity` consecutive samples is contiguous and can be returned as a view.
+
+    Attributes:
+        name (str): The name of the buffer, used for spill file names.
+        capacity (int): The number of most recent samples retained in memory.
+        columns (list[str]): The name of each channel.
+        block_size (int): The number of samples per spilled block.
+        spill_dir (str): The directory spilled blocks are written to, or None to disable spilling.
+    """
+
+    def __init__(self, capacity: int, channels: int = 1, dtype=np.float64, name: str = 'stream',
+                 columns: Optional[list] = None, block_size: Optional[int] = None, spill_dir: Optional[str] = None):
+        """
+        Initializes the RingBuffer instance.
+
+        Args:
+            capacity (int): The number of most recent samples retained in memory.
+            channels (int): The number of values per sample. Defaults to 1.
+            dtype: The numpy dtype of the values. Defaults to float64.
+            name (str): The name of the buffer. Defaults to 'stream'.
+            columns (list[str], optional): The name of each channel. Defaults to 'ch<i>'.
+            block_size (int, optional): The number of samples per spilled block; must divide the capacity when
+                                        spilling. Defaults to a quarter of the capacity, or the whole capacity
+                                        if it is not a multiple of four.
+            spill_dir (str, optional): The directory spilled blocks are written to. Defaults to None (no spilling).
+        """
+        if capacity <= 0 or channels <= 0:
+            raise ValueError("capacity and channels must be positive")
+
+        self.name = name
+        self.capacity = int(capacity)
+        self.channels = int(channels)
+        self.dtype = np.dtype(dtype)
+        self.columns = list(columns) if columns is not None else [f"ch{i}" for i in range(self.channels)]
+        if len(self.columns) != self.channels:
+            raise ValueError(f"Expected {self.channels} column names, got {len(self.columns)}")
+
+        self.block_size = int(block_size or (self.capacity // 4 if self.capacity % 4 == 0 else self.capacity))
+        if spill_dir is not None and self.capacity % self.block_size != 0:
+            raise ValueError(f"block_size ({self.block_size}) must divide capacity ({self.capacity})")
+
+        self.spill_dir = spill_dir
+        if self.spill_dir is not None:
+            os.makedirs(self.spill_dir, exist_ok=True)
+
+        self._values = np.zeros((2 * self.capacity, self.channels), dtype=self.dtype)
+        self._timestamps = np.zeros(2 * self.capacity, dtype=np.float64)
+        self._count = 0
+        self._spilled = 0
+        self._spill_files = []
+        self._spill_executor = None
+        self._pending_spills = []
+
+    def __len__(self):
+        return min(self._count, self.capacity)
+
+    def __repr__(self):
+        return (f"RingBuffer(name={self.name}, capacity={self.capacity}, channels={self.channels}, "
+                f"total_samples={self._count}, spilled_samples={self._spilled})")
+
+    @property
+    def total_samples(self) -> int:
+        """Gets the number of samples appended since the buffer was created."""
+        return self._count
+
+    @property
+    def first_index(self) -> int:
+        """Gets the absolute index of the oldest sample still held in memory."""
+        return max(0, self._count - self.capacity)
+
+    @property
+    def spilled_samples(self) -> int:
+        """Gets the number of samples written to spill files."""
+        return self._spilled
+
+    @property
+    def spill_files(self) -> list:
+        """Gets the paths of the spill files written so far, oldest first."""
+        return list(self._spill_files)
+
+    def append(self, sample, timestamp: Optional[float] = None):
+        """
+        Appends one sample.
+
+        Args:
+            sample: A scalar or a sequence of `channels` values.
+            timestamp (float, optional): The time of the sample. Defaults to the current time.
+        """
+        position = self._count % self.capacity
+        values = self._values
+        values[position] = sample
+        values[position + self.capacity] = values[position]
+        _timestamp = time.time() if timestamp is None else timestamp
+        self._timestamps[position] = _timestamp
+        self._timestamps[position + self.capacity] = _timestamp
+        self._count += 1
+
+        if self.spill_dir is not None and self._count % self.block_size == 0:
+            self._spill_block(max(self._spilled, self.first_index), self._count)
+
+    def extend(self, samples, timestamps=None):
+        """
+        Appends several samples at once.
+
+        Args:
+            samples: An array of samples shaped (N,) or (N, channels).
+            timestamps (array-like, optional): The time of each sample. Defaults to the current time for all.
+        """
+        samples = np.asarray(samples, dtype=self.dtype).reshape(-1, self.channels)
+        if timestamps is None:
+            timestamps = np.full(len(samples), time.time())
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+
+        start = 0
+        while start < len(samples):
+            position = self._count % self.capacity
+            _count = min(len(samples) - start, self.capacity - position,
+                         self.block_size - self._count % self.block_size)
+            for offset in (position, position + self.capacity):
+                self._values[offset:offset + _count] = samples[start:start + _count]
+                self._timestamps[offset:offset + _count] = timestamps[start:start + _count]
+            self._count += _count
+            start += _count
+
+            if self.spill_dir is not None and self._count % self.block_size == 0:
+                self._spill_block(max(self._spilled, self.first_index), self._count)
+
+    def window(self, size: Optional[int] = None):
+        """
+        Returns the most recent samples as zero-copy views.
+
+        The views share memory with the buffer and are overwritten as new samples arrive; copy them to keep them.
+
+        Args:
+            size (int, optional): The number of samples. Defaults to every sample held in memory.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The timestamps, shaped (size,), and the values, shaped (size, channels).
+        """
+        size = len(self) if size is None else min(int(size), len(self))
+        return self.view(self._count - size, self._count)
+
+    def view(self, start: int, stop: int):
+        """
+        Returns the samples with absolute indices in [start, stop) as zero-copy views.
+
+        Args:
+            start (int): The absolute index of the first sample.
+            stop (int): The absolute index after the last sample.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The timestamps and the values of the samples.
+        """
+        if start < self.first_index or stop > self._count or start > stop:
+            raise IndexError(f"Samples [{start}, {stop}) are not held in memory "
+                             f"(available: [{self.first_index}, {self._count}))")
+
+        offset = start % self.capacity
+        length = stop - start
+        return self._timestamps[offset:offset + length], self._values[offset:offset + length]
+
+    def flush(self):
+        """
+        Spills the samples not yet written to disk, including a partial block, and waits for pending writes.
+        """
+        if self.spill_dir is not None and self._spilled < self._count:
+            self._spill_block(max(self._spilled, self.first_index), self._count)
+
+        for future in self._pending_spills:
+            future.result()
+        self._pending_spills = []
+
+    def close(self):
+        """
+        Flushes the buffer and releases the spill thread.
+        """
+        self.flush()
+        if self._spill_executor is not None:
+            self._spill_executor.shutdown(wait=True)
+            self._spill_executor = None
+
+    def read_spilled(self):
+        """
+        Reads every spilled block back from disk.
+
+        Returns:
+            pyarrow.Table: The spilled samples, with a 'timestamp' column and one column per channel.
+        """
+        self.flush()
+        if not self._spill_files:
+            return pa.table({'timestamp': pa.array([], type=pa.float64()),
+                             **{column: pa.array([], type=pa.from_numpy_dtype(self.dtype))
+                                for column in self.columns}})
+        return pa.concat_tables([pq.read_table(path) for path in self._spill_files])
+
+    def _spill_block(self, start: int, stop: int):
+        """
+        Copies the samples in [start, stop) and writes them to a Parquet file on a background thread.
+
+        Args:
+            start (int): The absolute index of the first sample.
+            stop (int): The absolute index after the last sample.
+        """
+        timestamps, values = self.view(start, stop)
+        timestamps = timestamps.copy()
+        values = values.copy()
+
+        path = os.path.join(self.spill_dir, f"{self.name}_{start:012d}.parquet")
+        self._spill_files.append(path)
+        self._spilled = stop
+
+        if self._spill_executor is None:
+            self._spill_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"{self.name}_spill")
+        self._pending_spills = [future for future in self._pending_spills if not future.done()]
+        self._pending_spills.append(self._spill_executor.submit(self._write_block, path, timestamps, values))
+
+    def _write_block(self, path: str, timestamps: np.ndarray, values: np.ndarray):
+        """
+        Writes a block of samples to a Parquet file.
+
+        Args:
+            path (str): The path of the file.
+            timestamps (np.ndarray): The timestamps of the samples.
+            values (np.ndarray): The values of the samples.
+        """
+        table = pa.table({'timestamp': timestamps, **{column: values[:, i] for i, column in enumerate(self.columns)}})
+        pq.write_table(table, path)
@@ -0,0 +1,390 @@
+"""
+SchemaInference Module
+
+This module defines the SchemaInference class, which infers the layout and column types of a data file in a single
+pass over a bounded sample of its rows. The inferred schema is cached next to the file, keyed by the file's
+modification time and size, so that later loads can pass explicit column types and skip inference entirely.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import json
+import os
+import warnings
+
+from research_analytics_suite.data_engine.data_streams.DataTypeDetector import DataTypeDetector
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+pd = lazy_import('pandas')
+pq = lazy_import('pyarrow.parquet')
+
+
+class SchemaInference:
+    """
+    A class for inferring and caching the schema of a data file.
+
+    A schema is a dictionary with the file 'format', 'encoding' and 'delimiter', the 'header_row' and 'data_row'
+    indices, the column names in 'columns', the pandas dtype of each column in 'dtypes', the datetime columns in
+    'parse_dates', and whether the sample covered the whole file in 'complete'.
+    """
+    SCHEMA_VERSION = 4
+    MAX_HEADER_ROWS = 8
+    CACHE_SUFFIX = '.schema.json'
+    SAMPLE_ROWS = 1000
+    CATEGORY_RATIO = 0.5
+    CATEGORY_LIMIT = 1000
+    BOOLEAN_VALUES = {'true': True, 'false': False}
+    NA_VALUES = frozenset(('', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                           '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null'))
+
+    @staticmethod
+    def infer(file_path, data_type=None, sample_rows=SAMPLE_ROWS, use_cache=True):
+        """
+        Infers the schema of a data file, or returns the cached schema if the file has not changed.
+
+        Args:
+            file_path (str): The path to the data file.
+            data_type (str, optional): The format of the file. Defaults to the format detected from its content.
+            sample_rows (int): The maximum number of data rows sampled. Defaults to SAMPLE_ROWS.
+            use_cache (bool): Whether to read and write the cached schema. Defaults to True.
+
+        Returns:
+            dict: The schema of the file.
+        """
+        _stat = os.stat(file_path)
+        signature = [_stat.st_mtime_ns, _stat.st_size]
+
+        if use_cache:
+            schema = SchemaInference.load_cached(file_path)
+            if (schema is not None and schema.get('signature') == signature
+                    and (data_type is None or schema.get('format') == data_type)):
+                return schema
+
+        info = DataTypeDetector.detect(file_path)
+        data_type = data_type or info['format']
+        schema = {
+            'version': SchemaInference.SCHEMA_VERSION, 'signature': signature, 'format': data_type,
+            'encoding': info['encoding'], 'delimiter': info['delimiter'], 'header_row': None, 'data_row': 0,
+            'columns': None, 'dtypes': dict(), 'parse_dates': [], 'complete': True,
+        }
+
+        if data_type == 'csv':
+            schema.update(SchemaInference._infer_csv(file_path, info, sample_rows))
+        elif data_type == 'excel':
+            schema.update(SchemaInference._infer_excel(file_path, sample_rows))
+        elif data_type == 'parquet':
+            schema.update(SchemaInference._infer_parquet(file_path))
+        elif data_type not in ('json', 'ndjson', 'hdf5', 'avro'):
+            raise ValueError(f"Unsupported data type: {data_type}")
+
+        if use_cache:
+            SchemaInference.save_cached(file_path, schema)
+        return schema
+
+    @staticmethod
+    def read_options(schema) -> dict:
+        """
+        Returns the keyword arguments that read a delimited file with the given schema through pandas or dask.
+
+        When the schema was inferred from a sample of the file, integer and boolean columns are read as their
+        nullable types so that missing values later in the file do not fail the read.
+
+        Args:
+            schema (dict): The schema of the file.
+
+        Returns:
+            dict: The keyword arguments for `read_csv`.
+        """
+        dtypes = dict(schema['dtypes'])
+        if not schema.get('complete', True):
+            widened = {'int64': 'Int64', 'bool': 'boolean'}
+            dtypes = {column: widened.get(dtype, dtype) for column, dtype in dtypes.items()}
+
+        options = {
+            'sep': schema['delimiter'] or ',',
+            'skiprows': schema['data_row'],
+            'header': None,
+            'names': schema['columns'],
+            'dtype': dtypes,
+            'parse_dates': schema['parse_dates'] or None,
+        }
+        if schema['encoding']:
+            options['encoding'] = schema['encoding']
+        return options
+
+    @staticmethod
+    def cache_path(file_path) -> str:
+        """
+        Returns the path of the cached schema of a file.
+
+        Args:
+            file_path (str): The path to the data file.
+
+        Returns:
+            str: The path of the cached schema.
+        """
+        return f"{file_path}{SchemaInference.CACHE_SUFFIX}"
+
+    @staticmethod
+    def load_cached(file_path):
+        """
+        Reads the cached schema of a file.
+
+        Args:
+            file_path (str): The path to the data file.
+
+        Returns:
+            dict: The cached schema, or None if there is no readable schema of the current version.
+        """
+        try:
+            with open(SchemaInference.cache_path(file_path), 'r') as file:
+                schema = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(schema, dict) or schema.get('version') != SchemaInference.SCHEMA_VERSION:
+            return None
+        return schema
+
+    @staticmethod
+    def save_cached(file_path, schema):
+        """
+        Writes the schema of a file next to it. Read-only locations are skipped.
+
+        Args:
+            file_path (str): The path to the data file.
+            schema (dict): The schema of the file.
+        """
+        try:
+            with open(SchemaInference.cache_path(file_path), 'w') as file:
+                json.dump(schema, file, indent=2)
+        except OSError as e:
+            from research_analytics_suite.utils.CustomLogger import CustomLogger
+            CustomLogger().debug(f"Schema of '{file_path}' was not cached: {e}")
+
+    @staticmethod
+    def _infer_csv(file_path, info, sample_rows) -> dict:
+        """
+        Infers the columns of a delimited file from its header rows and a sample of its data rows.
+
+        A file in which no delimiter was detected, such as a single column, is read with commas and its first data
+        row is found in the sample.
+
+        Args:
+            file_path (str): The path to the data file.
+            info (dict): The layout detected by DataTypeDetector.
+            sample_rows (int): The maximum number of data rows sampled.
+
+        Returns:
+            dict: The inferred schema fields.
+        """
+        data_row = info['data_row'] or 0
+        sample = pd.read_csv(file_path, sep=info['delimiter'] or ',', header=None, dtype=str,
+                             nrows=data_row + sample_rows + 1, encoding=info['encoding'] or 'utf-8',
+                             keep_default_na=False)
+        if info['data_row'] is None:
+            data_row = SchemaInference._find_data_row(sample.iloc[:DataTypeDetector.SAMPLE_LINES])
+        data_row = SchemaInference._check_data_row(sample, data_row, file_path)
+
+        header = sample.iloc[:data_row]
+        data = sample.iloc[data_row:data_row + sample_rows]
+        complete = len(sample) <= data_row + sample_rows
+
+        result = SchemaInference._infer_frame(data, SchemaInference._column_names(header, sample.shape[1]))
+        result.update({'data_row': data_row, 'header_row': data_row - 1 if data_row > 0 else None,
+                       'complete': complete})
+        return result
+
+    @staticmethod
+    def _infer_excel(file_path, sample_rows) -> dict:
+        """
+        Infers the columns of the first sheet of a workbook from a single bounded read.
+
+        Args:
+            file_path (str): The path to the workbook.
+            sample_rows (int): The maximum number of data rows sampled.
+
+        Returns:
+            dict: The inferred schema fields.
+        """
+        sample = pd.read_excel(file_path, sheet_name=0, header=None, dtype=str, nrows=sample_rows + 64)
+        sample = sample.fillna('')
+        data_row = SchemaInference._check_data_row(sample, SchemaInference._find_data_row(sample), file_path)
+
+        result = SchemaInference._infer_frame(sample.iloc[data_row:],
+                                              SchemaInference._column_names(sample.iloc[:data_row], sample.shape[1]))
+        result.update({'data_row': data_row, 'header_row': data_row - 1 if data_row > 0 else None,
+                       'complete': len(sample) < sample_rows + 64, 'encoding': None, 'delimiter': None})
+        return result
+
+    @staticmethod
+    def _infer_parquet(file_path) -> dict:
+        """
+        Reads the columns of a Parquet file from its footer.
+
+        Args:
+            file_path (str): The path to the Parquet file.
+
+        Returns:
+            dict: The schema fields.
+        """
+        schema = pq.read_schema(file_path)
+        dtypes = dict()
+        parse_dates = []
+        for name, dtype in schema.empty_table().to_pandas().dtypes.items():
+            if str(dtype).startswith('datetime64'):
+                parse_dates.append(name)
+            else:
+                dtypes[name] = str(dtype)
+        return {'columns': schema.names, 'dtypes': dtypes, 'parse_dates': parse_dates}
+
+    @staticmethod
+    def _column_names(header, width) -> list:
+        """
+        Builds column names from the header rows, joining multi-row headers with underscores.
+
+        A first header row with the same value in every column but the first (such as a DeepLabCut scorer row) is
+        dropped when another header row follows it.
+
+        Args:
+            header (pd.DataFrame): The header rows, as strings.
+            width (int): The number of columns.
+
+        Returns:
+            list[str]: The column names; unnamed or repeated columns are made unique.
+        """
+        rows = [[str(value).strip() for value in row] for row in header.itertuples(index=False)]
+        if len(rows) > 1 and len(set(rows[0][1:])) <= 1:
+            rows = rows[1:]
+
+        names = []
+        for column in range(width):
+            parts = [row[column] for row in rows if row[column] and row[column].lower() != 'nan']
+            names.append('_'.join(parts) or f"column_{column}")
+
+        seen = dict()
+        for i, name in enumerate(names):
+            if name in seen:
+                seen[name] += 1
+                names[i] = f"{name}_{seen[name]}"
+            else:
+                seen[name] = 0
+        return names
+
+    @staticmethod
+    def _find_data_row(sample) -> int:
+        """
+        Finds the first data row of a sample, see DataTypeDetector.find_data_row.
+
+        Args:
+            sample (pd.DataFrame): The leading rows of a sheet, as strings.
+
+        Returns:
+            int: The index of the first data row.
+        """
+        return DataTypeDetector.find_data_row(sample.astype(str).values.tolist())
+
+    @staticmethod
+    def _check_data_row(sample, data_row, file_path) -> int:
+        """
+        Rejects an implausible header: more than MAX_HEADER_ROWS rows, or a row whose cells are all numbers, which is
+        data that would otherwise be skipped and merged into the column names. The first row is then the header, or
+        data if it is all numbers.
+
+        Args:
+            sample (pd.DataFrame): The leading rows of the file, as strings.
+            data_row (int): The detected index of the first data row.
+            file_path (str): The path to the data file, for the warning.
+
+        Returns:
+            int: The index of the first data row.
+        """
+        kinds = [[DataTypeDetector.cell_kind(cell) for cell in row]
+                 for row in sample.iloc[:max(data_row, 1)].astype(str).values.tolist()]
+        numeric = [SchemaInference._is_numeric_row(row) for row in kinds[:data_row]]
+        if data_row <= SchemaInference.MAX_HEADER_ROWS and not any(numeric):
+            return data_row
+
+        fallback = 0 if kinds and SchemaInference._is_numeric_row(kinds[0]) else 1
+        from research_analytics_suite.utils.CustomLogger import CustomLogger
+        CustomLogger().warning(f"Ignoring the {data_row} header row(s) detected in '{file_path}'; reading it "
+                               + ("with the first row as its header" if fallback else "without a header"))
+        return fallback
+
+    @staticmethod
+    def _is_numeric_row(kinds) -> bool:
+        """Returns whether every non-empty cell of a row, of which there is at least one, is a number."""
+        filled = [kind for kind in kinds if kind is not None]
+        return bool(filled) and all(kind == 'number' for kind in filled)
+
+    @staticmethod
+    def _infer_frame(data, names) -> dict:
+        """
+        Infers the dtype of every column of a sample.
+
+        Args:
+            data (pd.DataFrame): The sampled data rows, as strings.
+            names (list[str]): The column names.
+
+        Returns:
+            dict: The 'columns', 'dtypes' and 'parse_dates' of the sample.
+        """
+        dtypes = dict()
+        parse_dates = []
+        for name, (_, column) in zip(names, data.items()):
+            dtype = SchemaInference._infer_column(column)
+            if dtype == 'datetime64[ns]':
+                parse_dates.append(name)
+            else:
+                dtypes[name] = dtype
+        return {'columns': names, 'dtypes': dtypes, 'parse_dates': parse_dates}
+
+    @staticmethod
+    def _infer_column(column) -> str:
+        """
+        Infers the dtype of a column from its sampled values.
+
+        Only the tokens in NA_VALUES, which pandas reads as missing by default, are treated as missing values, so a
+        column holding any other token such as 'none' is not typed as a number.
+
+        Args:
+            column (pd.Series): The sampled values, as strings.
+
+        Returns:
+            str: 'int64', 'float64', 'bool', 'boolean', 'datetime64[ns]', 'category' or 'object'.
+        """
+        column = column.astype(str)
+        values = column.str.strip()
+        values = values[(values != '') & (~column.isin(SchemaInference.NA_VALUES))]
+        if values.empty:
+            return 'float64'
+
+        has_missing = len(values) < len(column)
+        numbers = pd.to_numeric(values, errors='coerce')
+        if numbers.notna().all():
+            if not has_missing and (numbers == numbers.round()).all() and numbers.abs().max() < 2 ** 63:
+                if not values.str.contains(r'[.eE]', regex=True).any():
+                    return 'int64'
+            return 'float64'
+
+        lowered = values.str.lower()
+        if lowered.isin(SchemaInference.BOOLEAN_VALUES.keys()).all():
+            return 'boolean' if has_missing else 'bool'
+
+        if values.str.contains(r'\d', regex=True).all() and values.str.contains(r'[-/:]', regex=True).all():
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                dates = pd.to_datetime(values, errors='coerce', format='mixed')
+            if dates.notna().all():
+                return 'datetime64[ns]'
+
+        unique = values.nunique()
+        if unique <= SchemaInference.CATEGORY_LIMIT and unique <= SchemaInference.CATEGORY_RATIO * len(values):
+            return 'category'
+        return 'object'
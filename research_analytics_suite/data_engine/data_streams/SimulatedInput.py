@@ -0,0 +1,101 @@
+"""
+SimulatedInput Module
+
+Defines the SimulatedInput class, a stand-in live input that generates a synthetic multichannel signal at a fixed
+sample rate. It exercises the same reader thread, queue and overflow handling as hardware inputs, so live pipelines
+can be developed and tested without a device attached.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import math
+import time
+
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.ThreadedInput import ThreadedInput
+
+
+class SimulatedInput(ThreadedInput):
+    """
+    Class for generating a simulated live signal.
+
+    Each channel is a sine wave with a channel-specific phase plus Gaussian noise.
+
+    Attributes:
+        sample_rate (float): The rate, in Hz, at which samples are generated.
+        channels (int): The number of values per sample.
+        frequency (float): The frequency, in Hz, of the sine wave.
+        amplitude (float): The amplitude of the sine wave.
+        noise (float): The standard deviation of the noise.
+        max_samples (int): The number of samples after which the device stops producing data, or None.
+        read_delay (float): An artificial delay, in seconds, added to every read to simulate a slow device.
+    """
+    def __init__(self, sample_rate=1000.0, channels=1, frequency=1.0, amplitude=1.0, noise=0.0, max_samples=None,
+                 read_delay=0.0, seed=None, **kwargs):
+        """
+        Initializes the SimulatedInput instance.
+
+        Args:
+            sample_rate (float): The rate, in Hz, at which samples are generated. Defaults to 1000.
+            channels (int): The number of values per sample. Defaults to 1.
+            frequency (float): The frequency, in Hz, of the sine wave. Defaults to 1.
+            amplitude (float): The amplitude of the sine wave. Defaults to 1.
+            noise (float): The standard deviation of the noise. Defaults to 0.
+            max_samples (int, optional): The number of samples to generate. Defaults to no limit.
+            read_delay (float): An artificial delay, in seconds, added to every read. Defaults to 0.
+            seed (int, optional): The seed of the noise generator.
+            **kwargs: Queue size, overflow policy and poll interval, see ThreadedInput.
+        """
+        super().__init__(source="Simulated", **kwargs)
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.frequency = frequency
+        self.amplitude = amplitude
+        self.noise = noise
+        self.max_samples = max_samples
+        self.read_delay = read_delay
+
+        self._rng = np.random.default_rng(seed)
+        self._phases = np.linspace(0, math.pi, channels, endpoint=False)
+        self._generated = 0
+        self._start_time = None
+
+    def open(self):
+        """
+        Starts the simulated clock.
+        """
+        self._start_time = time.monotonic()
+        self._generated = 0
+
+    def read_data(self):
+        """
+        Generates the next sample once it is due.
+
+        Returns:
+            np.ndarray: The sample, shaped (channels,), or None if no sample is due yet.
+        """
+        if self.max_samples is not None and self._generated >= self.max_samples:
+            return None
+
+        if self.read_delay:
+            time.sleep(self.read_delay)
+
+        due = self._start_time + self._generated / self.sample_rate
+        now = time.monotonic()
+        if due > now:
+            self._stop_event.wait(min(due - now, 0.01))
+            return None
+
+        t = self._generated / self.sample_rate
+        self._generated += 1
+        sample = self.amplitude * np.sin(2 * math.pi * self.frequency * t + self._phases)
+        if self.noise:
+            sample += self._rng.normal(0.0, self.noise, self.channels)
+        return sample
@@ -0,0 +1,277 @@
+"""
+ThreadedInput Module
+
+Defines the ThreadedInput class, a base class for live inputs whose device calls block. The device is opened and
+read on a dedicated reader thread, and samples are handed to the event loop through a bounded queue with an explicit
+overflow policy, so a slow or stalled device never blocks the GUI or running operations.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import asyncio
+import queue
+import threading
+import time
+
+from research_analytics_suite.data_engine.data_streams.BaseInput import BaseInput
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+class ThreadedInput(BaseInput):
+    """
+    A base class for live inputs read on a dedicated thread.
+
+    Subclasses implement `open`, `read_data` and `close`; these are only ever called from the reader thread.
+
+    Attributes:
+        queue_size (int): The maximum number of samples waiting to be consumed.
+        overflow (str): What happens when the queue is full: 'drop_oldest' discards the oldest queued sample,
+                        'drop_newest' discards the incoming sample, and 'block' pauses the reader until there is room.
+        poll_interval (float): The time, in seconds, the reader waits after `read_data` returns no sample.
+    """
+    OVERFLOW_POLICIES = ('drop_oldest', 'drop_newest', 'block')
+
+    def __init__(self, source=None, queue_size: int = 1024, overflow: str = 'drop_oldest',
+                 poll_interval: float = 0.001):
+        """
+        Initializes the ThreadedInput instance.
+
+        Args:
+            source (str, optional): The type of source the input reads from.
+            queue_size (int): The maximum number of samples waiting to be consumed. Defaults to 1024.
+            overflow (str): The overflow policy; one of OVERFLOW_POLICIES. Defaults to 'drop_oldest'.
+            poll_interval (float): The time, in seconds, to wait after an empty read. Defaults to 0.001.
+        """
+        super().__init__(source=source)
+        if overflow not in ThreadedInput.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy '{overflow}'; "
+                             f"expected one of {ThreadedInput.OVERFLOW_POLICIES}")
+
+        self._logger = CustomLogger()
+
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.poll_interval = poll_interval
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._counter_lock = threading.Lock()
+        self._error = None
+
+        self.samples_received = 0
+        self.samples_delivered = 0
+        self.samples_dropped = 0
+        self._latency_total = 0.0
+        self._latency_max = 0.0
+
+    def open(self):
+        """Opens the device. Called on the reader thread before the first read."""
+        pass
+
+    def read_data(self):
+        """
+        Reads one sample from the device, blocking for at most a short timeout.
+
+        Returns:
+            The sample, or None if no sample is available.
+        """
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def close(self):
+        """Closes the device. Called on the reader thread after the last read."""
+        pass
+
+    @property
+    def is_running(self) -> bool:
+        """Gets whether the reader thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def error(self):
+        """Gets the exception that stopped the reader thread, if any."""
+        return self._error
+
+    def start(self):
+        """Starts the reader thread, unless a previous reader thread has not yet stopped."""
+        if self.is_running:
+            if self._stop_event.is_set():
+                self._logger.warning(f"Live input '{self.source}' was not restarted: its reader thread is still "
+                                     f"stopping")
+            return
+
+        self._stop_event.clear()
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name=f"{self.source or type(self).__name__}_reader",
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stops the reader thread and waits for the device to be closed.
+
+        A reader thread still blocked in the device after the timeout is kept, so the input is not restarted while it
+        is running; it exits at its next read.
+
+        Args:
+            timeout (float): The maximum time, in seconds, to wait for the reader thread. Defaults to 5.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                self._logger.warning(f"Live input '{self.source}' did not stop within {timeout} s")
+            else:
+                self._thread = None
+
+    def read(self):
+        """
+        Returns the oldest queued sample without blocking.
+
+        Returns:
+            The sample, or None if the queue is empty.
+        """
+        try:
+            item = self._queue.get_nowait()
+        except queue.Empty:
+            return None
+        return self._deliver(item)[1]
+
+    def drain(self, max_items: int = None) -> list:
+        """
+        Returns the queued samples without blocking.
+
+        Args:
+            max_items (int, optional): The maximum number of samples to return. Defaults to every queued sample.
+
+        Returns:
+            list[tuple[float, object]]: The timestamp and value of each sample, oldest first.
+        """
+        items = []
+        while max_items is None or len(items) < max_items:
+            try:
+                items.append(self._deliver(self._queue.get_nowait()))
+            except queue.Empty:
+                break
+        return items
+
+    async def read_async(self, timeout: float = None):
+        """
+        Waits for the next sample without blocking the event loop.
+
+        Args:
+            timeout (float, optional): The maximum time, in seconds, to wait. Defaults to waiting indefinitely.
+
+        Returns:
+            tuple[float, object]: The timestamp and value of the sample, or None on timeout.
+        """
+        try:
+            item = self._queue.get_nowait()
+        except queue.Empty:
+            try:
+                item = await asyncio.to_thread(self._queue.get, True, timeout)
+            except queue.Empty:
+                return None
+        return self._deliver(item)
+
+    def stats(self) -> dict:
+        """
+        Returns the ingest counters of the input.
+
+        Returns:
+            dict: The received, delivered and dropped sample counts, the queue depth, and the mean and maximum
+                  latency in seconds between a sample being read and being consumed.
+        """
+        with self._counter_lock:
+            return {
+                'received': self.samples_received,
+                'delivered': self.samples_delivered,
+                'dropped': self.samples_dropped,
+                'queue_depth': self._queue.qsize(),
+                'mean_latency': self._latency_total / self.samples_delivered if self.samples_delivered else 0.0,
+                'max_latency': self._latency_max,
+            }
+
+    def _deliver(self, item) -> tuple:
+        """
+        Records the latency of a consumed sample.
+
+        Args:
+            item (tuple): The wall-clock timestamp, monotonic timestamp and value of the sample.
+
+        Returns:
+            tuple[float, object]: The wall-clock timestamp and value of the sample.
+        """
+        timestamp, received_at, value = item
+        latency = time.monotonic() - received_at
+        with self._counter_lock:
+            self.samples_delivered += 1
+            self._latency_total += latency
+            self._latency_max = max(self._latency_max, latency)
+        return timestamp, value
+
+    def _enqueue(self, value):
+        """
+        Hands a sample to the consumer, applying the overflow policy when the queue is full.
+
+        Args:
+            value: The sample.
+        """
+        item = (time.time(), time.monotonic(), value)
+        with self._counter_lock:
+            self.samples_received += 1
+
+        if self.overflow == 'block':
+            while not self._stop_event.is_set():
+                try:
+                    self._queue.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+            return
+
+        try:
+            self._queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+
+        dropped = 1
+        if self.overflow == 'drop_oldest':
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                dropped = 0
+            try:
+                self._queue.put_nowait(item)
+            except queue.Full:
+                dropped += 1
+
+        with self._counter_lock:
+            self.samples_dropped += dropped
+
+    def _run(self):
+        """Opens the device, reads samples until stopped, then closes the device."""
+        try:
+            self.open()
+            while not self._stop_event.is_set():
+                value = self.read_data()
+                if value is None:
+                    if self.poll_interval:
+                        self._stop_event.wait(self.poll_interval)
+                    continue
+                self._enqueue(value)
+        except Exception as e:
+            self._error = e
+            self._logger.error(Exception(f"Live input '{self.source}' stopped: {e}"), self)
+        finally:
+            try:
+                self.close()
+            except Exception as e:
+                self._logger.error(Exception(f"Failed to close live input '{self.source}': {e}"), self)
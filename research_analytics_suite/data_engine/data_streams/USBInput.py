@@ -3,6 +3,9 @@ USBInput Module
 
 Defines the USBInput class for handling live data input from USB sources.
 
+The serial port is opened and read on the input's reader thread, so opening a slow device or waiting for a line
+never blocks the event loop.
+
 Author: Lane
 Copyright: Lane
 Credits: Lane
@@ -12,47 +15,60 @@ Maintainer: Lane
 Email: justlane@uw.edu
 Status: Prototype
 """
-import serial
+from research_analytics_suite.data_engine.data_streams.ThreadedInput import ThreadedInput
+from research_analytics_suite.utils.LazyModule import lazy_import
 
-from research_analytics_suite.data_engine.data_streams.BaseInput import BaseInput
+serial = lazy_import('serial')
 
 
-class USBInput(BaseInput):
+class USBInput(ThreadedInput):
     """
     Class for handling live data input from a USB source.
 
     Attributes:
         port: The USB port.
         baud_rate: The baud rate for the USB connection.
-        serial_connection: The serial connection to the USB port.
+        read_timeout: The maximum time, in seconds, a read waits for a line.
+        serial_connection: The serial connection to the USB port, once opened.
     """
-    def __init__(self, port, baud_rate=9600):
+    def __init__(self, port, baud_rate=9600, read_timeout=0.1, **kwargs):
         """
-        Initializes the USBInput instance.
+        Initializes the USBInput instance. The port is opened when the input is started.
 
         Args:
             port (str): The USB port.
             baud_rate (int): The baud rate for the USB connection. Default is 9600.
+            read_timeout (float): The maximum time, in seconds, a read waits for a line. Default is 0.1.
+            **kwargs: Queue size, overflow policy and poll interval, see ThreadedInput.
         """
-        super().__init__(source="USB")
+        kwargs.setdefault('poll_interval', 0)
+        super().__init__(source="USB", **kwargs)
         self.port = port
         self.baud_rate = baud_rate
-        self.serial_connection = serial.Serial(port, baud_rate)
+        self.read_timeout = read_timeout
+        self.serial_connection = None
+
+    def open(self):
+        """
+        Opens the serial connection.
+        """
+        self.serial_connection = serial.Serial(self.port, self.baud_rate, timeout=self.read_timeout)
 
     def read_data(self):
         """
-        Reads data from the USB source.
+        Reads a line from the USB source, waiting at most `read_timeout` seconds.
 
         Returns:
             The data read from the USB source.
         """
-        if self.serial_connection.in_waiting:
-            return self.serial_connection.readline().decode('utf-8').strip()
-        return None
+        line = self.serial_connection.readline()
+        if not line:
+            return None
+        return line.decode('utf-8').strip() or None
 
     def close(self):
         """
         Closes the USB connection.
         """
-        if self.serial_connection.is_open:
+        if self.serial_connection is not None and self.serial_connection.is_open:
             self.serial_connection.close()
@@ -3,6 +3,13 @@ Classes for handling live data input.
 """
 
 from .BaseInput import BaseInput
+from .ThreadedInput import ThreadedInput
 from .AnalogInput import AnalogInput
 from .LiveDataHandler import LiveDataHandler
+from .RingBuffer import RingBuffer
+from .SchemaInference import SchemaInference
+from .DecimationPyramid import DecimationPyramid
+from .SimulatedInput import SimulatedInput
 from .USBInput import USBInput
+from .operators import (StreamOperator, BandPassFilter, Downsample, EventDetector, EWMA, PercentileSketch,
+                        RollingMinMax, RollingStatistics)
@@ -0,0 +1,78 @@
+"""
+BandPassFilter Module
+
+Defines the BandPassFilter operator, a causal Butterworth band-pass filter applied one sample at a time.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.operators.StreamOperator import StreamOperator
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+signal = lazy_import('scipy.signal')
+
+
+class BandPassFilter(StreamOperator):
+    """
+    A Butterworth band-pass filter in second-order sections, applied per sample in direct form II transposed.
+
+    The filter state is kept between samples, so the output matches filtering the whole stream at once with
+    `scipy.signal.sosfilt`.
+
+    Attributes:
+        low (float): The lower cutoff frequency, in Hz.
+        high (float): The upper cutoff frequency, in Hz.
+        sample_rate (float): The sample rate of the stream, in Hz.
+        order (int): The order of the filter.
+    """
+
+    def __init__(self, low: float, high: float, sample_rate: float, order: int = 2, channels: int = 1,
+                 name: str = None):
+        """
+        Initializes the BandPassFilter operator.
+
+        Args:
+            low (float): The lower cutoff frequency, in Hz.
+            high (float): The upper cutoff frequency, in Hz.
+            sample_rate (float): The sample rate of the stream, in Hz.
+            order (int): The order of the filter. Defaults to 2.
+            channels (int): The number of values per sample. Defaults to 1.
+            name (str, optional): The name of the operator.
+        """
+        super().__init__(name=name, channels=channels)
+        if not 0 < low < high < sample_rate / 2:
+            raise ValueError("Cutoff frequencies must satisfy 0 < low < high < sample_rate / 2")
+        self.low = float(low)
+        self.high = float(high)
+        self.sample_rate = float(sample_rate)
+        self.order = int(order)
+        self._sos = signal.butter(self.order, [self.low, self.high], btype='bandpass', output='sos',
+                                  fs=self.sample_rate)
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._state = np.zeros((len(self._sos), 2, self.channels))
+        self._value = np.full(self.channels, np.nan)
+
+    def _update(self, sample, timestamp):
+        x = sample
+        for section, (b0, b1, b2, _, a1, a2) in enumerate(self._sos):
+            z = self._state[section]
+            y = b0 * x + z[0]
+            z[0] = b1 * x - a1 * y + z[1]
+            z[1] = b2 * x - a2 * y
+            x = y
+        self._value = x
+        return x
+
+    def result(self) -> dict:
+        return {'value': self._value.copy()}
@@ -0,0 +1,88 @@
+"""
+Downsample Module
+
+Defines the Downsample operator, which reduces the rate of a stream by a fixed factor.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+from collections import deque
+
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.operators.StreamOperator import StreamOperator
+
+
+class Downsample(StreamOperator):
+    """
+    Emits one output for every `factor` input samples.
+
+    Attributes:
+        factor (int): The number of input samples per output.
+        method (str): How a group of samples is reduced: 'mean', 'last', or 'minmax', which emits the minimum and
+                      maximum of each channel so that peaks survive the reduction.
+        outputs (deque): The most recent outputs, as (timestamp, value) pairs.
+    """
+    METHODS = ('mean', 'last', 'minmax')
+
+    def __init__(self, factor: int, method: str = 'mean', channels: int = 1, history: int = 1024, name: str = None):
+        """
+        Initializes the Downsample operator.
+
+        Args:
+            factor (int): The number of input samples per output.
+            method (str): One of METHODS. Defaults to 'mean'.
+            channels (int): The number of values per sample. Defaults to 1.
+            history (int): The number of outputs kept. Defaults to 1024.
+            name (str, optional): The name of the operator.
+        """
+        super().__init__(name=name, channels=channels)
+        if factor <= 0:
+            raise ValueError("factor must be positive")
+        if method not in Downsample.METHODS:
+            raise ValueError(f"Unknown method '{method}'; expected one of {Downsample.METHODS}")
+        self.factor = int(factor)
+        self.method = method
+        self.history = int(history)
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.outputs = deque(maxlen=self.history)
+        self._sum = np.zeros(self.channels)
+        self._min = np.full(self.channels, np.inf)
+        self._max = np.full(self.channels, -np.inf)
+
+    def _update(self, sample, timestamp):
+        if self.method == 'mean':
+            self._sum += sample
+        elif self.method == 'minmax':
+            np.minimum(self._min, sample, out=self._min)
+            np.maximum(self._max, sample, out=self._max)
+
+        if self.samples_seen % self.factor != 0:
+            return None
+
+        if self.method == 'mean':
+            value = self._sum / self.factor
+            self._sum = np.zeros(self.channels)
+        elif self.method == 'minmax':
+            value = np.stack([self._min, self._max])
+            self._min = np.full(self.channels, np.inf)
+            self._max = np.full(self.channels, -np.inf)
+        else:
+            value = sample.copy()
+
+        output = (timestamp, value)
+        self.outputs.append(output)
+        return output
+
+    def result(self) -> dict:
+        latest = self.outputs[-1][1] if self.outputs else None
+        return {'latest': latest, 'outputs': len(self.outputs)}
@@ -0,0 +1,63 @@
+"""
+EWMA Module
+
+Defines the EWMA operator, which keeps an exponentially weighted moving mean and variance of a stream.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.operators.StreamOperator import StreamOperator
+
+
+class EWMA(StreamOperator):
+    """
+    Exponentially weighted moving mean and variance.
+
+    Attributes:
+        alpha (float): The weight of the newest sample, between 0 and 1.
+    """
+
+    def __init__(self, alpha: float = None, span: float = None, channels: int = 1, name: str = None):
+        """
+        Initializes the EWMA operator. Exactly one of `alpha` and `span` must be given.
+
+        Args:
+            alpha (float, optional): The weight of the newest sample, between 0 and 1.
+            span (float, optional): The span in samples; alpha = 2 / (span + 1).
+            channels (int): The number of values per sample. Defaults to 1.
+            name (str, optional): The name of the operator.
+        """
+        super().__init__(name=name, channels=channels)
+        if (alpha is None) == (span is None):
+            raise ValueError("Exactly one of alpha and span must be given")
+        self.alpha = float(alpha) if alpha is not None else 2.0 / (float(span) + 1.0)
+        if not 0 < self.alpha <= 1:
+            raise ValueError("alpha must be in (0, 1]")
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._mean = None
+        self._variance = np.zeros(self.channels)
+
+    def _update(self, sample, timestamp):
+        if self._mean is None:
+            self._mean = sample.copy()
+            return None
+
+        delta = sample - self._mean
+        self._mean += self.alpha * delta
+        self._variance = (1 - self.alpha) * (self._variance + self.alpha * delta * delta)
+        return None
+
+    def result(self) -> dict:
+        mean = self._mean.copy() if self._mean is not None else np.full(self.channels, np.nan)
+        return {'mean': mean, 'variance': self._variance.copy(), 'std': np.sqrt(self._variance)}
@@ -0,0 +1,99 @@
+"""
+EventDetector Module
+
+Defines the EventDetector operator, which detects threshold crossings in a stream.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+from collections import deque
+
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.operators.StreamOperator import StreamOperator
+
+
+class EventDetector(StreamOperator):
+    """
+    Detects threshold crossings, with hysteresis and a refractory period, on each channel.
+
+    A rising event fires when a channel goes above `threshold` and re-arms once it falls below
+    `threshold - hysteresis`; falling events mirror this. After an event, the channel ignores crossings for
+    `refractory` samples.
+
+    Attributes:
+        threshold (float): The crossing level.
+        direction (str): Which crossings are events: 'rising', 'falling' or 'both'.
+        hysteresis (float): The distance back across the threshold needed to re-arm.
+        refractory (int): The number of samples after an event during which no event fires on that channel.
+        events (deque): The most recent events, as dicts with index, timestamp, channel, direction and value.
+    """
+    DIRECTIONS = ('rising', 'falling', 'both')
+
+    def __init__(self, threshold: float, direction: str = 'rising', hysteresis: float = 0.0, refractory: int = 0,
+                 channels: int = 1, max_events: int = 1000, name: str = None):
+        """
+        Initializes the EventDetector operator.
+
+        Args:
+            threshold (float): The crossing level.
+            direction (str): One of DIRECTIONS. Defaults to 'rising'.
+            hysteresis (float): The distance back across the threshold needed to re-arm. Defaults to 0.
+            refractory (int): The number of samples ignored after an event. Defaults to 0.
+            channels (int): The number of values per sample. Defaults to 1.
+            max_events (int): The number of events kept. Defaults to 1000.
+            name (str, optional): The name of the operator.
+        """
+        super().__init__(name=name, channels=channels)
+        if direction not in EventDetector.DIRECTIONS:
+            raise ValueError(f"Unknown direction '{direction}'; expected one of {EventDetector.DIRECTIONS}")
+        self.threshold = float(threshold)
+        self.direction = direction
+        self.hysteresis = abs(float(hysteresis))
+        self.refractory = int(refractory)
+        self.max_events = int(max_events)
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self.events = deque(maxlen=self.max_events)
+        self.event_count = 0
+        self._armed_rising = None
+        self._armed_falling = None
+        self._last_event = np.full(self.channels, -np.inf)
+
+    def _update(self, sample, timestamp):
+        index = self.samples_seen - 1
+        if self._armed_rising is None:
+            self._armed_rising = sample <= self.threshold
+            self._armed_falling = sample >= self.threshold
+            return None
+
+        rising = self._armed_rising & (sample > self.threshold)
+        falling = self._armed_falling & (sample < self.threshold)
+        self._armed_rising = (self._armed_rising & ~rising) | (sample < self.threshold - self.hysteresis)
+        self._armed_falling = (self._armed_falling & ~falling) | (sample > self.threshold + self.hysteresis)
+
+        fired = []
+        ready = index - self._last_event > self.refractory
+        for kind, crossed in (('rising', rising), ('falling', falling)):
+            if self.direction not in (kind, 'both'):
+                continue
+            for channel in np.flatnonzero(crossed & ready):
+                event = {'index': index, 'timestamp': timestamp, 'channel': int(channel), 'direction': kind,
+                         'value': float(sample[channel])}
+                self._last_event[channel] = index
+                self.events.append(event)
+                fired.append(event)
+
+        self.event_count += len(fired)
+        return fired or None
+
+    def result(self) -> dict:
+        return {'event_count': self.event_count, 'last_event': self.events[-1] if self.events else None}
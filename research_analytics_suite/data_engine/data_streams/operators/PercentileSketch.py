@@ -0,0 +1,110 @@
+"""
+PercentileSketch Module
+
+Defines the PercentileSketch operator, which estimates quantiles of a stream in constant memory.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.operators.StreamOperator import StreamOperator
+
+
+class PercentileSketch(StreamOperator):
+    """
+    Streaming quantile estimates using the P-square algorithm (Jain and Chlamtac, 1985).
+
+    Each channel and quantile keeps five markers whose heights are adjusted with a piecewise-parabolic formula as
+    samples arrive, so memory and time per sample are constant and no sample history is kept.
+
+    Attributes:
+        quantiles (tuple[float]): The quantiles estimated, each between 0 and 1.
+    """
+
+    def __init__(self, quantiles=(0.5, 0.9, 0.99), channels: int = 1, name: str = None):
+        """
+        Initializes the PercentileSketch operator.
+
+        Args:
+            quantiles (tuple[float]): The quantiles to estimate, each between 0 and 1. Defaults to (0.5, 0.9, 0.99).
+            channels (int): The number of values per sample. Defaults to 1.
+            name (str, optional): The name of the operator.
+        """
+        super().__init__(name=name, channels=channels)
+        self.quantiles = tuple(float(q) for q in quantiles)
+        if not self.quantiles or not all(0 < q < 1 for q in self.quantiles):
+            raise ValueError("quantiles must be between 0 and 1")
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        shape = (self.channels, len(self.quantiles), 5)
+        q = np.array(self.quantiles)[:, None]
+        self._heights = np.zeros(shape)
+        self._positions = np.tile(np.arange(1.0, 6.0), shape[:2] + (1,))
+        self._desired = np.broadcast_to(np.hstack([np.ones_like(q), 1 + 2 * q, 1 + 4 * q, 3 + 2 * q, 5 * np.ones_like(q)]),
+                                        shape).copy()
+        self._increments = np.broadcast_to(np.hstack([np.zeros_like(q), q / 2, q, (1 + q) / 2, np.ones_like(q)]),
+                                           shape).copy()
+
+    def _update(self, sample, timestamp):
+        if self.samples_seen <= 5:
+            self._heights[:, :, self.samples_seen - 1] = sample[:, None]
+            if self.samples_seen == 5:
+                self._heights.sort(axis=2)
+            return None
+
+        heights, positions = self._heights, self._positions
+        x = np.broadcast_to(sample[:, None], heights.shape[:2])
+
+        np.minimum(heights[:, :, 0], x, out=heights[:, :, 0])
+        np.maximum(heights[:, :, 4], x, out=heights[:, :, 4])
+        cell = np.clip((x[..., None] >= heights[:, :, 1:4]).sum(axis=2), 0, 3)
+        positions[:, :, 1:] += np.arange(1, 5) > cell[..., None]
+        self._desired += self._increments
+
+        for i in (1, 2, 3):
+            d = self._desired[:, :, i] - positions[:, :, i]
+            up = (d >= 1) & (positions[:, :, i + 1] - positions[:, :, i] > 1)
+            down = (d <= -1) & (positions[:, :, i - 1] - positions[:, :, i] < -1)
+            move = up | down
+            if not move.any():
+                continue
+
+            step = np.where(up, 1.0, -1.0)
+            n, n_prev, n_next = positions[:, :, i], positions[:, :, i - 1], positions[:, :, i + 1]
+            h, h_prev, h_next = heights[:, :, i], heights[:, :, i - 1], heights[:, :, i + 1]
+            parabolic = h + step / (n_next - n_prev) * (
+                (n - n_prev + step) * (h_next - h) / (n_next - n) +
+                (n_next - n - step) * (h - h_prev) / (n - n_prev))
+            neighbour = np.where(up, h_next, h_prev)
+            linear = h + step * (neighbour - h) / (np.where(up, n_next, n_prev) - n)
+            candidate = np.where((h_prev < parabolic) & (parabolic < h_next), parabolic, linear)
+            heights[:, :, i] = np.where(move, candidate, h)
+            positions[:, :, i] = np.where(move, n + step, n)
+        return None
+
+    def quantile_estimates(self) -> np.ndarray:
+        """
+        Returns the current quantile estimates.
+
+        Returns:
+            np.ndarray: The estimates, shaped (channels, quantiles).
+        """
+        if self.samples_seen == 0:
+            return np.full((self.channels, len(self.quantiles)), np.nan)
+        if self.samples_seen < 5:
+            seen = np.sort(self._heights[:, 0, :self.samples_seen], axis=1)
+            return np.quantile(seen, self.quantiles, axis=1).T
+        return self._heights[:, :, 2].copy()
+
+    def result(self) -> dict:
+        estimates = self.quantile_estimates()
+        return {f"p{round(q * 100, 3):g}": estimates[:, i] for i, q in enumerate(self.quantiles)}
@@ -0,0 +1,82 @@
+"""
+RollingMinMax Module
+
+Defines the RollingMinMax operator, which keeps the minimum and maximum of the most recent samples of a stream.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+from collections import deque
+
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.operators.StreamOperator import StreamOperator
+
+
+class RollingMinMax(StreamOperator):
+    """
+    Rolling minimum and maximum over a window of the most recent samples.
+
+    Each channel keeps a monotonic deque of candidate extremes, so each update costs amortized constant time.
+
+    Attributes:
+        window (int): The number of samples in the window.
+    """
+
+    def __init__(self, window: int, channels: int = 1, name: str = None):
+        """
+        Initializes the RollingMinMax operator.
+
+        Args:
+            window (int): The number of samples in the window.
+            channels (int): The number of values per sample. Defaults to 1.
+            name (str, optional): The name of the operator.
+        """
+        super().__init__(name=name, channels=channels)
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = int(window)
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._minima = [deque() for _ in range(self.channels)]
+        self._maxima = [deque() for _ in range(self.channels)]
+
+    def _update(self, sample, timestamp):
+        index = self.samples_seen
+        oldest = index - self.window
+        for channel, value in enumerate(sample.tolist()):
+            minima = self._minima[channel]
+            while minima and minima[-1][1] >= value:
+                minima.pop()
+            minima.append((index, value))
+            if minima[0][0] <= oldest:
+                minima.popleft()
+
+            maxima = self._maxima[channel]
+            while maxima and maxima[-1][1] <= value:
+                maxima.pop()
+            maxima.append((index, value))
+            if maxima[0][0] <= oldest:
+                maxima.popleft()
+        return None
+
+    @property
+    def minimum(self) -> np.ndarray:
+        """Gets the minimum of each channel over the window."""
+        return np.array([minima[0][1] if minima else np.nan for minima in self._minima])
+
+    @property
+    def maximum(self) -> np.ndarray:
+        """Gets the maximum of each channel over the window."""
+        return np.array([maxima[0][1] if maxima else np.nan for maxima in self._maxima])
+
+    def result(self) -> dict:
+        return {'min': self.minimum, 'max': self.maximum}
@@ -0,0 +1,86 @@
+"""
+RollingStatistics Module
+
+Defines the RollingStatistics operator, which keeps the mean and variance of the most recent samples of a stream.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.operators.StreamOperator import StreamOperator
+
+
+class RollingStatistics(StreamOperator):
+    """
+    Rolling mean and variance over a window of the most recent samples.
+
+    The window is kept in a circular array and the statistics are updated with Welford's method, adding the new
+    sample and removing the one leaving the window, so each update costs the same regardless of the window size.
+
+    Attributes:
+        window (int): The number of samples in the window.
+        ddof (int): The delta degrees of freedom of the variance.
+    """
+
+    def __init__(self, window: int, channels: int = 1, ddof: int = 1, name: str = None):
+        """
+        Initializes the RollingStatistics operator.
+
+        Args:
+            window (int): The number of samples in the window.
+            channels (int): The number of values per sample. Defaults to 1.
+            ddof (int): The delta degrees of freedom of the variance. Defaults to 1.
+            name (str, optional): The name of the operator.
+        """
+        super().__init__(name=name, channels=channels)
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = int(window)
+        self.ddof = ddof
+        self.reset()
+
+    def reset(self):
+        super().reset()
+        self._values = np.zeros((self.window, self.channels))
+        self._count = 0
+        self._mean = np.zeros(self.channels)
+        self._m2 = np.zeros(self.channels)
+
+    def _update(self, sample, timestamp):
+        position = (self.samples_seen - 1) % self.window
+        if self._count < self.window:
+            self._count += 1
+            delta = sample - self._mean
+            self._mean += delta / self._count
+            self._m2 += delta * (sample - self._mean)
+        else:
+            old = self._values[position]
+            mean = self._mean + (sample - old) / self._count
+            self._m2 += (sample - old) * (sample - mean + old - self._mean)
+            np.maximum(self._m2, 0.0, out=self._m2)
+            self._mean = mean
+        self._values[position] = sample
+        return None
+
+    @property
+    def mean(self) -> np.ndarray:
+        """Gets the mean of each channel over the window."""
+        return self._mean.copy()
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Gets the variance of each channel over the window."""
+        if self._count <= self.ddof:
+            return np.full(self.channels, np.nan)
+        return self._m2 / (self._count - self.ddof)
+
+    def result(self) -> dict:
+        variance = self.variance
+        return {'mean': self.mean, 'variance': variance, 'std': np.sqrt(variance), 'count': self._count}
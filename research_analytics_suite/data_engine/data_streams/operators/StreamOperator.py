@@ -0,0 +1,123 @@
+"""
+StreamOperator Module
+
+Defines the StreamOperator class, the base class for incremental operators over live streams. An operator is
+updated with one sample at a time, in constant time per sample, and publishes its current result into a MemorySlot
+so that operations and the GUI can read it without rescanning the stream's history.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import uuid
+
+import numpy as np
+
+from research_analytics_suite.data_engine.memory.MemorySlot import MemorySlot
+
+
+class StreamOperator:
+    """
+    A base class for incremental stream operators.
+
+    Subclasses implement `_update`, `result` and `reset`.
+
+    Attributes:
+        name (str): The name of the operator, used as the name of its memory slot.
+        channels (int): The number of values per sample.
+        samples_seen (int): The number of samples the operator has been updated with.
+        slot (MemorySlot): The memory slot the operator's result is published into.
+    """
+
+    def __init__(self, name: str = None, channels: int = 1):
+        """
+        Initializes the StreamOperator instance.
+
+        Args:
+            name (str, optional): The name of the operator. Defaults to the class name.
+            channels (int): The number of values per sample. Defaults to 1.
+        """
+        self.name = name or type(self).__name__
+        self.channels = int(channels)
+        self.samples_seen = 0
+        self.slot = MemorySlot(memory_id=str(uuid.uuid4()), name=self.name, operation_required=False, data={})
+
+    def __repr__(self):
+        return f"{type(self).__name__}(name={self.name}, channels={self.channels}, samples_seen={self.samples_seen})"
+
+    def update(self, sample, timestamp: float = None):
+        """
+        Updates the operator with one sample.
+
+        Args:
+            sample: A scalar or a sequence of `channels` values.
+            timestamp (float, optional): The time of the sample.
+
+        Returns:
+            The operator's output for this sample, or None if the sample produced no output.
+        """
+        sample = np.asarray(sample, dtype=float).reshape(self.channels)
+        self.samples_seen += 1
+        return self._update(sample, timestamp)
+
+    def update_many(self, samples, timestamps=None) -> list:
+        """
+        Updates the operator with several samples, in order.
+
+        Args:
+            samples: An array of samples shaped (N,) or (N, channels).
+            timestamps (array-like, optional): The time of each sample.
+
+        Returns:
+            list: The outputs that were produced.
+        """
+        samples = np.asarray(samples, dtype=float).reshape(-1, self.channels)
+        outputs = []
+        for i, sample in enumerate(samples):
+            output = self.update(sample, None if timestamps is None else timestamps[i])
+            if output is not None:
+                outputs.append(output)
+        return outputs
+
+    def _update(self, sample: np.ndarray, timestamp: float):
+        """
+        Updates the operator's state with one sample.
+
+        Args:
+            sample (np.ndarray): The sample, shaped (channels,).
+            timestamp (float): The time of the sample, or None.
+
+        Returns:
+            The operator's output for this sample, or None.
+        """
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def result(self) -> dict:
+        """
+        Returns the operator's current result.
+
+        Returns:
+            dict: The named outputs of the operator.
+        """
+        raise NotImplementedError("Subclasses should implement this method")
+
+    def reset(self):
+        """Resets the operator to its initial state."""
+        self.samples_seen = 0
+
+    async def publish(self) -> MemorySlot:
+        """
+        Publishes the operator's current result into its memory slot.
+
+        Returns:
+            MemorySlot: The memory slot.
+        """
+        data = {key: (type(value), value) for key, value in self.result().items()}
+        data['samples_seen'] = (int, self.samples_seen)
+        await self.slot.update_data(data)
+        return self.slot
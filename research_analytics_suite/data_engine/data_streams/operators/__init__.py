@@ -0,0 +1,12 @@
+"""
+Incremental operators over live data streams.
+"""
+
+from .StreamOperator import StreamOperator
+from .BandPassFilter import BandPassFilter
+from .Downsample import Downsample
+from .EventDetector import EventDetector
+from .EWMA import EWMA
+from .PercentileSketch import PercentileSketch
+from .RollingMinMax import RollingMinMax
+from .RollingStatistics import RollingStatistics
@@ -0,0 +1,146 @@
+"""
+DaskClusterManager Module
+
+This module defines the DaskClusterManager class, which owns the single Dask cluster of a workspace. The cluster is
+started on first use and shared by every data engine and DaskOperation until the workspace is closed, so cluster
+start-up happens once per session rather than once per operation.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import asyncio
+import os
+
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+distributed = lazy_import('dask.distributed')
+
+
+class DaskClusterManager:
+    """
+    Manages the Dask cluster and client shared by a workspace.
+
+    The cluster is configured from Config: DASK_SCHEDULER_ADDRESS connects to an existing scheduler; otherwise a
+    LocalCluster is started with DASK_WORKERS worker processes (threads when DISTRIBUTED is False), NUM_THREADS threads
+    in total, MEMORY_LIMIT split between the workers, and DASK_SPILL_DIR as the worker spill directory.
+
+    Attributes:
+        client (dask.distributed.Client): The shared client, or None if the cluster has not been started.
+        cluster (dask.distributed.LocalCluster): The local cluster, or None when connected to an external scheduler.
+    """
+
+    def __init__(self, config=None):
+        """
+        Initializes the DaskClusterManager instance.
+
+        Args:
+            config (Config, optional): The configuration to read the cluster settings from. Defaults to Config().
+        """
+        from research_analytics_suite.utils.Config import Config
+        from research_analytics_suite.utils.CustomLogger import CustomLogger
+        self._config = config or Config()
+        self._logger = CustomLogger()
+
+        self.client = None
+        self.cluster = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Gets whether the shared client is connected."""
+        return self.client is not None and self.client.status == 'running'
+
+    @property
+    def dashboard_link(self):
+        """Gets the address of the cluster dashboard, if it is enabled."""
+        return self.client.dashboard_link if self.is_running and self._config.DASK_DASHBOARD_ADDRESS else None
+
+    async def get_client(self):
+        """
+        Returns the shared client, starting the cluster on first use.
+
+        Start-up runs on a worker thread so that it does not block the event loop.
+
+        Returns:
+            dask.distributed.Client: The shared client.
+        """
+        if self.is_running:
+            return self.client
+
+        async with self._lock:
+            if not self.is_running:
+                await self._close()
+                self.client, self.cluster = await asyncio.to_thread(self._start)
+        return self.client
+
+    async def close(self):
+        """Closes the shared client and shuts down the local cluster."""
+        async with self._lock:
+            await self._close()
+
+    def cluster_settings(self) -> dict:
+        """
+        Returns the LocalCluster arguments derived from the configuration.
+
+        Returns:
+            dict: The keyword arguments for `dask.distributed.LocalCluster`.
+        """
+        processes = bool(self._config.DISTRIBUTED)
+        threads = max(1, int(self._config.NUM_THREADS or os.cpu_count() or 1))
+        workers = int(self._config.DASK_WORKERS or min(threads, os.cpu_count() or 1)) if processes else 1
+        workers = max(1, workers)
+
+        settings = {
+            'n_workers': workers,
+            'threads_per_worker': max(1, threads // workers),
+            'processes': processes,
+            'dashboard_address': self._config.DASK_DASHBOARD_ADDRESS,
+        }
+        if self._config.MEMORY_LIMIT:
+            settings['memory_limit'] = int(self._config.MEMORY_LIMIT // workers)
+
+        if self._config.DASK_SPILL_DIR:
+            spill_dir = self._config.DASK_SPILL_DIR
+            if not os.path.isabs(spill_dir) and self._config.BASE_DIR and self._config.WORKSPACE_NAME:
+                spill_dir = os.path.join(self._config.BASE_DIR, self._config.WORKSPACE_NAME, spill_dir)
+            settings['local_directory'] = os.path.normpath(spill_dir)
+        return settings
+
+    def _start(self):
+        """
+        Connects to the configured scheduler or starts a local cluster.
+
+        Returns:
+            tuple[dask.distributed.Client, dask.distributed.LocalCluster]: The client and the local cluster, which is
+                                                                            None for an external scheduler.
+        """
+        if self._config.DASK_SCHEDULER_ADDRESS:
+            self._logger.info(f"Connecting to Dask scheduler at {self._config.DASK_SCHEDULER_ADDRESS}")
+            return distributed.Client(self._config.DASK_SCHEDULER_ADDRESS), None
+
+        settings = self.cluster_settings()
+        if 'local_directory' in settings:
+            os.makedirs(settings['local_directory'], exist_ok=True)
+
+        cluster = distributed.LocalCluster(**settings)
+        self._logger.info(f"Started Dask cluster with {settings['n_workers']} worker(s) of "
+                          f"{settings['threads_per_worker']} thread(s)")
+        return distributed.Client(cluster), cluster
+
+    async def _close(self):
+        """Closes the client and the local cluster, if any."""
+        client, cluster = self.client, self.cluster
+        self.client, self.cluster = None, None
+        try:
+            if client is not None:
+                await asyncio.to_thread(client.close)
+            if cluster is not None:
+                await asyncio.to_thread(cluster.close)
+        except Exception as e:
+            self._logger.error(Exception(f"Failed to shut down the Dask cluster: {e}"), self)
@@ -44,11 +44,17 @@ class DataEngineOptimized(UnifiedDataEngine):
         """
         Performs the specified operation on the data and caches the result.
 
+        When the workspace cluster is running, the result is persisted on it so that later reads are served from the
+        workers' memory instead of being recomputed.
+
         Args:
             operation_name (str): The name of the operation to perform.
         """
         self._logger.info(f"Performing operation: {operation_name}")
         result = self.data.map_partitions(self._apply_operation, operation_name)
+        client = self.dask_client or self._workspace.dask_client
+        if client is not None:
+            result = client.persist(result)
         self._cache.set(operation_name, result)
         self._logger.info("Operation performed and result cached")
         return result
@@ -69,17 +75,38 @@ class DataEngineOptimized(UnifiedDataEngine):
             return df * 2
         return df
 
-    def update_live_data(self, new_data):
+    def update_live_data(self, new_data, live_input=None, timestamp=None):
         """
-        Updates the data engine with new live data and caches the updated data.
+        Ingests a new live sample into the ring buffer of its input.
+
+        The sample is written into a preallocated buffer, so the cost does not depend on how much live data has been
+        received; the buffer itself is cached once, when it is created, see cache_live_buffer. The stream operators
+        attached to the buffer are then updated with the sample.
 
         Args:
             new_data: The new live data.
+            live_input (BaseInput, optional): The input the sample was read from. Defaults to the default live buffer.
+            timestamp (float, optional): The time the sample was read. Defaults to the current time.
+        """
+        buffer = self.live_data_handler.get_buffer(live_input)
+        buffer.append(self.live_data_handler.to_sample(new_data), timestamp)
+
+        operators = self.live_data_handler.get_operators(buffer)
+        if operators:
+            timestamps, values = buffer.window(1)
+            for operator in operators:
+                operator.update(values[0], timestamps[0])
+
+    def cache_live_buffer(self, buffer):
+        """
+        Caches a live ring buffer; called by the LiveDataHandler when it creates the buffer.
+
+        The default buffer is cached as 'live_data' and the buffer of each live input as 'live_data_<buffer name>'.
+
+        Args:
+            buffer (RingBuffer): The ring buffer.
         """
-        self._logger.info("Updating live data")
-        self.data = self.data.append(new_data)
-        self._cache.set('live_data', self.data)
-        self._logger.info("Live data updated and cached")
+        self._cache.set('live_data' if buffer.name == 'live' else f"live_data_{buffer.name}", buffer)
 
     def monitor_memory_usage(self):
         """
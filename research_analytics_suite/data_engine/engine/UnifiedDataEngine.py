@@ -12,18 +12,21 @@ import uuid
 from typing import Any, Dict
 
 import aiofiles
-import dask.dataframe as dd
-import pandas as pd
-from torch.utils.data import DataLoader
 
 from research_analytics_suite.analytics.core.AnalyticsCore import AnalyticsCore
 from research_analytics_suite.utils.Config import Config
 from research_analytics_suite.data_engine.core.DaskData import DaskData
+from research_analytics_suite.data_engine.core.DataPipeline import DataPipeline
+from research_analytics_suite.data_engine.core.PartitionPlanner import PartitionPlanner
 from research_analytics_suite.data_engine.memory.DataCache import DataCache
 from research_analytics_suite.data_engine.data_streams.DataTypeDetector import DataTypeDetector
-from research_analytics_suite.data_engine.core.TorchData import TorchData
+from research_analytics_suite.data_engine.data_streams.SchemaInference import SchemaInference
 from research_analytics_suite.data_engine.data_streams.BaseInput import BaseInput
 from research_analytics_suite.utils.CustomLogger import CustomLogger
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+dd = lazy_import('dask.dataframe')
+pd = lazy_import('pandas')
 
 
 def flatten_json(y: Dict[str, Any]) -> Dict[str, Any]:
@@ -92,10 +95,12 @@ class UnifiedDataEngine:
         self._workspace = Workspace()
 
         self.dask_data = DaskData(data)
-        self.torch_data = TorchData(data)
+        self._torch_data = None  # Created on first access, see torch_data
+        self._torch_pipeline = DataPipeline()  # Torch actions queued until torch_data is next used
         self.data_cache = DataCache()  # Initialize DataCache
         self.live_input_source = None  # Initialize live input source
         self.engine_id = f"{uuid.uuid4()}"
+        self.load_partitioning = None  # Partitioning used by the last load_data call
 
     def __getstate__(self):
         state = self.__dict__.copy()
@@ -107,7 +112,8 @@ class UnifiedDataEngine:
         state['live_input_source'] = None
         state['_cache'] = None
         state['analytics'] = None
-        state['torch_data'] = None
+        state['_torch_data'] = None
+        state['_torch_pipeline'] = None
         state['dask_data'] = None
         state['_workspace'] = None
         state['live_data_handler'] = None
@@ -125,9 +131,37 @@ class UnifiedDataEngine:
 
         self.live_input_source = None
         self.analytics = AnalyticsCore()
-        self.torch_data = TorchData(self.data)
+        self._torch_data = None
+        self._torch_pipeline = DataPipeline()
         self.dask_data = DaskData(self.data)
 
+    @property
+    def torch_data(self):
+        """
+        Returns the TorchData instance for the data, creating it (and importing torch) on first access. Actions
+        queued by apply and filter are run as one fused pass, and the TorchData is rebuilt once for all of them.
+
+        Returns:
+            TorchData: The TorchData instance.
+        """
+        if self._torch_data is None or self._torch_pipeline.steps:
+            from research_analytics_suite.data_engine.core.TorchData import TorchData
+            data = self._torch_data.get_data() if self._torch_data is not None else self.data
+            pipeline, self._torch_pipeline = self._torch_pipeline, DataPipeline()
+            self._torch_data = TorchData(pipeline.execute(data))
+        return self._torch_data
+
+    @torch_data.setter
+    def torch_data(self, value):
+        """
+        Sets the TorchData instance for the data.
+
+        Args:
+            value (TorchData): The TorchData instance.
+        """
+        self._torch_pipeline = DataPipeline()
+        self._torch_data = value
+
     @property
     def runtime_id(self) -> str:
         """
@@ -149,34 +183,20 @@ class UnifiedDataEngine:
         return f"{self.data_name}_{self.engine_id[:4]}"
 
     def detect_data_row(self, file_path, data_type):
-        def is_numerical(_row):
-            return all(self.is_number(_cell) for _cell in _row)
-
-        if data_type == 'csv':
-            with open(file_path, 'r') as f:
-                for i, line in enumerate(f):
-                    row = line.strip().split(',')
-                    if is_numerical(row):
-                        return i
-
-        elif data_type == 'json':
-            return 0
+        """
+        Detects the index of the first data row of a file from its inferred schema.
 
-        elif data_type == 'parquet':
-            return 0
+        The schema is inferred from a bounded sample of the file in a single pass and cached next to the file, so
+        repeated calls on an unchanged file do not read it again.
 
-        elif data_type == 'hdf5':
-            return 0
-
-        elif data_type == 'excel':
-            xls = pd.ExcelFile(file_path)
-            for sheet_name in xls.sheet_names:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-                for i, row in df.iterrows():
-                    if is_numerical(row):
-                        return i
+        Args:
+            file_path (str): The path to the data file.
+            data_type (str): The format of the file.
 
-        raise ValueError(f"Unsupported data type: {data_type}")
+        Returns:
+            int: The index of the first data row.
+        """
+        return SchemaInference.infer(file_path, data_type)['data_row']
 
     @staticmethod
     def is_number(value):
@@ -191,21 +211,32 @@ class UnifiedDataEngine:
         self._logger.info(f"Loading data from {file_path} as {data_type}")
 
         try:
+            planner = PartitionPlanner()
             if data_type == 'csv':
-                data = dd.read_csv(file_path)
+                self.load_partitioning = planner.plan_file(file_path, data_type)
+                options = SchemaInference.read_options(SchemaInference.infer(file_path, 'csv'))
+                # A single partition is read whole, so dask does not sample ahead of the skipped header rows
+                blocksize = self.load_partitioning['blocksize'] if self.load_partitioning['npartitions'] > 1 else None
+                data = dd.read_csv(file_path, blocksize=blocksize, **options)
             elif data_type == 'json':
                 with open(file_path, 'r') as f:
                     json_data = json.load(f)
                     flattened_data = [flatten_json(json_data)]
                     pandas_df = pd.DataFrame(flattened_data)
-                    data = dd.from_pandas(pandas_df, npartitions=1)
+                    self.load_partitioning = planner.plan(PartitionPlanner.estimate_nbytes(pandas_df), data_type)
+                    data = dd.from_pandas(pandas_df, npartitions=self.load_partitioning['npartitions'])
+            elif data_type in ('ndjson', 'jsonl'):
+                self.load_partitioning = planner.plan_file(file_path, 'ndjson')
+                blocksize = self.load_partitioning['blocksize'] if self.load_partitioning['npartitions'] > 1 else None
+                data = dd.read_json(file_path, lines=True, orient='records', blocksize=blocksize)
             elif data_type == 'parquet':
                 data = dd.read_parquet(file_path)
             elif data_type == 'hdf5':
                 data = dd.read_hdf(file_path)
             elif data_type == 'excel':
                 pandas_df = pd.read_excel(file_path)
-                data = dd.from_pandas(pandas_df, npartitions=1)
+                self.load_partitioning = planner.plan(PartitionPlanner.estimate_nbytes(pandas_df), data_type)
+                data = dd.from_pandas(pandas_df, npartitions=self.load_partitioning['npartitions'])
             else:
                 raise ValueError(f"Unsupported data type: {data_type}")
 
@@ -240,6 +271,9 @@ class UnifiedDataEngine:
             self.data.to_csv(file_path, single_file=True)
         elif data_type == 'json':
             self.data.to_json(file_path)
+        elif data_type == 'ndjson':
+            pandas_df = self.data.compute() if isinstance(self.data, dd.DataFrame) else self.data
+            pandas_df.to_json(file_path, orient='records', lines=True)
         elif data_type == 'parquet':
             self.data.to_parquet(file_path)
         elif data_type == 'hdf5':
@@ -266,13 +300,8 @@ class UnifiedDataEngine:
             await data_file.write(json.dumps(self.data, indent=4))
 
         # Save metadata
-        metadata = {
-            'data_name': self.data_name,
-            'backend': self.backend,
-            'engine_id': self.engine_id,
-        }
         async with aiofiles.open(os.path.join(f"{engine_path}", "metadata.json"), 'w') as metadata_file:
-            await metadata_file.write(json.dumps(metadata, indent=4))
+            await metadata_file.write(json.dumps(self.metadata, indent=4))
 
         # Save a pickleable state of the engine
         engine_state = self.__getstate__()
@@ -315,17 +344,47 @@ class UnifiedDataEngine:
             raise ValueError("Backend must be either 'dask' or 'torch'")
         self.backend = backend
 
-    def apply(self, action):
+    @property
+    def metadata(self) -> dict:
+        """
+        Returns the engine metadata, including the partitioning of its Dask data and of the last loaded file.
+
+        Returns:
+            dict: The engine metadata.
+        """
+        return {
+            'data_name': self.data_name,
+            'backend': self.backend,
+            'engine_id': self.engine_id,
+            'partitioning': self.dask_data.partition_info if self.dask_data else None,
+            'load_partitioning': self.load_partitioning,
+        }
+
+    def apply(self, action, rebalance=False):
         """
         Applies a function to the data.
 
         Args:
             action (function): The function to apply to the data.
+            rebalance (bool): Whether to re-plan the Dask partitions for the size of the result. Default is False.
         """
         if self.backend == 'dask':
-            self.dask_data.apply(action)
+            self.dask_data.apply(action, rebalance=rebalance)
         elif self.backend == 'torch':
-            self.torch_data = TorchData(action(self.torch_data.get_data()))
+            self._torch_pipeline.map(action)
+
+    def filter(self, predicate):
+        """
+        Keeps the rows of the data for which a predicate holds. With the Dask backend the partitions are re-planned
+        for the reduced size.
+
+        Args:
+            predicate (function): A function of the data returning a boolean mask of the rows to keep.
+        """
+        if self.backend == 'dask':
+            self.dask_data.filter(predicate)
+        elif self.backend == 'torch':
+            self._torch_pipeline.filter(predicate)
 
     def compute(self):
         """
@@ -339,22 +398,59 @@ class UnifiedDataEngine:
         elif self.backend == 'torch':
             return self.torch_data.get_data()
 
-    def get_torch_loader(self, batch_size=32, shuffle=True):
+    def get_torch_loader(self, batch_size=32, shuffle=True, drop_last=False, num_workers=0):
         """
         Gets a PyTorch DataLoader for the data.
 
+        Each batch is read from the tensor with one indexing operation, see BatchIndexSampler, rather than collated
+        from single samples.
+
         Args:
             batch_size (int): The batch size for the DataLoader. Default is 32.
             shuffle (bool): Whether to shuffle the data. Default is True.
+            drop_last (bool): Whether to drop the last batch if it is incomplete. Default is False.
+            num_workers (int): The number of DataLoader worker processes. Default is 0.
 
         Returns:
             DataLoader: The PyTorch DataLoader for the data.
         """
         if self.backend == 'torch':
-            return DataLoader(self.torch_data, batch_size=batch_size, shuffle=shuffle)
+            from torch.utils.data import DataLoader
+            from research_analytics_suite.data_engine.core.BatchIndexSampler import BatchIndexSampler
+            sampler = BatchIndexSampler(len(self.torch_data), batch_size=batch_size, shuffle=shuffle,
+                                        drop_last=drop_last)
+            return DataLoader(self.torch_data, sampler=sampler, batch_size=None, num_workers=num_workers)
         else:
             raise RuntimeError("DataLoader is only available for 'torch' backend")
 
+    def get_torch_stream(self, batch_size=32, columns=None, shuffle=False, chunk_rows=65536, num_workers=0):
+        """
+        Gets a PyTorch DataLoader that streams batches from the data one chunk at a time, see TorchChunkDataset.
+
+        With the Dask backend, chunks are the partitions of the Dask DataFrame, so the data is never loaded in full.
+        With the torch backend, chunks are blocks of rows of the tensor, which shares the storage of numpy or memmap
+        data.
+
+        Args:
+            batch_size (int): The batch size. Default is 32.
+            columns (list, optional): The DataFrame columns to stream. Default is all columns.
+            shuffle (bool): Whether to shuffle the chunks and the rows within them. Default is False.
+            chunk_rows (int): The number of rows per chunk for the torch backend. Default is 65536.
+            num_workers (int): The number of DataLoader worker processes, each streaming its own chunks. Default is 0.
+
+        Returns:
+            DataLoader: The streaming DataLoader.
+        """
+        from torch.utils.data import DataLoader
+        from research_analytics_suite.data_engine.core.TorchChunkDataset import TorchChunkDataset
+
+        source = self.dask_data.dask_dataframe if self.backend == 'dask' else self.torch_data.torch_tensor
+        if source is None:
+            raise RuntimeError("No data to stream")
+        dataset = TorchChunkDataset(source, batch_size=batch_size, columns=columns, chunk_rows=chunk_rows,
+                                    shuffle=shuffle)
+        return DataLoader(dataset, batch_size=None, num_workers=num_workers)
+
     def get_pickleable_data(self):
         data = self.__dict__.copy()
         data.pop('_logger', None)
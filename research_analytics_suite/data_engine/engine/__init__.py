@@ -4,3 +4,4 @@ Data engine classes for unified and optimized data handling.
 
 from .UnifiedDataEngine import UnifiedDataEngine
 from .DataEngineOptimized import DataEngineOptimized
+from .DaskClusterManager import DaskClusterManager
@@ -7,7 +7,9 @@ and processing within the research analytics suite.
 Author: Lane
 """
 
-import boto3
+from research_analytics_suite.utils.LazyModule import lazy_import
+
+boto3 = lazy_import('boto3')
 
 
 class CloudIntegration:
@@ -6,7 +6,7 @@ An abstract base class representing a collection of memory slots for storing dat
 Author: Lane
 """
 from abc import ABC
-from typing import List, Optional
+from typing import Dict, List, Optional
 import json
 import uuid
 
@@ -20,7 +20,8 @@ class MemorySlotCollection(ABC):
     Properties:
         collection_id (str): A unique identifier for the collection.
         name (str): A name for the collection.
-        slots (List[MemorySlot]): A list of memory slots.
+        slots (List[MemorySlot]): The memory slots, in the order added. They are held by memory_id, so a slot is
+            added once however often it is added, and looked up in constant time.
 
     Methods:
         add_slot(slot: MemorySlot): Add a memory slot to the collection.
@@ -46,7 +47,17 @@ class MemorySlotCollection(ABC):
             self._name = name
 
         self.collection_id = str(uuid.uuid4().hex)  # Generate a unique identifier for the collection
-        self.slots: List[MemorySlot] = []
+        self._slots: Dict[str, MemorySlot] = {}
+
+    @property
+    def slots(self) -> List[MemorySlot]:
+        """Get the memory slots, in the order added."""
+        return list(self._slots.values())
+
+    @slots.setter
+    def slots(self, value: List[MemorySlot]):
+        """Set the memory slots."""
+        self._slots = {slot.memory_id: slot for slot in value}
 
     @property
     def display_name(self) -> str:
@@ -67,13 +78,13 @@ class MemorySlotCollection(ABC):
 
     def list_slots(self) -> Optional[list[MemorySlot]]:
         """List all memory slots."""
-        if len(self.slots) > 0:
+        if len(self._slots) > 0:
             return self.slots
         return None
 
     def add_slot(self, slot: MemorySlot):
-        """Add a memory slot to the collection."""
-        self.slots.append(slot)
+        """Add a memory slot to the collection; a slot with the same ID is replaced in place."""
+        self._slots[slot.memory_id] = slot
 
     def new_slot_with_data(self, data: dict) -> MemorySlot:
         """Create a new memory slot from data and add it to the collection."""
@@ -84,14 +95,11 @@ class MemorySlotCollection(ABC):
 
     async def remove_slot(self, memory_id: str):
         """Remove a memory slot from the collection by its ID."""
-        self.slots = [slot for slot in self.slots if slot.memory_id != memory_id]
+        self._slots.pop(memory_id, None)
 
     def get_slot(self, memory_id: str) -> Optional[MemorySlot]:
         """Retrieve a memory slot by its ID."""
-        for slot in self.slots:
-            if slot.memory_id == memory_id:
-                return slot
-        return None
+        return self._slots.get(memory_id)
 
     def get_slot_data(self, memory_id: str) -> Optional[dict]:
         """Retrieve the data of a memory slot by its ID."""
@@ -100,19 +108,17 @@ class MemorySlotCollection(ABC):
 
     async def clear_slots(self):
         """Clear all memory slots."""
-        self.slots.clear()
+        self._slots.clear()
 
     async def update_slot(self, slot: MemorySlot):
         """Update an existing memory slot."""
-        for i, s in enumerate(self.slots):
-            if s.memory_id == slot.memory_id:
-                self.slots[i] = slot
-                return
-        raise ValueError(f"No slot found with memory_id: {slot.memory_id}")
+        if slot.memory_id not in self._slots:
+            raise ValueError(f"No slot found with memory_id: {slot.memory_id}")
+        self._slots[slot.memory_id] = slot
 
     async def slot_exists(self, memory_id: str) -> bool:
         """Check if a slot exists by its ID."""
-        return any(slot.memory_id == memory_id for slot in self.slots)
+        return memory_id in self._slots
 
     async def to_dict(self) -> dict:
         """Convert the collection to a dictionary."""
@@ -143,16 +149,18 @@ class MemorySlotCollection(ABC):
 
     def filter_slots(self, operation_required: bool) -> List[MemorySlot]:
         """Filter slots based on operation_required."""
-        return [slot for slot in self.slots if slot.operation_required == operation_required]
+        return [slot for slot in self._slots.values() if slot.operation_required == operation_required]
 
     def find_slots_by_name(self, name: str) -> List[MemorySlot]:
         """Find slots by name."""
-        return [slot for slot in self.slots if slot.name == name]
+        return [slot for slot in self._slots.values() if slot.name == name]
 
     def add_slots(self, slots: List[MemorySlot]):
         """Add multiple slots at once."""
-        self.slots.extend(slots)
+        for slot in slots:
+            self.add_slot(slot)
 
     def remove_slots(self, memory_ids: List[str]):
         """Remove multiple slots at once by their IDs."""
-        self.slots = [slot for slot in self.slots if slot.memory_id not in memory_ids]
+        for memory_id in memory_ids:
+            self._slots.pop(memory_id, None)
@@ -0,0 +1,270 @@
+"""
+SlotLineage Module
+
+This module defines the SlotLineage class, which records which operation produced each memory slot and which operations
+consume it, and frees the data of intermediate slots that no running or pending operation still needs.
+
+Author: Lane
+"""
+import os
+import pickle
+import sys
+import weakref
+
+import numpy as np
+
+
+class SlotLineage:
+    """
+    A lineage graph of memory slots, with reference-counting garbage collection of intermediate results.
+
+    Every output slot is recorded with its producing operation, and every parent that receives a child's output slot
+    as input is recorded as a pending consumer of it, until the consumer next finishes running. A slot is intermediate
+    when its producer is a child operation; collect() frees, or spills to disk, the data of intermediate slots with no
+    pending consumer whose producer and parent are not running, unless they are pinned or held in a MemoryManager
+    collection. Outputs of top-level operations are results, and children of persistent operations are rerun with them,
+    so neither is collected. A collected slot stays in its consumers' inputs. A freed slot's producer is reset to idle,
+    so a rerun of the parent runs the producer again and refills the slot; a spilled slot is restored from disk when
+    its consumer next runs or its producer's results are read.
+
+    When a top-level operation finishes, collect_if_needed() collects once the collectable slots hold at least
+    `collect_threshold` bytes, so intermediate results stay readable until memory is needed. BatchRunner suspends this
+    with `auto_collect` until it has written the results, then collects.
+
+    Attributes:
+        auto_collect (bool): Whether collect_if_needed() collects.
+        collect_threshold (int): The bytes held by collectable slots above which collect_if_needed() collects.
+        spill (bool): Whether collect_if_needed() spills slots to disk instead of freeing them.
+    """
+    _instance = None
+    COLLECT_THRESHOLD = 256 * 2 ** 20
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """
+        Initializes the SlotLineage instance.
+        """
+        if not hasattr(self, "_initialized"):
+            from research_analytics_suite.utils.CustomLogger import CustomLogger
+            self._logger = CustomLogger()
+
+            self._slots = {}  # memory_id -> weakref to the slot
+            self._producers = {}  # memory_id -> weakref to the producing operation
+            self._consumers = {}  # memory_id -> {consumer runtime_id: [weakref to the consumer, pending]}
+            self._running = {}  # runtime_id -> how many runs of the operation are in progress
+            self._pinned = set()
+            self.spilled = {}  # memory_id -> path of the spilled slot data
+            self.reclaimed_bytes = 0
+            self.auto_collect = True
+            self.collect_threshold = SlotLineage.COLLECT_THRESHOLD
+            self.spill = False
+            self._initialized = True
+
+    def record_output(self, operation, slot):
+        """
+        Records an operation as the producer of an output slot; a re-produced slot is no longer spilled.
+
+        Args:
+            operation (BaseOperation): The producing operation.
+            slot (MemorySlot): The output slot.
+        """
+        self._slots[slot.memory_id] = weakref.ref(slot)
+        self._producers[slot.memory_id] = weakref.ref(operation)
+        path = self.spilled.pop(slot.memory_id, None)
+        if path and os.path.exists(path):
+            os.remove(path)
+
+    def record_consumer(self, slot, operation):
+        """
+        Records an operation as a pending consumer of a slot, until the operation next finishes running.
+
+        Args:
+            slot (MemorySlot): The consumed slot.
+            operation (BaseOperation): The consuming operation.
+        """
+        self._slots.setdefault(slot.memory_id, weakref.ref(slot))
+        self._consumers.setdefault(slot.memory_id, {})[operation.runtime_id] = [weakref.ref(operation), True]
+
+    def begin(self, operation):
+        """Marks an operation as running, so its inputs and its children's outputs are kept."""
+        self._running[operation.runtime_id] = self._running.get(operation.runtime_id, 0) + 1
+
+    def end(self, operation):
+        """
+        Marks a run of an operation as finished. The last run releases the slots the operation was a pending consumer
+        of, unless it failed, in which case they are kept for a retry.
+        """
+        remaining = self._running.pop(operation.runtime_id, 1) - 1
+        if remaining > 0:
+            self._running[operation.runtime_id] = remaining
+            return
+        if operation.status == "error":
+            return
+        for consumers in self._consumers.values():
+            if operation.runtime_id in consumers:
+                consumers[operation.runtime_id][1] = False
+
+    def pin(self, memory_id: str):
+        """Keeps a slot from being collected."""
+        self._pinned.add(memory_id)
+
+    def unpin(self, memory_id: str):
+        """Allows a pinned slot to be collected."""
+        self._pinned.discard(memory_id)
+
+    def producer(self, memory_id: str):
+        """Returns the operation that produced a slot, or None."""
+        ref = self._producers.get(memory_id)
+        return ref() if ref else None
+
+    def consumers(self, memory_id: str) -> list:
+        """Returns the live operations recorded as consumers of a slot."""
+        return [op for op in (ref() for ref, _ in self._consumers.get(memory_id, {}).values()) if op is not None]
+
+    def collectable(self) -> list:
+        """
+        Returns the intermediate slots that no running or pending operation still needs.
+
+        Returns:
+            list[MemorySlot]: The slots whose data can be freed.
+        """
+        from research_analytics_suite.data_engine.memory.MemoryManager import MemoryManager
+        held = {slot.memory_id for collection in MemoryManager().memory_slot_collections.values()
+                for slot in collection.slots}
+
+        slots = []
+        for memory_id in list(self._slots):
+            slot = self._slots[memory_id]()
+            producer = self.producer(memory_id)
+            if slot is None or producer is None:
+                self._forget(memory_id)
+                continue
+            parent = producer.parent_operation
+            if (parent is None or parent.persistent or memory_id in self._pinned or memory_id in held
+                    or memory_id in self.spilled or not slot.data or producer.runtime_id in self._running
+                    or parent.runtime_id in self._running):
+                continue
+            pending = [ref() for ref, waiting in self._consumers.get(memory_id, {}).values() if waiting]
+            if any(consumer is not None for consumer in pending):
+                continue
+            slots.append(slot)
+        return slots
+
+    async def collect_if_needed(self):
+        """
+        Collects the collectable slots if auto_collect is set and they hold at least `collect_threshold` bytes.
+
+        Returns:
+            dict: The result of collect(), or None if nothing was collected.
+        """
+        if not self.auto_collect:
+            return None
+        slots = self.collectable()
+        held = sum(SlotLineage.nbytes(value) for slot in slots for _, value in slot.data.values())
+        if not slots or held < self.collect_threshold:
+            return None
+        return await self.collect(spill=self.spill, slots=slots)
+
+    async def collect(self, spill: bool = False, directory: str = None, slots: list = None) -> dict:
+        """
+        Frees the data of every collectable slot. Freed slots have their producer reset, so that it reruns when next
+        needed; spilled slots are restored from disk instead.
+
+        Args:
+            spill (bool): Whether to write the data to disk, for restore(), before freeing it.
+            directory (str, optional): The spill directory. Defaults to 'spill' in the workspace data directory.
+            slots (list[MemorySlot], optional): The slots to collect, from collectable(). Defaults to every
+                                                collectable slot.
+
+        Returns:
+            dict: The number of slots collected and spilled, and the bytes reclaimed.
+        """
+        slots = self.collectable() if slots is None else slots
+        if spill and slots and directory is None:
+            from research_analytics_suite.utils.Config import Config
+            config = Config()
+            directory = os.path.join(config.BASE_DIR, config.WORKSPACE_NAME, config.DATA_DIR, 'spill')
+
+        reclaimed = 0
+        for slot in slots:
+            try:
+                size = sum(SlotLineage.nbytes(value) for _, value in slot.data.values())
+                if spill:
+                    os.makedirs(directory, exist_ok=True)
+                    path = os.path.join(directory, f"{slot.memory_id}.pkl")
+                    with open(path, 'wb') as file:
+                        pickle.dump(dict(slot.data), file, protocol=pickle.HIGHEST_PROTOCOL)
+                    self.spilled[slot.memory_id] = path
+                await slot.clear_data()
+                producer = self.producer(slot.memory_id)
+                if not spill and producer is not None and producer.status == "completed":
+                    producer.status = "idle"
+                self._consumers.pop(slot.memory_id, None)
+                reclaimed += size
+            except Exception as e:
+                self._logger.error(Exception(f"Failed to collect memory slot {slot.memory_id}: {e}"), self)
+
+        self.reclaimed_bytes += reclaimed
+        if slots:
+            self._logger.info(f"Collected {len(slots)} intermediate memory slot(s), reclaiming "
+                              f"{reclaimed / 1024 ** 2:.2f} MB" + (" (spilled to disk)" if spill else ""))
+        return {"slots": len(slots), "spilled": len(slots) if spill else 0, "bytes": reclaimed}
+
+    async def restore(self, slots) -> int:
+        """
+        Reloads the data of the spilled slots among the given ones; called before the slots are read.
+
+        Args:
+            slots (list[MemorySlot]): The slots.
+
+        Returns:
+            int: The number of slots restored.
+        """
+        restored = 0
+        for slot in slots:
+            if slot.memory_id in self.spilled:
+                try:
+                    await self._restore(slot)
+                    restored += 1
+                except Exception as e:
+                    self._logger.error(Exception(f"Failed to restore memory slot {slot.memory_id}: {e}"), self)
+        return restored
+
+    async def _restore(self, slot):
+        """
+        Reloads the data of a spilled slot.
+
+        Args:
+            slot (MemorySlot): The spilled slot.
+        """
+        path = self.spilled.pop(slot.memory_id)
+        with open(path, 'rb') as file:
+            await slot.update_data(pickle.load(file))
+        os.remove(path)
+
+    @staticmethod
+    def nbytes(value) -> int:
+        """Returns an estimate of the memory held by a value; memory-mapped arrays hold none."""
+        if isinstance(value, np.memmap):
+            return 0
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if hasattr(value, 'memory_usage') and 'pandas' in type(value).__module__:
+            usage = value.memory_usage(deep=True)
+            return int(usage.sum()) if hasattr(usage, 'sum') else int(usage)
+        if isinstance(value, (list, tuple, set)):
+            return sys.getsizeof(value) + sum(SlotLineage.nbytes(item) for item in value)
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(SlotLineage.nbytes(item) for item in value.values())
+        return sys.getsizeof(value)
+
+    def _forget(self, memory_id: str):
+        """Drops a slot whose slot or producer no longer exists."""
+        self._slots.pop(memory_id, None)
+        self._producers.pop(memory_id, None)
+        self._consumers.pop(memory_id, None)
+        self._pinned.discard(memory_id)
@@ -5,5 +5,6 @@ Classes for managing memory slots used in operations.
 from .MemorySlot import *
 from .MemorySlotCollection import *
 from .MemoryManager import *
+from .SlotLineage import *
 from .storage import *
 from .DataCache import *
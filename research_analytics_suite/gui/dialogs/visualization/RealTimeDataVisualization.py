@@ -4,10 +4,17 @@ RealTimeDataVisualization Module
 This module defines the RealTimeDataVisualization class, which provides a GUI for visualizing real-time data updates
 within the Research Analytics Suite.
 
+Each live buffer is drawn through a DecimationPyramid, so a redraw sends DearPyGui about two points per horizontal
+pixel of the visible range instead of every sample, and redraws are paced to a fixed frame budget.
+
 Author: Lane
 """
+import asyncio
+import time
+
 import dearpygui.dearpygui as dpg
 
+from research_analytics_suite.data_engine.data_streams.DecimationPyramid import DecimationPyramid
 from research_analytics_suite.data_engine.engine.DataEngineOptimized import DataEngineOptimized
 from research_analytics_suite.gui.GUIBase import GUIBase
 
@@ -15,43 +22,153 @@ from research_analytics_suite.gui.GUIBase import GUIBase
 class RealTimeDataVisualization(GUIBase):
     """Class to create and manage the Real-Time Data Visualization pane."""
 
-    def __init__(self, data_engine: DataEngineOptimized, width: int, height: int, parent):
+    def __init__(self, data_engine: DataEngineOptimized, width: int, height: int, parent,
+                 frame_budget: float = 1 / 30, window_seconds: float = 10.0):
         """
         Initializes the RealTimeDataVisualization instance.
 
         Args:
             data_engine (DataEngineOptimized): The data engine with real-time data.
+            frame_budget (float): The target time, in seconds, between redraws. Defaults to 1/30.
+            window_seconds (float): The time span shown while following the newest data. Defaults to 10.
         """
         super().__init__(width, height, parent)
         self._data_engine = data_engine
+        self._frame_budget = frame_budget
+        self._window_seconds = window_seconds
+
+        self._pyramids = dict()
+        self._series = dict()
+        self._origin = None
+        self._running = False
+        self._follow = True
+        self._last_frame_time = 0.0
+
+        self._plot_id = f"real_time_plot_{self._runtime_id}"
+        self._x_axis_id = f"real_time_x_axis_{self._runtime_id}"
+        self._y_axis_id = f"real_time_y_axis_{self._runtime_id}"
+        self._status_id = f"real_time_status_{self._runtime_id}"
 
     async def initialize_gui(self):
         """Initializes the Real-Time Data Visualization pane."""
-        pass
+        from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+        self._update_operation = await self._operation_control.operation_manager.add_operation_with_parameters(
+            operation_type=BaseOperation, name="gui_RealTimeVisualizationUpdateTask",
+            action=self._update_async, persistent=True, concurrent=True)
+        self._update_operation.is_ready = True
 
     async def _update_async(self) -> None:
-        """Updates the Real-Time Data Visualization pane asynchronously."""
-        pass
+        """Updates the Real-Time Data Visualization pane asynchronously, once per frame budget."""
+        while not dpg.does_item_exist(self._plot_id):
+            await asyncio.sleep(0.1)
+
+        while True:
+            started = time.perf_counter()
+            if self._running:
+                try:
+                    self.update_plot()
+                except Exception as e:
+                    self._logger.error(e, self)
+            self._last_frame_time = time.perf_counter() - started
+            await asyncio.sleep(max(0.0, self._frame_budget - self._last_frame_time))
 
     async def resize_gui(self, new_width: int, new_height: int) -> None:
         """Resizes the Real-Time Data Visualization pane."""
-        pass
+        self.width = new_width
+        self.height = new_height
+        if dpg.does_item_exist(self._plot_id):
+            dpg.set_item_width(self._plot_id, new_width)
+            dpg.set_item_height(self._plot_id, new_height)
 
     def draw(self):
         """Draws the GUI elements for the Real-Time Data Visualization pane."""
         with dpg.window(label="Real-Time Data Visualization", tag="real_time_data_visualization"):
             dpg.add_text("Real-Time Data Visualization", color=(255, 255, 0))
-            dpg.add_plot(label="Real-Time Data", tag="real_time_plot")
+            with dpg.plot(label="Real-Time Data", tag=self._plot_id, width=self.width, height=self.height):
+                dpg.add_plot_legend()
+                dpg.add_plot_axis(dpg.mvXAxis, label="Time (s)", tag=self._x_axis_id)
+                dpg.add_plot_axis(dpg.mvYAxis, label="Value", tag=self._y_axis_id)
             with dpg.group(horizontal=True):
                 dpg.add_button(label="Start Visualization", callback=self.start_visualization)
                 dpg.add_button(label="Stop Visualization", callback=self.stop_visualization)
+                dpg.add_checkbox(label="Follow", default_value=self._follow, callback=self._toggle_follow)
+                dpg.add_text("", tag=self._status_id)
 
     def start_visualization(self):
         """Starts real-time data visualization."""
         self._logger.info("Starting real-time data visualization")
-        # Placeholder for starting real-time data visualization
+        self._running = True
 
     def stop_visualization(self):
         """Stops real-time data visualization."""
         self._logger.info("Stopping real-time data visualization")
-        # Placeholder for stopping real-time data visualization
+        self._running = False
+
+    def update_plot(self):
+        """
+        Brings the decimation pyramids up to date with the live buffers and redraws the visible range.
+
+        While following, the x axis shows the last `window_seconds`; otherwise the range the user has zoomed or
+        panned to is redrawn at the resolution of the plot.
+        """
+        handler = self._data_engine.live_data_handler
+        for name, buffer in handler.buffers.items():
+            if name not in self._pyramids:
+                self._pyramids[name] = DecimationPyramid(buffer)
+            self._pyramids[name].update()
+
+        pixels = max(1, dpg.get_item_rect_size(self._plot_id)[0] or self.width)
+        newest = None
+        for pyramid in self._pyramids.values():
+            if pyramid.buffer.total_samples:
+                _timestamps, _ = pyramid.buffer.window(1)
+                newest = _timestamps[0] if newest is None else max(newest, _timestamps[0])
+        if newest is None:
+            return
+
+        if self._origin is None:
+            self._origin = newest
+        if self._follow:
+            start, stop = newest - self._window_seconds, newest
+        else:
+            x_min, x_max = dpg.get_axis_limits(self._x_axis_id)
+            start, stop = self._origin + x_min, self._origin + x_max
+
+        drawn = 0
+        for name, pyramid in self._pyramids.items():
+            timestamps, values, level = pyramid.query(pixels, start, stop)
+            x = (timestamps - self._origin).tolist()
+            for channel, column in enumerate(pyramid.buffer.columns):
+                self._set_series(f"{name}:{column}", x, values[:, channel].tolist())
+            drawn += len(x)
+
+        if self._follow:
+            dpg.set_axis_limits(self._x_axis_id, start - self._origin, stop - self._origin)
+            dpg.fit_axis_data(self._y_axis_id)
+        dpg.set_value(self._status_id, f"{drawn} points, {self._last_frame_time * 1000:.1f} ms/frame")
+
+    def _set_series(self, label: str, x: list, y: list):
+        """
+        Updates the line series with the given label, creating it on first use.
+
+        Args:
+            label (str): The label of the series.
+            x (list[float]): The x values.
+            y (list[float]): The y values.
+        """
+        if label not in self._series:
+            self._series[label] = dpg.add_line_series(x, y, label=label, parent=self._y_axis_id)
+        else:
+            dpg.set_value(self._series[label], [x, y])
+
+    def _toggle_follow(self, sender, app_data):
+        """
+        Switches between following the newest data and a user-controlled x axis.
+
+        Args:
+            sender: The checkbox.
+            app_data (bool): Whether to follow the newest data.
+        """
+        self._follow = bool(app_data)
+        if not self._follow:
+            dpg.set_axis_limits_auto(self._x_axis_id)
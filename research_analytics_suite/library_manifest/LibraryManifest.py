@@ -20,6 +20,7 @@ import importlib
 from research_analytics_suite.library_manifest.utils import check_verified
 from research_analytics_suite.library_manifest.Category import Category
 from research_analytics_suite.library_manifest.CategoryID import CategoryID
+from research_analytics_suite.library_manifest.ManifestScanner import ManifestScanner
 
 
 class LibraryManifest:
@@ -52,6 +53,7 @@ class LibraryManifest:
 
             self._categories = {}
             self._library = {}
+            self._scanner = ManifestScanner()
             self._initialized = False
 
     async def initialize(self):
@@ -107,15 +109,7 @@ class LibraryManifest:
             }
 
         user_dir = os.path.normpath(os.path.join(self._config.BASE_DIR, 'operations'))
-        if os.path.exists(user_dir):
-            files = [f for f in os.listdir(user_dir) if f.endswith('.json')]
-            for file in files:
-                from research_analytics_suite.operation_manager.operations.core.memory.OperationAttributes import \
-                    OperationAttributes
-                op_attributes = OperationAttributes()
-                await op_attributes.initialize()
-                await op_attributes.from_disk(os.path.join(user_dir, file))
-                self.add_operation_from_attributes(op_attributes)
+        await self._load_directory(user_dir)
 
     async def load_user_library(self):
         # Called when a workspace is loaded, rebuilds the user library
@@ -124,15 +118,22 @@ class LibraryManifest:
         if not os.path.exists(_local_operation_dir):
             return []
 
-        operation_files = [os.path.join(_local_operation_dir, f) for f in os.listdir(_local_operation_dir)
-                           if f.endswith('.json')]
-        for _op in operation_files:
-            from research_analytics_suite.operation_manager.operations.core.memory.OperationAttributes import \
-                OperationAttributes
-            _op_attributes = OperationAttributes()
-            await _op_attributes.initialize()
-            await _op_attributes.from_disk(_op)
-            self.add_operation_from_attributes(_op_attributes)
+        await self._load_directory(_local_operation_dir)
+
+    async def _load_directory(self, directory):
+        """
+        Registers the operations stored in a directory, reading only the files that changed since the last scan.
+
+        Args:
+            directory (str): The directory containing the operation files.
+        """
+        from research_analytics_suite.operation_manager.operations.core.memory.OperationAttributes import \
+            OperationAttributes
+
+        for attributes in await self._scanner.scan(directory):
+            op_attributes = OperationAttributes(**attributes)
+            await op_attributes.initialize()
+            self.add_operation_from_attributes(op_attributes)
 
     async def maintain_library(self):
         # Logic to maintain the library by checking for new operations
@@ -0,0 +1,237 @@
+"""
+ManifestScanner
+
+This module contains the ManifestScanner class, which reads the operation files of a library directory for the
+LibraryManifest. Files are read concurrently with a bounded number of open files, each file is parsed at most once
+into a shared cache, and a persistent index keyed by file modification time and size lets later scans skip files
+that have not changed.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import asyncio
+import json
+import os
+
+import aiofiles
+
+
+class ManifestScanner:
+    """
+    ManifestScanner class is used to collect the attributes of every operation file in a library directory.
+
+    Attributes:
+        max_concurrency (int): The maximum number of operation files read at the same time.
+        _cache (dict): The parsed attributes of each operation file, keyed by file path.
+    """
+    INDEX_FILE_NAME = '.manifest_index'
+    INDEX_VERSION = 1
+    DEFAULT_CONCURRENCY = 16
+
+    _ATTRIBUTE_KEYS = ('unique_id', 'category_id', 'version', 'name', 'author', 'github', 'email', 'description',
+                       'action', 'persistent', 'concurrent', 'is_cpu_bound', 'dependencies', 'parent_operation',
+                       'child_operations')
+
+    def __init__(self, max_concurrency: int = None):
+        """
+        Initializes the ManifestScanner.
+
+        Args:
+            max_concurrency (int, optional): The maximum number of operation files read at the same time.
+                                             Defaults to DEFAULT_CONCURRENCY.
+        """
+        from research_analytics_suite.utils import CustomLogger
+        self._logger = CustomLogger()
+
+        self.max_concurrency = max(1, int(max_concurrency or ManifestScanner.DEFAULT_CONCURRENCY))
+        self._cache = dict()
+        self._loaded_indexes = set()
+
+    async def scan(self, directory: str) -> list:
+        """
+        Collects the attributes of every operation file in a directory.
+
+        Unchanged files are served from the cache; new or modified files are read concurrently and the persistent
+        index of the directory is rewritten when anything has changed.
+
+        Args:
+            directory (str): The directory containing the operation files.
+
+        Returns:
+            list[dict]: The attributes of each operation, ordered by file name.
+        """
+        directory = os.path.normpath(directory)
+        if not os.path.isdir(directory):
+            return []
+
+        await self._load_index(directory)
+
+        signatures = dict()
+        for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+            if entry.is_file() and entry.name.endswith('.json') and not entry.name.startswith('.'):
+                _stat = entry.stat()
+                signatures[os.path.normpath(entry.path)] = (_stat.st_mtime_ns, _stat.st_size)
+
+        stale = [path for path, signature in signatures.items()
+                 if path not in self._cache or tuple(self._cache[path]['signature']) != signature]
+        removed = [path for path in self._cache.keys()
+                   if os.path.dirname(path) == directory and path not in signatures]
+        for path in removed:
+            del self._cache[path]
+
+        if stale:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            parsed = await asyncio.gather(*[self._read_file(path, semaphore) for path in stale])
+            for path, state in zip(stale, parsed):
+                if state is not None:
+                    self._cache[path] = {'signature': list(signatures[path]), 'state': state}
+            self._logger.debug(f"[MANIFEST] Parsed {len(stale)} of {len(signatures)} operation file(s) in {directory}")
+
+        if stale or removed:
+            await self._save_index(directory)
+
+        return [self._resolve_attributes(path, directory) for path in signatures.keys() if path in self._cache]
+
+    def invalidate(self, directory: str = None):
+        """
+        Clears cached operation files so that the next scan reads them from disk.
+
+        Args:
+            directory (str, optional): The directory to clear. Defaults to clearing every directory.
+        """
+        if directory is None:
+            self._cache.clear()
+            self._loaded_indexes.clear()
+            return
+
+        directory = os.path.normpath(directory)
+        for path in [p for p in self._cache.keys() if os.path.dirname(p) == directory]:
+            del self._cache[path]
+        self._loaded_indexes.discard(directory)
+
+    async def _read_file(self, file_path: str, semaphore: asyncio.Semaphore):
+        """
+        Reads and decodes a single operation file.
+
+        Args:
+            file_path (str): The path to the operation file.
+            semaphore (asyncio.Semaphore): The semaphore bounding the number of open files.
+
+        Returns:
+            dict: The decoded operation file, or None if it could not be read.
+        """
+        async with semaphore:
+            try:
+                async with aiofiles.open(file_path, 'r') as file:
+                    state = json.loads(await file.read())
+            except Exception as e:
+                self._logger.error(Exception(f"Failed to read operation file '{file_path}': {e}"), self)
+                return None
+
+        if not isinstance(state, dict):
+            self._logger.error(Exception(f"Operation file '{file_path}' does not contain a dictionary"), self)
+            return None
+        return state
+
+    def _resolve_attributes(self, file_path: str, directory: str) -> dict:
+        """
+        Builds the attributes of an operation from its cached file.
+
+        Local references (entries without an action) are completed from the referenced operation file in the same
+        directory, which is itself read only once through the cache.
+
+        Args:
+            file_path (str): The path to the operation file.
+            directory (str): The directory containing the operation file.
+
+        Returns:
+            dict: The attributes of the operation.
+        """
+        state = self._cache[file_path]['state']
+        if 'action' not in state:
+            _reference = os.path.normpath(os.path.join(
+                directory, f"{state.get('github')}_{state.get('name')}_{state.get('version')}.json"))
+            if _reference != file_path and _reference in self._cache:
+                state = {**state, **{key: value for key, value in self._cache[_reference]['state'].items()
+                                     if key in self._ATTRIBUTE_KEYS and key != 'parent_operation'}}
+
+        attributes = {key: state.get(key, None) for key in self._ATTRIBUTE_KEYS}
+        if not isinstance(attributes['parent_operation'], dict):
+            attributes['parent_operation'] = None
+        if isinstance(attributes['child_operations'], list):
+            attributes['child_operations'] = list(attributes['child_operations'])
+        return attributes
+
+    async def _load_index(self, directory: str):
+        """
+        Populates the cache from the persistent index of a directory, if it has not been loaded yet.
+
+        Args:
+            directory (str): The directory containing the operation files.
+        """
+        if directory in self._loaded_indexes:
+            return
+        self._loaded_indexes.add(directory)
+
+        index_path = os.path.join(directory, ManifestScanner.INDEX_FILE_NAME)
+        if not os.path.exists(index_path):
+            return
+
+        try:
+            async with aiofiles.open(index_path, 'r') as file:
+                index = json.loads(await file.read())
+        except Exception as e:
+            self._logger.warning(f"[MANIFEST] Ignoring unreadable manifest index '{index_path}': {e}")
+            return
+
+        if not isinstance(index, dict) or index.get('version') != ManifestScanner.INDEX_VERSION:
+            return
+
+        files = index.get('files')
+        for file_name, entry in (files.items() if isinstance(files, dict) else ()):
+            path = os.path.normpath(os.path.join(directory, file_name))
+            if path not in self._cache and ManifestScanner._valid_entry(entry):
+                self._cache[path] = {'signature': list(entry['signature']), 'state': entry['state']}
+
+    @staticmethod
+    def _valid_entry(entry) -> bool:
+        """
+        Checks that an entry of a persistent index has a decoded file and a (modification time, size) signature.
+
+        Args:
+            entry: The entry read from the index.
+
+        Returns:
+            bool: Whether the entry can be cached.
+        """
+        if not isinstance(entry, dict) or not isinstance(entry.get('state'), dict):
+            return False
+        signature = entry.get('signature')
+        return (isinstance(signature, list) and len(signature) == 2
+                and all(isinstance(value, int) and not isinstance(value, bool) for value in signature))
+
+    async def _save_index(self, directory: str):
+        """
+        Writes the persistent index of a directory.
+
+        Args:
+            directory (str): The directory containing the operation files.
+        """
+        index = {
+            'version': ManifestScanner.INDEX_VERSION,
+            'files': {os.path.basename(path): entry for path, entry in self._cache.items()
+                      if os.path.dirname(path) == directory},
+        }
+
+        index_path = os.path.join(directory, ManifestScanner.INDEX_FILE_NAME)
+        try:
+            async with aiofiles.open(index_path, 'w') as file:
+                await file.write(json.dumps(index))
+        except Exception as e:
+            self._logger.warning(f"[MANIFEST] Failed to write manifest index '{index_path}': {e}")
@@ -1,3 +1,4 @@
 from .CategoryID import CategoryID
 from .Category import Category
 from .LibraryManifest import LibraryManifest
+from .ManifestScanner import ManifestScanner
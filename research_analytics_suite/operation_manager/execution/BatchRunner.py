@@ -0,0 +1,222 @@
+"""
+BatchRunner Module.
+
+This module defines the BatchRunner class, which executes a saved operation group non-interactively. It is used by
+the headless batch mode of the Research Analytics Suite, where no GUI, console or resource monitor is started and
+the process exits with a status code once the operation group has finished.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import asyncio
+import json
+import os
+import time
+from typing import Optional
+
+import aiofiles
+
+from research_analytics_suite.data_engine.memory.SlotLineage import SlotLineage
+from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+from research_analytics_suite.utils.Config import Config
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+class BatchRunner:
+    """
+    A class to run a saved operation group to completion without user interaction.
+
+    Child operations are executed before their parent, sibling dependencies are respected, and at most
+    `max_parallel` operations execute at the same time.
+    """
+    EXIT_SUCCESS = 0
+    EXIT_OPERATION_FAILED = 1
+    EXIT_LOAD_FAILED = 2
+    EXIT_WORKSPACE_FAILED = 3
+
+    def __init__(self, max_parallel: int = 1, output_path: Optional[str] = None):
+        """
+        Initializes the BatchRunner.
+
+        Args:
+            max_parallel (int): The maximum number of operations executing at the same time. Defaults to 1.
+            output_path (str, optional): The file the results are written to. Defaults to a JSON file named after the
+                                         operation group in the workspace data directory.
+        """
+        self._logger = CustomLogger()
+        self._config = Config()
+
+        self.max_parallel = max(1, int(max_parallel or 1))
+        self.output_path = output_path
+
+        self._semaphore = None
+        self._tasks = dict()
+
+    def resolve_operation_file(self, operation_file: str) -> str:
+        """
+        Resolves an operation group file, either as given or relative to the workspace operations directory.
+
+        Args:
+            operation_file (str): The path or file name of the operation group.
+
+        Returns:
+            str: The path to the operation group file.
+        """
+        if os.path.exists(operation_file):
+            return os.path.normpath(operation_file)
+
+        _file_name = operation_file if operation_file.endswith('.json') else f"{operation_file}.json"
+        return os.path.normpath(os.path.join(self._config.BASE_DIR, self._config.WORKSPACE_NAME,
+                                             self._config.WORKSPACE_OPERATIONS_DIR, _file_name))
+
+    async def run(self, operation_file: str) -> int:
+        """
+        Loads and executes an operation group, then writes the results to disk.
+
+        Args:
+            operation_file (str): The path or file name of the operation group.
+
+        Returns:
+            int: The exit status; EXIT_SUCCESS if every operation completed.
+        """
+        file_path = self.resolve_operation_file(operation_file)
+        self._logger.info(f"[BATCH] Loading operation group: {file_path}")
+
+        try:
+            operation_group = await BaseOperation.load_operation_group(file_path, dict())
+        except Exception as e:
+            self._logger.error(Exception(f"Failed to load operation group '{file_path}': {e}"), self)
+            return BatchRunner.EXIT_LOAD_FAILED
+
+        operations = list({op.runtime_id: op for op in operation_group.values()}.values())
+        if not operations:
+            self._logger.error(Exception(f"Operation group '{file_path}' is empty"), self)
+            return BatchRunner.EXIT_LOAD_FAILED
+
+        self._logger.info(f"[BATCH] Executing {len(operations)} operation(s) with parallelism {self.max_parallel}")
+        self._semaphore = asyncio.Semaphore(self.max_parallel)
+        self._tasks = dict()
+
+        # Intermediate results are only freed once they have been written
+        lineage = SlotLineage()
+        auto_collect, lineage.auto_collect = lineage.auto_collect, False
+        try:
+            _start = time.perf_counter()
+            await asyncio.gather(*[self._schedule(op) for op in operations])
+            _elapsed = time.perf_counter() - _start
+
+            failed = [op for op in operations if not op.is_complete]
+            exit_status = BatchRunner.EXIT_OPERATION_FAILED if failed else BatchRunner.EXIT_SUCCESS
+
+            await self._write_results(file_path, operations, exit_status, _elapsed)
+        finally:
+            lineage.auto_collect = auto_collect
+        await lineage.collect()
+
+        for op in failed:
+            self._logger.warning(f"[BATCH] {op.name} finished with status '{op.status}'")
+        self._logger.info(f"[BATCH] Finished in {_elapsed:.3f}s with exit status {exit_status}")
+        return exit_status
+
+    def _schedule(self, operation: BaseOperation) -> asyncio.Future:
+        """
+        Returns the task executing the operation, creating it on first request so that each operation runs once.
+
+        Args:
+            operation (BaseOperation): The operation to schedule.
+
+        Returns:
+            asyncio.Future: The task executing the operation; its result is whether the operation completed.
+        """
+        if operation.runtime_id not in self._tasks:
+            self._tasks[operation.runtime_id] = asyncio.ensure_future(self._execute(operation))
+        return self._tasks[operation.runtime_id]
+
+    async def _execute(self, operation: BaseOperation) -> bool:
+        """
+        Executes an operation once its child operations and sibling dependencies have completed.
+
+        Args:
+            operation (BaseOperation): The operation to execute.
+
+        Returns:
+            bool: Whether the operation completed.
+        """
+        prerequisites = [self._schedule(child) for child in operation.child_operations.values()]
+        prerequisites.extend(self._schedule(sibling) for sibling in self._sibling_dependencies(operation))
+
+        if prerequisites and not all(await asyncio.gather(*prerequisites)):
+            operation.handle_error(Exception(f"[BATCH] {operation.name} skipped; a prerequisite operation failed"))
+            return False
+
+        async with self._semaphore:
+            await operation.execute()
+
+        return operation.is_complete
+
+    @staticmethod
+    def _sibling_dependencies(operation: BaseOperation) -> list:
+        """
+        Returns the sibling operations that the parent operation declares as dependencies of the operation.
+
+        Args:
+            operation (BaseOperation): The operation whose dependencies are resolved.
+
+        Returns:
+            list[BaseOperation]: The sibling operations to complete first.
+        """
+        parent = operation.parent_operation
+        if parent is None or not parent.dependencies:
+            return []
+
+        _dependencies = parent.dependencies.get(operation.name) or parent.dependencies.get(operation.unique_id) or []
+        if isinstance(_dependencies, str):
+            _dependencies = [_dependencies]
+
+        return [sibling for sibling in parent.child_operations.values()
+                if sibling is not operation and (sibling.name in _dependencies
+                                                 or sibling.unique_id in _dependencies)]
+
+    async def _write_results(self, file_path: str, operations: list, exit_status: int, elapsed: float):
+        """
+        Writes the status and memory outputs of every operation to the output file.
+
+        Args:
+            file_path (str): The path to the operation group file.
+            operations (list[BaseOperation]): The executed operations.
+            exit_status (int): The exit status of the batch run.
+            elapsed (float): The wall-clock time of the batch run, in seconds.
+        """
+        if self.output_path is None:
+            _group_name = os.path.splitext(os.path.basename(file_path))[0]
+            self.output_path = os.path.join(self._config.BASE_DIR, self._config.WORKSPACE_NAME,
+                                            self._config.DATA_DIR, f"batch_{_group_name}_results.json")
+
+        results = {
+            'operation_group': file_path,
+            'exit_status': exit_status,
+            'elapsed_seconds': elapsed,
+            'operations': dict(),
+        }
+        for op in operations:
+            outputs = await op.get_results_from_memory()
+            results['operations'][op.runtime_id] = {
+                'unique_id': op.unique_id,
+                'name': op.name,
+                'status': op.status,
+                'results': {name: value[1] if isinstance(value, tuple) else value for name, value in outputs.items()},
+            }
+
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
+            async with aiofiles.open(self.output_path, 'w') as output_file:
+                await output_file.write(json.dumps(results, indent=4, default=str))
+            self._logger.info(f"[BATCH] Results written to {self.output_path}")
+        except Exception as e:
+            self._logger.error(Exception(f"Failed to write batch results to '{self.output_path}': {e}"), self)
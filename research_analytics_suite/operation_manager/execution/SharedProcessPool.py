@@ -0,0 +1,99 @@
+"""
+SharedProcessPool Module
+
+This module defines the SharedProcessPool class, which owns the single process pool used by CPU-bound operations.
+Worker processes are started on first use and reused by every operation until the application closes, instead of a new
+pool being created, and torn down, for each operation.
+
+Author: Lane
+Copyright: Lane
+Credits: Lane
+License: BSD 3-Clause License
+Version: 0.0.0.1
+Maintainer: Lane
+Email: justlane@uw.edu
+Status: Prototype
+"""
+import asyncio
+import functools
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+class SharedProcessPool:
+    """
+    A singleton process pool shared by CPU-bound operations.
+
+    Workers are spawned rather than forked, so that they do not inherit the threads and event loop of the application.
+    Functions submitted to the pool, and their arguments, must therefore be importable and picklable.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls, *args, **kwargs):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self, max_workers: int = None):
+        """
+        Initializes the SharedProcessPool instance.
+
+        Args:
+            max_workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        """
+        if not hasattr(self, '_initialized'):
+            self._logger = CustomLogger()
+            self._executor = None
+            self.max_workers = max_workers or os.cpu_count() or 1
+            self._initialized = True
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        """Gets the process pool, starting it on first use or after a worker crashed."""
+        with SharedProcessPool._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                     mp_context=multiprocessing.get_context('spawn'))
+                self._logger.info(f"Started shared process pool with {self.max_workers} worker(s)")
+            return self._executor
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Runs a function in the pool without blocking the event loop.
+
+        Args:
+            func (callable): An importable function.
+            *args: The positional arguments of the function.
+            **kwargs: The keyword arguments of the function.
+
+        Returns:
+            The result of the function.
+        """
+        executor = self.executor
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, functools.partial(func, *args, **kwargs))
+        except BrokenProcessPool:
+            with SharedProcessPool._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts down the worker processes. The pool is restarted if it is used again.
+
+        Args:
+            wait (bool): Whether to wait for running tasks to finish.
+        """
+        with SharedProcessPool._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,3 +1,5 @@
 # operation_manager/execution/__init__.py
 
 from .OperationExecutor import OperationExecutor
+from .BatchRunner import BatchRunner
+from .SharedProcessPool import SharedProcessPool
@@ -2,7 +2,8 @@
 A module that defines the DaskOperation class, a subclass of the Operation class.
 
 The DaskOperation class is designed to handle Dask computations. It provides methods for setting the Dask computation
-to be processed and executing the operations.
+to be processed and executing the operations. Unless a client is given, operations run on the workspace's shared
+Dask cluster, which is started once per session.
 
 Author: Lane
 Copyright: Lane
@@ -13,6 +14,7 @@ Maintainer: Lane
 Email: justlane@uw.edu
 Status: Prototype
 """
+import asyncio
 
 import dask
 import dask.distributed
@@ -44,7 +46,8 @@ class DaskOperation(BaseOperation):
             concurrent (bool, optional): Whether child operations should run concurrently. Defaults to False.
             parent_operation (BaseOperation, optional): The parent operation. Defaults to None.
             local_vars (dict, optional): Local variables for the function execution. Defaults to None.
-            client (dask.distributed.Client, optional): The Dask client for managing the computation.
+            client (dask.distributed.Client, optional): The Dask client for managing the computation. Defaults to the
+                                                        workspace's shared client.
         """
         self._client = kwargs.pop('client', None)
         super().__init__(*args, **kwargs)
@@ -67,7 +70,8 @@ class DaskOperation(BaseOperation):
         """
         await super().initialize_operation()
         if self._client is None:
-            self._client = dask.distributed.Client()
+            from research_analytics_suite.data_engine.Workspace import Workspace
+            self._client = await Workspace().get_dask_client()
 
     async def execute_action(self):
         """
@@ -76,16 +80,13 @@ class DaskOperation(BaseOperation):
         Returns:
             The result of the Dask computation.
         """
-        temp_vars = self._local_vars.copy()
         try:
             # Execute the Dask computation
             future = self.client.submit(self._action)
-            self._result_output = future.result()
+            self._result_output = await asyncio.to_thread(future.result)
         except Exception as e:
             self.status = "error"
             self.handle_error(e)
-        finally:
-            self._local_vars = temp_vars
 
     def get_results_from_memory(self):
         """
@@ -99,7 +100,7 @@ class DaskOperation(BaseOperation):
     def cleanup_operation(self):
         """
         Clean up any resources or perform any necessary teardown after the Dask operation has completed or been stopped.
+
+        The client is shared with the workspace (or owned by the caller that supplied it) and is left open.
         """
-        if self.client:
-            self.client.close()
         super().cleanup_operation()
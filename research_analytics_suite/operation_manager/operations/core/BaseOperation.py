@@ -67,6 +67,7 @@ class BaseOperation(ABC):
         action (callable): The action to be executed by the operation.
         persistent (bool): Whether the operation should run indefinitely.
         is_cpu_bound (bool): Whether the operation is CPU-bound.
+        quiet (bool): Whether log entries are kept out of the console log.
         concurrent (bool): Whether child operations should run concurrently.
         status (str): The status of the operation.
         task (asyncio.Task): The task associated with the operation.
@@ -131,6 +132,8 @@ class BaseOperation(ABC):
                 dict[BaseOperation.runtime_id, 'BaseOperation']()
             )
             self.operation_logs = []
+            # Whether log entries are kept out of the console log, e.g. while a large operation group is loaded
+            self._quiet = kwargs.get('quiet', False)
 
             self.memory_inputs = None
             self.memory_outputs = None
@@ -416,6 +419,8 @@ class BaseOperation(ABC):
         Returns:
             dict[name, value]: The name of the variable and its value.
         """
+        from research_analytics_suite.data_engine.memory.SlotLineage import SlotLineage
+        await SlotLineage().restore(self.memory_outputs.slots)
         return await self.memory_outputs.aggregate_results()
 
     async def clear_memory_inputs(self):
@@ -649,6 +654,18 @@ class BaseOperation(ABC):
             self.handle_error("\'is_cpu_bound\' property must be a boolean")
         self._is_cpu_bound = value
 
+    @property
+    def quiet(self) -> bool:
+        """Gets whether log entries are kept out of the console log."""
+        return self._quiet
+
+    @quiet.setter
+    def quiet(self, value: bool):
+        """Sets whether log entries are kept out of the console log."""
+        if not isinstance(value, bool):
+            self.handle_error("\'quiet\' property must be a boolean")
+        self._quiet = value
+
     @property
     def status(self) -> str:
         """Gets the status of the operation."""
@@ -808,7 +825,8 @@ class BaseOperation(ABC):
             self._logger.error(message, self)
         else:
             self.operation_logs.insert(0, message)
-            self._logger.info(f"[{self._name}] {message}")
+            if not self._quiet:
+                self._logger.info(f"[{self._name}] {message}")
 
     def handle_error(self, e):
         """
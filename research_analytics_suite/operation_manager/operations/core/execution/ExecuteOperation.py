@@ -1,19 +1,24 @@
 import asyncio
-from concurrent.futures import ProcessPoolExecutor
+import pickle
+import types
 from typing import List
 
 from research_analytics_suite.data_engine.memory.MemorySlot import MemorySlot
-from .PrepareAction import prepare_action_for_exec
+from research_analytics_suite.data_engine.memory.SlotLineage import SlotLineage
+from .PrepareAction import callable_inputs, prepare_action_for_exec
 
 
 async def execute_operation(operation):
     """
     Execute the operation and all child operations.
     """
+    lineage = SlotLineage()
+    lineage.begin(operation)
     try:
         if operation.child_operations:
             await execute_child_operations(operation)
 
+        await lineage.restore(operation.memory_inputs.slots)
         await operation.validate_memory_inputs()
 
         await prepare_action_for_exec(operation)
@@ -23,12 +28,18 @@ async def execute_operation(operation):
         if operation.parent_operation:
             for slot in operation.memory_outputs.slots:
                 await operation.parent_operation.add_memory_input_slot(slot)
+                lineage.record_consumer(slot, operation.parent_operation)
 
-        if not operation.persistent:
+        if not operation.persistent and operation.status != "error":
             operation.status = "completed"
             operation.add_log_entry(f"[COMPLETE]")
     except Exception as e:
         operation.handle_error(e)
+    finally:
+        lineage.end(operation)
+
+    if operation.parent_operation is None:
+        await lineage.collect_if_needed()
 
 
 async def execute_child_operations(parent_operation):
@@ -82,12 +93,17 @@ async def execute_action(operation):
     """
     Execute the action associated with the operation.
     """
+    lineage = SlotLineage()
+    lineage.begin(operation)
     try:
+        if operation._action_callable is None:
+            # Child operations run through run_operations are not prepared by execute_operation
+            await prepare_action_for_exec(operation)
+
         if operation.is_cpu_bound:
-            with ProcessPoolExecutor() as executor:
-                operation.status = "running"
-                operation.add_log_entry(f"[RUN] {operation.name}: CPU-bound Operation")
-                _exec_output = await asyncio.get_event_loop().run_in_executor(executor, operation.action_callable)
+            operation.status = "running"
+            operation.add_log_entry(f"[RUN] {operation.name}: CPU-bound Operation")
+            _exec_output = await _run_cpu_bound(operation)
         else:
             operation.status = "running"
             operation.add_log_entry(f"[RUN - ASYNC] {operation.name}")
@@ -106,17 +122,48 @@ async def execute_action(operation):
                 slots = operation.memory_outputs.find_slots_by_name(name)
                 if slots and len(slots) > 0:
                     for slot in slots:
-                        slot.data = {name: (type(value), value)}
-                        await operation.memory_outputs.update_slot(slot)
+                        await slot.update_data({name: (type(value), value)})
+                        lineage.record_output(operation, slot)
                 else:
                     new_slot = MemorySlot(
-                        memory_id=f'{operation.runtime_id}',
+                        memory_id=f'{operation.runtime_id}_{name}',
                         name=f"{name}",
                         operation_required=False,
                         data={name: (type(value), value)}
                     )
                     await operation.add_memory_output_slot(new_slot)
+                    lineage.record_output(operation, new_slot)
 
         operation.add_log_entry(f"[RESULT] {operation.memory_outputs.list_slots()}")
     except Exception as e:
         operation.handle_error(e)
+    finally:
+        lineage.end(operation)
+
+
+async def _run_cpu_bound(operation):
+    """
+    Run the action of a CPU-bound operation off the event loop.
+
+    Plain functions are run in the SharedProcessPool with the keyword inputs resolved from the memory inputs. The
+    workers are spawned, so actions or inputs that cannot be pickled, such as lambdas, closures and code actions, run
+    in a thread instead.
+
+    Returns:
+        The output of the action.
+    """
+    from research_analytics_suite.operation_manager.execution.SharedProcessPool import SharedProcessPool
+    action = operation.action
+    if (callable(action) and not asyncio.iscoroutinefunction(action)
+            and not isinstance(action, types.MethodType)):
+        inputs = callable_inputs(action, operation.memory_inputs)
+        try:
+            pickle.dumps((action, inputs))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            operation.add_log_entry(f"[RUN] {operation.name}: action cannot be pickled, running in a thread")
+        else:
+            return await SharedProcessPool().run(action, **inputs)
+
+    # Reading action_callable calls the prepared action; coroutine actions are then awaited on the event loop
+    _exec_output = await asyncio.to_thread(lambda: operation.action_callable)
+    return await _exec_output if asyncio.iscoroutine(_exec_output) else _exec_output
@@ -4,6 +4,8 @@ import types
 from typing import Any, Callable
 import ast
 
+from research_analytics_suite.utils.LazyModule import lazy_import
+
 SAFE_BUILTINS = {
     'print': print,
     'range': range,
@@ -13,13 +15,14 @@ SAFE_BUILTINS = {
     '__import__': __import__,
 }
 
+# Heavy backends are proxied and only imported once a code action actually uses them
 SAFE_MODULES = {
     'math': __import__('math'),
-    'numpy': __import__('numpy'),
-    'pandas': __import__('pandas'),
-    'sklearn': __import__('sklearn'),
-    'torch': __import__('torch'),
-    'matplotlib': __import__('matplotlib'),
+    'numpy': lazy_import('numpy'),
+    'pandas': lazy_import('pandas'),
+    'sklearn': lazy_import('sklearn'),
+    'torch': lazy_import('torch'),
+    'matplotlib': lazy_import('matplotlib'),
 }
 
 
@@ -48,10 +51,8 @@ async def prepare_action_for_exec(operation):
         if isinstance(operation.action, str):
             code = operation.action
             if operation.memory_inputs and operation.memory_inputs.list_slots():
-                _action = await _execute_code_action(code, operation.memory_inputs.list_slots())
                 operation.add_log_entry(f"Memory Inputs: {operation.memory_inputs.list_slots()}")
-            else:
-                _action = await _execute_code_action(code, [])
+            _action = await _execute_code_action(code, operation.memory_inputs)
             operation.add_log_entry(f"[CODE] {code}")
         elif callable(operation.action):
             if asyncio.iscoroutinefunction(operation.action):
@@ -61,21 +62,19 @@ async def prepare_action_for_exec(operation):
             else:
                 t_action = operation.action
                 operation.add_log_entry(f"Memory Inputs: {operation.memory_inputs.list_slots()}")
-                _action = _execute_callable_action(t_action=t_action,
-                                                   memory_inputs=operation.memory_inputs.list_slots() if
-                                                   operation.memory_inputs else [])
+                _action = _execute_callable_action(t_action=t_action, memory_inputs=operation.memory_inputs)
         operation.action_callable = _action
     except Exception as e:
         operation.handle_error(e)
 
 
-async def _execute_code_action(code: str, memory_inputs: list = None) -> Callable[[], Any]:
+async def _execute_code_action(code: str, memory_inputs=None) -> Callable[[], Any]:
     """
     Execute a code action.
 
     Args:
         code (str): The code to execute.
-        memory_inputs (list): The inputs for the code action.
+        memory_inputs (MemoryInput): The inputs for the code action, read when the action runs.
 
     Returns:
         callable: The action callable.
@@ -84,7 +83,8 @@ async def _execute_code_action(code: str, memory_inputs: list = None) -> Callabl
     async def action() -> Any:
 
         # Extract the actual data values from the MemorySlot tuples
-        inputs = {slot.name: await slot.get_data_by_key(slot.name) for slot in memory_inputs} if memory_inputs else {}
+        slots = memory_inputs.slots if memory_inputs is not None else []
+        inputs = {slot.name: await slot.get_data_by_key(slot.name) for slot in slots}
         for k, v in inputs.items():
             if isinstance(v, tuple):
                 if v[0] is type(None):
@@ -118,23 +118,48 @@ async def _execute_code_action(code: str, memory_inputs: list = None) -> Callabl
     return action
 
 
-def _execute_callable_action(t_action, memory_inputs: list = None) -> Callable[[], Any]:
+def callable_inputs(t_action, memory_inputs=None) -> dict:
+    """
+    Resolve the keyword inputs of a callable action.
+
+    Each data key of the slots of memory_inputs is passed as the keyword argument of that name, if the callable accepts
+    it.
+
+    Args:
+        t_action (callable): The callable to execute.
+        memory_inputs (MemoryInput): The memory inputs to use for the action.
+
+    Returns:
+        dict: The keyword arguments of the callable.
+    """
+    try:
+        parameters = inspect.signature(t_action).parameters.values()
+    except (TypeError, ValueError):
+        parameters = []
+    any_keyword = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters)
+    keywords = {p.name for p in parameters if p.kind in (inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                                          inspect.Parameter.KEYWORD_ONLY)}
+    # Extract the actual data values from the MemorySlot tuples
+    return {key: value for slot in (memory_inputs.slots if memory_inputs is not None else [])
+            for key, (_, value) in slot.data.items() if any_keyword or key in keywords}
+
+
+def _execute_callable_action(t_action, memory_inputs=None) -> Callable[[], Any]:
     """
     Execute a callable action.
 
+    The inputs are read from the slots of memory_inputs each time the action runs, so results of children run after
+    preparation are seen.
+
     Args:
         t_action (callable): The callable to execute.
-        memory_inputs (list): The memory inputs to use for the action.
+        memory_inputs (MemoryInput): The memory inputs to use for the action.
 
     Returns:
         callable: The action callable.
     """
-
     def action() -> Any:
-        inputs = {slot.name: slot.data for slot in memory_inputs} if memory_inputs else {}
-        # Extract the actual data values from the MemorySlot tuples
-        inputs = {k: v[1] for k, v in inputs.items()}
-        _output = t_action(*inputs)
+        _output = t_action(**callable_inputs(t_action, memory_inputs))
         if _output is not None:
             return _output
         return
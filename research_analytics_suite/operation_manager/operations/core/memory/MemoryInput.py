@@ -42,15 +42,18 @@ class MemoryInput(MemorySlotCollection):
     async def preprocess_data(self):
         """Preprocess all input data."""
         for slot in self.slots:
-            # Example preprocessing steps
-            data = slot.data
-            if 'values' in data:
-                values = np.array(data['values'])
-                # Normalization
-                data['values'] = (values - values.min()) / (values.max() - values.min())
-                # Cleaning
-                data['values'] = np.nan_to_num(values)
-                slot.data = data
+            values = await slot.get_data_by_key('values')
+            if values is None:
+                continue
+            values = np.array(values, dtype=float)
+            # Normalization, in place
+            low, high = np.nanmin(values), np.nanmax(values)
+            values -= low
+            if high > low:
+                values /= high - low
+            # Cleaning
+            np.nan_to_num(values, copy=False)
+            await slot.set_data_by_key('values', values, np.ndarray)
 
     def add_dependency(self, memory_id: str, dependency_id: str):
         """Add a dependency between input slots."""
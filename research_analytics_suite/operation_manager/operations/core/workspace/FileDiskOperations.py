@@ -13,11 +13,12 @@ Email: justlane@uw.edu
 Status: Prototype
 """
 
+import asyncio
 import os
 import json
 from typing import Optional
 
-import aiofiles
+_READ_CHUNK_SIZE = 256
 
 
 async def load_from_disk(file_path: str, operation_group: Optional[dict], with_instance=True):
@@ -32,33 +33,26 @@ async def load_from_disk(file_path: str, operation_group: Optional[dict], with_i
     Returns:
         BaseOperation: The loaded operation.
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
+    state = await _read_operation_file(file_path, dict())
 
-    async with aiofiles.open(file_path, 'r') as file:
-        try:
-            data = await file.read()
-            state = json.loads(data)
-        except json.JSONDecodeError as e:
-            raise json.JSONDecodeError(f"Failed to decode JSON from file: {file_path}", data, e.pos) from e
-        except Exception as e:
-            raise e
+    if not with_instance:
+        return await populate_operation_args(data=state, file_dir=os.path.dirname(file_path))
 
-        if not isinstance(state, dict):
-            raise TypeError("Loaded data must be a dictionary")
-
-        operation = await from_dict(data=state, file_dir=os.path.dirname(file_path), with_instance=with_instance)
+    _, operation = await _build_operation_graph(state, os.path.dirname(file_path), dict())
 
-        if operation_group is not None and operation.runtime_id not in operation_group.keys():
-            operation_group[operation.runtime_id] = operation
+    if operation_group is not None and operation.runtime_id not in operation_group.keys():
+        operation_group[operation.runtime_id] = operation
 
-        return operation
+    return operation
 
 
 async def load_operation_group(file_path: str, operation_group: dict, iterate_child_operations: bool = True) -> dict:
     """
     Load a group of operations from disk.
 
+    Every operation file in the group is read at most once, operations are deduplicated by unique_id (including
+    operations already present in the group) and all parent and child links are built in a single pass.
+
     Args:
         file_path (str): The path to the file to load.
         operation_group (dict, optional): The group of operations to which the loaded operations belong.
@@ -68,60 +62,215 @@ async def load_operation_group(file_path: str, operation_group: dict, iterate_ch
     Returns:
         dict: The loaded operation group.
     """
-    processed_operations = set()
-
-    async def load_and_process_operation(path, group):
-        if not os.path.exists(path):
-            raise FileNotFoundError(f"File not found: {path}")
-
-        operation = await load_from_disk(path, group)
-        processed_operations.add(operation.runtime_id)
-
-        parent = operation.parent_operation
-        if isinstance(parent, dict):
-            parent_id = parent['unique_id']
-            if parent_id not in group.values().unique_id:
-                parent_file_path = construct_file_path(file_dir, parent)
-                if os.path.exists(parent_file_path):
-                    parent_operation = await load_and_process_operation(parent_file_path, group)
-                    operation.parent_operation = parent_operation
-                    group[parent_operation.runtime_id] = parent_operation
-                else:
-                    raise FileNotFoundError(f"Parent operation file not found: {parent_file_path}")
-            else:
-                for op in group.values():
-                    if op.unique_id == parent_id:
-                        operation.parent_operation = op
-                        break
-
-        if operation.child_operations and iterate_child_operations:
-            if isinstance(operation.child_operations, list):
-                children = operation.child_operations
-                for child in children:
-                    if isinstance(child, dict):
-                        child_id = child['unique_id']
-                        if child_id not in group.values().unique_id:
-                            child_file_path = construct_file_path(file_dir, child)
-                            if os.path.exists(child_file_path):
-                                child_operation = await load_and_process_operation(child_file_path, group)
-                                await operation.add_child_operation(child_operation)
-                                await operation.link_child_operation(child_operation)
-                                group[child_operation.runtime_id] = child_operation
-                            else:
-                                raise FileNotFoundError(f"Child operation file not found: {child_file_path}")
-
-        return operation
+    if operation_group is None:
+        operation_group = dict()
 
     file_dir = os.path.dirname(file_path)
     if not os.path.exists(file_dir):
         raise FileNotFoundError(f"Directory not found: {file_dir}")
 
-    root_operation = await load_and_process_operation(file_path, operation_group)
-    operation_group[root_operation.runtime_id] = root_operation
+    state = await _read_operation_file(file_path, dict())
+
+    existing = {op.unique_id: op for op in operation_group.values()}
+    graph, _ = await _build_operation_graph(state, file_dir, existing,
+                                            iterate_child_operations=iterate_child_operations)
+    for operation in graph.values():
+        operation_group[operation.runtime_id] = operation
 
     return operation_group
 
 
+async def _read_operation_file(file_path: str, file_cache: dict) -> dict:
+    """
+    Read and decode an operation file, at most once per file cache.
+
+    Args:
+        file_path (str): The path to the operation file.
+        file_cache (dict): The decoded operation files of the current load, keyed by normalized path.
+
+    Returns:
+        dict: The decoded operation file.
+    """
+    file_path = os.path.normpath(file_path)
+    await _read_operation_files([file_path], file_cache)
+    return file_cache[file_path]
+
+
+async def _read_operation_files(file_paths: list, file_cache: dict):
+    """
+    Read and decode the operation files missing from the file cache.
+
+    Files are decoded in chunks on the default executor, which avoids the per-call overhead of asynchronous file
+    objects when a graph references thousands of small files.
+
+    Args:
+        file_paths (list[str]): The normalized paths to the operation files.
+        file_cache (dict): The decoded operation files of the current load, keyed by normalized path.
+    """
+    missing = list(dict.fromkeys(path for path in file_paths if path not in file_cache))
+    if not missing:
+        return
+
+    loop = asyncio.get_running_loop()
+    chunks = [missing[i:i + _READ_CHUNK_SIZE] for i in range(0, len(missing), _READ_CHUNK_SIZE)]
+    for decoded in await asyncio.gather(*[loop.run_in_executor(None, _decode_operation_files, chunk)
+                                          for chunk in chunks]):
+        file_cache.update(decoded)
+
+
+def _decode_operation_files(file_paths: list) -> dict:
+    """
+    Read and decode operation files synchronously.
+
+    Args:
+        file_paths (list[str]): The paths to the operation files.
+
+    Returns:
+        dict: The decoded operation files, keyed by path.
+    """
+    decoded = dict()
+    for file_path in file_paths:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        with open(file_path, 'r') as file:
+            data = file.read()
+
+        try:
+            state = json.loads(data)
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"Failed to decode JSON from file: {file_path}", data, e.pos) from e
+
+        if not isinstance(state, dict):
+            raise TypeError("Loaded data must be a dictionary")
+
+        decoded[file_path] = state
+    return decoded
+
+
+def _operation_key(data: dict) -> str:
+    """
+    Return the unique_id of a serialized operation or operation reference.
+
+    Args:
+        data (dict): The serialized operation or reference.
+
+    Returns:
+        str: The unique_id, defaulting to the same value BaseOperation derives when none is stored.
+    """
+    unique_id = data.get('unique_id')
+    if unique_id is None:
+        unique_id = f"{data.get('github')}_{data.get('name')}_{data.get('version')}"
+    return unique_id
+
+
+async def _build_operation_graph(root: dict, file_dir, existing: dict, parent_operation=None,
+                                 iterate_child_operations: bool = True) -> tuple:
+    """
+    Build the operation graph reachable from a serialized operation.
+
+    The graph is resolved breadth-first: each referenced operation file is read once per load and the files of a
+    level are read concurrently. Each unique_id is then instantiated once (or reused from `existing`) and the
+    parent and child links are set once all operations exist. The log entries of the new operations are kept in their
+    operation logs only, and the load is logged once, since thousands of console lines would dominate the load time.
+
+    Args:
+        root (dict): The serialized root operation.
+        file_dir: The directory where the operation files are located.
+        existing (dict[str, BaseOperation]): Already loaded operations, keyed by unique_id, to reuse.
+        parent_operation (BaseOperation, optional): An explicit parent for the root operation. When given, the parent
+                                                    stored in the root is not loaded.
+        iterate_child_operations (bool, optional): Whether to load child operations. Defaults to True.
+
+    Returns:
+        tuple[dict[str, BaseOperation], BaseOperation]: The operations of the graph keyed by unique_id, and the root
+                                                        operation.
+    """
+    file_cache = dict()
+    states = dict()
+    order = []
+
+    pending = [root]
+    while pending:
+        _paths = [os.path.normpath(construct_file_path(file_dir, ref)) for ref in pending if 'action' not in ref]
+        await _read_operation_files(_paths, file_cache)
+
+        _pending, pending = pending, dict()
+        for reference in _pending:
+            state = reference
+            if 'action' not in reference:
+                state = {**reference, **file_cache[os.path.normpath(construct_file_path(file_dir, reference))]}
+
+            key = _operation_key(state)
+            if key in states:
+                continue
+            states[key] = state
+            order.append(key)
+
+            references = []
+            _parent = state.get('parent_operation')
+            if isinstance(_parent, dict) and not (key == order[0] and parent_operation is not None):
+                references.append(_parent)
+            if iterate_child_operations and isinstance(state.get('child_operations'), list):
+                references.extend(child for child in state['child_operations'] if isinstance(child, dict))
+
+            for _reference in references:
+                _ref_key = _operation_key(_reference)
+                if _ref_key not in states and _ref_key not in existing and _ref_key not in pending:
+                    pending[_ref_key] = _reference
+        pending = list(pending.values())
+
+    from research_analytics_suite.operation_manager.operations.core import BaseOperation
+    graph = dict()
+    created = []
+
+    def lookup(reference: dict):
+        _ref_key = _operation_key(reference)
+        return graph.get(_ref_key) or existing.get(_ref_key)
+
+    # Operations are quiet until the whole group is linked, and are made to log again even if loading fails
+    try:
+        for key in order:
+            if key in existing:
+                graph[key] = existing[key]
+                continue
+
+            temp_kwargs = {k: v for k, v in states[key].items() if k not in ('parent_operation', 'child_operations')}
+            temp_kwargs['parent_operation'] = None
+            operation = BaseOperation(quiet=True)
+            operation.temp_kwargs = temp_kwargs
+            created.append(operation)
+            await operation.initialize_operation()
+            graph[key] = operation
+
+        for key in order:
+            operation = graph[key]
+            state = states[key]
+
+            if iterate_child_operations and isinstance(state.get('child_operations'), list):
+                for child in state['child_operations']:
+                    child_operation = lookup(child) if isinstance(child, dict) else child
+                    if isinstance(child_operation, BaseOperation) and child_operation is not operation:
+                        await operation.link_child_operation(child_operation)
+
+            _parent = state.get('parent_operation')
+            if operation.parent_operation is None and isinstance(_parent, dict):
+                operation.parent_operation = lookup(_parent)
+    finally:
+        for operation in created:
+            operation.quiet = False
+
+    root_operation = graph[order[0]]
+    if parent_operation is not None:
+        root_operation.parent_operation = parent_operation
+
+    if created:
+        from research_analytics_suite.utils.CustomLogger import CustomLogger
+        CustomLogger().info(f"Loaded {len(created)} operation(s) from {file_dir}, rooted at {root_operation.name}")
+
+    return graph, root_operation
+
+
 def construct_file_path(base_dir, operation_ref):
     """
     Helper method to construct file path for an operation reference.
@@ -153,97 +302,43 @@ async def from_dict(data: dict, file_dir, parent_operation=None, with_instance=T
     Returns:
         BaseOperation: The created operation instance.
     """
-    data_metadata = await populate_operation_args(data=data, file_dir=file_dir, parent_operation=parent_operation,
-                                                  with_instance=with_instance)
-
-    if with_instance:
-        from research_analytics_suite.operation_manager.operations.core import BaseOperation
-        operation = BaseOperation()
-        operation.temp_kwargs = data_metadata
-        await operation.initialize_operation()
-        return operation
+    if not with_instance:
+        return await populate_operation_args(data=data, file_dir=file_dir, parent_operation=parent_operation)
 
-    return data_metadata
+    _, operation = await _build_operation_graph(data, file_dir, dict(), parent_operation=parent_operation)
+    return operation
 
 
-async def populate_operation_args(data, file_dir, parent_operation=None, with_instance=True) -> dict:
+async def populate_operation_args(data, file_dir, parent_operation=None) -> dict:
     """
-    Populate the arguments of an operation.
+    Populate the arguments of an operation without instantiating it.
+
+    Parent and child operations are kept as local references.
 
     Args:
         data (dict): The operation data.
         file_dir: The directory where the operation file is located.
-        parent_operation (BaseOperation, optional): The parent operation
-        with_instance (bool, optional): Whether to populate parent argument with an initialized BaseOperation instance.
+        parent_operation (dict, optional): The parent operation reference. Defaults to None.
     """
     data_metadata = data.copy()
 
     if 'action' not in data_metadata.keys():
-        operation_file = f"{data_metadata.get('github')}_{data_metadata.get('name')}_{data_metadata.get('version')}"
-        operation_file += ".json"
-        operation_file = os.path.join(file_dir, operation_file)
-
-        if os.path.exists(operation_file):
-            try:
-                async with aiofiles.open(operation_file, mode='r') as f:
-                    operation_data = await f.read()
-                    op_file_data = json.loads(operation_data)
-
-                    data_metadata['unique_id'] = op_file_data.get('unique_id')
-                    data_metadata['name'] = op_file_data.get('name')
-                    data_metadata['version'] = op_file_data.get('version')
-                    data_metadata['author'] = op_file_data.get('author')
-                    data_metadata['github'] = op_file_data.get('github')
-                    data_metadata['email'] = op_file_data.get('email')
-                    data_metadata['description'] = op_file_data.get('description')
-                    data_metadata['action'] = op_file_data.get('action')
-                    data_metadata['persistent'] = op_file_data.get('persistent')
-                    data_metadata['is_cpu_bound'] = op_file_data.get('is_cpu_bound')
-                    data_metadata['concurrent'] = op_file_data.get('concurrent')
-                    data_metadata['dependencies'] = op_file_data.get('dependencies')
-                    data_metadata['child_operations'] = op_file_data.get('child_operations')
-
-            except Exception as e:
-                raise e
-
-        else:
+        operation_file = construct_file_path(file_dir, data_metadata)
+        if not os.path.exists(operation_file):
             raise FileNotFoundError(f"Operation file not found for operation: {operation_file}")
 
+        op_file_data = await _read_operation_file(operation_file, dict())
+        for key in ('unique_id', 'name', 'version', 'author', 'github', 'email', 'description', 'action',
+                    'persistent', 'is_cpu_bound', 'concurrent', 'dependencies', 'child_operations'):
+            data_metadata[key] = op_file_data.get(key)
+
     if parent_operation is not None:
         data_metadata['parent_operation'] = parent_operation
 
-    if isinstance(data_metadata.get('parent_operation'), dict):
-        if with_instance:
-            try:
-                data_metadata['parent_operation'] = await from_dict(
-                    data=data_metadata.get('parent_operation'),
-                    file_dir=file_dir
-                )
-            except Exception as e:
-                raise e
-        else:
-            data_metadata['parent_operation'] = data_metadata.get('parent_operation')
-    else:
+    if not isinstance(data_metadata.get('parent_operation'), dict):
         data_metadata['parent_operation'] = parent_operation
 
-    if data_metadata.get('child_operations') is not None:
-        if isinstance(data_metadata.get('child_operations'), list):
-            children = data_metadata.get('child_operations')
-            data_metadata['child_operations'] = []
-            for child in children:
-                if isinstance(child, dict):
-                    if with_instance:
-                        try:
-                            child_op = await from_dict(
-                                data=child,
-                                file_dir=file_dir
-                            )
-                            data_metadata['child_operations'].append(child_op)
-                        except Exception as e:
-                            raise e
-                    else:
-                        data_metadata['child_operations'].append(child)
-                else:
-                    data_metadata['child_operations'].append(child)
+    if isinstance(data_metadata.get('child_operations'), list):
+        data_metadata['child_operations'] = list(data_metadata.get('child_operations'))
 
     return data_metadata
@@ -0,0 +1,29 @@
+import time
+import unittest
+from unittest import mock
+
+from research_analytics_suite.data_engine.data_streams.AnalogInput import AnalogInput
+
+
+class AnalogInputTest(unittest.TestCase):
+    @mock.patch('research_analytics_suite.utils.CustomLogger.CustomLogger.info')
+    def test_restart_does_not_burst(self, info):
+        reads = []
+        analog = AnalogInput(lambda: reads.append(time.monotonic()) or len(reads), sample_rate=100)
+
+        analog.start()
+        time.sleep(0.05)
+        analog.stop()
+        time.sleep(0.3)
+
+        restarted = time.monotonic()
+        analog.start()
+        time.sleep(0.05)
+        analog.stop()
+
+        # About 5 reads at 100 Hz; catching up on the pause would read about 35 times
+        self.assertLessEqual(len([read for read in reads if read >= restarted]), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
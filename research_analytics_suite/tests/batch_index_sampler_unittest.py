@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+
+from research_analytics_suite.data_engine.core.BatchIndexSampler import BatchIndexSampler
+
+
+class BatchIndexSamplerTest(unittest.TestCase):
+    def indices(self, sampler):
+        return [np.arange(batch.start, batch.stop) if isinstance(batch, slice) else batch for batch in sampler]
+
+    def test_every_index_is_served_once(self):
+        for shuffle in (False, True):
+            for length, batch_size in ((100, 10), (103, 10), (5, 32), (1, 1)):
+                with self.subTest(shuffle=shuffle, length=length, batch_size=batch_size):
+                    batches = self.indices(BatchIndexSampler(length, batch_size, shuffle=shuffle, seed=0))
+                    np.testing.assert_array_equal(np.sort(np.concatenate(batches)), np.arange(length))
+                    self.assertTrue(all(len(batch) == batch_size for batch in batches[:-1]))
+
+    def test_batch_count(self):
+        for drop_last, expected in ((False, [10, 11, 11, 1, 0]), (True, [10, 10, 11, 0, 0])):
+            for (length, batch_size), count in zip(((100, 10), (103, 10), (110, 10), (5, 32), (0, 4)), expected):
+                with self.subTest(drop_last=drop_last, length=length):
+                    sampler = BatchIndexSampler(length, batch_size, drop_last=drop_last)
+                    self.assertEqual(len(sampler), count)
+                    self.assertEqual(len(list(sampler)), count)
+
+        batches = self.indices(BatchIndexSampler(103, 10, shuffle=True, drop_last=True, seed=0))
+        self.assertEqual(sum(len(batch) for batch in batches), 100)
+        self.assertEqual(len(np.unique(np.concatenate(batches))), 100)
+
+    def test_unshuffled_batches_are_slices(self):
+        self.assertEqual(list(BatchIndexSampler(5, 2)), [slice(0, 2), slice(2, 4), slice(4, 5)])
+
+    def test_shuffled_batches_are_sorted(self):
+        sampler = BatchIndexSampler(1000, 64, shuffle=True, seed=1)
+        first = list(sampler)
+        for batch in first:
+            self.assertIsInstance(batch, np.ndarray)
+            self.assertTrue(np.all(np.diff(batch) > 0))
+        self.assertFalse(np.array_equal(np.concatenate(first), np.arange(1000)))
+        self.assertFalse(np.array_equal(np.concatenate(first), np.concatenate(list(sampler))))
+
+    def test_invalid_batch_size(self):
+        with self.assertRaises(ValueError):
+            BatchIndexSampler(10, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import asyncio
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from argparse import Namespace
+from unittest import mock
+
+from research_analytics_suite.operation_manager.execution.BatchRunner import BatchRunner
+from research_analytics_suite.utils.Config import Config
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+def write_group(directory, child_actions):
+    """Write an operation group of a parent 'op0', whose action is 'total = 3', and a child per action."""
+    def ref(i):
+        return {'unique_id': f'g_op{i}_1', 'name': f'op{i}', 'github': 'g', 'version': '1'}
+
+    children = range(1, len(child_actions) + 1)
+    with open(os.path.join(directory, 'g_op0_1.json'), 'w') as file:
+        json.dump({**ref(0), 'action': 'total = 3', 'child_operations': [ref(i) for i in children],
+                   'parent_operation': None}, file)
+    for i, action in zip(children, child_actions):
+        with open(os.path.join(directory, f'g_op{i}_1.json'), 'w') as file:
+            json.dump({**ref(i), 'action': action, 'child_operations': None, 'parent_operation': ref(0)}, file)
+    return os.path.join(directory, 'g_op0_1.json')
+
+
+class FakeOperation:
+    """An operation that records when it runs, for testing the scheduling of BatchRunner."""
+
+    def __init__(self, name, log, active, parent=None, dependencies=None, fails=False):
+        self.name = self.unique_id = self.runtime_id = name
+        self.parent_operation = parent
+        self.dependencies = dependencies
+        self.child_operations = dict()
+        self.is_complete = False
+        self.errors = []
+        self._log, self._active, self._fails = log, active, fails
+        if parent is not None:
+            parent.child_operations[name] = self
+
+    async def execute(self):
+        self._active.append(self.name)
+        self._log.append(('start', self.name, len(self._active)))
+        await asyncio.sleep(0.01)
+        self._active.remove(self.name)
+        self._log.append(('end', self.name))
+        self.is_complete = not self._fails
+
+    def handle_error(self, error):
+        self.errors.append(error)
+
+
+class BatchRunnerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.mkdtemp()
+        config = Config()
+        await config.initialize()
+        config.BASE_DIR = self.directory
+        await CustomLogger().initialize()
+
+        from research_analytics_suite.data_engine.memory.DataCache import DataCache
+        from research_analytics_suite.data_engine.memory.MemoryManager import MemoryManager
+        from research_analytics_suite.operation_manager.control.OperationControl import OperationControl
+        await DataCache().initialize()
+        await MemoryManager().initialize()
+        await OperationControl().initialize()
+
+        self.group = os.path.join(self.directory, 'group')
+        os.makedirs(self.group)
+        self.output_path = os.path.join(self.directory, 'results.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def schedule(self, operations, max_parallel):
+        runner = BatchRunner(max_parallel=max_parallel)
+        runner._semaphore = asyncio.Semaphore(max_parallel)
+        return asyncio.gather(*[runner._schedule(op) for op in operations])
+
+    async def test_successful_group_exits_with_success(self):
+        runner = BatchRunner(max_parallel=2, output_path=self.output_path)
+        self.assertEqual(await runner.run(write_group(self.group, ['x1 = 1', 'x2 = 2'])), BatchRunner.EXIT_SUCCESS)
+        with open(self.output_path) as file:
+            self.assertEqual(json.load(file)['exit_status'], BatchRunner.EXIT_SUCCESS)
+
+    async def test_failing_child_skips_the_parent(self):
+        runner = BatchRunner(output_path=self.output_path)
+        with mock.patch.object(CustomLogger(), 'error'):
+            status = await runner.run(write_group(self.group, ['x1 = 1', 'x2 = 1 / 0']))
+        self.assertEqual(status, BatchRunner.EXIT_OPERATION_FAILED)
+
+        with open(self.output_path) as file:
+            results = json.load(file)
+        self.assertEqual(results['exit_status'], BatchRunner.EXIT_OPERATION_FAILED)
+        operations = {op['name']: op for op in results['operations'].values()}
+        self.assertEqual(operations['op1']['status'], 'completed')
+        self.assertNotEqual(operations['op2']['status'], 'completed')
+        self.assertNotEqual(operations['op0']['status'], 'completed')
+        self.assertNotIn('total', operations['op0']['results'])
+
+    async def test_missing_group_fails_to_load(self):
+        with mock.patch.object(CustomLogger(), 'error'):
+            status = await BatchRunner().run(os.path.join(self.group, 'missing.json'))
+        self.assertEqual(status, BatchRunner.EXIT_LOAD_FAILED)
+
+    async def test_children_and_dependencies_run_first_within_the_parallel_limit(self):
+        log, active = [], []
+        parent = FakeOperation('parent', log, active, dependencies={'c': ['a', 'b']})
+        children = [FakeOperation(name, log, active, parent=parent) for name in ('a', 'b', 'c', 'd', 'e')]
+
+        self.assertTrue(all(await self.schedule([parent] + children, max_parallel=2)))
+        events = [entry[:2] for entry in log]
+        starts = [name for event, name in events if event == 'start']
+        self.assertEqual(sorted(starts), ['a', 'b', 'c', 'd', 'e', 'parent'])
+        self.assertEqual(starts[-1], 'parent')
+        self.assertGreater(events.index(('start', 'c')), max(events.index(('end', 'a')), events.index(('end', 'b'))))
+        self.assertEqual(max(entry[2] for entry in log if entry[0] == 'start'), 2)
+
+    async def test_failed_prerequisite_skips_dependents(self):
+        log, active = [], []
+        parent = FakeOperation('parent', log, active, dependencies={'b': 'a'})
+        failing = FakeOperation('a', log, active, parent=parent, fails=True)
+        dependent = FakeOperation('b', log, active, parent=parent)
+
+        self.assertEqual(await self.schedule([parent, failing, dependent], max_parallel=4), [False, False, False])
+        self.assertEqual([name for event, name, *_ in log if event == 'start'], ['a'])
+        self.assertEqual((len(parent.errors), len(dependent.errors)), (1, 1))
+
+
+class LauncherExitStatusTest(unittest.IsolatedAsyncioTestCase):
+    async def test_workspace_failure_exits_non_zero_in_batch_mode(self):
+        import research_analytics_suite.RASLauncher  # noqa: F401
+        launcher = sys.modules['research_analytics_suite.RASLauncher']
+
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        not_a_directory = os.path.join(directory, 'file')
+        open(not_a_directory, 'w').close()
+
+        args = Namespace(open_workspace=None, config=None, directory=not_a_directory, name=None,
+                         batch='group.json', jobs=1, output=None, gui='false')
+        # The workspace library is not loaded; only the workspace directory setup fails here
+        with mock.patch.object(launcher, 'get_launch_args') as get_launch_args, \
+                mock.patch.object(launcher.Workspace, 'initialize', new=mock.AsyncMock()), \
+                mock.patch.object(CustomLogger(), 'error') as error:
+            get_launch_args.return_value.parse_args.return_value = args
+            status = await launcher.RASLauncher()
+
+        self.assertEqual(status, BatchRunner.EXIT_WORKSPACE_FAILED)
+        error.assert_called_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
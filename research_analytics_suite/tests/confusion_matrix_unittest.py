@@ -0,0 +1,80 @@
+import unittest
+import warnings
+
+import numpy as np
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support
+
+from research_analytics_suite.analytics.evaluation.Evaluator import Evaluator
+from research_analytics_suite.analytics.utils.ConfusionMatrix import ConfusionMatrix
+from research_analytics_suite.analytics.utils.Metrics import Metrics
+
+
+class LookupModel:
+    """A model whose prediction for a row is its first feature."""
+    def predict(self, X):
+        return np.asarray(X)[:, 0]
+
+
+def chunks(y_true, y_pred, size):
+    return [(y_true[i:i + size], y_pred[i:i + size]) for i in range(0, len(y_true), size)]
+
+
+class ConfusionMatrixTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.int_true = rng.integers(0, 5, 503)
+        # Label 5 is only ever predicted, and label 4 never is
+        self.int_pred = np.where(rng.random(503) < 0.6, self.int_true, rng.integers(0, 6, 503))
+        self.int_pred[self.int_pred == 4] = 3
+        names = np.array(['cat', 'dog', 'eel', 'fox', 'gnu', 'hen'])
+        self.str_true, self.str_pred = names[self.int_true], names[self.int_pred]
+
+    def assert_matches_sklearn(self, metrics, y_true, y_pred, average):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            precision, recall, f1, _ = precision_recall_fscore_support(y_true, y_pred, average=average)
+        self.assertAlmostEqual(metrics['accuracy'], accuracy_score(y_true, y_pred))
+        self.assertAlmostEqual(metrics['precision'], precision)
+        self.assertAlmostEqual(metrics['recall'], recall)
+        self.assertAlmostEqual(metrics['f1'], f1)
+
+    def test_merged_chunks_match_sklearn(self):
+        for y_true, y_pred in ((self.int_true, self.int_pred), (self.str_true, self.str_pred)):
+            # Each worker sees a different subset of the labels
+            workers = [Metrics.accumulate(chunks(y_true[i::3], y_pred[i::3], 37)) for i in range(3)]
+            merged = sum(workers)
+            self.assertEqual(merged.matrix.sum(), len(y_true))
+            self.assertEqual(list(merged.labels), sorted(set(y_true) | set(y_pred)))
+            for average in ('weighted', 'macro', 'micro'):
+                with self.subTest(dtype=y_true.dtype.kind, average=average):
+                    self.assert_matches_sklearn(merged.metrics(average), y_true, y_pred, average)
+                    self.assertEqual(merged.metrics(average), Metrics.calculate_metrics(y_true, y_pred, average))
+
+    def test_merge_order_does_not_matter(self):
+        a = ConfusionMatrix().update(self.str_true[:100], self.str_pred[:100])
+        b = ConfusionMatrix().update(self.str_true[100:], self.str_pred[100:])
+        np.testing.assert_array_equal((a + b).matrix, (b + a).matrix)
+        np.testing.assert_array_equal((a + b).matrix, ConfusionMatrix().update(self.str_true, self.str_pred).matrix)
+
+    def test_accumulate_adds_to_an_existing_matrix(self):
+        matrix = ConfusionMatrix(labels=[0, 1, 2, 3, 4, 5, 9])
+        self.assertIs(Metrics.accumulate(chunks(self.int_true, self.int_pred, 50), matrix), matrix)
+        self.assertEqual(matrix.matrix.sum(), len(self.int_true))
+        self.assertEqual(matrix.matrix[-1].sum() + matrix.matrix[:, -1].sum(), 0)
+        self.assertEqual(Metrics.accumulate([]).matrix.shape, (0, 0))
+
+    def test_evaluate_batches_matches_sklearn(self):
+        batches = [(self.int_pred[i:i + 64, None], self.int_true[i:i + 64]) for i in range(0, len(self.int_true), 64)]
+        batches.insert(2, (np.empty((0, 1)), np.empty(0)))
+        self.assert_matches_sklearn(Evaluator.evaluate_batches(LookupModel(), batches),
+                                    self.int_true, self.int_pred, 'weighted')
+        self.assertEqual(Evaluator.evaluate(LookupModel(), self.int_pred[:, None], self.int_true, batch_rows=50),
+                         Evaluator.evaluate_batches(LookupModel(), batches))
+
+    def test_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            ConfusionMatrix().update([1, 2], [1])
+
+
+if __name__ == '__main__':
+    unittest.main()
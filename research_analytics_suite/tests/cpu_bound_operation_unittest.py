@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from research_analytics_suite.utils.Config import Config
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+def square(value):
+    """A CPU-bound action that the spawned workers can import."""
+    return {'squared': value ** 2, 'pid': os.getpid()}
+
+
+class CpuBoundOperationTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.mkdtemp()
+        config = Config()
+        await config.initialize()
+        config.BASE_DIR = self.directory
+        await CustomLogger().initialize()
+
+        from research_analytics_suite.data_engine.memory.DataCache import DataCache
+        from research_analytics_suite.data_engine.memory.MemoryManager import MemoryManager
+        from research_analytics_suite.operation_manager.control.OperationControl import OperationControl
+        await DataCache().initialize()
+        await MemoryManager().initialize()
+        await OperationControl().initialize()
+
+    async def asyncTearDown(self):
+        from research_analytics_suite.operation_manager.execution.SharedProcessPool import SharedProcessPool
+        SharedProcessPool().shutdown()
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    async def run_with_input(self, action):
+        """Runs a CPU-bound operation whose input value = 7 is the output of a child operation."""
+        from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+        parent = BaseOperation(action=action, name='parent', is_cpu_bound=True)
+        await parent.initialize_operation()
+        child = BaseOperation(action='value = 7', name='child')
+        await child.initialize_operation()
+        await parent.add_child_operation(child)
+
+        await child.execute()
+        await parent.execute()
+        self.assertEqual(parent.status, 'completed')
+        return await parent.get_results_from_memory()
+
+    async def test_function_runs_in_the_shared_process_pool(self):
+        results = await self.run_with_input(square)
+        self.assertEqual(results['squared'], (int, 49))
+        self.assertNotEqual(results['pid'][1], os.getpid())
+
+    async def test_unpicklable_action_runs_in_a_thread(self):
+        offset = 1
+        results = await self.run_with_input(lambda value: {'squared': value ** 2 + offset, 'pid': os.getpid()})
+        self.assertEqual(results['squared'], (int, 50))
+        self.assertEqual(results['pid'][1], os.getpid())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import asyncio
+import os
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from research_analytics_suite.data_engine.engine.DaskClusterManager import DaskClusterManager
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+def settings(**overrides):
+    config = {'DISTRIBUTED': False, 'DASK_SCHEDULER_ADDRESS': None, 'DASK_WORKERS': None, 'DASK_SPILL_DIR': None,
+              'DASK_DASHBOARD_ADDRESS': None, 'MEMORY_LIMIT': None, 'NUM_THREADS': 2, 'BASE_DIR': None,
+              'WORKSPACE_NAME': None}
+    config.update(overrides)
+    return SimpleNamespace(**config)
+
+
+class DaskClusterManagerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        await CustomLogger().initialize()
+
+    async def test_client_is_shared_until_closed(self):
+        manager = DaskClusterManager(settings())
+        self.addAsyncCleanup(manager.close)
+        first, second = await asyncio.gather(manager.get_client(), manager.get_client())
+        self.assertIs(first, second)
+        self.assertIs(await manager.get_client(), first)
+        self.assertTrue(manager.is_running)
+        self.assertEqual(manager.client.submit(sum, [1, 2, 3]).result(), 6)
+
+        await manager.close()
+        self.assertIsNone(manager.client)
+        self.assertIsNone(manager.cluster)
+        self.assertFalse(manager.is_running)
+        self.assertEqual(first.status, 'closed')
+
+        restarted = await manager.get_client()
+        self.assertIsNot(restarted, first)
+        self.assertTrue(manager.is_running)
+
+    async def test_workspace_shares_the_client(self):
+        from research_analytics_suite.data_engine.Workspace import Workspace
+        workspace = Workspace()
+        manager = DaskClusterManager(settings())
+        with mock.patch.object(workspace, '_distributed', manager):
+            engine = SimpleNamespace(dask_client=None)
+            with mock.patch.object(workspace, '_data_engines', {'engine': engine}):
+                client = await workspace.get_dask_client()
+                self.assertIs(await workspace.get_dask_client(), client)
+                self.assertIs(workspace.dask_client, client)
+                self.assertIs(engine.dask_client, client)
+
+                await workspace.close()
+                self.assertIsNone(workspace.dask_client)
+                self.assertIsNone(engine.dask_client)
+
+    async def test_scheduler_address_connects_without_a_local_cluster(self):
+        manager = DaskClusterManager(settings(DASK_SCHEDULER_ADDRESS='tcp://scheduler:8786'))
+        client = mock.MagicMock(status='running')
+        module = sys.modules[DaskClusterManager.__module__]
+        with mock.patch.object(module, 'distributed') as distributed:
+            distributed.Client.return_value = client
+            self.assertIs(await manager.get_client(), client)
+            self.assertIs(await manager.get_client(), client)
+            await manager.close()
+
+        distributed.Client.assert_called_once_with('tcp://scheduler:8786')
+        distributed.LocalCluster.assert_not_called()
+        client.close.assert_called_once()
+
+    def test_cluster_settings(self):
+        config = settings(DISTRIBUTED=True, DASK_WORKERS=2, NUM_THREADS=8, MEMORY_LIMIT=4e9,
+                          DASK_SPILL_DIR='spill', BASE_DIR=os.path.join('base'), WORKSPACE_NAME='workspace')
+        self.assertEqual(DaskClusterManager(config).cluster_settings(), {
+            'n_workers': 2, 'threads_per_worker': 4, 'processes': True, 'dashboard_address': None,
+            'memory_limit': 2000000000, 'local_directory': os.path.join('base', 'workspace', 'spill')})
+
+        threaded = DaskClusterManager(settings(DASK_WORKERS=2, NUM_THREADS=8)).cluster_settings()
+        self.assertEqual((threaded['n_workers'], threaded['threads_per_worker'], threaded['processes']), (1, 8, False))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from research_analytics_suite.data_engine.core.DaskData import DaskData
+from research_analytics_suite.utils.Config import Config
+
+
+class DaskDataTest(unittest.TestCase):
+    def setUp(self):
+        self.frame = pd.DataFrame({'x': np.arange(100_000)})
+
+    def test_filter_is_lazy(self):
+        calls = []
+
+        def double(partition):
+            calls.append('apply')
+            return partition.assign(y=partition['x'] * 2)
+
+        def tens(partition):
+            calls.append('filter')
+            return partition['x'] % 10 == 0
+
+        data = DaskData(self.frame)
+        data.apply(double).filter(tens)
+        self.assertEqual(calls, [])
+
+        result = data.compute()
+        self.assertEqual(len(result), 10_000)
+        self.assertTrue((result['y'] == result['x'] * 2).all())
+        self.assertEqual(data.partition_info['reason'], 'filter (sampled)')
+
+    def test_filter_replans_partitions_when_used(self):
+        with mock.patch.object(Config(), 'DASK_PARTITION_SIZE', 100_000):
+            data = DaskData(self.frame)
+            before = data.partition_info['npartitions']
+            data.filter(lambda partition: partition['x'] % 100 == 0)
+            self.assertEqual(data.partition_info['npartitions'], before)
+            self.assertLess(data.dask_dataframe.npartitions, before)
+
+
+if __name__ == '__main__':
+    unittest.main()
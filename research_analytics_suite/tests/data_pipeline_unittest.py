@@ -0,0 +1,41 @@
+import unittest
+
+import dask.dataframe as dd
+import pandas as pd
+
+from research_analytics_suite.data_engine.core.DataPipeline import DataPipeline
+
+
+class DataPipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.frame = pd.DataFrame({'a': range(10), 'b': range(10, 20), 'c': range(20, 30)})
+
+    def selects(self, pipeline):
+        return [stage['columns'] for stage in pipeline.optimize() if stage['kind'] == 'select']
+
+    def test_nested_selects_are_merged(self):
+        pipeline = DataPipeline().select(['a', 'b', 'c']).select(['b', 'a'])
+        self.assertEqual(self.selects(pipeline), [['b', 'a']])
+        pd.testing.assert_frame_equal(pipeline.compute(self.frame), self.frame[['b', 'a']])
+
+    def test_select_of_a_dropped_column_still_fails(self):
+        pipeline = DataPipeline().select(['a', 'b']).select(['a', 'c'])
+        self.assertEqual(self.selects(pipeline), [['a', 'b'], ['a', 'c']])
+        with self.assertRaises(KeyError):
+            pipeline.compute(self.frame)
+
+        pipeline = DataPipeline().select(['a', 'b']).filter(lambda f: f['a'] > 2, columns=['a']).select(['a', 'c'])
+        with self.assertRaises(KeyError):
+            pipeline.compute(self.frame)
+
+    def test_optimized_plan_matches_the_steps(self):
+        pipeline = (DataPipeline().map(lambda f: f.assign(d=f['a'] * 2), reads=['a'], writes=['d'])
+                    .filter(lambda f: f['b'] % 2 == 0, columns=['b']).select(['d', 'b']).select(['d']))
+        expected = self.frame.assign(d=self.frame['a'] * 2)
+        expected = expected[expected['b'] % 2 == 0][['d']]
+        pd.testing.assert_frame_equal(pipeline.compute(self.frame), expected)
+        pd.testing.assert_frame_equal(pipeline.compute(dd.from_pandas(self.frame, npartitions=3)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
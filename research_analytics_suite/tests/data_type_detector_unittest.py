@@ -0,0 +1,75 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from research_analytics_suite.data_engine.data_streams.DataTypeDetector import DataTypeDetector
+
+
+def write_csv(path, rows=200, blank_rows=()):
+    """Write a `time,a,b,label` CSV whose 'a' cell is empty on the given data rows."""
+    lines = ['time,a,b,label']
+    for i in range(rows):
+        a = '' if i in blank_rows else f"{i * 0.5:.3f}"
+        lines.append(f"{i},{a},{i * 0.25:.3f},{'x' if i % 2 else 'y'}")
+    with open(path, 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
+
+class DataTypeDetectorTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'data.csv')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assert_header_layout(self, blank_rows):
+        write_csv(self.path, blank_rows=blank_rows)
+        info = DataTypeDetector.detect(self.path)
+        self.assertEqual(info['format'], 'csv')
+        self.assertEqual(info['header_row'], 0)
+        self.assertEqual(info['data_row'], 1)
+        self.assertGreater(info['estimated_rows'], 150)
+
+    def test_complete_rows(self):
+        self.assert_header_layout(blank_rows=())
+
+    def test_missing_values_do_not_move_the_header(self):
+        self.assert_header_layout(blank_rows={40, 55})
+
+    def test_frequent_missing_values(self):
+        self.assert_header_layout(blank_rows=set(range(0, 200, 7)))
+
+    def test_missing_values_in_the_first_data_row(self):
+        rows = [['t', 'x'], ['1', ''], ['2', 'NA'], ['3', '4'], ['4', '5']]
+        self.assertEqual(DataTypeDetector.find_data_row(rows), 1)
+
+    def test_multi_row_header(self):
+        rows = ([['scorer', 'DLC', 'DLC', 'DLC'], ['bodyparts', 'nose', 'nose', 'nose'],
+                 ['coords', 'x', 'y', 'likelihood']] + [[str(i), '1.5', '', '0.9'] for i in range(20)])
+        self.assertEqual(DataTypeDetector.find_data_row(rows), 3)
+
+    def test_single_column(self):
+        with open(self.path, 'w') as file:
+            file.write('value\n1\n2\n\n3\n')
+        info = DataTypeDetector.detect(self.path)
+        self.assertEqual((info['format'], info['data_row'], info['header_row']), ('csv', 1, 0))
+        self.assertEqual(info['estimated_rows'], 3)
+
+        rows, delimiter = DataTypeDetector._sniff_delimiter(['1.5', '2', 'NA', '3'])
+        self.assertEqual((rows, delimiter), ([['1.5'], ['2'], ['NA'], ['3']], ','))
+        self.assertEqual(DataTypeDetector._sniff_delimiter(['t', '1', 'a', '2']), ([], None))
+
+    def test_ndjson(self):
+        path = os.path.join(self.directory, 'data.jsonl')
+        with open(path, 'w') as file:
+            file.write('{"a": 1}\n{"a": 2}\n')
+        self.assertEqual(DataTypeDetector.detect_type(path), 'ndjson')
+
+    def test_headerless_numeric_data(self):
+        self.assertEqual(DataTypeDetector.find_data_row([['1', '2'], ['3', ''], ['5', '6']]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
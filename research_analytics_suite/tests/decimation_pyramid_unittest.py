@@ -0,0 +1,107 @@
+import unittest
+
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.DecimationPyramid import DecimationPyramid
+from research_analytics_suite.data_engine.data_streams.RingBuffer import RingBuffer
+
+
+class DecimationPyramidTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.values = self.rng.normal(size=(0, 2))
+
+    def feed(self, pyramid, total, chunks=(1, 3, 7, 16, 29)):
+        """Appends `total` samples, timestamped by their index, in irregular chunks, updating after each."""
+        samples = self.rng.normal(size=(total, 2))
+        self.values = np.vstack([self.values, samples])
+        start = pyramid.buffer.total_samples
+        offset = 0
+        while offset < total:
+            size = min(chunks[offset % len(chunks)], total - offset)
+            pyramid.buffer.extend(samples[offset:offset + size], np.arange(start + offset, start + offset + size))
+            pyramid.update()
+            offset += size
+
+    def expected(self, timestamp, stop):
+        """Returns the brute-force minimum and maximum of the raw samples in [timestamp, stop)."""
+        samples = self.values[int(timestamp):int(stop)]
+        return samples.min(axis=0), samples.max(axis=0)
+
+    def check_levels(self, pyramid):
+        consumed = pyramid.consumed
+        for level in range(1, len(pyramid.levels) + 1):
+            timestamps, values = pyramid._level_data(level)
+            size = pyramid.bucket_size(level)
+            with self.subTest(level=level, consumed=consumed):
+                self.assertEqual(len(timestamps), -(-consumed // size) - int(timestamps[0]) // size)
+                np.testing.assert_array_equal(np.diff(timestamps), size)
+                for timestamp, row in zip(timestamps, values):
+                    minimum, maximum = self.expected(timestamp, min(timestamp + size, consumed))
+                    np.testing.assert_array_equal(row[:2], minimum)
+                    np.testing.assert_array_equal(row[2:], maximum)
+
+    def check_query(self, pyramid, pixels, start=None, stop=None):
+        timestamps, points, level = pyramid.query(pixels, start, stop)
+        if level == 0:
+            np.testing.assert_array_equal(points, self.values[timestamps.astype(int)])
+            np.testing.assert_array_equal(np.diff(timestamps), 1)
+            return level
+
+        self.assertLessEqual(len(points), 2 * pixels)
+        starts = timestamps[0::2]
+        size = pyramid.bucket_size(level)
+        end = pyramid.consumed if stop is None else min((stop // size + 1) * size, pyramid.consumed)
+        stops = np.append(starts[1:], end)
+        for timestamp, bucket_stop, minimum, maximum in zip(starts, stops, points[0::2], points[1::2]):
+            expected_minimum, expected_maximum = self.expected(timestamp, bucket_stop)
+            np.testing.assert_array_equal(minimum, expected_minimum)
+            np.testing.assert_array_equal(maximum, expected_maximum)
+        if start is not None:
+            self.assertLessEqual(starts[0], start)
+        if stop is not None:
+            self.assertLessEqual(starts[-1], stop)
+        return level
+
+    def test_levels_match_brute_force_with_partial_buckets(self):
+        pyramid = DecimationPyramid(RingBuffer(4096, channels=2), factor=4, levels=3, capacity=1024)
+        for total in (1, 2, 5, 63, 64, 65, 300):
+            self.feed(pyramid, total)
+            self.check_levels(pyramid)
+
+    def test_levels_match_brute_force_after_wrap_around(self):
+        pyramid = DecimationPyramid(RingBuffer(64, channels=2), factor=3, levels=3, capacity=10)
+        for total in (50, 100, 733):
+            self.feed(pyramid, total)
+            self.check_levels(pyramid)
+            self.assertGreater(pyramid.levels[0].total_samples, pyramid.levels[0].capacity)
+
+    def test_query_every_level(self):
+        pyramid = DecimationPyramid(RingBuffer(256, channels=2), factor=4, levels=3, capacity=100)
+        self.feed(pyramid, 1001)
+
+        levels = [self.check_query(pyramid, pixels) for pixels in (500, 110, 70, 20, 3, 1)]
+        self.assertEqual(levels, [0, 1, 2, 3, 3, 3])
+
+        for start, stop in ((900, 1000), (700, 950), (500, 1000), (40, 600), (0, 1000)):
+            for pixels in (200, 20, 2):
+                with self.subTest(start=start, stop=stop, pixels=pixels):
+                    self.check_query(pyramid, pixels, start, stop)
+
+    def test_query_regroups_the_coarsest_level(self):
+        pyramid = DecimationPyramid(RingBuffer(64, channels=2), factor=2, levels=2, capacity=64)
+        self.feed(pyramid, 203)
+        timestamps, points, level = pyramid.query(1)
+        self.assertEqual(level, 2)
+        self.assertEqual(len(points), 2)
+        np.testing.assert_array_equal(points[0], self.values[int(timestamps[0]):].min(axis=0))
+        np.testing.assert_array_equal(points[1], self.values[int(timestamps[0]):].max(axis=0))
+
+    def test_empty_pyramid(self):
+        pyramid = DecimationPyramid(RingBuffer(64, channels=2))
+        timestamps, points, level = pyramid.query(100)
+        self.assertEqual((len(timestamps), points.shape, level), (0, (0, 2), 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
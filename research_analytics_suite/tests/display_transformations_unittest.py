@@ -0,0 +1,48 @@
+import unittest
+from unittest import mock
+
+import matplotlib
+import numpy as np
+
+matplotlib.use('Agg')
+from matplotlib import pyplot as plt
+
+from research_analytics_suite.analytics.preloaded.transformations import ScaleTransform, TranslateTransform
+from research_analytics_suite.analytics.visualization.display_transformations import display_transformations
+
+
+class DisplayTransformationsTest(unittest.TestCase):
+    def setUp(self):
+        self.points = np.random.default_rng(0).uniform(0, 640, size=(50, 4, 2))
+        show = mock.patch.object(plt, 'show')
+        show.start()
+        self.addCleanup(show.stop)
+        self.addCleanup(plt.close, 'all')
+
+    def test_scatter_downsamples_each_stage(self):
+        display_transformations(self.points, [ScaleTransform(2.0), TranslateTransform(5.0, -5.0)], max_points=30)
+        axis = plt.gcf().axes[0]
+        self.assertEqual(len(axis.collections), 3)
+        self.assertTrue(all(len(collection.get_offsets()) == 29 for collection in axis.collections))
+        np.testing.assert_allclose(axis.collections[1].get_offsets()[0], self.points.reshape(-1, 2)[0] * 2.0)
+
+    def test_density_plots_one_histogram_per_stage(self):
+        display_transformations(self.points, [ScaleTransform(2.0)], density=True, bins=16)
+        visible = [axis for axis in plt.gcf().axes if axis.get_visible()]
+        self.assertEqual(len(visible), 2)
+        for axis in visible:
+            self.assertEqual(axis.images[0].get_array().shape, (16, 16))
+        self.assertEqual(visible[1].images[0].get_extent()[1], self.points[..., 0].max() * 2.0)
+
+    def test_density_without_finite_points(self):
+        for points in (np.empty((0, 2)), np.full((10, 2), np.nan)):
+            with self.subTest(points=len(points)):
+                display_transformations(points, [ScaleTransform(2.0)], density=True, bins=8)
+                visible = [axis for axis in plt.gcf().axes if axis.get_visible()]
+                self.assertEqual(len(visible), 2)
+                self.assertEqual(float(visible[0].images[0].get_array().sum()), 0.0)
+                plt.close('all')
+
+
+if __name__ == '__main__':
+    unittest.main()
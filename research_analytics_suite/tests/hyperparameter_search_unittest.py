@@ -0,0 +1,110 @@
+import operator
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from research_analytics_suite.analytics.training.CandidateFitOperation import CandidateFitOperation
+from research_analytics_suite.analytics.training.HyperparameterSearchOperation import HyperparameterSearchOperation
+from research_analytics_suite.analytics.training.SharedArrays import SharedArrays
+
+
+class HyperparameterSearchTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.X = rng.normal(size=(900, 3))
+        self.search = HyperparameterSearchOperation(self.X, rng.integers(0, 3, size=900), refit=False,
+                                                    candidates=[{'C': c} for c in (0.1, 1.0, 10.0)])
+
+    def test_class_count(self):
+        self.assertEqual(HyperparameterSearchOperation._class_count(np.array([0, 1, 2, 1, 0])), 3)
+        self.assertEqual(HyperparameterSearchOperation._class_count(np.array(['a', 'b', 'a'])), 2)
+        self.assertEqual(HyperparameterSearchOperation._class_count(np.linspace(0, 1, 500)), 1)
+
+    def test_regression_targets_keep_small_rungs(self):
+        resources = self.search._resources(900, HyperparameterSearchOperation._class_count(np.linspace(0, 1, 900)))
+        self.assertEqual(resources, [200, 600])
+
+    async def test_results_are_reset_between_searches(self):
+        async def run_rung(handle, rung, resource, survivors):
+            self.search.results.extend({'rung': rung, 'candidate': candidate} for candidate in survivors)
+            return {candidate: float(candidate) for candidate in survivors}
+
+        with mock.patch.object(self.search, '_run_rung', side_effect=run_rung), \
+                mock.patch.object(self.search, 'add_log_entry'):
+            first = await self.search.search()
+            second = await self.search.search()
+
+        self.assertEqual(len(first['search_results']), 4)
+        self.assertEqual(second['search_results'], self.search.results)
+        self.assertEqual(len(self.search.results), 4)
+        self.assertEqual(second['best_params'], {'C': 10.0})
+
+    def test_string_labels_are_shared_as_fixed_width_strings(self):
+        frame = pd.DataFrame(self.X, columns=['a', 'b', 'c'])
+        frame['label'] = pd.Series(np.where(self.X[:, 0] > 0, 'high', 'low'), dtype=object)
+        search = HyperparameterSearchOperation(frame, 'label', refit=False, candidates=[{'C': 1.0}])
+
+        X, y = search._arrays()
+        self.assertEqual(X.shape, (900, 3))
+        self.assertEqual(y.dtype.kind, 'U')
+        shared = SharedArrays(X=X, y=y)
+        try:
+            np.testing.assert_array_equal(SharedArrays.attach(shared.handle)['y'], frame['label'].to_numpy())
+        finally:
+            shared.close()
+
+
+class SharedArraysTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        self.X = rng.normal(size=(300, 2))
+        self.y = np.where(self.X[:, 0] + self.X[:, 1] > 0, 'pos', 'neg')
+        self.shared = SharedArrays(X=self.X, y=self.y)
+        self.addCleanup(self.shared.close)
+
+    def test_attached_arrays_are_read_only_copies(self):
+        arrays = SharedArrays.attach(self.shared.handle)
+        np.testing.assert_array_equal(arrays['X'], self.X)
+        np.testing.assert_array_equal(arrays['y'], self.y)
+        self.assertIs(SharedArrays.attach(self.shared.handle)['X'], arrays['X'])
+        with self.assertRaises(ValueError):
+            arrays['X'][0, 0] = 1.0
+
+    def test_object_arrays_are_rejected(self):
+        with self.assertRaises(TypeError):
+            SharedArrays(y=np.array(['a', None], dtype=object))
+
+    def test_candidate_fits_on_nested_subsamples(self):
+        results = [CandidateFitOperation.fit_and_score(self.shared.handle, 'logistic_regression', {'C': 1.0}, 0, 3,
+                                                       resource, 'accuracy', 0) for resource in (50, 200)]
+        self.assertEqual([result['resource'] for result in results], [50, 200])
+        self.assertGreater(results[1]['score'], 0.9)
+
+        train, test = CandidateFitOperation._splits(self.shared.handle, self.y, 3, 0)[0]
+        self.assertFalse(set(train) & set(test))
+        self.assertEqual(len(train) + len(test), 300)
+        self.assertEqual(set(self.y[train[:50]]), {'pos', 'neg'})
+
+        model = CandidateFitOperation.refit(self.shared.handle, 'logistic_regression', {'C': 1.0})
+        self.assertEqual(set(model.predict(self.X)), {'pos', 'neg'})
+
+
+class SharedProcessPoolTest(unittest.IsolatedAsyncioTestCase):
+    async def test_pool_is_shared_and_restarted_after_shutdown(self):
+        from research_analytics_suite.operation_manager.execution.SharedProcessPool import SharedProcessPool
+        pool = SharedProcessPool()
+        self.addCleanup(pool.shutdown)
+        with mock.patch.object(pool, '_logger'):
+            self.assertEqual(await pool.run(operator.add, 2, 3), 5)
+            executor = pool.executor
+            self.assertIs(SharedProcessPool().executor, executor)
+
+            pool.shutdown()
+            self.assertEqual(await pool.run(operator.mul, 2, 3), 6)
+            self.assertIsNot(pool.executor, executor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+HEAVY_MODULES = ('torch', 'sklearn', 'matplotlib', 'dask.dataframe', 'pandas', 'dearpygui')
+
+# Importing the launcher takes about 0.3 s; the bound leaves room for slow CI machines
+MAX_IMPORT_SECONDS = 3.0
+
+PROBE = f"""
+import json, sys, time
+start = time.perf_counter()
+import research_analytics_suite.RASLauncher
+print(json.dumps({{
+    'seconds': time.perf_counter() - start,
+    'loaded': [name for name in {HEAVY_MODULES!r} if name in sys.modules],
+}}))
+"""
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_launcher_import_defers_heavy_modules(self):
+        root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        environment = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+        # The fastest of a few runs, so a cold disk cache does not fail the test
+        runs = []
+        for _ in range(3):
+            output = subprocess.run([sys.executable, '-c', PROBE], capture_output=True, text=True, check=True,
+                                    env=environment).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+
+        self.assertEqual(runs[0]['loaded'], [])
+        self.assertLess(min(run['seconds'] for run in runs), MAX_IMPORT_SECONDS)
+
+
+if __name__ == '__main__':
+    unittest.main()
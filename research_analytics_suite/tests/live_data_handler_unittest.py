@@ -0,0 +1,120 @@
+import asyncio
+import time
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.BaseInput import BaseInput
+from research_analytics_suite.data_engine.data_streams.LiveDataHandler import LiveDataHandler
+from research_analytics_suite.data_engine.data_streams.ThreadedInput import ThreadedInput
+from research_analytics_suite.data_engine.data_streams.operators import RollingStatistics
+from research_analytics_suite.data_engine.engine.DataEngineOptimized import DataEngineOptimized
+
+
+class CountingInput(ThreadedInput):
+    def __init__(self, count):
+        super().__init__(source='Counter')
+        self._values = iter(range(count))
+
+    def read_data(self):
+        value = next(self._values, None)
+        return None if value is None else [float(value)]
+
+
+def make_engine():
+    engine = SimpleNamespace(engine_id='engine', cache_live_buffer=lambda buffer: None)
+    engine.update_live_data = lambda *args: DataEngineOptimized.update_live_data(engine, *args)
+    return engine
+
+
+class LiveDataHandlerTest(unittest.TestCase):
+    def setUp(self):
+        self.cache = {}
+        engine = SimpleNamespace(engine_id='engine', _cache=SimpleNamespace(set=self.cache.__setitem__))
+        engine.cache_live_buffer = lambda buffer: DataEngineOptimized.cache_live_buffer(engine, buffer)
+        self.handler = LiveDataHandler(data_engine=engine, capacity=16, block_size=8, spill=False)
+
+    def test_every_buffer_is_cached_when_created(self):
+        first, second = BaseInput(source='Analog'), BaseInput(source='USB')
+        self.handler.add_live_input(first)
+        self.handler.add_live_input(second, channels=2)
+        default = self.handler.get_buffer()
+
+        self.assertIs(self.cache['live_data_Analog_0'], first.buffer)
+        self.assertIs(self.cache['live_data_USB_1'], second.buffer)
+        self.assertIs(self.cache['live_data'], default)
+        self.assertIs(self.handler.get_buffer(second), second.buffer)
+        self.assertEqual(len(self.cache), 3)
+
+    def test_buffers_are_cached_once(self):
+        with mock.patch.object(DataEngineOptimized, 'cache_live_buffer') as cache_live_buffer:
+            live_input = BaseInput(source='Analog')
+            self.handler.add_live_input(live_input)
+            for _ in range(5):
+                self.handler.get_buffer(live_input).append([1.0])
+                self.handler.get_buffer().append([2.0])
+        self.assertEqual(cache_live_buffer.call_count, 2)
+
+    @mock.patch('research_analytics_suite.utils.CustomLogger.CustomLogger.debug')
+    def test_without_an_event_loop_inputs_are_drained_on_request(self, debug):
+        engine = make_engine()
+        engine.live_data_handler = handler = LiveDataHandler(data_engine=engine, capacity=64, spill=False)
+        live_input = CountingInput(50)
+        handler.add_live_input(live_input)
+        handler.start_all()
+        self.assertIsNone(handler._drain_task)
+        for _ in range(200):
+            if live_input.samples_received == 50:
+                break
+            time.sleep(0.01)
+        handler.stop_all()
+        self.assertEqual(live_input.buffer.total_samples, 50)
+
+
+class LiveDataHandlerDrainTest(unittest.IsolatedAsyncioTestCase):
+    async def test_running_inputs_are_drained_periodically(self):
+        engine = make_engine()
+        engine.live_data_handler = handler = LiveDataHandler(data_engine=engine, capacity=64, spill=False,
+                                                             drain_interval=0.005)
+        live_input = CountingInput(50)
+        handler.add_live_input(live_input)
+        with mock.patch.object(handler, 'update_data_engine', wraps=handler.update_data_engine) as update:
+            handler.start_all()
+            for _ in range(200):
+                if live_input.buffer.total_samples == 50:
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(live_input.buffer.total_samples, 50)
+            self.assertGreater(update.call_count, 1)
+
+            drain_task = handler._drain_task
+            handler.stop_all()
+            await asyncio.sleep(0)
+            self.assertTrue(drain_task.cancelled() or drain_task.done())
+            self.assertIsNone(handler._drain_task)
+        np.testing.assert_array_equal(live_input.buffer.window()[1][:, 0], np.arange(50.0))
+
+    async def test_drain_publishes_operators(self):
+        engine = make_engine()
+        engine.live_data_handler = handler = LiveDataHandler(data_engine=engine, capacity=64, spill=False,
+                                                             drain_interval=0.005)
+        live_input = CountingInput(50)
+        handler.add_live_input(live_input)
+        with mock.patch('research_analytics_suite.data_engine.memory.MemoryManager.MemoryManager'):
+            operator = handler.add_operator(RollingStatistics(10), live_input)
+
+        handler.start_all()
+        for _ in range(200):
+            if await operator.slot.get_data_by_key('samples_seen') == 50:
+                break
+            await asyncio.sleep(0.01)
+        handler.stop_all()
+
+        self.assertEqual(await operator.slot.get_data_by_key('samples_seen'), 50)
+        np.testing.assert_allclose(await operator.slot.get_data_by_key('mean'), [44.5])
+
+
+if __name__ == '__main__':
+    unittest.main()
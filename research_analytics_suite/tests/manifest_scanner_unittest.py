@@ -0,0 +1,82 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from research_analytics_suite.library_manifest.ManifestScanner import ManifestScanner
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+def operation(i):
+    return {'unique_id': f'g_op{i}_1', 'name': f'op{i}', 'github': 'g', 'version': '1', 'action': f'x = {i}'}
+
+
+class ManifestScannerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        await CustomLogger().initialize()
+        self.directory = tempfile.mkdtemp()
+        for i in range(3):
+            self.write(i, operation(i))
+        self.index_path = os.path.join(self.directory, ManifestScanner.INDEX_FILE_NAME)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def write(self, i, state):
+        with open(os.path.join(self.directory, f'g_op{i}_1.json'), 'w') as file:
+            json.dump(state, file)
+
+    async def scan(self, scanner=None):
+        scanner = scanner or ManifestScanner()
+        with mock.patch.object(scanner, '_read_file', wraps=scanner._read_file) as read:
+            attributes = await scanner.scan(self.directory)
+        return attributes, read.call_count
+
+    async def test_unchanged_files_are_served_from_the_cache(self):
+        scanner = ManifestScanner()
+        attributes, reads = await self.scan(scanner)
+        self.assertEqual(([a['name'] for a in attributes], reads), (['op0', 'op1', 'op2'], 3))
+        self.assertTrue(os.path.exists(self.index_path))
+
+        self.assertEqual((await self.scan(scanner))[1], 0)
+        attributes, reads = await self.scan()
+        self.assertEqual(([a['action'] for a in attributes], reads), (['x = 0', 'x = 1', 'x = 2'], 0))
+
+    async def test_changed_and_removed_files_are_read_again(self):
+        await self.scan()
+        self.write(1, {**operation(1), 'action': 'x = 100, 200'})
+        os.remove(os.path.join(self.directory, 'g_op2_1.json'))
+
+        attributes, reads = await self.scan()
+        self.assertEqual(reads, 1)
+        self.assertEqual([a['action'] for a in attributes], ['x = 0', 'x = 100, 200'])
+
+        with open(self.index_path, 'r') as file:
+            self.assertEqual(sorted(json.load(file)['files'].keys()), ['g_op0_1.json', 'g_op1_1.json'])
+
+    async def test_corrupt_index_entries_are_ignored(self):
+        await self.scan()
+        with open(self.index_path, 'r') as file:
+            index = json.load(file)
+        index['files']['g_op0_1.json'].pop('signature')
+        index['files']['g_op1_1.json']['signature'] = [1]
+        index['files']['g_op2_1.json'] = 'not an entry'
+        with open(self.index_path, 'w') as file:
+            json.dump(index, file)
+
+        attributes, reads = await self.scan()
+        self.assertEqual(reads, 3)
+        self.assertEqual([a['name'] for a in attributes], ['op0', 'op1', 'op2'])
+
+        for content in ('{"version": 1, "files": []}', '{not json'):
+            with open(self.index_path, 'w') as file:
+                file.write(content)
+            with mock.patch.object(CustomLogger(), 'warning'):
+                attributes, reads = await self.scan()
+            self.assertEqual((len(attributes), reads), (3, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+import shutil
+import tempfile
+import unittest
+
+from research_analytics_suite.data_engine.memory.MemorySlot import MemorySlot
+from research_analytics_suite.operation_manager.operations.core.execution.PrepareAction import \
+    _execute_callable_action
+from research_analytics_suite.operation_manager.operations.core.memory.MemoryInput import MemoryInput
+from research_analytics_suite.utils.Config import Config
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+def make_slot(memory_id, **data):
+    return MemorySlot(memory_id=memory_id, name=memory_id, operation_required=False,
+                      data={key: (type(value), value) for key, value in data.items()})
+
+
+def add_one(x1):
+    return {'y': x1 + 1}
+
+
+class MemorySlotCollectionTest(unittest.TestCase):
+    def test_adding_a_slot_again_replaces_it_in_place(self):
+        collection = MemoryInput(name='inputs')
+        first, second = make_slot('a', a=1), make_slot('b', b=2)
+        collection.add_slots([first, second])
+        replacement = make_slot('a', a=3)
+        collection.add_slot(replacement)
+
+        self.assertEqual([slot.memory_id for slot in collection.slots], ['a', 'b'])
+        self.assertIs(collection.get_slot('a'), replacement)
+        self.assertIs(collection.slots[1], second)
+
+        collection.remove_slots(['a', 'missing'])
+        self.assertEqual(collection.slots, [second])
+
+    def test_callable_receives_only_accepted_keywords(self):
+        collection = MemoryInput(name='inputs')
+        collection.add_slots([make_slot('first', a=1, b=2), make_slot('second', c=3)])
+
+        self.assertEqual(_execute_callable_action(lambda a, c: a + c, collection)(), 4)
+        self.assertEqual(_execute_callable_action(lambda b, *, c=0: (b, c), collection)(), (2, 3))
+        self.assertEqual(_execute_callable_action(lambda a=10, d=20: (a, d), collection)(), (1, 20))
+        self.assertEqual(_execute_callable_action(lambda **kwargs: kwargs, collection)(), {'a': 1, 'b': 2, 'c': 3})
+        self.assertEqual(_execute_callable_action(lambda: 5, collection)(), 5)
+        self.assertIsNone(_execute_callable_action(lambda **kwargs: None, collection)())
+
+    def test_callable_reads_slots_when_it_runs(self):
+        collection = MemoryInput(name='inputs')
+        action = _execute_callable_action(lambda **kwargs: kwargs, collection)
+        self.assertEqual(action(), {})
+
+        collection.add_slot(make_slot('late', a=1))
+        self.assertEqual(action(), {'a': 1})
+        collection.add_slot(make_slot('late', a=2))
+        self.assertEqual(action(), {'a': 2})
+
+
+class ChildRerunTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.mkdtemp()
+        config = Config()
+        await config.initialize()
+        config.BASE_DIR = self.directory
+        await CustomLogger().initialize()
+
+        from research_analytics_suite.data_engine.memory.DataCache import DataCache
+        from research_analytics_suite.data_engine.memory.MemoryManager import MemoryManager
+        from research_analytics_suite.operation_manager.control.OperationControl import OperationControl
+        await DataCache().initialize()
+        await MemoryManager().initialize()
+        await OperationControl().initialize()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    async def test_rerun_child_keeps_parent_inputs(self):
+        from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+        parent = BaseOperation(action=add_one, name='parent')
+        await parent.initialize_operation()
+        child = BaseOperation(action='x1 = 1\nx2 = 2', name='child')
+        await child.initialize_operation()
+        await parent.add_child_operation(child)
+
+        for _ in range(3):
+            child.status = 'idle'
+            await child.execute()
+            self.assertEqual(len(parent.memory_inputs.slots), 2)
+            for received, produced in zip(parent.memory_inputs.slots, child.memory_outputs.slots):
+                self.assertIs(received, produced)
+
+        await parent.execute()
+        self.assertEqual(parent.status, 'completed')
+        self.assertEqual(len(parent.memory_inputs.slots), 2)
+        self.assertEqual((await parent.get_results_from_memory())['y'], (int, 2))
+
+
+if __name__ == '__main__':
+    unittest.main()
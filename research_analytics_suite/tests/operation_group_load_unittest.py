@@ -0,0 +1,83 @@
+import json
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from research_analytics_suite.utils.Config import Config
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+CHILDREN = 5000
+
+
+def reference(i):
+    return {'unique_id': f'g_op{i}_1', 'name': f'op{i}', 'github': 'g', 'version': '1'}
+
+
+class OperationGroupLoadTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.mkdtemp()
+        config = Config()
+        await config.initialize()
+        config.BASE_DIR = self.directory
+        await CustomLogger().initialize()
+
+        from research_analytics_suite.data_engine.memory.MemoryManager import MemoryManager
+        from research_analytics_suite.operation_manager.control.OperationControl import OperationControl
+        await MemoryManager().initialize()
+        await OperationControl().initialize()
+
+        self.group = os.path.join(self.directory, 'group')
+        os.makedirs(self.group)
+        with open(os.path.join(self.group, 'g_op0_1.json'), 'w') as file:
+            json.dump({**reference(0), 'action': 'x = 1', 'parent_operation': None,
+                       'child_operations': [reference(i) for i in range(1, CHILDREN + 1)]}, file)
+        for i in range(1, CHILDREN + 1):
+            with open(os.path.join(self.group, f'g_op{i}_1.json'), 'w') as file:
+                json.dump({**reference(i), 'action': 'x = 1', 'child_operations': None,
+                           'parent_operation': reference(0)}, file)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    async def test_large_group_loads_quietly(self):
+        from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+        with mock.patch.object(CustomLogger(), 'info') as info:
+            start = time.perf_counter()
+            group = await BaseOperation.load_operation_group(os.path.join(self.group, 'g_op1_1.json'), dict())
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(group), CHILDREN + 1)
+        parent = next(op for op in group.values() if op.name == 'op0')
+        self.assertEqual(len(parent.child_operations), CHILDREN)
+        self.assertTrue(all(op.parent_operation is parent for op in group.values() if op is not parent))
+        self.assertIn('[INIT] op0', parent.operation_logs)
+
+        # One summary line instead of several console lines per operation
+        self.assertEqual(info.call_count, 1)
+        # About 0.6 s here; the bound leaves room for slow CI machines
+        self.assertLess(elapsed, 5.0)
+        self.assertFalse(any(op.quiet for op in group.values()))
+
+    async def test_failed_load_restores_logging(self):
+        from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+        linked = []
+
+        async def link_child_operation(operation, child_operation, dependencies=None):
+            linked.extend((operation, child_operation))
+            if len(linked) > 4:
+                raise RuntimeError('link failed')
+
+        with mock.patch.object(BaseOperation, 'link_child_operation', autospec=True,
+                               side_effect=link_child_operation):
+            with self.assertRaises(RuntimeError):
+                await BaseOperation.load_operation_group(os.path.join(self.group, 'g_op1_1.json'), dict())
+
+        self.assertEqual(len(linked), 6)
+        self.assertFalse(any(op.quiet for op in linked))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+from research_analytics_suite.data_engine.core.PartitionPlanner import PartitionPlanner
+
+MIB = 2 ** 20
+
+
+class PartitionPlannerTest(unittest.TestCase):
+    def test_small_data_stays_in_one_partition(self):
+        planner = PartitionPlanner(target_size=128 * MIB, workers=8)
+        for nbytes in (0, 1, PartitionPlanner.MIN_PARTITION_SIZE, 2 * PartitionPlanner.MIN_PARTITION_SIZE - 1):
+            self.assertEqual(planner.plan(nbytes)['npartitions'], 1)
+        self.assertEqual(PartitionPlanner(target_size=MIB, workers=8).plan(31 * MIB)['npartitions'], 31)
+
+    def test_worker_floor(self):
+        plan = PartitionPlanner(target_size=128 * MIB, workers=8).plan(100 * MIB, reason='test')
+        self.assertEqual((plan['npartitions'], plan['workers'], plan['reason']), (6, 8, 'test'))
+        self.assertEqual(PartitionPlanner(target_size=128 * MIB, workers=2).plan(100 * MIB)['npartitions'], 2)
+        self.assertEqual(PartitionPlanner(target_size=128 * MIB, workers=8).plan(32 * MIB)['npartitions'], 2)
+
+    def test_target_size_ceiling(self):
+        plan = PartitionPlanner(target_size=128 * MIB, workers=4).plan(10 * 1024 * MIB)
+        self.assertEqual(plan['npartitions'], 80)
+        self.assertLessEqual(plan['partition_bytes'], plan['target_bytes'])
+        self.assertEqual(PartitionPlanner(target_size=128 * MIB, workers=4).plan(129 * MIB)['npartitions'], 4)
+        self.assertEqual(PartitionPlanner(target_size=32 * MIB, workers=1).plan(129 * MIB)['npartitions'], 5)
+
+    def test_plan_file_block_size(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'data.csv')
+            with open(path, 'wb') as file:
+                file.write(b'x' * 1000)
+            plan = PartitionPlanner(target_size=500, workers=1).plan_file(path, 'csv')
+            self.assertEqual((plan['estimated_bytes'], plan['npartitions'], plan['blocksize']), (2000, 4, 250))
+
+            plan = PartitionPlanner(target_size=300, workers=1).plan_file(path, 'unknown')
+            self.assertEqual((plan['npartitions'], plan['blocksize']), (4, 250))
+            self.assertEqual(PartitionPlanner(target_size=MIB, workers=1).plan_file(path, 'csv')['blocksize'], 1000)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def test_estimate_nbytes(self):
+        small = pd.DataFrame({'x': np.arange(100.0), 'label': ['a' * 10] * 100})
+        self.assertEqual(PartitionPlanner.estimate_nbytes(small), small.memory_usage(deep=True).sum())
+
+        large = pd.DataFrame({'x': np.arange(50000.0), 'label': [f"row {i}" for i in range(50000)]})
+        exact = large.memory_usage(deep=True).sum()
+        self.assertAlmostEqual(PartitionPlanner.estimate_nbytes(large) / exact, 1.0, delta=0.05)
+        self.assertAlmostEqual(PartitionPlanner.estimate_nbytes(dd.from_pandas(large, npartitions=5)) / exact, 1.0,
+                               delta=0.05)
+        self.assertEqual(PartitionPlanner.estimate_nbytes(np.zeros(10)), 0)
+
+        narrow = pd.DataFrame({'x': np.arange(50000.0)})
+        self.assertAlmostEqual(PartitionPlanner.estimate_nbytes(narrow) / narrow.memory_usage(deep=True).sum(), 1.0,
+                               delta=0.05)
+        labelled = large.set_index('label')
+        self.assertAlmostEqual(PartitionPlanner.estimate_nbytes(labelled) / labelled.memory_usage(deep=True).sum(),
+                               1.0, delta=0.05)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import importlib.util
+import shutil
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from research_analytics_suite.data_engine.core.DataPipeline import DataPipeline
+from research_analytics_suite.data_engine.core.PipelineCheckpoints import PipelineCheckpoints
+
+T = 5
+LOCK = threading.Lock()
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+
+def above(frame):
+    return frame['x'] > T
+
+
+def above_helper(frame):
+    return above(frame)
+
+
+def guarded(frame):
+    with LOCK:
+        return frame['x'] > 0
+
+
+def guarded_by(lock):
+    def predicate(frame):
+        with lock:
+            return frame['x'] > 0
+    return predicate
+
+
+class PipelineCheckpointsTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.frame = pd.DataFrame({'x': range(20)})
+        logger = mock.patch('research_analytics_suite.utils.CustomLogger.CustomLogger')
+        logger.start()
+        self.addCleanup(logger.stop)
+        self.checkpoints = PipelineCheckpoints(self.directory)
+
+    def tearDown(self):
+        global T
+        T = 5
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def run_pipeline(self, predicate):
+        pipeline = DataPipeline().filter(predicate).checkpoint('filtered')
+        return pipeline.compute(self.frame, checkpoints=self.checkpoints), pipeline.timings[0].get('resumed', False)
+
+    @unittest.skipUnless(HAS_PYARROW, 'pyarrow is required to store checkpoints')
+    def test_changed_global_invalidates_the_checkpoint(self):
+        global T
+        for predicate in (above, above_helper):
+            with self.subTest(predicate=predicate.__name__):
+                T = 5
+                result, resumed = self.run_pipeline(predicate)
+                self.assertEqual((len(result), resumed), (14, False))
+                self.assertEqual(len(self.run_pipeline(predicate)[0]), 14)
+                self.assertTrue(self.run_pipeline(predicate)[1])
+
+                T = 15
+                result, resumed = self.run_pipeline(predicate)
+                self.assertEqual((len(result), resumed), (4, False))
+
+    @unittest.skipUnless(HAS_PYARROW, 'pyarrow is required to store checkpoints')
+    def test_unhashable_globals_keep_a_stable_key(self):
+        step = {'kind': 'filter', 'func': guarded, 'columns': None}
+        self.assertEqual(PipelineCheckpoints.step_key('input', step), PipelineCheckpoints.step_key('input', step))
+        self.assertFalse(self.run_pipeline(guarded)[1])
+        self.assertTrue(self.run_pipeline(guarded)[1])
+
+
+    def test_unhashable_closure_values_keep_a_stable_key(self):
+        step = {'kind': 'filter', 'func': guarded_by(threading.Lock()), 'columns': None}
+        self.assertEqual(PipelineCheckpoints.step_key('input', step), PipelineCheckpoints.step_key('input', step))
+
+        other = {'kind': 'filter', 'func': guarded_by(threading.Lock()), 'columns': None}
+        self.assertEqual(PipelineCheckpoints.step_key('input', step), PipelineCheckpoints.step_key('input', other))
+
+    def test_changed_closure_value_changes_the_key(self):
+        def step(threshold):
+            return {'kind': 'filter', 'func': lambda frame: frame['x'] > threshold, 'columns': None}
+        self.assertEqual(PipelineCheckpoints.step_key('input', step(5)), PipelineCheckpoints.step_key('input', step(5)))
+        self.assertNotEqual(PipelineCheckpoints.step_key('input', step(5)),
+                            PipelineCheckpoints.step_key('input', step(15)))
+
+
+if __name__ == '__main__':
+    unittest.main()
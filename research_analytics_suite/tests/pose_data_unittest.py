@@ -0,0 +1,94 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from research_analytics_suite.data_engine.core.PoseData import PoseData
+
+BODYPARTS = ['nose', 'left_ear', 'right_ear', 'neck', 'tail']
+
+
+class PoseDataTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        rng = np.random.default_rng(0)
+        self.pose = PoseData(rng.uniform(0, 640, size=(100, len(BODYPARTS), 3)), BODYPARTS, scorer='DLC_resnet50')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_select_views(self):
+        for bodyparts in ('neck', ['nose', 'left_ear', 'right_ear'], ['nose', 'right_ear', 'tail']):
+            with self.subTest(bodyparts=bodyparts):
+                selection = self.pose.select(slice(10, 20), bodyparts)
+                self.assertTrue(np.shares_memory(selection.data, self.pose.data))
+                self.assertEqual(selection.bodyparts, [bodyparts] if isinstance(bodyparts, str) else bodyparts)
+                indices = [BODYPARTS.index(name) for name in selection.bodyparts]
+                np.testing.assert_array_equal(selection.data, self.pose.data[10:20][:, indices])
+
+        copied = self.pose.select(bodyparts=['tail', 'nose'])
+        self.assertFalse(np.shares_memory(copied.data, self.pose.data))
+        np.testing.assert_array_equal(copied.x, self.pose.x[:, [4, 0]])
+        self.assertTrue(np.shares_memory(self.pose[5].data, self.pose.data))
+        self.assertEqual(len(self.pose[-1]), 1)
+
+    def test_select_no_bodyparts(self):
+        empty = self.pose.select(slice(0, 10), bodyparts=[])
+        self.assertEqual(empty.data.shape, (10, 0, 3))
+        self.assertEqual(empty.bodyparts, [])
+        with self.assertRaises(KeyError):
+            self.pose.select(bodyparts=['nose', 'paw'])
+
+    def test_two_coordinate_input(self):
+        pose = PoseData(np.zeros((4, 2, 2)))
+        self.assertEqual(pose.data.dtype, np.float32)
+        np.testing.assert_array_equal(pose.likelihood, np.ones((4, 2)))
+        self.assertEqual(pose.bodyparts, ['bodypart0', 'bodypart1'])
+        with self.assertRaises(ValueError):
+            PoseData(np.zeros((4, 2, 2)), bodyparts=['nose'])
+
+    def test_dlc_csv_round_trip(self):
+        path = os.path.join(self.directory, 'video1DLC_resnet50.csv')
+        self.pose.to_dataframe().to_csv(path)
+        loaded = PoseData.from_dlc_csv(path)
+        self.assertEqual((loaded.bodyparts, loaded.scorer), (BODYPARTS, 'DLC_resnet50'))
+        np.testing.assert_array_equal(loaded.data, self.pose.data)
+
+    def test_multi_animal_and_flat_columns(self):
+        columns = pd.MultiIndex.from_product([['DLC'], ['mouse1', 'mouse2'], ['nose', 'tail'], list(PoseData.FIELDS)],
+                                             names=['scorer', 'individuals', 'bodyparts', 'coords'])
+        values = np.arange(3 * 12, dtype=float).reshape(3, 12)
+        pose = PoseData.from_dataframe(pd.DataFrame(values, columns=columns))
+        self.assertEqual(pose.bodyparts, ['mouse1_nose', 'mouse1_tail', 'mouse2_nose', 'mouse2_tail'])
+        np.testing.assert_array_equal(pose.data.reshape(3, -1), values)
+
+        flat = PoseData.from_dataframe(pd.DataFrame({'nose_x': [1.0, 2.0], 'nose_y': [3.0, np.nan], 'frame': [0, 1]}))
+        self.assertEqual(flat.bodyparts, ['nose'])
+        np.testing.assert_array_equal(flat.data[:, 0], [[1.0, 3.0, 1.0], [2.0, np.nan, 1.0]])
+
+    def test_save_and_load_memory_mapped(self):
+        path = os.path.join(self.directory, 'session', 'pose')
+        self.pose.save(path)
+        self.assertTrue(os.path.exists(f"{path}.npy"))
+
+        loaded = PoseData.load(path)
+        # The coordinates are a read-only view of the mapped file, not a copy
+        self.assertIsInstance(loaded.data.base, np.memmap)
+        self.assertFalse(loaded.data.flags.writeable)
+        self.assertEqual((loaded.bodyparts, loaded.scorer), (BODYPARTS, 'DLC_resnet50'))
+        np.testing.assert_array_equal(loaded.data, self.pose.data)
+
+        selection = loaded.select(slice(50, 60), 'tail')
+        self.assertTrue(np.shares_memory(selection.data, loaded.data))
+        np.testing.assert_array_equal(selection.xy, self.pose.xy[50:60, 4:5])
+
+        in_memory = PoseData.load(f"{path}.npy", mmap_mode=None)
+        self.assertNotIsInstance(in_memory.data.base, np.memmap)
+        np.testing.assert_array_equal(in_memory.data, self.pose.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
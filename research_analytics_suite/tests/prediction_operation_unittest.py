@@ -0,0 +1,66 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from research_analytics_suite.utils.Config import Config
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+class LabelModel:
+    """Predicts 'even' or 'odd' from the first feature, as an object array of labels."""
+    classes_ = np.array(['odd', 'even'], dtype=object)
+
+    def predict(self, X):
+        return np.where(X[:, 0] % 2 == 0, 'even', 'odd').astype(object)
+
+
+class PredictionOperationTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.mkdtemp()
+        config = Config()
+        await config.initialize()
+        config.BASE_DIR = self.directory
+        await CustomLogger().initialize()
+
+        from research_analytics_suite.data_engine.memory.DataCache import DataCache
+        from research_analytics_suite.data_engine.memory.MemoryManager import MemoryManager
+        from research_analytics_suite.operation_manager.control.OperationControl import OperationControl
+        await DataCache().initialize()
+        await MemoryManager().initialize()
+        await OperationControl().initialize()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    async def predict(self, model, data):
+        from research_analytics_suite.analytics.prediction.PredictionOperation import PredictionOperation
+        operation = PredictionOperation(model, data, batch_rows=7, workers=2,
+                                        output_path=os.path.join(self.directory, 'data.predictions'))
+        await operation.initialize_operation()
+        return await operation.predict()
+
+    async def test_numeric_predictions(self):
+        class Double:
+            def predict(self, X):
+                return X[:, 0] * 2.0
+
+        data = np.arange(50, dtype=float).reshape(-1, 1)
+        outputs = await self.predict(Double(), data)
+        np.testing.assert_array_equal(outputs["predictions"], data[:, 0] * 2.0)
+        self.assertNotIn("prediction_classes", outputs)
+        self.assertEqual(outputs["prediction_stats"]["summary"]["rows"], 50)
+
+    async def test_label_predictions_are_encoded(self):
+        data = np.arange(50).reshape(-1, 1)
+        outputs = await self.predict(LabelModel(), data)
+        predictions, classes = outputs["predictions"], outputs["prediction_classes"]
+        self.assertEqual(predictions.dtype, np.int32)
+        self.assertEqual(list(classes), ['odd', 'even'])
+        self.assertEqual(list(classes[predictions]), ['even' if i % 2 == 0 else 'odd' for i in range(50)])
+
+
+if __name__ == '__main__':
+    unittest.main()
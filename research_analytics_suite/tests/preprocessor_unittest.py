@@ -0,0 +1,110 @@
+import unittest
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from research_analytics_suite.analytics.preprocessing.Preprocessor import Preprocessor
+from research_analytics_suite.analytics.preprocessing.RunningMoments import RunningMoments
+from research_analytics_suite.data_engine.memory.MemorySlot import MemorySlot
+from research_analytics_suite.operation_manager.operations.core.memory.MemoryInput import MemoryInput
+
+
+def make_data(rows=1000, seed=0):
+    """Columns on very different scales, with NaNs, a constant column and a column that is almost all NaN."""
+    rng = np.random.default_rng(seed)
+    data = np.column_stack([rng.normal(5, 2, rows), rng.normal(1e4, 0.5, rows), np.full(rows, 3.7),
+                            rng.exponential(1, rows), rng.normal(0, 1, rows)])
+    data[rng.random(rows) < 0.1, 0] = np.nan
+    data[rng.random(rows) < 0.3, 3] = np.nan
+    data[2:, 4] = np.nan
+    return data
+
+
+class PreprocessorTest(unittest.TestCase):
+    def setUp(self):
+        self.data = make_data()
+        self.scaler = StandardScaler().fit(self.data)
+
+    def assert_matches_scaler(self, preprocessor):
+        np.testing.assert_allclose(preprocessor.mean_, self.scaler.mean_, rtol=1e-12)
+        np.testing.assert_allclose(preprocessor.moments.variance, self.scaler.var_, rtol=1e-9, atol=1e-18)
+        np.testing.assert_allclose(preprocessor.scale_, self.scaler.scale_, rtol=1e-9)
+        np.testing.assert_array_equal(preprocessor.moments.count, self.scaler.n_samples_seen_)
+        np.testing.assert_allclose(preprocessor.transform(self.data), self.scaler.transform(self.data),
+                                   rtol=1e-8, atol=1e-12)
+
+    def test_streaming_fit(self):
+        for chunk_rows in (1, 7, 100, 5000):
+            with self.subTest(chunk_rows=chunk_rows):
+                self.assert_matches_scaler(Preprocessor().fit(self.data, chunk_rows=chunk_rows))
+
+        preprocessor = Preprocessor()
+        for offset in range(0, len(self.data), 64):
+            preprocessor.partial_fit(self.data[offset:offset + 64])
+        self.assert_matches_scaler(preprocessor)
+
+    def test_merged_fits(self):
+        workers = [Preprocessor().fit(self.data[i::4], chunk_rows=50) for i in range(4)]
+        merged = Preprocessor()
+        for worker in workers:
+            merged.merge(worker)
+        self.assert_matches_scaler(merged)
+
+        moments = sum(RunningMoments.of(self.data[offset:offset + 300]) for offset in range(0, len(self.data), 300))
+        self.assert_matches_scaler(Preprocessor().merge(moments))
+
+    def test_constant_columns_keep_a_unit_scale(self):
+        preprocessor = Preprocessor().fit(self.data, chunk_rows=33)
+        self.assertEqual(preprocessor.scale_[2], 1.0)
+        np.testing.assert_allclose(preprocessor.transform(self.data)[:, 2], 0, atol=1e-12)
+
+    def test_dask_partitions(self):
+        frame = pd.DataFrame(self.data, columns=list('abcde'))
+        dask_frame = dd.from_pandas(frame, npartitions=7)
+        preprocessor = Preprocessor().fit(dask_frame)
+        self.assert_matches_scaler(preprocessor)
+
+        transformed = preprocessor.transform(dask_frame)
+        self.assertIsInstance(transformed, dd.DataFrame)
+        np.testing.assert_allclose(transformed.compute().to_numpy(), self.scaler.transform(self.data),
+                                   rtol=1e-8, atol=1e-12)
+
+    def test_mismatched_columns(self):
+        with self.assertRaises(ValueError):
+            RunningMoments.of(self.data).merge(RunningMoments.of(self.data[:, :2]))
+
+
+class MemoryInputPreprocessTest(unittest.IsolatedAsyncioTestCase):
+    async def preprocess(self, values):
+        slot = MemorySlot(memory_id='values', name='values', operation_required=True,
+                          data={'values': (type(values), values)})
+        other = MemorySlot(memory_id='other', name='other', operation_required=False, data={'x': (int, 1)})
+        memory_input = MemoryInput(name='input')
+        memory_input.add_slot(slot)
+        memory_input.add_slot(other)
+        await memory_input.preprocess_data()
+        self.assertEqual(other.data, {'x': (int, 1)})
+        return await slot.get_data_by_key('values')
+
+    async def test_min_max_normalization(self):
+        values = [3, 5, np.nan, 11, 7]
+        result = await self.preprocess(values)
+        np.testing.assert_allclose(result, [0, 0.25, 0, 1, 0.5])
+        self.assertIsInstance(result, np.ndarray)
+        self.assertTrue(np.isnan(values[2]))
+
+    async def test_input_array_is_not_modified(self):
+        values = np.array([[2.0, 4.0], [6.0, 10.0]])
+        result = await self.preprocess(values)
+        np.testing.assert_allclose(result, [[0, 0.25], [0.5, 1]])
+        np.testing.assert_array_equal(values, [[2, 4], [6, 10]])
+
+    async def test_constant_values(self):
+        np.testing.assert_array_equal(await self.preprocess(np.full(4, 9.0)), np.zeros(4))
+        np.testing.assert_array_equal(await self.preprocess([np.nan, np.nan]), np.zeros(2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from research_analytics_suite.data_engine.data_streams.LiveDataHandler import LiveDataHandler
+from research_analytics_suite.data_engine.data_streams.RingBuffer import RingBuffer
+
+
+class RingBufferTest(unittest.TestCase):
+    def test_odd_capacities(self):
+        for capacity in (1001, 1025, 7):
+            with self.subTest(capacity=capacity):
+                buffer = RingBuffer(capacity)
+                self.assertEqual(buffer.block_size, capacity)
+                buffer.extend(np.arange(2.5 * capacity), np.arange(2.5 * capacity))
+                timestamps, values = buffer.window()
+                np.testing.assert_array_equal(values[:, 0], np.arange(2.5 * capacity)[-capacity:])
+                np.testing.assert_array_equal(timestamps, values[:, 0])
+
+    def test_default_block_size_is_a_quarter_when_it_divides(self):
+        self.assertEqual(RingBuffer(1024).block_size, 256)
+        self.assertEqual(RingBuffer(1001, block_size=10).block_size, 10)
+
+    def test_spilling_requires_a_dividing_block_size(self):
+        directory = tempfile.mkdtemp()
+        try:
+            with self.assertRaises(ValueError):
+                RingBuffer(1001, block_size=10, spill_dir=directory)
+            buffer = RingBuffer(1001, spill_dir=directory)
+            buffer.extend(np.arange(2500.0), np.arange(2500.0))
+            table = buffer.read_spilled()
+            buffer.close()
+            np.testing.assert_array_equal(table.column('ch0').to_numpy(), np.arange(2500.0))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    def test_live_data_handler_odd_capacity(self):
+        engine = SimpleNamespace(engine_id='engine', cache_live_buffer=lambda buffer: None)
+        handler = LiveDataHandler(data_engine=engine, capacity=1001, spill=False)
+        buffer = handler.get_buffer()
+        self.assertEqual(buffer.capacity, 1001)
+        buffer.extend(np.ones(1500))
+        self.assertEqual(len(buffer), 1001)
+
+
+if __name__ == '__main__':
+    unittest.main()
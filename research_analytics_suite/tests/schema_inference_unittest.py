@@ -0,0 +1,85 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from research_analytics_suite.data_engine.data_streams.SchemaInference import SchemaInference
+from research_analytics_suite.tests.data_type_detector_unittest import write_csv
+
+
+class SchemaInferenceTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'data.csv')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def read(self, data_type=None):
+        schema = SchemaInference.infer(self.path, data_type, use_cache=False)
+        return pd.read_csv(self.path, **SchemaInference.read_options(schema))
+
+    def test_missing_values_keep_every_row(self):
+        for blank_rows in ({40, 55}, set(range(0, 200, 7))):
+            write_csv(self.path, blank_rows=blank_rows)
+            frame = self.read()
+            self.assertEqual(len(frame), 200)
+            self.assertEqual(list(frame.columns), ['time', 'a', 'b', 'label'])
+            self.assertEqual(int(frame['a'].isna().sum()), len(blank_rows))
+
+    def test_single_column(self):
+        with open(self.path, 'w') as file:
+            file.write('value\n1\n2\n3\n')
+        frame = self.read('csv')
+        self.assertEqual(list(frame.columns), ['value'])
+        self.assertEqual(frame['value'].tolist(), [1, 2, 3])
+        self.assertEqual(str(frame['value'].dtype), 'int64')
+
+        with open(self.path, 'w') as file:
+            file.write('1.5\n2\n3\n')
+        self.assertEqual(self.read('csv')['column_0'].tolist(), [1.5, 2.0, 3.0])
+
+    def test_missing_booleans_are_nullable(self):
+        with open(self.path, 'w') as file:
+            file.write('flag,value\ntrue,1\n,2\nfalse,3\n')
+        schema = SchemaInference.infer(self.path, 'csv', use_cache=False)
+        self.assertTrue(schema['complete'])
+        self.assertEqual(schema['dtypes']['flag'], 'boolean')
+
+        frame = self.read('csv')
+        self.assertEqual(frame['flag'].tolist()[::2], [True, False])
+        self.assertTrue(pd.isna(frame['flag'][1]))
+
+    def test_only_pandas_missing_tokens_are_missing(self):
+        with open(self.path, 'w') as file:
+            file.write('a,b\n1.5,1.5\nNone,none\nNA,NONE\n2.5,Na\n')
+        schema = SchemaInference.infer(self.path, 'csv', use_cache=False)
+        self.assertEqual(schema['dtypes']['a'], 'float64')
+        self.assertNotEqual(schema['dtypes']['b'], 'float64')
+
+        frame = self.read('csv')
+        self.assertEqual(int(frame['a'].isna().sum()), 2)
+        self.assertEqual([str(value) for value in frame['b']], ['1.5', 'none', 'NONE', 'Na'])
+
+    @mock.patch('research_analytics_suite.utils.CustomLogger.CustomLogger.warning')
+    def test_numeric_header_rows_fall_back_to_the_first_row(self, warning):
+        sample = pd.DataFrame([['time', 'a'], ['0', '0.5'], ['1', ''], ['2', '1.5']])
+        self.assertEqual(SchemaInference._check_data_row(sample, 3, self.path), 1)
+        self.assertEqual(SchemaInference._check_data_row(sample, 1, self.path), 1)
+        warning.assert_called_once()
+
+    @mock.patch('research_analytics_suite.utils.CustomLogger.CustomLogger.warning')
+    def test_long_headers_fall_back(self, warning):
+        header = [[f"meta {i}", 'x'] for i in range(SchemaInference.MAX_HEADER_ROWS + 1)]
+        sample = pd.DataFrame(header + [['1', '2']])
+        self.assertEqual(SchemaInference._check_data_row(sample, len(header), self.path), 1)
+        headerless = pd.DataFrame([['1', '2'], ['3', '4']])
+        self.assertEqual(SchemaInference._check_data_row(headerless, 1, self.path), 0)
+        self.assertEqual(warning.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
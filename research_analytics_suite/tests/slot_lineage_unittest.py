@@ -0,0 +1,138 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from research_analytics_suite.data_engine.memory.SlotLineage import SlotLineage
+from research_analytics_suite.utils.Config import Config
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+
+
+def write_group(directory):
+    """Write an operation group of a parent 'op0' and two children that output x1 = 1 and x2 = 2."""
+    def ref(i):
+        return {'unique_id': f'g_op{i}_1', 'name': f'op{i}', 'github': 'g', 'version': '1'}
+
+    with open(os.path.join(directory, 'g_op0_1.json'), 'w') as file:
+        json.dump({**ref(0), 'action': 'total = 3', 'child_operations': [ref(1), ref(2)],
+                   'parent_operation': None}, file)
+    for i in (1, 2):
+        with open(os.path.join(directory, f'g_op{i}_1.json'), 'w') as file:
+            json.dump({**ref(i), 'action': f'x{i} = {i}', 'child_operations': None, 'parent_operation': ref(0)}, file)
+    return os.path.join(directory, 'g_op0_1.json')
+
+
+class SlotLineageTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.mkdtemp()
+        config = Config()
+        await config.initialize()
+        config.BASE_DIR = self.directory
+        await CustomLogger().initialize()
+
+        from research_analytics_suite.data_engine.memory.DataCache import DataCache
+        from research_analytics_suite.data_engine.memory.MemoryManager import MemoryManager
+        from research_analytics_suite.operation_manager.control.OperationControl import OperationControl
+        await DataCache().initialize()
+        await MemoryManager().initialize()
+        await OperationControl().initialize()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    async def test_batch_results_keep_child_outputs(self):
+        from research_analytics_suite.operation_manager.execution.BatchRunner import BatchRunner
+        group = os.path.join(self.directory, 'group')
+        os.makedirs(group)
+        output_path = os.path.join(self.directory, 'results.json')
+
+        runner = BatchRunner(output_path=output_path)
+        self.assertEqual(await runner.run(write_group(group)), BatchRunner.EXIT_SUCCESS)
+
+        with open(output_path) as file:
+            results = {op['name']: op['results'] for op in json.load(file)['operations'].values()}
+        self.assertEqual(results['op1'], {'x1': 1})
+        self.assertEqual(results['op2'], {'x2': 2})
+        self.assertEqual(results['op0'], {'x1': 1, 'x2': 2, 'total': 3})
+
+    async def test_collected_inputs_are_recomputed_on_rerun(self):
+        from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+        parent = BaseOperation(action='total = 3', name='parent')
+        await parent.initialize_operation()
+        child = BaseOperation(action='x1 = 1', name='child')
+        await child.initialize_operation()
+        await parent.add_child_operation(child)
+
+        await child.execute()
+        await parent.execute()
+        self.assertEqual(await child.get_results_from_memory(), {'x1': (int, 1)})
+
+        collected = await SlotLineage().collect()
+        self.assertGreaterEqual(collected['slots'], 1)
+        self.assertEqual(child.status, 'idle')
+        self.assertEqual([slot.memory_id for slot in parent.memory_inputs.slots],
+                         [slot.memory_id for slot in child.memory_outputs.slots])
+
+        await parent.execute()
+        self.assertEqual(parent.status, 'completed')
+        self.assertEqual([slot.data for slot in parent.memory_inputs.slots], [{'x1': (int, 1)}])
+
+    async def make_parent(self):
+        from research_analytics_suite.operation_manager.operations.core.BaseOperation import BaseOperation
+        parent = BaseOperation(action='total = 3', name='parent')
+        await parent.initialize_operation()
+        child = BaseOperation(action='x1 = 1', name='child')
+        await child.initialize_operation()
+        await parent.add_child_operation(child)
+        return parent, child
+
+    async def test_top_level_finish_collects_above_threshold(self):
+        lineage = SlotLineage()
+        self.addCleanup(setattr, lineage, 'collect_threshold', lineage.collect_threshold)
+        parent, child = await self.make_parent()
+
+        await parent.execute()
+        self.assertEqual([slot.data for slot in child.memory_outputs.slots], [{'x1': (int, 1)}])
+
+        lineage.collect_threshold = 0
+        await parent.execute()
+        self.assertEqual([slot.data for slot in child.memory_outputs.slots], [{}])
+
+    async def test_auto_collect_can_be_disabled(self):
+        lineage = SlotLineage()
+        self.addCleanup(setattr, lineage, 'collect_threshold', lineage.collect_threshold)
+        self.addCleanup(setattr, lineage, 'auto_collect', lineage.auto_collect)
+        parent, child = await self.make_parent()
+
+        lineage.collect_threshold = 0
+        lineage.auto_collect = False
+        await parent.execute()
+        self.assertEqual([slot.data for slot in child.memory_outputs.slots], [{'x1': (int, 1)}])
+
+    async def test_spilled_slots_are_restored_on_access(self):
+        lineage = SlotLineage()
+        parent, child = await self.make_parent()
+        await child.execute()
+        await parent.execute()
+
+        collected = await lineage.collect(spill=True)
+        self.assertGreaterEqual(collected['spilled'], 1)
+        slot = child.memory_outputs.slots[0]
+        path = lineage.spilled[slot.memory_id]
+        self.assertEqual(slot.data, {})
+        self.assertEqual(child.status, 'completed')
+
+        self.assertEqual(await child.get_results_from_memory(), {'x1': (int, 1)})
+        self.assertNotIn(slot.memory_id, lineage.spilled)
+        self.assertFalse(os.path.exists(path))
+
+        await lineage.collect(spill=True)
+        self.assertIn(slot.memory_id, lineage.spilled)
+        await parent.execute()
+        self.assertEqual(parent.status, 'completed')
+        self.assertEqual([slot.data for slot in parent.memory_inputs.slots], [{'x1': (int, 1)}])
+        self.assertNotIn(slot.memory_id, lineage.spilled)
+
+if __name__ == '__main__':
+    unittest.main()
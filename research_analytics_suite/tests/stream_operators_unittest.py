@@ -0,0 +1,113 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import signal
+
+from research_analytics_suite.data_engine.data_streams.operators import (BandPassFilter, Downsample, EventDetector,
+                                                                         EWMA, PercentileSketch, RollingMinMax,
+                                                                         RollingStatistics)
+
+
+class StreamOperatorsTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.samples = rng.normal(size=(2000, 3)) * [1.0, 10.0, 0.1] + [0.0, 1e4, -5.0]
+
+    def test_rolling_statistics(self):
+        for window, ddof in ((1, 0), (50, 1), (256, 0)):
+            with self.subTest(window=window, ddof=ddof):
+                operator = RollingStatistics(window, channels=3, ddof=ddof)
+                for stop in (window // 2 + 1, 700, 2000):
+                    operator.update_many(self.samples[operator.samples_seen:stop])
+                    recent = self.samples[max(0, stop - window):stop]
+                    np.testing.assert_allclose(operator.mean, recent.mean(axis=0), rtol=1e-9, atol=1e-9)
+                    if len(recent) > ddof:
+                        np.testing.assert_allclose(operator.variance, recent.var(axis=0, ddof=ddof),
+                                                   rtol=1e-6, atol=1e-9)
+                    self.assertEqual(operator.result()['count'], len(recent))
+
+    def test_rolling_min_max(self):
+        operator = RollingMinMax(64, channels=3)
+        expected_min = sliding_window_view(self.samples, 64, axis=0).min(axis=2)
+        expected_max = sliding_window_view(self.samples, 64, axis=0).max(axis=2)
+        for index, sample in enumerate(self.samples):
+            operator.update(sample)
+            if index >= 63 and index % 97 == 0:
+                np.testing.assert_array_equal(operator.minimum, expected_min[index - 63])
+                np.testing.assert_array_equal(operator.maximum, expected_max[index - 63])
+
+    def test_ewma_matches_pandas(self):
+        operator = EWMA(span=20, channels=3)
+        operator.update_many(self.samples)
+        ewm = pd.DataFrame(self.samples).ewm(span=20, adjust=False)
+        np.testing.assert_allclose(operator.result()['mean'], ewm.mean().iloc[-1], rtol=1e-9)
+        np.testing.assert_allclose(operator.result()['variance'], ewm.var(bias=True).iloc[-1], rtol=1e-9)
+
+    def test_percentile_sketch(self):
+        operator = PercentileSketch((0.1, 0.5, 0.9, 0.99), channels=3)
+        self.assertTrue(np.isnan(operator.quantile_estimates()).all())
+        operator.update_many(self.samples[:3])
+        np.testing.assert_allclose(operator.quantile_estimates(),
+                                   np.quantile(self.samples[:3], (0.1, 0.5, 0.9, 0.99), axis=0).T)
+
+        rng = np.random.default_rng(1)
+        samples = np.column_stack([rng.normal(size=20000), rng.exponential(size=20000), rng.uniform(size=20000)])
+        operator = PercentileSketch((0.1, 0.5, 0.9, 0.99), channels=3)
+        operator.update_many(samples)
+        expected = np.quantile(samples, (0.1, 0.5, 0.9, 0.99), axis=0).T
+        tolerance = np.broadcast_to(0.1 * samples.std(axis=0)[:, None], expected.shape)
+        np.testing.assert_array_less(np.abs(operator.quantile_estimates() - expected), tolerance)
+        self.assertEqual(sorted(operator.result()), ['p10', 'p50', 'p90', 'p99'])
+
+    def test_band_pass_filter_matches_sosfilt(self):
+        operator = BandPassFilter(5.0, 40.0, sample_rate=250.0, order=4, channels=3)
+        outputs = np.array(operator.update_many(self.samples))
+        expected = signal.sosfilt(signal.butter(4, [5.0, 40.0], btype='bandpass', output='sos', fs=250.0),
+                                  self.samples, axis=0)
+        np.testing.assert_allclose(outputs, expected, rtol=1e-9, atol=1e-9)
+        np.testing.assert_array_equal(operator.result()['value'], outputs[-1])
+
+    def test_event_detector(self):
+        t = np.arange(1000) / 100.0
+        clean = np.sin(2 * np.pi * t)
+        noisy = clean + np.random.default_rng(2).normal(scale=0.05, size=len(t))
+        rising = np.flatnonzero((clean[:-1] <= 0.5) & (clean[1:] > 0.5)) + 1
+
+        operator = EventDetector(0.5)
+        operator.update_many(clean)
+        self.assertEqual([event['index'] for event in operator.events], rising.tolist())
+
+        # Noise makes the signal cross the threshold several times per period unless hysteresis re-arms it
+        chattering = EventDetector(0.5)
+        chattering.update_many(noisy)
+        self.assertGreater(chattering.event_count, len(rising))
+        operator = EventDetector(0.5, hysteresis=0.3)
+        operator.update_many(noisy)
+        self.assertEqual(operator.event_count, len(rising))
+        np.testing.assert_allclose([event['index'] for event in operator.events], rising, atol=5)
+
+        both = EventDetector(0.0, direction='both')
+        both.update_many(clean)
+        self.assertEqual([event['direction'] for event in both.events], ['rising', 'falling'] * 10)
+        # A refractory period longer than half a period suppresses every falling crossing
+        operator = EventDetector(0.0, direction='both', refractory=60)
+        operator.update_many(clean)
+        self.assertEqual({event['direction'] for event in operator.events}, {'rising'})
+        self.assertEqual(operator.event_count, 10)
+
+    def test_downsample(self):
+        mean = Downsample(8, channels=3)
+        outputs = mean.update_many(self.samples, timestamps=np.arange(len(self.samples)))
+        np.testing.assert_allclose(np.array([value for _, value in outputs]),
+                                   self.samples.reshape(-1, 8, 3).mean(axis=1), rtol=1e-12)
+        self.assertEqual([timestamp for timestamp, _ in outputs[:2]], [7, 15])
+
+        minmax = Downsample(8, method='minmax', channels=3)
+        value = minmax.update_many(self.samples[:8])[0][1]
+        np.testing.assert_array_equal(value, [self.samples[:8].min(axis=0), self.samples[:8].max(axis=0)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import threading
+import unittest
+from unittest import mock
+
+from research_analytics_suite.data_engine.data_streams.ThreadedInput import ThreadedInput
+
+
+class StalledInput(ThreadedInput):
+    def __init__(self):
+        super().__init__(source='Stalled')
+        self.release = threading.Event()
+        self.opened = 0
+
+    def open(self):
+        self.opened += 1
+
+    def read_data(self):
+        # A device call that ignores the stop request until it returns
+        self.release.wait()
+        return None
+
+
+class ThreadedInputTest(unittest.TestCase):
+    @mock.patch('research_analytics_suite.utils.CustomLogger.CustomLogger.warning')
+    def test_stalled_reader_is_kept_until_it_exits(self, warning):
+        live_input = StalledInput()
+        live_input.start()
+        thread = live_input._thread
+
+        live_input.stop(timeout=0.05)
+        self.assertIs(live_input._thread, thread)
+        self.assertTrue(live_input.is_running)
+        warning.assert_called_once()
+
+        live_input.start()
+        self.assertIs(live_input._thread, thread)
+        self.assertEqual(warning.call_count, 2)
+
+        live_input.release.set()
+        live_input.stop(timeout=1.0)
+        self.assertIsNone(live_input._thread)
+        self.assertFalse(thread.is_alive())
+
+        live_input.start()
+        self.assertIsNot(live_input._thread, thread)
+        live_input.stop(timeout=1.0)
+        self.assertEqual(live_input.opened, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
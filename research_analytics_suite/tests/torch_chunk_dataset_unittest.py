@@ -0,0 +1,81 @@
+import importlib.util
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+HAS_TORCH = importlib.util.find_spec('torch') is not None
+if HAS_TORCH:
+    import torch
+
+    from research_analytics_suite.data_engine.core.TorchChunkDataset import TorchChunkDataset
+
+
+@unittest.skipUnless(HAS_TORCH, 'torch is not installed')
+class TorchChunkDatasetTest(unittest.TestCase):
+    def rows(self, batches):
+        return torch.cat(batches)[:, 0].numpy()
+
+    def test_data_engine_exposes_the_dataset(self):
+        from research_analytics_suite import data_engine
+        self.assertIs(data_engine.TorchChunkDataset, TorchChunkDataset)
+
+    def test_batches_carry_over_chunk_boundaries(self):
+        data = np.arange(20.0).reshape(10, 2)
+        dataset = TorchChunkDataset(data, batch_size=3, chunk_rows=4)
+        self.assertEqual(dataset.num_chunks, 3)
+
+        batches = list(dataset)
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 3, 1])
+        np.testing.assert_array_equal(self.rows(batches), data[:, 0])
+
+        dataset.drop_last = True
+        self.assertEqual([len(batch) for batch in dataset], [3, 3, 3])
+
+    def test_carry_spans_chunks_smaller_than_the_remainder(self):
+        frame = pd.DataFrame({'a': np.arange(23.0), 'b': np.arange(23.0)})
+        dataset = TorchChunkDataset(dd.from_pandas(frame, npartitions=5), batch_size=8)
+        batches = list(dataset)
+        self.assertEqual([len(batch) for batch in batches], [8, 8, 7])
+        np.testing.assert_array_equal(self.rows(batches), frame['a'].to_numpy())
+
+    def test_shuffled_batches_serve_every_row_once(self):
+        data = np.arange(50.0)[:, None]
+        dataset = TorchChunkDataset(data, batch_size=7, chunk_rows=10, shuffle=True, seed=3)
+        batches = list(dataset)
+        self.assertTrue(all(len(batch) == 7 for batch in batches[:-1]))
+        rows = self.rows(batches)
+        np.testing.assert_array_equal(np.sort(rows), data[:, 0])
+        self.assertFalse(np.array_equal(rows, data[:, 0]))
+
+        dataset.set_epoch(1)
+        self.assertFalse(np.array_equal(self.rows(list(dataset)), rows))
+
+    def test_workers_stream_disjoint_chunks(self):
+        data = np.arange(100.0)[:, None]
+        for shuffle in (False, True):
+            dataset = TorchChunkDataset(data, batch_size=4, chunk_rows=10, shuffle=shuffle, seed=5)
+            served = []
+            for worker in range(3):
+                info = SimpleNamespace(id=worker, num_workers=3)
+                with mock.patch('research_analytics_suite.data_engine.core.TorchChunkDataset.get_worker_info',
+                                return_value=info):
+                    served.append(set(self.rows(list(dataset))))
+            with self.subTest(shuffle=shuffle):
+                self.assertEqual(sum(len(rows) for rows in served), 100)
+                self.assertEqual(set.union(*served), set(data[:, 0]))
+                chunks = [{int(row) // 10 for row in rows} for rows in served]
+                self.assertFalse(chunks[0] & chunks[1] or chunks[0] & chunks[2] or chunks[1] & chunks[2])
+
+    def test_numpy_chunks_share_storage(self):
+        data = np.arange(12.0).reshape(6, 2)
+        batch = next(iter(TorchChunkDataset(data, batch_size=6)))
+        data[0, 0] = -1.0
+        self.assertEqual(batch[0, 0].item(), -1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
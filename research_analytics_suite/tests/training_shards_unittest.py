@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+import unittest
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+
+from research_analytics_suite.analytics.training.MLTrainingOperation import MLTrainingOperation
+from research_analytics_suite.analytics.training.ShardPrefetcher import ShardPrefetcher
+from research_analytics_suite.analytics.training.TrainingShards import TrainingShards
+
+
+class TrainingShardsTest(unittest.TestCase):
+    def setUp(self):
+        self.frame = pd.DataFrame({'a': np.arange(1000.0), 'b': np.arange(1000.0) * 2, 'label': np.arange(1000) % 3})
+
+    def assert_stable_split(self, shards):
+        for index in range(len(shards)):
+            train, validation, rows = (shards.load(index, subset=subset) for subset in ('train', 'validation', 'all'))
+            np.testing.assert_array_equal(shards.load(index, subset='validation')[0], validation[0])
+            self.assertEqual(len(train[0]) + len(validation[0]), len(rows[0]))
+            self.assertFalse(set(train[0][:, 0]) & set(validation[0][:, 0]))
+
+    def test_in_memory_split_is_stable(self):
+        shards = TrainingShards(self.frame, 'label', test_size=0.25, shard_rows=300)
+        self.assertEqual(len(shards), 4)
+        self.assert_stable_split(shards)
+        held_out = sum(len(shards.load(index, subset='validation')[0]) for index in range(len(shards)))
+        self.assertAlmostEqual(held_out / len(self.frame), 0.25, delta=0.05)
+
+    def test_dask_split_matches_the_same_seed(self):
+        shards = TrainingShards(dd.from_pandas(self.frame, npartitions=4), 'label', test_size=0.25)
+        self.assertEqual(len(shards), 4)
+        self.assert_stable_split(shards)
+        again = TrainingShards(dd.from_pandas(self.frame, npartitions=4), 'label', test_size=0.25)
+        np.testing.assert_array_equal(shards.load(2, subset='validation')[1], again.load(2, subset='validation')[1])
+        np.testing.assert_array_equal(shards.classes(), [0, 1, 2])
+
+    def test_array_targets(self):
+        X, y = self.frame[['a', 'b']].to_numpy(), self.frame['label'].to_numpy()
+        shards = TrainingShards(X, y, shard_rows=400)
+        X_all, y_all = shards.load(1, subset='all')
+        np.testing.assert_array_equal(X_all, X[400:800])
+        np.testing.assert_array_equal(y_all, y[400:800])
+
+    def test_training_operation_data(self):
+        operation = MLTrainingOperation(None, self.frame, 'label', shard_rows=300)
+        self.assertIsNone(operation.val_data)
+        operation.shards = TrainingShards(self.frame, 'label', shard_rows=300)
+        X_val, y_val = operation.val_data
+        X_train, y_train = operation.train_data
+        self.assertIs(operation.val_data[0], X_val)
+        self.assertEqual(len(X_val) + len(X_train), len(self.frame))
+        self.assertEqual(sorted(np.concatenate([X_val[:, 0], X_train[:, 0]])), list(self.frame['a']))
+
+
+class ShardPrefetcherTest(unittest.IsolatedAsyncioTestCase):
+    async def test_order_and_bound(self):
+        lock = threading.Lock()
+        started, consumed, outstanding = [0], [0], []
+
+        def load(index):
+            with lock:
+                started[0] += 1
+            # Later shards load faster, so completion order differs from the requested order
+            time.sleep(0.002 * (10 - index))
+            return index
+
+        order = [3, 1, 4, 0, 9, 2, 6, 5, 8, 7]
+        received = []
+        async for shard in ShardPrefetcher(load, order, prefetch=3, workers=3):
+            received.append(shard)
+            consumed[0] += 1
+            with lock:
+                outstanding.append(started[0] - consumed[0])
+            await asyncio.sleep(0.005)
+
+        self.assertEqual(received, order)
+        self.assertLessEqual(max(outstanding), 3)
+
+    async def test_stopping_early_cancels_pending_loads(self):
+        loaded = []
+
+        def load(index):
+            loaded.append(index)
+            return index
+
+        async for shard in ShardPrefetcher(load, range(100), prefetch=2, workers=1):
+            if shard == 1:
+                break
+        await asyncio.sleep(0.05)
+        self.assertLessEqual(len(loaded), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
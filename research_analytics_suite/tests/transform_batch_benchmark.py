@@ -0,0 +1,73 @@
+"""
+Benchmark of the batch transformation paths of AnalyticsCore.
+
+Times the same pipeline of preloaded transformations applied three ways: one datapoint at a time through
+`transform`, one transformation at a time through each `transform_batch`, and through `AnalyticsCore.transform_batch`,
+which fuses consecutive affine transformations. The per-point path is timed on a subset of the points and reported per
+point. Not collected by the test suite; run it with
+
+    python -m research_analytics_suite.tests.transform_batch_benchmark [--points N] [--repeat R]
+"""
+import argparse
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from research_analytics_suite.analytics.core.AnalyticsCore import AnalyticsCore
+from research_analytics_suite.analytics.preloaded.transformations import (OpticalDistortTransform,
+                                                                          PerspectiveTransform, RotateTransform,
+                                                                          ScaleTransform, TranslateTransform)
+
+PER_POINT_SAMPLE = 20_000
+
+
+def best_of(repeat, func, *args):
+    """Return the fastest of `repeat` runs of a function, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def per_point(core, points):
+    for x, y in points:
+        core.transform(SimpleNamespace(x=float(x), y=float(y)))
+
+
+def unfused(core, points):
+    for transformation in core.transformations:
+        points = transformation.transform_batch(points)
+    return points
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--points', type=int, default=1_000_000, help='The number of coordinates transformed.')
+    parser.add_argument('--repeat', type=int, default=5, help='The number of runs; the fastest is reported.')
+    args = parser.parse_args()
+
+    points = np.random.default_rng(0).uniform(0, 640, size=(args.points, 2))
+    core = AnalyticsCore([RotateTransform(0.3), ScaleTransform(1.7), TranslateTransform(12.5, -4.0),
+                          PerspectiveTransform(2e-4), RotateTransform(-1.1), ScaleTransform(0.5),
+                          OpticalDistortTransform(points, k1=5e-7), TranslateTransform(3.0, 7.0)])
+    np.testing.assert_allclose(core.transform_batch(points), unfused(core, points), rtol=1e-10, atol=1e-8)
+
+    sample = points[:PER_POINT_SAMPLE]
+    results = [
+        ('per point', best_of(1, per_point, core, sample) / len(sample)),
+        ('batch, unfused', best_of(args.repeat, unfused, core, points) / len(points)),
+        ('batch, fused', best_of(args.repeat, core.transform_batch, points) / len(points)),
+    ]
+
+    print(f"{len(core.transformations)} transformations, {len(core._fuse_transformations())} fused stages, "
+          f"{args.points:,} points")
+    for name, seconds in results:
+        print(f"{name:>16}: {seconds * 1e9:10.1f} ns/point  {results[0][1] / seconds:8.1f}x  "
+              f"({seconds * args.points:.3f} s total)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from research_analytics_suite.analytics.core.AnalyticsCore import AnalyticsCore
+from research_analytics_suite.analytics.preloaded.transformations import (JitterTransform, OpticalDistortTransform,
+                                                                          PerspectiveTransform, RotateTransform,
+                                                                          ScaleTransform, TranslateTransform)
+
+
+def transform_points(transformation, points):
+    """Apply a transformation one datapoint at a time, through its per-point path."""
+    result = []
+    for x, y in points.reshape(-1, 2):
+        datapoint = transformation.transform(SimpleNamespace(x=float(x), y=float(y)))
+        result.append((datapoint.x, datapoint.y))
+    return np.array(result).reshape(points.shape)
+
+
+class TransformBatchTest(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.points = rng.uniform(0, 640, size=(20, 12, 2))
+
+    def transformations(self):
+        return [RotateTransform(0.3), ScaleTransform(1.7), TranslateTransform(12.5, -4.0),
+                PerspectiveTransform(2e-4), OpticalDistortTransform(self.points, k1=5e-7)]
+
+    def test_batch_matches_per_point(self):
+        for transformation in self.transformations():
+            with self.subTest(transformation=repr(transformation)):
+                np.testing.assert_allclose(transformation.transform_batch(self.points),
+                                           transform_points(transformation, self.points), rtol=1e-12, atol=1e-9)
+
+    def test_jitter_batch_matches_per_point_for_the_same_seed(self):
+        jitter = JitterTransform(0.5)
+        np.random.seed(1)
+        expected = transform_points(jitter, self.points)
+        np.random.seed(1)
+        np.testing.assert_array_equal(jitter.transform_batch(self.points), expected)
+
+    def test_fused_pipeline_matches_per_point(self):
+        transformations = self.transformations()
+        core = AnalyticsCore(transformations[:3] + [transformations[3], RotateTransform(-1.1), ScaleTransform(0.5),
+                                                    transformations[4], TranslateTransform(3.0, 7.0)])
+        self.assertEqual(len(core._fuse_transformations()), 5)
+        np.testing.assert_allclose(core.transform_batch(self.points), transform_points(core, self.points),
+                                   rtol=1e-10, atol=1e-8)
+        np.testing.assert_allclose(core.transform_batch(self.points[0]), transform_points(core, self.points[0]),
+                                   rtol=1e-10, atol=1e-8)
+
+    def test_optical_distort_ignores_missing_coordinates(self):
+        points = np.array([[10.0, 20.0], [np.nan, np.nan], [30.0, 60.0], [20.0, np.nan]])
+        distort = OpticalDistortTransform(points, k1=1.0)
+        self.assertEqual((distort.x_center, distort.y_center, distort.k1), (20.0, 40.0, 20.0))
+
+
+if __name__ == '__main__':
+    unittest.main()
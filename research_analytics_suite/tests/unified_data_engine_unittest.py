@@ -0,0 +1,58 @@
+import os
+import shutil
+import tempfile
+import unittest
+import warnings
+
+import pandas as pd
+
+from research_analytics_suite.utils.Config import Config
+from research_analytics_suite.utils.CustomLogger import CustomLogger
+from research_analytics_suite.tests.data_type_detector_unittest import write_csv
+
+
+class UnifiedDataEngineLoadTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.mkdtemp()
+        config = Config()
+        await config.initialize()
+        config.BASE_DIR = self.directory
+        await CustomLogger().initialize()
+
+        from research_analytics_suite.data_engine.engine.UnifiedDataEngine import UnifiedDataEngine
+        self.engine = UnifiedDataEngine()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def test_small_csv_loads_without_dask_warnings(self):
+        path = os.path.join(self.directory, 'data.csv')
+        write_csv(path)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            frame = self.engine.load_data(path, return_type='dataframe')
+
+        self.assertEqual(self.engine.load_partitioning['npartitions'], 1)
+        self.assertEqual(list(frame.columns), ['time', 'a', 'b', 'label'])
+        self.assertEqual(len(frame), 200)
+        self.assertFalse([str(warning.message) for warning in caught if 'skiprows' in str(warning.message)])
+
+    def test_single_column_csv(self):
+        path = os.path.join(self.directory, 'values.csv')
+        with open(path, 'w') as file:
+            file.write('value\n1\n2\n3\n')
+        self.assertEqual(self.engine.load_data(path), {'value': {0: 1, 1: 2, 2: 3}})
+
+    def test_ndjson_round_trip(self):
+        path = os.path.join(self.directory, 'records.ndjson')
+        frame = pd.DataFrame({'a': [1, 2, 3], 'b': ['x', 'y', 'z']})
+        self.engine.data = frame
+        self.engine.save_data(path)
+        with open(path) as file:
+            self.assertEqual(file.readline().strip(), '{"a":1,"b":"x"}')
+        pd.testing.assert_frame_equal(self.engine.load_data(path, return_type='dataframe').reset_index(drop=True),
+                                      frame)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -34,7 +34,13 @@ class Config:
             self.WORKSPACE_OPERATIONS_DIR = None
             self.BACKUP_DIR = None
             self.ENGINE_DIR = None
+            self.CHECKPOINT_DIR = None
             self.DISTRIBUTED = None
+            self.DASK_SCHEDULER_ADDRESS = None
+            self.DASK_WORKERS = None
+            self.DASK_SPILL_DIR = None
+            self.DASK_DASHBOARD_ADDRESS = None
+            self.DASK_PARTITION_SIZE = None
             self.MEMORY_LIMIT = None
             self.LOG_LEVEL = None
             self.LOG_FILE = None
@@ -87,6 +93,7 @@ class Config:
         self.WORKSPACE_OPERATIONS_DIR = os.path.normpath(os.path.join(self.WORKSPACE_DIR, 'operations'))
         self.BACKUP_DIR = 'backup'
         self.ENGINE_DIR = 'engine'
+        self.CHECKPOINT_DIR = 'checkpoints'  # Pipeline checkpoints, relative to the workspace directory
 
         # Memory settings
         self.MEMORY_LIMIT = psutil.virtual_memory().total * 0.5  # 50% of available memory
@@ -102,6 +109,13 @@ class Config:
         self.CACHE_SIZE = 2e9  # 2GB cache size by default
         self.NUM_THREADS = 4  # Number of threads for processing
 
+        # Distributed settings
+        self.DASK_SCHEDULER_ADDRESS = None  # Address of an existing scheduler; None starts a local cluster
+        self.DASK_WORKERS = None  # Number of local workers; None uses min(NUM_THREADS, CPU count)
+        self.DASK_SPILL_DIR = 'dask-worker-space'  # Relative to the workspace directory
+        self.DASK_DASHBOARD_ADDRESS = None  # e.g. ':8787'; None disables the dashboard
+        self.DASK_PARTITION_SIZE = 128 * 2 ** 20  # Target in-memory size of a partition, in bytes
+
         # Database settings
         self.DB_HOST = 'localhost'
         self.DB_PORT = 5432
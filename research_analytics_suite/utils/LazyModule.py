@@ -0,0 +1,83 @@
+"""
+LazyModule Module
+
+This module defines the LazyModule class, a module proxy that defers importing heavy third-party backends (torch,
+dask, sklearn, matplotlib, pandas) until one of their attributes is first accessed. This keeps the start-up cost of
+the Research Analytics Suite independent of backends that a given session never touches.
+
+Author: Lane
+"""
+import importlib
+import sys
+import types
+
+
+class LazyModule(types.ModuleType):
+    """
+    A module proxy that imports the target module on first attribute access.
+
+    Attributes:
+        module_name (str): The fully-qualified name of the module being proxied.
+    """
+
+    def __init__(self, module_name: str):
+        """
+        Initializes the LazyModule instance.
+
+        Args:
+            module_name (str): The fully-qualified name of the module to import on first use.
+        """
+        super().__init__(module_name)
+        self.__dict__['_module_name'] = module_name
+        self.__dict__['_module'] = None
+
+    def _load(self) -> types.ModuleType:
+        """
+        Imports the proxied module, if it has not been imported already.
+
+        Returns:
+            ModuleType: The imported module.
+        """
+        module = self.__dict__['_module']
+        if module is None:
+            module = importlib.import_module(self.__dict__['_module_name'])
+            self.__dict__['_module'] = module
+        return module
+
+    @property
+    def module_name(self) -> str:
+        """Gets the name of the proxied module."""
+        return self.__dict__['_module_name']
+
+    @property
+    def is_loaded(self) -> bool:
+        """Gets whether the proxied module has been imported, either through this proxy or elsewhere."""
+        return self.__dict__['_module'] is not None or self.__dict__['_module_name'] in sys.modules
+
+    def __getattr__(self, name):
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._load(), name, value)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self.is_loaded else "not loaded"
+        return f"<LazyModule '{self.module_name}' ({state})>"
+
+
+def lazy_import(module_name: str):
+    """
+    Returns the named module if it is already imported, otherwise a LazyModule proxy for it.
+
+    Args:
+        module_name (str): The fully-qualified name of the module.
+
+    Returns:
+        ModuleType: The imported module, or a LazyModule that imports it on first attribute access.
+    """
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    return LazyModule(module_name)
@@ -2,3 +2,4 @@
 
 from .CustomLogger import CustomLogger
 from .Config import Config
+from .LazyModule import LazyModule, lazy_import
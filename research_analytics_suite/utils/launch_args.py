@@ -36,4 +36,13 @@ def get_launch_args():
     _parser.add_argument('-n', '--name',
                          help='Name of the new workspace')
 
+    # Headless batch arguments
+    _parser.add_argument('-b', '--batch',
+                         help='Runs the specified operation group (file path, or file name within the workspace '
+                              'operations directory) without the GUI or console, then exits with a status code')
+    _parser.add_argument('-j', '--jobs', type=int, default=1,
+                         help='Maximum number of operations executed in parallel in batch mode')
+    _parser.add_argument('--output',
+                         help='File the batch results are written to (defaults to the workspace data directory)')
+
     return _parser